@@ -18,9 +18,13 @@ def _isolate_db(tmp_path, monkeypatch):
     Also clears DATABASE_URL because litellm calls dotenv.load_dotenv()
     at import time, which can set it from a local .env file and cause
     the engine to connect to Neon instead of the temp DuckDB.
+
+    Points the daemon socket at the temp dir too, so `voicetest run` in a
+    test never hands its work to a developer's running daemon.
     """
     db_path = tmp_path / "test.duckdb"
     monkeypatch.setenv("VOICETEST_DB_PATH", str(db_path))
+    monkeypatch.setenv("VOICETEST_DAEMON_SOCKET", str(tmp_path / "daemon.sock"))
     monkeypatch.delenv("DATABASE_URL", raising=False)
 
 
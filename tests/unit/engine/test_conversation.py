@@ -1,5 +1,6 @@
 """Tests for voicetest.engine.conversation module."""
 
+import json
 import logging
 from unittest.mock import AsyncMock
 from unittest.mock import patch
@@ -18,6 +19,7 @@ from voicetest.models.agent import ToolDefinition
 from voicetest.models.agent import Transition
 from voicetest.models.agent import TransitionCondition
 from voicetest.models.agent import VariableExtraction
+from voicetest.util.timing import collect_timings
 
 
 class TestConversationEngine:
@@ -81,6 +83,66 @@ class TestConversationEngine:
         assert len(engine.nodes_visited) == 1  # Original unchanged
 
 
+class TestSnapshot:
+    """Tests for ConversationEngine.snapshot() / restore()."""
+
+    @staticmethod
+    async def _two_turns(engine: ConversationEngine) -> None:
+        async def mock_call_llm(model, signature, **kwargs):
+            class MockResult:
+                response = "Goodbye!"
+                objectives_complete = True
+                transition_to = "farewell"
+
+            return MockResult()
+
+        with patch("voicetest.engine.conversation.call_llm", side_effect=mock_call_llm):
+            await engine.add_user_message("I want to leave")
+            await engine.advance()
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, simple_graph):
+        engine = ConversationEngine(
+            simple_graph, model="openai/gpt-4o-mini", dynamic_variables={"name": "Jane"}
+        )
+        await self._two_turns(engine)
+
+        data = json.loads(json.dumps(engine.snapshot()))
+        restored = ConversationEngine(simple_graph, model="openai/gpt-4o-mini")
+        restored.restore(data)
+
+        assert restored.current_node == "farewell"
+        assert restored.transcript == engine.transcript
+        assert restored.nodes_visited == ["greeting", "farewell"]
+        assert restored.tools_called == engine.tools_called
+        assert restored._dynamic_variables == {"name": "Jane"}
+
+    def test_initial_snapshot_omits_empty_fields(self, simple_graph):
+        engine = ConversationEngine(simple_graph, model="openai/gpt-4o-mini")
+
+        assert engine.snapshot() == {
+            "v": 1,
+            "node": "greeting",
+            "transcript": [],
+            "visited": ["greeting"],
+        }
+
+    def test_rejects_unknown_version(self, simple_graph):
+        engine = ConversationEngine(simple_graph, model="openai/gpt-4o-mini")
+        data = {**engine.snapshot(), "v": 99}
+
+        with pytest.raises(ValueError, match="version"):
+            engine.restore(data)
+
+    def test_rejects_node_missing_from_graph(self, simple_graph):
+        engine = ConversationEngine(simple_graph, model="openai/gpt-4o-mini")
+        data = {**engine.snapshot(), "node": "deleted"}
+
+        with pytest.raises(ValueError, match="deleted"):
+            engine.restore(data)
+        assert engine.current_node == "greeting"
+
+
 class TestTurnResult:
     """Tests for TurnResult dataclass."""
 
@@ -157,6 +219,44 @@ class TestProcessTurn:
         assert len(agent_msgs) == 1
         assert agent_msgs[0].content == "Hello there!"
 
+    @pytest.mark.asyncio
+    async def test_advance_records_turn_timings(self, simple_graph):
+        engine = ConversationEngine(simple_graph, model="openai/gpt-4o-mini")
+
+        async def mock_call_llm(model, signature, **kwargs):
+            class MockResult:
+                response = "Hello there!"
+                objectives_complete = False
+                transition_to = "none"
+
+            return MockResult()
+
+        with (
+            patch("voicetest.engine.conversation.call_llm", side_effect=mock_call_llm),
+            collect_timings() as timings,
+        ):
+            await engine.add_user_message("Hi!")
+            await engine.advance()
+            await engine.add_user_message("Still there?")
+            await engine.advance()
+
+        agent_msgs = [m for m in engine.transcript if m.role == "assistant"]
+        assert all(set(m.metadata["timings"]) == {"transition", "response"} for m in agent_msgs)
+        spans = timings.snapshot()
+        assert spans["transition"].count == 2
+        assert spans["response"].count == 2
+
+    @pytest.mark.asyncio
+    async def test_add_user_message_with_timings(self, simple_graph):
+        engine = ConversationEngine(simple_graph, model="openai/gpt-4o-mini")
+
+        await engine.add_user_message("Hi!", timings={"simulator": 12.5})
+
+        assert engine.transcript[0].metadata == {
+            "node_id": "greeting",
+            "timings": {"simulator": 12.5},
+        }
+
     @pytest.mark.asyncio
     async def test_advance_handles_transition(self, simple_graph):
         """Test that advance handles node transitions."""
@@ -0,0 +1,58 @@
+"""Tests for voicetest.engine.forking module."""
+
+from voicetest.engine.forking import ConversationForks
+from voicetest.models.test_case import TestCase
+
+
+def _case(**dynamic_variables) -> TestCase:
+    return TestCase(name="test", user_prompt="Hello", dynamic_variables=dynamic_variables)
+
+
+def _opening(node: str = "greeting") -> dict:
+    return {"turns": 0, "engine": {"v": 1, "node": node, "transcript": [], "visited": [node]}}
+
+
+class TestConversationForks:
+    def test_no_fork_before_an_opening_is_recorded(self):
+        assert ConversationForks().fork(_case()) is None
+
+    def test_fork_shares_opening_between_same_variables(self):
+        forks = ConversationForks()
+        forks.record(_case(name="Jane", plan="gold"), _opening(), llm_calls=2)
+
+        checkpoint, llm_calls = forks.fork(_case(plan="gold", name="Jane"))
+
+        assert checkpoint == _opening()
+        assert llm_calls == 2
+        assert forks.fork(_case(name="John", plan="gold")) is None
+
+    def test_forks_are_independent_copies(self):
+        forks = ConversationForks()
+        forks.record(_case(), _opening(), llm_calls=1)
+
+        first, _ = forks.fork(_case())
+        first["engine"]["visited"].append("farewell")
+        second, _ = forks.fork(_case())
+
+        assert second["engine"]["visited"] == ["greeting"]
+
+    def test_only_first_opening_is_kept(self):
+        forks = ConversationForks()
+        forks.record(_case(), {**_opening("greeting"), "turns": 1}, llm_calls=4)
+        forks.record(_case(), _opening("greeting"), llm_calls=1)
+        forks.record(_case(), _opening("other"), llm_calls=1)
+
+        checkpoint, _ = forks.fork(_case())
+
+        assert checkpoint["engine"]["node"] == "greeting"
+
+    def test_llm_calls_saved_counts_each_fork(self):
+        forks = ConversationForks()
+        forks.record(_case(), _opening(), llm_calls=2)
+        forks.record(_case(lang="fr"), _opening(), llm_calls=3)
+
+        forks.fork(_case())
+        forks.fork(_case())
+        forks.fork(_case(lang="fr"))
+
+        assert forks.llm_calls_saved == 7
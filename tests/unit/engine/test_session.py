@@ -786,3 +786,63 @@ class TestPerTurnTimeout:
 
         assert state.end_reason == "max_turns"
         assert state.turn_count == 3
+
+
+class TestCheckpointResume:
+    """Conversations checkpoint after every turn and resume from a checkpoint."""
+
+    @staticmethod
+    def _simulator(*messages: str) -> UserSimulator:
+        simulator = UserSimulator("test", "mock-model")
+        simulator._mock_mode = True
+        simulator._mock_responses = [SimulatorResponse(message=m) for m in messages]
+        return simulator
+
+    @pytest.mark.asyncio
+    async def test_resume_continues_from_last_completed_turn(self, simple_graph):
+        options = RunOptions(max_turns=3)
+        test_case = TestCase(name="test", user_prompt="Hello")
+        llm_calls = 0
+
+        async def mock_call_llm(model, signature, **kwargs):
+            nonlocal llm_calls
+            llm_calls += 1
+
+            class MockResult:
+                response = "Sure."
+                objectives_complete = False
+                transition_to = "none"
+
+            return MockResult()
+
+        checkpoints: list[dict] = []
+        with patch("voicetest.engine.conversation.call_llm", side_effect=mock_call_llm):
+            full = await ConversationRunner(simple_graph, options=options).run(
+                test_case, self._simulator("one", "two", "three"), on_checkpoint=checkpoints.append
+            )
+        full_calls, llm_calls = llm_calls, 0
+
+        assert [c["turns"] for c in checkpoints] == [0, 1, 2, 3]
+
+        with patch("voicetest.engine.conversation.call_llm", side_effect=mock_call_llm):
+            resumed = await ConversationRunner(simple_graph, options=options).run(
+                test_case, self._simulator("three"), checkpoint=checkpoints[2]
+            )
+
+        assert resumed.turn_count == 3
+        assert resumed.end_reason == "max_turns"
+        assert [m.content for m in resumed.transcript] == [m.content for m in full.transcript]
+        assert llm_calls < full_calls
+
+    @pytest.mark.asyncio
+    async def test_resume_after_agent_ended(self, simple_graph):
+        engine = ConversationEngine(simple_graph, model="m")
+        engine._end_call_invoked = True
+        checkpoint = {"turns": 2, "engine": engine.snapshot()}
+
+        state = await ConversationRunner(simple_graph).run(
+            TestCase(name="test", user_prompt="Hello"), self._simulator(), checkpoint=checkpoint
+        )
+
+        assert state.end_reason == "agent_ended"
+        assert state.turn_count == 2
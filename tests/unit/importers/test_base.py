@@ -1,6 +1,9 @@
 """Tests for voicetest.importers.base module."""
 
+from pathlib import Path
+
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.importers.base import SourceImporter
 
 
@@ -24,3 +27,69 @@ class TestImporterInfo:
         assert info.source_type == "retell"
         assert info.description == "Import Retell Conversation Flow JSON"
         assert info.file_patterns == ["*.json"]
+
+
+class TestImportSource:
+    """Tests for the shared ImportSource representation."""
+
+    def test_dict_input(self):
+        config = {"nodes": {}}
+        source = ImportSource(config)
+
+        assert source.path is None
+        assert source.config is config
+        assert source.raw is None
+        assert source.content_hash is None
+        assert source.workbook is None
+
+    def test_json_file_read_once(self, tmp_path, monkeypatch):
+        path = tmp_path / "agent.json"
+        path.write_text('{"a": 1}')
+        source = ImportSource(str(path))
+
+        reads = []
+        real = Path.read_bytes
+        monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or real(self))
+
+        assert source.config == {"a": 1}
+        assert source.text == '{"a": 1}'
+        assert source.config is source.config
+        assert len(reads) == 1
+
+    def test_non_object_json_has_no_config(self, tmp_path):
+        path = tmp_path / "tests.json"
+        path.write_text("[1, 2]")
+
+        assert ImportSource(path).config is None
+
+    def test_missing_and_binary_files(self, tmp_path):
+        missing = ImportSource(tmp_path / "missing.json")
+        assert missing.raw is None
+        assert missing.config is None
+        assert missing.content_hash is None
+
+        binary = tmp_path / "blob.json"
+        binary.write_bytes(b"\xff\xfe\x00")
+        assert ImportSource(binary).text is None
+        assert ImportSource(binary).config is None
+
+    def test_workbook_only_for_spreadsheets(self, fixtures_dir):
+        xlsx = ImportSource(fixtures_dir / "xlsform" / "sample_survey.xlsx")
+        assert "survey" in xlsx.workbook.sheetnames
+        assert xlsx.config is None
+
+        json_source = ImportSource(fixtures_dir / "graphs" / "simple_graph.json")
+        assert json_source.workbook is None
+
+    def test_content_hash_depends_on_suffix_and_bytes(self, tmp_path):
+        a = tmp_path / "a.json"
+        b = tmp_path / "b.json"
+        c = tmp_path / "c.txt"
+        for path in (a, b, c):
+            path.write_text("{}")
+
+        assert ImportSource(a).content_hash == ImportSource(b).content_hash
+        assert ImportSource(a).content_hash != ImportSource(c).content_hash
+
+        b.write_text('{"x": 1}')
+        assert ImportSource(a).content_hash != ImportSource(b).content_hash
@@ -1,5 +1,7 @@
 """Tests for voicetest.importers.registry module."""
 
+import json
+
 import pytest
 
 from voicetest.importers.base import ImporterInfo
@@ -242,3 +244,107 @@ class TestGlobalRegistry:
 
         assert graph.source_type == "retell"
         assert graph.entry_node_id == "greeting"
+
+
+class TestSharedDetection:
+    """Auto-detection loads each input once and caches matches by content hash."""
+
+    @pytest.fixture
+    def registry(self, container):
+        return container.resolve(ImporterRegistry)
+
+    def test_file_parsed_once_across_probes_and_import(self, registry, fixtures_dir, monkeypatch):
+        calls = []
+        real_loads = json.loads
+        monkeypatch.setattr(json, "loads", lambda *a, **k: calls.append(1) or real_loads(*a, **k))
+
+        graph = registry.import_agent(fixtures_dir / "vapi" / "sample_squad.json")
+
+        assert graph.source_type == "vapi"
+        assert len(calls) == 1
+
+    def test_detection_cached_by_content_hash(self, registry, fixtures_dir, tmp_path):
+        path = tmp_path / "agent.json"
+        path.write_text((fixtures_dir / "retell" / "sample_config.json").read_text())
+        assert registry.auto_detect(path).source_type == "retell"
+
+        probes = []
+        retell = registry.get("retell")
+        original = retell.can_import_source
+        retell.can_import_source = lambda source: probes.append(source) or original(source)
+        try:
+            copy = tmp_path / "copy.json"
+            copy.write_bytes(path.read_bytes())
+            assert registry.auto_detect(copy).source_type == "retell"
+            assert probes == []
+
+            path.write_text((fixtures_dir / "graphs" / "simple_graph.json").read_text())
+            assert registry.auto_detect(path).source_type == "agentgraph"
+            assert len(probes) == 1
+        finally:
+            del retell.can_import_source
+
+    def test_cache_key_includes_suffix(self, registry, fixtures_dir, tmp_path):
+        content = (fixtures_dir / "graphs" / "simple_graph.json").read_bytes()
+        as_json = tmp_path / "graph.json"
+        as_txt = tmp_path / "graph.txt"
+        as_json.write_bytes(content)
+        as_txt.write_bytes(content)
+
+        assert registry.auto_detect(as_json).source_type == "agentgraph"
+        assert registry.auto_detect(as_txt) is None
+
+    def test_register_clears_detection_cache(self, fixtures_dir):
+        registry = ImporterRegistry()
+
+        class AnyJson:
+            def __init__(self, source_type):
+                self.source_type = source_type
+
+            def get_info(self) -> ImporterInfo:
+                return ImporterInfo(self.source_type, "", ["*.json"])
+
+            def can_import(self, path_or_config) -> bool:
+                return True
+
+            def import_agent(self, path_or_config) -> AgentGraph:
+                raise NotImplementedError
+
+        path = fixtures_dir / "graphs" / "simple_graph.json"
+        registry.register(AnyJson("first"))
+        assert registry.auto_detect(path).source_type == "first"
+
+        registry._importers.clear()
+        registry.register(AnyJson("second"))
+        assert registry.auto_detect(path).source_type == "second"
+
+    def test_plugin_without_source_probe_gets_original_input(self, tmp_path):
+        registry = ImporterRegistry()
+        seen = []
+
+        class PathOnly:
+            source_type = "path-only"
+
+            def get_info(self) -> ImporterInfo:
+                return ImporterInfo("path-only", "", ["*.json"])
+
+            def can_import(self, path_or_config) -> bool:
+                seen.append(path_or_config)
+                return True
+
+            def import_agent(self, path_or_config) -> AgentGraph:
+                seen.append(path_or_config)
+                return AgentGraph(
+                    nodes={
+                        "n": AgentNode(id="n", state_prompt="", node_type=NodeType.CONVERSATION)
+                    },
+                    entry_node_id="n",
+                    source_type="path-only",
+                )
+
+        path = tmp_path / "agent.json"
+        path.write_text("{}")
+        registry.register(PathOnly())
+        registry.import_agent(path)
+
+        assert seen == [path, path]
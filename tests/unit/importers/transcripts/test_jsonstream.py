@@ -0,0 +1,65 @@
+"""Tests for the incremental JSON record reader."""
+
+import io
+import json
+
+import pytest
+
+from voicetest.importers.transcripts.jsonstream import iter_json_records
+
+
+def _records(text: str, chunk_size: int = 4) -> list:
+    return list(iter_json_records(io.StringIO(text), chunk_size=chunk_size))
+
+
+class TestIterJsonRecords:
+    def test_array_elements_across_chunk_boundaries(self):
+        items = [{"id": i, "text": "x" * i} for i in range(20)]
+
+        assert _records(json.dumps(items, indent=2), chunk_size=3) == items
+
+    def test_numbers_split_at_chunk_edge(self):
+        assert _records("[1234567, 89, true, null]", chunk_size=3) == [1234567, 89, True, None]
+
+    def test_json_lines(self):
+        text = '{"a": 1}\n{"a": 2}\n\n{"a": 3}\n'
+
+        assert _records(text) == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+    def test_single_object(self):
+        assert _records('{"items": [1, 2]}') == [{"items": [1, 2]}]
+
+    @pytest.mark.parametrize("text", ["", "   \n", "[]", " [ ] "])
+    def test_empty_inputs(self, text):
+        assert _records(text) == []
+
+    def test_reads_incrementally(self):
+        items = [{"id": i, "pad": "x" * 100} for i in range(100)]
+        fp = io.StringIO(json.dumps(items))
+
+        records = iter_json_records(fp, chunk_size=256)
+        assert next(records) == items[0]
+        assert fp.tell() < 1024
+
+    @pytest.mark.parametrize(
+        "text",
+        ["not json", '[{"a": 1} {"a": 2}]', '[{"a": 1},', '[{"a": 1}] trailing', '{"a": 1'],
+    )
+    def test_malformed_input_raises(self, text):
+        with pytest.raises(ValueError, match="Not valid JSON"):
+            _records(text)
+
+    def test_malformed_record_fails_without_reading_on(self):
+        items = [{"id": i, "pad": "x" * 100} for i in range(1000)]
+        fp = io.StringIO('[{"id": oops}, ' + json.dumps(items)[1:])
+
+        with pytest.raises(ValueError, match="Not valid JSON"):
+            list(iter_json_records(fp, chunk_size=256))
+        assert fp.tell() < 1024
+
+    def test_record_over_size_limit_raises(self):
+        fp = io.StringIO('[{"text": "' + "x" * 10_000)
+
+        with pytest.raises(ValueError, match="longer than 1000 characters"):
+            list(iter_json_records(fp, chunk_size=64, max_record_size=1000))
+        assert fp.tell() < 4096
@@ -4,6 +4,7 @@ import json
 
 import pytest
 
+from voicetest.importers.transcripts.retell import iter_retell_file
 from voicetest.importers.transcripts.retell import parse_retell
 from voicetest.importers.transcripts.retell import parse_retell_file
 
@@ -169,3 +170,28 @@ class TestParseRetellFile:
 
         with pytest.raises(ValueError, match="Not valid JSON"):
             parse_retell_file(path)
+
+
+class TestIterRetellFile:
+    def test_json_lines_export(self, tmp_path, retell_call):
+        path = tmp_path / "calls.jsonl"
+        lines = [json.dumps(retell_call(f"call_{i}")) for i in range(3)]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        assert [r.test_name for r in iter_retell_file(path)] == ["call_0", "call_1", "call_2"]
+
+    def test_array_yields_before_reading_whole_file(self, tmp_path, retell_call):
+        path = tmp_path / "calls.json"
+        path.write_text(json.dumps([retell_call("first"), "broken"]) + " trailing garbage")
+
+        results = iter_retell_file(path, chunk_size=64)
+        assert next(results).test_name == "first"
+        with pytest.raises(ValueError, match="Not valid JSON"):
+            next(results)
+
+    def test_no_calls_raises_after_exhausting(self, tmp_path):
+        path = tmp_path / "empty.json"
+        path.write_text(json.dumps([{"unrelated": 1}]), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="No Retell call objects"):
+            list(iter_retell_file(path))
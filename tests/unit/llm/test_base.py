@@ -4,6 +4,8 @@ Covers centralized LLM call handling, cache salt behavior,
 and no-cache integration with RunOptions.
 """
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import dspy
@@ -11,16 +13,23 @@ import litellm
 import pytest
 
 from voicetest.engine.conversation import ConversationEngine
+from voicetest.exceptions import CacheMissError
 from voicetest.llm import _call_llm_sync
 from voicetest.llm import _invoke_callback
 from voicetest.llm import call_llm
+from voicetest.llm.base import _billed_usage
 from voicetest.llm.base import _create_lm
+from voicetest.llm.base import _in_flight
+from voicetest.llm.base import _served_from_cache
+from voicetest.llm.stats import collect_llm_stats
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import AgentNode
 from voicetest.models.agent import NodeType
 from voicetest.models.agent import Transition
 from voicetest.models.agent import TransitionCondition
 from voicetest.models.test_case import RunOptions
+from voicetest.settings import ModelPrice
+from voicetest.util.cache import strict_offline
 from voicetest.util.retry import RetryError
 
 
@@ -394,3 +403,273 @@ class TestConversationEngineNoCache:
             await engine._process_node()
 
         assert call_args[0]["no_cache"] is False
+
+
+class TestCallLlmStats:
+    """Test that call_llm reports per-role stats to the active collector."""
+
+    class DummySignature(dspy.Signature):
+        input: str = dspy.InputField()
+        output: str = dspy.OutputField()
+
+    @pytest.mark.asyncio
+    async def test_records_role_and_miss(self):
+        with (
+            patch("dspy.Predict.__call__", return_value=dspy.Prediction(output="ok")),
+            collect_llm_stats() as collector,
+        ):
+            await call_llm(
+                "openai/gpt-4o-mini",
+                self.DummySignature,
+                predictor_class=dspy.Predict,
+                role="judge",
+                input="test",
+            )
+
+        stats = collector.snapshot()
+        assert list(stats) == ["judge"]
+        assert stats["judge"].calls == 1
+        assert stats["judge"].cache_misses == 1
+        assert stats["judge"].latency_ms >= 0
+
+    @pytest.mark.asyncio
+    async def test_records_hit(self):
+        with (
+            patch("dspy.Predict.__call__", return_value=dspy.Prediction(output="ok")),
+            patch("voicetest.llm.base._served_from_cache", return_value=True),
+            collect_llm_stats() as collector,
+        ):
+            await call_llm(
+                "openai/gpt-4o-mini",
+                self.DummySignature,
+                predictor_class=dspy.Predict,
+                role="agent",
+                input="test",
+            )
+
+        assert collector.snapshot()["agent"].cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_no_cache_counts_as_bypassed(self):
+        with (
+            patch("dspy.Predict.__call__", return_value=dspy.Prediction(output="ok")),
+            collect_llm_stats() as collector,
+        ):
+            await call_llm(
+                "openai/gpt-4o-mini",
+                self.DummySignature,
+                predictor_class=dspy.Predict,
+                no_cache=True,
+                input="test",
+            )
+
+        stats = collector.snapshot()["other"]
+        assert stats.cache_bypassed == 1
+        assert stats.cache_hits == stats.cache_misses == 0
+
+    @pytest.mark.asyncio
+    async def test_no_cache_rejected_in_strict_offline(self):
+        with strict_offline(), pytest.raises(CacheMissError, match="bypasses the cache"):
+            await call_llm(
+                "openai/gpt-4o-mini",
+                self.DummySignature,
+                predictor_class=dspy.Predict,
+                no_cache=True,
+                input="test",
+            )
+
+    @pytest.mark.asyncio
+    async def test_no_collector_is_noop(self):
+        with patch("dspy.Predict.__call__", return_value=dspy.Prediction(output="ok")):
+            result = await call_llm(
+                "openai/gpt-4o-mini",
+                self.DummySignature,
+                predictor_class=dspy.Predict,
+                input="test",
+            )
+        assert result.output == "ok"
+
+
+class TestServedFromCache:
+    """Test cache-hit detection from LM history."""
+
+    def _lm_with_history(self, *hits):
+        lm = _create_lm("openai/gpt-4o-mini")
+        lm.history = [{"response": SimpleNamespace(cache_hit=hit)} for hit in hits]
+        return lm
+
+    def test_all_entries_cached(self):
+        assert _served_from_cache(self._lm_with_history(True, True)) is True
+
+    def test_any_entry_uncached(self):
+        assert _served_from_cache(self._lm_with_history(True, False)) is False
+
+    def test_empty_history(self):
+        assert _served_from_cache(self._lm_with_history()) is False
+
+    def test_none_lm(self):
+        assert _served_from_cache(None) is False
+
+
+class TestBilledUsage:
+    """Test token and cost extraction from LM history."""
+
+    class Signature(dspy.Signature):
+        input: str = dspy.InputField()
+        output: str = dspy.OutputField()
+
+    def _entry(self, cache_hit, prompt_tokens, completion_tokens, cost):
+        return {
+            "response": SimpleNamespace(cache_hit=cache_hit),
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens},
+            "cost": cost,
+        }
+
+    def test_sums_uncached_entries(self):
+        lm = _create_lm("openai/gpt-4o-mini")
+        lm.history = [
+            self._entry(False, 100, 10, 0.01),
+            self._entry(True, 100, 10, 0.01),
+            self._entry(False, 50, 5, None),
+        ]
+
+        assert _billed_usage(lm) == (150, 15, 0.01)
+
+    def test_no_reported_cost(self):
+        lm = _create_lm("openai/gpt-4o-mini")
+        lm.history = [self._entry(False, 100, 10, None)]
+
+        assert _billed_usage(lm) == (100, 10, None)
+
+    def test_none_lm(self):
+        assert _billed_usage(None) == (0, 0, None)
+
+    @pytest.mark.asyncio
+    async def test_call_llm_records_priced_usage(self):
+        with collect_llm_stats(
+            {"mock/priced": ModelPrice(input_per_mtok=1.0, output_per_mtok=2.0)}
+        ) as collector:
+            await call_llm(
+                "mock/priced",
+                self.Signature,
+                predictor_class=dspy.Predict,
+                no_cache=True,
+                role="agent",
+                input="how much does this cost",
+            )
+
+        stats = collector.snapshot()["agent"]
+        assert stats.prompt_tokens > 0
+        assert stats.completion_tokens > 0
+        expected = (stats.prompt_tokens + 2 * stats.completion_tokens) / 1e6
+        assert stats.cost_usd == round(expected, 6)
+
+
+class TestSingleFlight:
+    """Test that concurrent identical call_llm requests share one provider call."""
+
+    class DummySignature(dspy.Signature):
+        input: str = dspy.InputField()
+        output: str = dspy.OutputField()
+
+    @pytest.fixture
+    def dispatch(self):
+        """Patch the provider call with a gated fake that counts invocations."""
+        state = SimpleNamespace(calls=0, gate=asyncio.Event(), error=None)
+
+        async def fake_dispatch(*args, **kwargs):
+            state.calls += 1
+            await state.gate.wait()
+            if state.error:
+                raise state.error
+            return dspy.Prediction(output=f"ok {kwargs['input']}")
+
+        with patch("voicetest.llm.base._dispatch_llm_call", side_effect=fake_dispatch):
+            yield state
+
+    def _call(self, input="test", **kwargs):
+        return call_llm(
+            "openai/gpt-4o-mini",
+            self.DummySignature,
+            predictor_class=dspy.Predict,
+            role="agent",
+            input=input,
+            **kwargs,
+        )
+
+    async def _release(self, dispatch, *calls):
+        """Start every call, let them reach the provider, then let it respond."""
+        tasks = [asyncio.ensure_future(c) for c in calls]
+        await asyncio.sleep(0)
+        dispatch.gate.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_request(self, dispatch):
+        with collect_llm_stats() as collector:
+            results = await self._release(dispatch, self._call(), self._call(), self._call())
+
+        assert dispatch.calls == 1
+        assert [r.output for r in results] == ["ok test"] * 3
+        stats = collector.snapshot()["agent"]
+        assert stats.calls == 3
+        assert stats.cache_misses == 1
+        assert stats.cache_hits == stats.coalesced == 2
+        assert not _in_flight.get(asyncio.get_running_loop())
+
+    @pytest.mark.asyncio
+    async def test_different_inputs_are_not_shared(self, dispatch):
+        await self._release(dispatch, self._call("a"), self._call("b"))
+        assert dispatch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_different_salts_are_not_shared(self, dispatch):
+        await self._release(dispatch, self._call(cache_salt="x"), self._call(cache_salt="y"))
+        assert dispatch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_no_cache_is_never_shared(self, dispatch):
+        await self._release(dispatch, self._call(no_cache=True), self._call(no_cache=True))
+        assert dispatch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_shared(self, dispatch):
+        dispatch.gate.set()
+        await self._call()
+        await self._call()
+        assert dispatch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared(self, dispatch):
+        dispatch.error = RuntimeError("provider down")
+        results = await self._release(dispatch, self._call(), self._call())
+
+        assert dispatch.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_off_to_joined_caller(self, dispatch):
+        leader = asyncio.create_task(self._call())
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(self._call())
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        results = await self._release(dispatch, leader, follower)
+
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1].output == "ok test"
+        assert dispatch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_joined_streaming_caller_receives_full_text(self, dispatch):
+        tokens = []
+        results = await self._release(
+            dispatch,
+            self._call(on_token=lambda t: None, stream_field="output"),
+            self._call(on_token=tokens.append, stream_field="output"),
+        )
+
+        assert dispatch.calls == 1
+        assert results[1].output == "ok test"
+        assert tokens == ["ok test"]
@@ -129,6 +129,35 @@ class TestClaudeCodeLMCall:
             assert len(result) == 1
             assert result[0]["text"] == "The answer is 4."
 
+    def test_records_cli_usage(self):
+        """Token counts and cost from the CLI JSON are kept for call_llm."""
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = json.dumps(
+            {
+                "result": "4",
+                "usage": {
+                    "input_tokens": 10,
+                    "cache_creation_input_tokens": 200,
+                    "cache_read_input_tokens": 1000,
+                    "output_tokens": 5,
+                },
+                "total_cost_usd": 0.0125,
+            }
+        )
+
+        with (
+            patch("shutil.which", return_value="/usr/local/bin/claude"),
+            patch("subprocess.run", return_value=mock_result),
+        ):
+            lm = ClaudeCodeLM(cache=False)
+            lm("What is 2+2?")
+
+        assert lm._voicetest_usage == [
+            {"prompt_tokens": 1210, "completion_tokens": 5, "cost": 0.0125}
+        ]
+
     def test_raises_on_nonzero_exit_code(self):
         """Should raise RuntimeError when CLI returns non-zero exit code with invalid JSON."""
 
@@ -0,0 +1,285 @@
+"""Tests for the mock/ LLM provider."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import dspy
+from dspy.utils.exceptions import AdapterParseError
+import litellm
+import pytest
+
+from voicetest.engine.modules import ConversationModule
+from voicetest.judges.flow import FlowValidationSignature
+from voicetest.judges.metric import MetricJudgeSignature
+from voicetest.llm import call_llm
+from voicetest.llm.base import _create_lm
+from voicetest.llm.base import _served_from_cache
+from voicetest.llm.mock import MockLM
+from voicetest.llm.mock import parse_mock_model
+from voicetest.models.agent import AgentGraph
+from voicetest.models.agent import AgentNode
+from voicetest.models.agent import NodeType
+from voicetest.models.agent import Transition
+from voicetest.models.agent import TransitionCondition
+from voicetest.simulator.user_sim import UserSimSignature
+
+
+SIM_INPUTS = {
+    "persona": "Caller wanting to book an appointment",
+    "conversation_history": "(conversation not started)",
+    "current_agent_message": "Hello, how can I help?",
+    "turn_number": 1,
+}
+
+
+@pytest.fixture
+def no_retry_sleep():
+    async def skip(_delay):
+        pass
+
+    with patch("voicetest.util.retry.asyncio.sleep", side_effect=skip):
+        yield
+
+
+@pytest.fixture
+def graph() -> AgentGraph:
+    return AgentGraph(
+        nodes={
+            "greeting": AgentNode(
+                id="greeting",
+                state_prompt="Greet the caller.",
+                node_type=NodeType.CONVERSATION,
+                transitions=[
+                    Transition(
+                        target_node_id="booking",
+                        condition=TransitionCondition(
+                            type="llm_prompt", value="Caller wants to book"
+                        ),
+                    )
+                ],
+            ),
+            "booking": AgentNode(
+                id="booking", state_prompt="Book the appointment.", node_type=NodeType.END
+            ),
+        },
+        entry_node_id="greeting",
+        source_type="custom",
+    )
+
+
+async def _call(model: str, signature: type, predictor_class=dspy.Predict, **inputs):
+    return await call_llm(
+        model, signature, no_cache=True, predictor_class=predictor_class, **inputs
+    )
+
+
+class TestParseMockModel:
+    def test_name_only(self):
+        assert parse_mock_model("mock/fast") == ("fast", {})
+
+    def test_typed_options(self):
+        name, options = parse_mock_model("mock/flaky?seed=7&latency_ms=120.5&rate_limit=0.1")
+        assert name == "flaky"
+        assert options == {"seed": 7, "latency_ms": 120.5, "rate_limit": 0.1}
+
+    def test_unknown_option(self):
+        with pytest.raises(ValueError, match="Unknown mock model option 'latency'"):
+            parse_mock_model("mock/x?latency=5")
+
+    def test_bad_value(self):
+        with pytest.raises(ValueError, match="Invalid value for mock model option 'seed'"):
+            parse_mock_model("mock/x?seed=abc")
+
+    def test_create_lm_resolves_prefix(self):
+        lm = _create_lm("mock/fast?seed=3", cache_salt="abc", no_cache=True)
+        assert isinstance(lm, MockLM)
+        assert lm.seed == 3
+        assert lm.cache is False
+        assert lm.kwargs["metadata"] == {"_cache_salt": "abc"}
+
+
+class TestMockOutputs:
+    """Every voicetest signature gets a parseable, correctly typed result."""
+
+    async def test_simulator(self):
+        result = await _call("mock/x", UserSimSignature, **SIM_INPUTS)
+        assert isinstance(result.message, str) and result.message
+
+    async def test_metric(self):
+        result = await _call("mock/x", MetricJudgeSignature, transcript="t", criterion="c")
+        assert 0.0 <= result.score <= 1.0
+        assert 0.0 <= result.confidence <= 1.0
+        assert isinstance(result.analysis, str)
+
+    async def test_flow_with_chain_of_thought(self):
+        result = await _call(
+            "mock/x",
+            FlowValidationSignature,
+            predictor_class=dspy.ChainOfThought,
+            graph_structure="g",
+            transcript="t",
+            nodes_visited=["greeting"],
+        )
+        assert isinstance(result.flow_valid, bool)
+        assert result.issues == []
+        assert result.reasoning
+
+    async def test_response(self, graph):
+        module = ConversationModule(graph)
+        signature = module.get_state_module("greeting").create_response_signature("Greet.")
+        result = await _call(
+            "mock/x",
+            signature,
+            general_instructions="",
+            conversation_history="",
+            user_message="hi",
+        )
+        assert result.response
+
+    async def test_transition_targets_available_transition(self, graph):
+        module = ConversationModule(graph)
+        targets = set()
+        for seed in range(8):
+            result = await _call(
+                f"mock/x?seed={seed}",
+                module._transition_signature,
+                predictor_class=dspy.ChainOfThought,
+                current_state_prompt="Greet the caller.",
+                conversation_history="USER: I'd like to book",
+                last_agent_message="Hello",
+                available_transitions=module.format_transitions("greeting"),
+            )
+            assert str(result.objectives_complete) in ("True", "False")
+            if str(result.objectives_complete) == "False":
+                assert result.transition_to == "none"
+            targets.add(result.transition_to)
+        assert targets <= {"booking", "none"}
+        assert "booking" in targets
+
+    async def test_extract(self):
+        signature = type(
+            "ExtractVariables",
+            (dspy.Signature,),
+            {
+                "__doc__": "Extract.",
+                "user_message": dspy.InputField(),
+                "name": dspy.OutputField(desc="Caller name"),
+                "age": dspy.OutputField(desc="Caller age", type=int),
+            },
+        )
+        result = await _call("mock/x", signature, user_message="I'm Sam")
+        assert isinstance(result.name, str)
+        assert result.age is not None
+
+
+class TestMockDeterminism:
+    async def test_same_request_same_output(self):
+        first = await _call("mock/x?seed=1", UserSimSignature, **SIM_INPUTS)
+        second = await _call("mock/x?seed=1", UserSimSignature, **SIM_INPUTS)
+        assert first.message == second.message
+
+    async def test_seed_changes_output(self):
+        first = await _call("mock/x?seed=1", UserSimSignature, **SIM_INPUTS)
+        second = await _call("mock/x?seed=2", UserSimSignature, **SIM_INPUTS)
+        assert first.message != second.message
+
+
+class TestMockLatencyAndStreaming:
+    async def test_latency(self):
+        start = time.perf_counter()
+        await _call("mock/x?latency_ms=60", UserSimSignature, **SIM_INPUTS)
+        assert time.perf_counter() - start >= 0.06
+
+    async def test_streams_tokens(self):
+        tokens: list[str] = []
+        result = await call_llm(
+            "mock/x?token_ms=1",
+            UserSimSignature,
+            on_token=tokens.append,
+            stream_field="message",
+            no_cache=True,
+            predictor_class=dspy.Predict,
+            **SIM_INPUTS,
+        )
+        assert len(tokens) > 1
+        assert "".join(tokens).strip() == result.message
+
+
+class TestMockErrorInjection:
+    MESSAGES = [{"role": "user", "content": "hi"}]
+
+    def test_rate_limit(self):
+        lm = MockLM("mock/x?rate_limit=1", cache=False)
+        with pytest.raises(litellm.RateLimitError):
+            lm(messages=self.MESSAGES)
+
+    def test_timeout(self):
+        lm = MockLM("mock/x?timeout=1", cache=False)
+        with pytest.raises(litellm.Timeout):
+            lm(messages=self.MESSAGES)
+
+    def test_parse_error(self):
+        lm = MockLM("mock/x?parse_error=1", cache=False)
+        with (
+            dspy.context(lm=lm, adapter=lm.preferred_adapter),
+            pytest.raises(AdapterParseError),
+        ):
+            dspy.Predict(UserSimSignature)(**SIM_INPUTS)
+
+    async def test_parse_error_is_not_cached(self, no_retry_sleep, monkeypatch):
+        monkeypatch.setattr(
+            dspy,
+            "cache",
+            dspy.clients.cache.Cache(
+                enable_disk_cache=False, enable_memory_cache=True, disk_cache_dir=None
+            ),
+        )
+        for seed in (1, 4, 5):
+            errors = []
+            result = await call_llm(
+                f"mock/x?seed={seed}&parse_error=0.5",
+                UserSimSignature,
+                on_error=errors.append,
+                predictor_class=dspy.Predict,
+                **SIM_INPUTS,
+            )
+            assert result.message
+
+        # The successful completion is cached, the unparseable ones are not.
+        errors = []
+        await call_llm(
+            "mock/x?seed=1&parse_error=0.5",
+            UserSimSignature,
+            on_error=errors.append,
+            predictor_class=dspy.Predict,
+            **SIM_INPUTS,
+        )
+        assert errors == []
+
+    async def test_retry_draws_a_fresh_outcome(self, no_retry_sleep):
+        errors = []
+        result = await call_llm(
+            "mock/x?seed=5&rate_limit=0.5",
+            UserSimSignature,
+            on_error=errors.append,
+            no_cache=True,
+            predictor_class=dspy.Predict,
+            **SIM_INPUTS,
+        )
+        assert result.message
+        assert [e.error_type for e in errors] == ["RateLimitError"]
+
+    async def test_concurrent_calls_are_independent(self):
+        results = await asyncio.gather(
+            *(
+                _call(f"mock/x?seed={i}&latency_ms=20", UserSimSignature, **SIM_INPUTS)
+                for i in range(5)
+            )
+        )
+        assert len({r.message for r in results}) == 5
+
+    def test_cache_hit_flag(self):
+        lm = MockLM("mock/x", cache=False)
+        lm(messages=self.MESSAGES)
+        assert _served_from_cache(lm) is False
@@ -0,0 +1,83 @@
+"""Tests for voicetest.llm.stats module."""
+
+from voicetest.llm.stats import LLMStatsCollector
+from voicetest.llm.stats import collect_llm_stats
+from voicetest.llm.stats import record_llm_call
+from voicetest.settings import ModelPrice
+
+
+class TestLLMStatsCollector:
+    def test_counts_hits_misses_and_bypassed(self):
+        collector = LLMStatsCollector()
+        collector.record("agent", True, 1.0)
+        collector.record("agent", False, 200.0)
+        collector.record("agent", None, 150.0)
+        collector.record("judge", True, 2.0)
+
+        stats = collector.snapshot()
+        assert stats["agent"].calls == 3
+        assert stats["agent"].cache_hits == 1
+        assert stats["agent"].cache_misses == 1
+        assert stats["agent"].cache_bypassed == 1
+        assert stats["agent"].latency_ms == 351.0
+        assert stats["agent"].hit_rate == 0.5
+        assert stats["judge"].hit_rate == 1.0
+
+    def test_coalesced_counts_as_hit(self):
+        collector = LLMStatsCollector()
+        collector.record("agent", True, 1.0, coalesced=True)
+        collector.record("agent", True, 1.0)
+
+        stats = collector.snapshot()["agent"]
+        assert stats.cache_hits == 2
+        assert stats.coalesced == 1
+
+    def test_tokens_priced_from_table(self):
+        collector = LLMStatsCollector(
+            {"openai/gpt-4o": ModelPrice(input_per_mtok=2.5, output_per_mtok=10.0)}
+        )
+        collector.record(
+            "agent",
+            False,
+            1.0,
+            model="openai/gpt-4o",
+            prompt_tokens=1000,
+            completion_tokens=100,
+            provider_cost=1.0,
+        )
+        collector.record(
+            "judge", False, 1.0, model="other/model", prompt_tokens=10, provider_cost=0.5
+        )
+        collector.record("judge", True, 1.0, model="other/model")
+
+        stats = collector.snapshot()
+        assert stats["agent"].prompt_tokens == 1000
+        assert stats["agent"].completion_tokens == 100
+        assert stats["agent"].cost_usd == 0.0035
+        assert stats["judge"].cost_usd == 0.5
+
+    def test_snapshot_is_a_copy(self):
+        collector = LLMStatsCollector()
+        collector.record("agent", True, 1.0)
+        snapshot = collector.snapshot()
+        collector.record("agent", True, 1.0)
+        assert snapshot["agent"].calls == 1
+
+
+class TestCollectLLMStats:
+    def test_records_inside_block_only(self):
+        record_llm_call("agent", True, 1.0)
+        with collect_llm_stats() as collector:
+            record_llm_call("agent", False, 5.0)
+        record_llm_call("agent", True, 1.0)
+
+        assert collector.snapshot()["agent"].calls == 1
+
+    def test_nested_blocks_are_independent(self):
+        with collect_llm_stats() as outer:
+            record_llm_call("agent", True, 1.0)
+            with collect_llm_stats() as inner:
+                record_llm_call("judge", True, 1.0)
+
+        assert list(outer.snapshot()) == ["agent"]
+        assert list(inner.snapshot()) == ["judge"]
@@ -1,6 +1,7 @@
 """Tests for voicetest.services.agents module."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -159,7 +160,7 @@ class TestLoadAndSaveGraph:
             "source_metadata": {},
         }
         created = svc.create_agent(name="Save Agent", config=config)
-        agent, graph = svc.load_graph(created["id"])
+        agent, graph = svc.load_graph(created["id"], copy=True)
         graph.nodes["main"].state_prompt = "Updated prompt."
         svc.save_graph(created["id"], agent, graph)
 
@@ -167,6 +168,90 @@ class TestLoadAndSaveGraph:
         assert reloaded.nodes["main"].state_prompt == "Updated prompt."
 
 
+_STORED_CONFIG = {
+    "source_type": "custom",
+    "entry_node_id": "main",
+    "nodes": {
+        "main": {
+            "id": "main",
+            "state_prompt": "Original prompt.",
+            "node_type": "conversation",
+            "transitions": [],
+        }
+    },
+    "source_metadata": {},
+}
+
+
+class TestGraphCache:
+    def test_stored_graph_parsed_once(self, svc):
+        created = svc.create_agent(name="Cached", config=_STORED_CONFIG)
+
+        with patch.object(svc._repo, "load_graph", wraps=svc._repo.load_graph) as load:
+            _, first = svc.load_graph(created["id"])
+            _, second = svc.load_graph(created["id"])
+
+        assert first is second
+        assert load.call_count == 1
+
+    def test_stored_graph_reloaded_after_update(self, svc):
+        created = svc.create_agent(name="Cached", config=_STORED_CONFIG)
+        svc.load_graph(created["id"])
+
+        svc.update_prompt(created["id"], "Changed.", node_id="main")
+
+        _, graph = svc.load_graph(created["id"])
+        assert graph.nodes["main"].state_prompt == "Changed."
+
+    def test_copy_is_independent_of_cache(self, svc):
+        created = svc.create_agent(name="Cached", config=_STORED_CONFIG)
+
+        _, copied = svc.load_graph(created["id"], copy=True)
+        copied.nodes["main"].state_prompt = "Scratch edit."
+
+        _, shared = svc.load_graph(created["id"])
+        assert copied is not shared
+        assert shared.nodes["main"].state_prompt == "Original prompt."
+
+    def test_mutators_leave_shared_graph_untouched(self, svc):
+        created = svc.create_agent(name="Cached", config=_STORED_CONFIG)
+        _, before = svc.load_graph(created["id"])
+
+        svc.update_metadata(created["id"], {"general_prompt": "New."})
+
+        assert "general_prompt" not in before.source_metadata
+
+    def test_linked_graph_reimported_only_on_change(self, svc, custom_config_path):
+        created = svc.create_agent(name="Linked", path=str(custom_config_path))
+        importers = svc._importers
+
+        with patch.object(importers, "import_agent", wraps=importers.import_agent) as imp:
+            svc.load_graph(created["id"])
+            svc.load_graph(created["id"])
+            assert imp.call_count == 1
+
+            data = json.loads(custom_config_path.read_text())
+            data["nodes"]["main"]["state_prompt"] = "Edited on disk, longer than before."
+            custom_config_path.write_text(json.dumps(data))
+            _, graph = svc.load_graph(created["id"])
+
+        assert imp.call_count == 2
+        assert graph.nodes["main"].state_prompt == "Edited on disk, longer than before."
+
+    def test_linked_etag_tracks_file_version(self, svc, custom_config_path):
+        created = svc.create_agent(name="Linked", path=str(custom_config_path))
+        _graph, etag, _ = svc.get_graph_with_etag(created["id"])
+
+        graph, same_etag, not_modified = svc.get_graph_with_etag(created["id"], etag)
+        assert (graph, same_etag, not_modified) == (None, etag, True)
+
+        custom_config_path.write_text(custom_config_path.read_text() + "\n")
+        graph, new_etag, not_modified = svc.get_graph_with_etag(created["id"], etag)
+        assert new_etag != etag
+        assert not not_modified
+        assert isinstance(graph, AgentGraph)
+
+
 class TestSaveGraphLinkedRetellCF:
     """Saving a linked Retell CF agent writes back via the retell-cf exporter."""
 
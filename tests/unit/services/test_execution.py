@@ -1,7 +1,12 @@
 """Tests for voicetest.services.testing.execution module."""
 
+from unittest.mock import patch
+
+import dspy
 import pytest
 
+from voicetest.engine.forking import ConversationForks
+from voicetest.llm.stats import record_llm_call
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import AgentNode
 from voicetest.models.agent import GlobalMetric
@@ -10,9 +15,12 @@ from voicetest.models.agent import NodeType
 from voicetest.models.results import Message
 from voicetest.models.results import TestResult
 from voicetest.models.results import TestRun
+from voicetest.models.test_case import RunOptions
 from voicetest.models.test_case import TestCase
 from voicetest.services.settings import SettingsService
 from voicetest.services.testing.execution import TestExecutionService
+from voicetest.util.cache import bounded_disk_cache
+from voicetest.util.timing import timed
 
 
 @pytest.fixture
@@ -78,6 +86,88 @@ class TestRunTest:
         assert result.models_used is not None
         assert result.models_used.agent is not None
 
+    @pytest.mark.asyncio
+    async def test_llm_stats_collected_per_test(self, svc, graph, test_case):
+        original = svc._run_test
+
+        async def run_with_calls(*args, **kwargs):
+            record_llm_call("agent", True, 5.0)
+            record_llm_call("judge", False, 20.0)
+            return await original(*args, **kwargs)
+
+        with patch.object(svc, "_run_test", side_effect=run_with_calls):
+            result = await svc.run_test(graph, test_case, _mock_mode=True)
+
+        assert result.llm_stats["agent"].cache_hits == 1
+        assert result.llm_stats["judge"].cache_misses == 1
+
+        # Stats from one test do not leak into the next.
+        result = await svc.run_test(graph, test_case, _mock_mode=True)
+        assert result.llm_stats == {}
+
+    @pytest.mark.asyncio
+    async def test_timings_collected_per_test(self, svc, graph, test_case):
+        original = svc._run_test
+
+        async def run_with_span(*args, **kwargs):
+            with timed("response"):
+                pass
+            return await original(*args, **kwargs)
+
+        with patch.object(svc, "_run_test", side_effect=run_with_span):
+            result = await svc.run_test(graph, test_case, _mock_mode=True)
+
+        assert result.timings["response"].count == 1
+
+        result = await svc.run_test(graph, test_case, _mock_mode=True)
+        assert "response" not in result.timings
+
+    @pytest.mark.asyncio
+    async def test_strict_offline_miss_is_an_error(self, svc, graph, test_case, tmp_path):
+        original = dspy.cache
+        dspy.cache = bounded_disk_cache(tmp_path)
+        try:
+            options = RunOptions(
+                agent_model="openai/gpt-4o-mini",
+                simulator_model="openai/gpt-4o-mini",
+                judge_model="openai/gpt-4o-mini",
+                max_turns=1,
+                strict_offline=True,
+            )
+            result = await svc.run_test(graph, test_case, options)
+        finally:
+            dspy.cache = original
+
+        assert result.status == "error"
+        assert "Strict offline" in result.error_message
+
+    @pytest.mark.asyncio
+    async def test_forks_share_opening_between_tests(self, svc, graph):
+        checkpoints = []
+
+        async def run_recording_opening(*args, checkpoint=None, on_checkpoint=None, **kwargs):
+            checkpoints.append(checkpoint)
+            if checkpoint is None:
+                record_llm_call("agent", None, 5.0)
+                record_llm_call("agent", True, 1.0)
+                await on_checkpoint({"turns": 0, "engine": {"node": "main"}})
+                await on_checkpoint({"turns": 1, "engine": {"node": "main"}})
+            return TestResult(test_name="t", status="pass")
+
+        forks = ConversationForks()
+        cases = [
+            TestCase(name="a", user_prompt="Hi"),
+            TestCase(name="b", user_prompt="Bye"),
+            TestCase(name="c", user_prompt="Hi", dynamic_variables={"name": "Jane"}),
+        ]
+        with patch.object(svc, "_run_test", side_effect=run_recording_opening):
+            results = [await svc.run_test(graph, case, forks=forks) for case in cases]
+
+        assert checkpoints == [None, {"turns": 0, "engine": {"node": "main"}}, None]
+        assert [r.llm_calls_saved for r in results] == [0, 1, 0]
+        assert results[1].llm_stats == {}
+        assert forks.llm_calls_saved == 1
+
 
 class TestRunTests:
     @pytest.mark.asyncio
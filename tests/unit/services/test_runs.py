@@ -1,12 +1,21 @@
 """Tests for voicetest.services.runs module."""
 
+from datetime import UTC
+from datetime import datetime
+
+import pyarrow.dataset as ds
 import pytest
+from sqlalchemy.orm import Session
 
 from voicetest.models.agent import AgentGraph
 from voicetest.models.results import Message
+from voicetest.models.results import TestResult
+from voicetest.models.results import TestRun
 from voicetest.models.test_case import RunOptions
 from voicetest.services.agents import AgentService
 from voicetest.services.runs import RunService
+from voicetest.settings import Settings
+from voicetest.storage.models import Run
 
 
 @pytest.fixture
@@ -53,6 +62,24 @@ class TestCreateRun:
         assert run["completed_at"] is None
 
 
+class TestSaveRun:
+    def test_keeps_run_id_and_start(self, agent_id, svc):
+        started = datetime(2026, 3, 1, 9, 0, tzinfo=UTC)
+        run = TestRun(
+            run_id="cli-run",
+            started_at=started,
+            completed_at=datetime(2026, 3, 1, 9, 5, tzinfo=UTC),
+            results=[TestResult(test_name="t", status="pass")],
+        )
+
+        svc.save_run(agent_id, run)
+
+        saved = svc.get_run("cli-run")
+        assert saved["started_at"].startswith("2026-03-01T09:00:00")
+        assert saved["completed_at"] is not None
+        assert [r["test_name"] for r in saved["results"]] == ["t"]
+
+
 class TestListRuns:
     def test_empty(self, agent_id, svc):
         assert svc.list_runs(agent_id) == []
@@ -136,6 +163,106 @@ class TestImportCalls:
         assert run["completed_at"] is not None
         assert run["results"] == []
 
+    def test_streams_in_batches_with_progress(self, agent_id, imported_test_result, svc):
+        progress = []
+        results = (imported_test_result(f"call_{i}") for i in range(5))
+
+        run = svc.import_calls(agent_id, results, batch_size=2, on_progress=progress.append)
+
+        assert progress == [2, 4, 5]
+        assert run["imported"] == 5
+        assert len(run["results"]) == 5
+
+    def test_include_results_false_returns_record_only(self, agent_id, imported_test_result, svc):
+        run = svc.import_calls(agent_id, [imported_test_result("a")], include_results=False)
+
+        assert run["imported"] == 1
+        assert run["completed_at"] is not None
+        assert "results" not in run
+        assert len(svc.get_run(run["id"])["results"]) == 1
+
+    def test_source_error_deletes_partial_run(self, agent_id, imported_test_result, svc):
+        def results():
+            yield imported_test_result("a")
+            yield imported_test_result("b")
+            raise ValueError("Not valid JSON: truncated")
+
+        with pytest.raises(ValueError, match="truncated"):
+            svc.import_calls(agent_id, results(), batch_size=1)
+
+        assert svc.list_runs(agent_id) == []
+
+    def test_rejects_non_positive_batch_size(self, agent_id, svc):
+        with pytest.raises(ValueError, match="batch_size"):
+            svc.import_calls(agent_id, [], batch_size=0)
+
+
+class TestExportAndArchive:
+    def _old_run(self, svc, container, agent_id, imported_test_result) -> str:
+        run = svc.import_calls(agent_id, [imported_test_result("old_call")])
+        session = container.resolve(Session)
+        session.get(Run, run["id"]).started_at = datetime(2020, 1, 1, tzinfo=UTC)
+        session.commit()
+        return run["id"]
+
+    def test_export_agent_runs(self, agent_id, imported_test_result, svc, tmp_path):
+        svc.import_calls(agent_id, [imported_test_result("a"), imported_test_result("b")])
+
+        summary = svc.export_runs(tmp_path / "out", agent_id=agent_id, batch_size=1)
+
+        assert (summary["runs"], summary["results"], summary["messages"]) == (1, 2, 4)
+        assert (tmp_path / "out" / "messages" / f"agent_id={agent_id}").is_dir()
+
+    def test_export_requires_selection(self, svc, tmp_path):
+        with pytest.raises(ValueError, match="run_ids or agent_id"):
+            svc.export_runs(tmp_path)
+
+    def test_archive_moves_only_old_runs(
+        self, agent_id, imported_test_result, svc, container, tmp_path
+    ):
+        old_id = self._old_run(svc, container, agent_id, imported_test_result)
+        recent = svc.import_calls(agent_id, [imported_test_result("new_call")])
+
+        summary = svc.archive_runs(30, tmp_path / "archive")
+
+        assert summary["runs"] == 1
+        assert summary["results"] == 1
+        assert svc.get_run(old_id) is None
+        assert svc.get_run(recent["id"]) is not None
+        assert list((tmp_path / "archive" / "results").rglob("*.parquet"))
+
+    def test_archive_keeps_runs_without_results(self, agent_id, svc, container, tmp_path):
+        run = svc.create_run(agent_id)
+        svc.complete(run["id"])
+        session = container.resolve(Session)
+        session.get(Run, run["id"]).started_at = datetime(2020, 1, 1, tzinfo=UTC)
+        session.commit()
+
+        summary = svc.archive_runs(30, tmp_path / "archive")
+
+        assert (summary["runs"], summary["results"]) == (1, 0)
+        assert svc.get_run(run["id"]) is None
+        table = ds.dataset(tmp_path / "archive" / "runs", partitioning="hive").to_table()
+        assert table.column("run_id").to_pylist() == [run["id"]]
+
+    def test_archive_uses_settings_retention(
+        self, agent_id, imported_test_result, svc, container, tmp_path
+    ):
+        (tmp_path / ".voicetest").mkdir()
+        archive_dir = tmp_path / "configured"
+        Settings(archive={"retention_days": 7, "directory": str(archive_dir)}).save()
+        old_id = self._old_run(svc, container, agent_id, imported_test_result)
+
+        summary = svc.archive_runs()
+
+        assert summary["output_dir"] == str(archive_dir)
+        assert svc.get_run(old_id) is None
+
+    def test_archive_without_retention_raises(self, svc, tmp_path):
+        (tmp_path / ".voicetest").mkdir()
+        with pytest.raises(ValueError, match="retention"):
+            svc.archive_runs()
+
 
 def _empty_graph():
     return AgentGraph(entry_node_id="x", nodes={}, source_type="test", source_metadata={})
@@ -10,6 +10,7 @@ from voicetest.simulator.user_sim import SimulatorResponse
 from voicetest.simulator.user_sim import UserSimSignature
 from voicetest.simulator.user_sim import UserSimulator
 from voicetest.util.retry import EmptyLLMOutputError
+from voicetest.util.timing import collect_timings
 
 
 class TestSimulatorResponse:
@@ -207,6 +208,22 @@ class TestUserSimulatorGenerate:
 
         assert response.message == "Thanks, bye!"
 
+    @pytest.mark.asyncio
+    async def test_llm_path_records_duration(self):
+        simulator = UserSimulator("## Identity\nJohn", "openai/gpt-4o-mini")
+
+        async def mock_call_llm(model, sig, **kwargs):
+            return dspy.Prediction(message="Hello?")
+
+        with (
+            patch("voicetest.simulator.user_sim.call_llm", side_effect=mock_call_llm),
+            collect_timings() as timings,
+        ):
+            response = await simulator.generate([])
+
+        assert response.duration_ms is not None
+        assert timings.snapshot()["simulator"].count == 1
+
     @pytest.mark.asyncio
     async def test_llm_none_message_retries_then_raises(self):
         """If the LLM returns None for `message`, retry once with a random salt
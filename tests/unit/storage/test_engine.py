@@ -195,6 +195,16 @@ class TestMigrateSchema:
                     ")"
                 )
             )
+            conn.execute(
+                text(
+                    "CREATE TABLE runs ("
+                    "id VARCHAR PRIMARY KEY, "
+                    "agent_id VARCHAR NOT NULL, "
+                    "started_at TIMESTAMP, "
+                    "completed_at TIMESTAMP"
+                    ")"
+                )
+            )
             conn.execute(
                 text(
                     "CREATE TABLE results ("
@@ -237,13 +247,31 @@ class TestMigrateSchema:
             )
             assert result.fetchone() is not None
 
+            # llm_stats, timings and usage columns should exist on results
+            for column in ("llm_stats", "timings", "prompt_tokens", "cost_usd"):
+                result = conn.execute(
+                    text(
+                        "SELECT 1 FROM information_schema.columns "
+                        f"WHERE table_name = 'results' AND column_name = '{column}'"
+                    )
+                )
+                assert result.fetchone() is not None
+
+            result = conn.execute(
+                text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_name = 'runs' AND column_name = 'options_json'"
+                )
+            )
+            assert result.fetchone() is not None
+
             # Existing data should survive
             result = conn.execute(text("SELECT name FROM agents WHERE id = 'a1'"))
             assert result.scalar() == "Old Agent"
 
             # Migration should be recorded
             version = _get_current_version(conn)
-            assert version == 3
+            assert version == 8
 
     def test_runs_pending_migration_on_old_schema(self, tmp_path):
         db_path = tmp_path / "old.duckdb"
@@ -266,6 +294,16 @@ class TestMigrateSchema:
                     ")"
                 )
             )
+            conn.execute(
+                text(
+                    "CREATE TABLE runs ("
+                    "id VARCHAR PRIMARY KEY, "
+                    "agent_id VARCHAR NOT NULL, "
+                    "started_at TIMESTAMP, "
+                    "completed_at TIMESTAMP"
+                    ")"
+                )
+            )
             conn.execute(
                 text(
                     "CREATE TABLE results ("
@@ -302,7 +340,7 @@ class TestMigrateSchema:
 
             # Migration should be recorded
             version = _get_current_version(conn)
-            assert version == 3
+            assert version == 8
 
     def test_tracks_version(self, tmp_path):
         db_path = tmp_path / "versioned.duckdb"
@@ -341,6 +379,16 @@ class TestMigrateSchema:
                     ")"
                 )
             )
+            conn.execute(
+                text(
+                    "CREATE TABLE runs ("
+                    "id VARCHAR PRIMARY KEY, "
+                    "agent_id VARCHAR NOT NULL, "
+                    "started_at TIMESTAMP, "
+                    "completed_at TIMESTAMP"
+                    ")"
+                )
+            )
             conn.execute(
                 text(
                     "CREATE TABLE results ("
@@ -376,6 +424,16 @@ class TestMigrateSchema:
                     ")"
                 )
             )
+            conn.execute(
+                text(
+                    "CREATE TABLE runs ("
+                    "id VARCHAR PRIMARY KEY, "
+                    "agent_id VARCHAR NOT NULL, "
+                    "started_at TIMESTAMP, "
+                    "completed_at TIMESTAMP"
+                    ")"
+                )
+            )
             conn.execute(
                 text(
                     "CREATE TABLE results ("
@@ -1,10 +1,12 @@
 """Tests for LinkedFile utility functions."""
 
 import json
+import os
 import time
 
 import pytest
 
+from voicetest.storage.linked_file import FileCache
 from voicetest.storage.linked_file import check_file
 from voicetest.storage.linked_file import compute_etag
 from voicetest.storage.linked_file import read_json
@@ -135,3 +137,63 @@ class TestWriteJson:
 
         text = f.read_text()
         assert "\n" in text
+
+
+class TestFileCache:
+    """Tests for the (mtime, size)-validated file cache."""
+
+    def test_reuses_value_while_file_unchanged(self, tmp_path):
+        f = tmp_path / "data.json"
+        f.write_text("[1]")
+        cache = FileCache()
+        calls = []
+
+        def build(path):
+            calls.append(path)
+            return read_json(path)
+
+        assert cache.get(str(f), build) == [1]
+        assert cache.get(str(f), build) == [1]
+        assert len(calls) == 1
+
+    def test_rebuilds_when_size_changes(self, tmp_path):
+        f = tmp_path / "data.json"
+        f.write_text("[1]")
+        cache = FileCache()
+        cache.get(str(f), read_json)
+
+        f.write_text("[1, 2]")
+
+        assert cache.get(str(f), read_json) == [1, 2]
+
+    def test_write_json_invalidates(self, tmp_path):
+        f = tmp_path / "data.json"
+        write_json(str(f), [1])
+        cache = FileCache()
+        cache.get(str(f), read_json)
+        mtime_ns = f.stat().st_mtime_ns
+
+        write_json(str(f), [2])
+        # Same size and mtime: only the explicit invalidation can catch this.
+        os.utime(f, ns=(mtime_ns, mtime_ns))
+
+        assert cache.get(str(f), read_json) == [2]
+
+    def test_missing_file_raises(self, tmp_path):
+        cache = FileCache()
+
+        with pytest.raises(FileNotFoundError):
+            cache.get(str(tmp_path / "missing.json"), read_json)
+
+    def test_invalidate_matches_other_spellings(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        f = tmp_path / "data.json"
+        f.write_text("[1]")
+        cache = FileCache()
+        built = []
+        cache.get("data.json", built.append)
+
+        cache.invalidate(str(f))
+        cache.get("data.json", built.append)
+
+        assert built == ["data.json", "data.json"]
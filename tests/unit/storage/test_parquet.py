@@ -0,0 +1,136 @@
+"""Tests for Parquet export of runs."""
+
+from datetime import datetime
+
+import duckdb
+import pyarrow.dataset as ds
+
+from voicetest.storage.parquet import flatten_result
+from voicetest.storage.parquet import write_runs_parquet
+
+
+def _row(result_id: str = "r1", run_id: str = "run1", **overrides) -> dict:
+    """An exported result row as yielded by RunRepository.iter_export_batches."""
+    row = {
+        "id": result_id,
+        "run_id": run_id,
+        "test_case_id": "tc1",
+        "call_id": None,
+        "test_name": "Booking",
+        "status": "fail",
+        "duration_ms": 1200,
+        "turn_count": 2,
+        "end_reason": "max_turns",
+        "error_message": None,
+        "transcript_json": [
+            {"role": "user", "content": "hi", "metadata": {}},
+            {"role": "assistant", "content": "hello", "metadata": {"node_id": "greet"}},
+        ],
+        "metrics_json": [
+            {"metric": "polite", "passed": True, "reasoning": "ok", "score": 0.9},
+            {"metric": "booked", "passed": False, "reasoning": "no", "score": 0.1},
+        ],
+        "audio_metrics_json": [{"metric": "polite", "passed": False, "reasoning": "garbled"}],
+        "nodes_visited": ["greet", "book"],
+        "tools_called": [{"name": "lookup", "arguments": {}}],
+        "models_used": {"agent": "a/m", "simulator": "s/m", "judge": "j/m"},
+        "prompt_tokens": 1500,
+        "completion_tokens": 300,
+        "cost_usd": 0.0042,
+        "created_at": datetime(2026, 3, 1, 12, 0),
+        "agent_id": "agent1",
+        "run_started_at": datetime(2026, 3, 1, 11, 59),
+        "run_completed_at": datetime(2026, 3, 1, 12, 1),
+    }
+    row.update(overrides)
+    return row
+
+
+class TestFlattenResult:
+    def test_splits_metrics_and_messages(self):
+        records = flatten_result(_row())
+
+        (result,) = records["results"]
+        assert result["run_date"] == "2026-03-01"
+        assert result["tools_called"] == ["lookup"]
+        assert result["agent_model"] == "a/m"
+        assert (result["metrics_total"], result["metrics_passed"]) == (2, 1)
+        assert (result["prompt_tokens"], result["cost_usd"]) == (1500, 0.0042)
+        assert [(m["metric"], m["audio"]) for m in records["metrics"]] == [
+            ("polite", False),
+            ("booked", False),
+            ("polite", True),
+        ]
+        assert [(m["position"], m["role"], m["node_id"]) for m in records["messages"]] == [
+            (0, "user", None),
+            (1, "assistant", "greet"),
+        ]
+
+    def test_tolerates_missing_payloads(self):
+        records = flatten_result(
+            _row(
+                transcript_json=[],
+                metrics_json=None,
+                audio_metrics_json=None,
+                nodes_visited=None,
+                tools_called=None,
+                models_used=None,
+            )
+        )
+
+        assert records["metrics"] == []
+        assert records["messages"] == []
+        assert records["results"][0]["nodes_visited"] == []
+
+
+class TestWriteRunsParquet:
+    def test_writes_hive_partitioned_datasets(self, tmp_path):
+        summary = write_runs_parquet([[_row("r1")], [_row("r2", run_id="run2")]], tmp_path)
+
+        assert summary == {
+            "runs": 2,
+            "results": 2,
+            "metrics": 6,
+            "messages": 4,
+            "output_dir": str(tmp_path),
+        }
+        partition = tmp_path / "results" / "agent_id=agent1" / "run_date=2026-03-01"
+        assert len(list(partition.glob("*.parquet"))) == 2
+
+    def test_duckdb_queries_archive_directly(self, tmp_path):
+        write_runs_parquet([[_row()]], tmp_path)
+
+        failing = duckdb.sql(
+            f"SELECT metric FROM read_parquet('{tmp_path}/metrics/**/*.parquet', "
+            "hive_partitioning = true) WHERE NOT passed AND agent_id = 'agent1' ORDER BY metric"
+        ).fetchall()
+
+        assert failing == [("booked",), ("polite",)]
+
+    def test_repeated_writes_append(self, tmp_path):
+        write_runs_parquet([[_row("r1")]], tmp_path)
+        write_runs_parquet([[_row("r2")]], tmp_path)
+
+        table = ds.dataset(tmp_path / "results", partitioning="hive").to_table()
+        assert sorted(table.column("result_id").to_pylist()) == ["r1", "r2"]
+
+    def test_writes_runs_without_results(self, tmp_path):
+        run = {
+            "id": "empty",
+            "agent_id": "agent1",
+            "started_at": datetime(2026, 3, 1, 9, 0),
+            "completed_at": datetime(2026, 3, 1, 9, 5),
+        }
+
+        summary = write_runs_parquet([[_row(run_id="run1")]], tmp_path, [run])
+
+        assert (summary["runs"], summary["results"]) == (2, 1)
+        table = ds.dataset(tmp_path / "runs", partitioning="hive").to_table()
+        assert table.column("run_id").to_pylist() == ["empty"]
+        assert table.column("run_date").to_pylist() == ["2026-03-01"]
+
+    def test_no_batches_writes_nothing(self, tmp_path):
+        summary = write_runs_parquet([], tmp_path / "out")
+
+        assert summary["runs"] == 0
+        assert not (tmp_path / "out").exists()
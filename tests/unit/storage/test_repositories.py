@@ -4,6 +4,7 @@ from datetime import UTC
 from datetime import datetime
 import json
 from pathlib import Path
+from unittest.mock import patch
 from uuid import NAMESPACE_URL
 from uuid import uuid5
 
@@ -17,12 +18,20 @@ from voicetest.models.agent import AgentNode
 from voicetest.models.agent import GlobalMetric
 from voicetest.models.agent import MetricsConfig
 from voicetest.models.agent import NodeType
+from voicetest.models.results import LLMRoleStats
 from voicetest.models.results import Message
 from voicetest.models.results import MetricResult
+from voicetest.models.results import SpanTiming
 from voicetest.models.results import TestResult
 from voicetest.models.results import TestRun
+from voicetest.models.results import ToolCall
 from voicetest.models.test_case import TestCase
+from voicetest.storage.linked_file import read_json
 from voicetest.storage.models import Base
+from voicetest.storage.models import ResultMetricOutcome
+from voicetest.storage.models import ResultNodeVisit
+from voicetest.storage.models import ResultToolCall
+from voicetest.storage.models import Run
 from voicetest.storage.repositories import AgentRepository
 from voicetest.storage.repositories import RunRepository
 from voicetest.storage.repositories import TestCaseRepository
@@ -645,6 +654,64 @@ class TestRunRepository:
         assert run["results"][0]["turn_count"] == 3
         assert len(run["results"][0]["transcript_json"]) == 2
 
+    def test_llm_stats_round_trip(self, run_repo, agent_repo, sample_run):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run_record = run_repo.create(agent["id"])
+        result_id = run_repo.create_pending_result(run_record["id"], "tc-1", "Test")
+
+        result = sample_run.results[0].model_copy(
+            update={
+                "llm_stats": {
+                    "agent": LLMRoleStats(
+                        calls=3,
+                        cache_hits=2,
+                        cache_misses=1,
+                        latency_ms=12.5,
+                        prompt_tokens=800,
+                        completion_tokens=40,
+                        cost_usd=0.002,
+                    ),
+                    "judge": LLMRoleStats(calls=1, prompt_tokens=200, cost_usd=0.001),
+                }
+            }
+        )
+        run_repo.complete_result(result_id, result)
+
+        run = run_repo.get_with_results(run_record["id"])
+        stored = run["results"][0]
+        assert stored["llm_stats"]["agent"] == {
+            "calls": 3,
+            "cache_hits": 2,
+            "cache_misses": 1,
+            "cache_bypassed": 0,
+            "coalesced": 0,
+            "latency_ms": 12.5,
+            "prompt_tokens": 800,
+            "completion_tokens": 40,
+            "cost_usd": 0.002,
+        }
+        assert (stored["prompt_tokens"], stored["completion_tokens"]) == (1000, 40)
+        assert stored["cost_usd"] == 0.003
+
+        (summary,) = run_repo.list_for_agent_with_summary(agent["id"])
+        assert summary["summary"]["prompt_tokens"] == 1000
+        assert summary["summary"]["cost_usd"] == 0.003
+
+    def test_timings_round_trip(self, run_repo, agent_repo, sample_run):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run_record = run_repo.create(agent["id"])
+        result_id = run_repo.create_pending_result(run_record["id"], "tc-1", "Test")
+
+        result = sample_run.results[0].model_copy(
+            update={"timings": {"response": SpanTiming(count=2, total_ms=150.5, max_ms=100.0)}}
+        )
+        run_repo.complete_result(result_id, result)
+
+        run = run_repo.get_with_results(run_record["id"])
+        assert run["results"][0]["timings"] == {
+            "response": {"count": 2, "total_ms": 150.5, "max_ms": 100.0}
+        }
+
 
 class TestAgentRepositoryEdgeCases:
     """Edge case tests for AgentRepository."""
@@ -863,6 +930,58 @@ class TestLinkedTests:
         assert billing["type"] == "llm"
         assert billing["metrics"] == ["Provides billing info"]
 
+    def test_linked_file_parsed_once_while_unchanged(
+        self, test_case_repo, agent_with_tests, tests_file
+    ):
+        with patch("voicetest.storage.repositories.read_json", wraps=read_json) as reader:
+            test_case_repo.list_for_agent_with_linked(agent_with_tests["id"], [str(tests_file)])
+            test_case_repo.list_for_agent_with_linked(agent_with_tests["id"], [str(tests_file)])
+
+        assert reader.call_count == 1
+
+    def test_linked_cache_sees_external_edits(self, test_case_repo, agent_with_tests, tests_file):
+        test_case_repo.list_for_agent_with_linked(agent_with_tests["id"], [str(tests_file)])
+        tests_file.write_text(json.dumps([{"name": "Edited elsewhere", "user_prompt": "x"}]))
+
+        results = test_case_repo.list_for_agent_with_linked(
+            agent_with_tests["id"], [str(tests_file)]
+        )
+
+        assert [t["name"] for t in results] == ["Edited elsewhere"]
+
+    def test_linked_cache_sees_own_writes(self, test_case_repo, agent_with_tests, tests_file):
+        test_case_repo.list_for_agent_with_linked(agent_with_tests["id"], [str(tests_file)])
+        test_case_repo.create_in_file(
+            str(tests_file), agent_with_tests["id"], TestCase(name="New", user_prompt="hi")
+        )
+
+        results = test_case_repo.list_for_agent_with_linked(
+            agent_with_tests["id"], [str(tests_file)]
+        )
+
+        assert [t["name"] for t in results][-1] == "New"
+
+    def test_linked_results_are_copies(self, test_case_repo, agent_with_tests, tests_file):
+        first = test_case_repo.list_for_agent_with_linked(agent_with_tests["id"], [str(tests_file)])
+        first[0]["name"] = "mutated"
+
+        second = test_case_repo.list_for_agent_with_linked(
+            agent_with_tests["id"], [str(tests_file)]
+        )
+
+        assert second[0]["name"] == "Greeting Test"
+        assert second[0]["agent_id"] == agent_with_tests["id"]
+
+    def test_find_linked_by_id(self, test_case_repo, agent_with_tests, tests_file):
+        test_id = str(uuid5(NAMESPACE_URL, f"{tests_file}:Billing Test"))
+
+        found = test_case_repo.find_linked(agent_with_tests["id"], [str(tests_file)], test_id)
+
+        assert found["name"] == "Billing Test"
+        assert found["source_index"] == 1
+        assert found["agent_id"] == agent_with_tests["id"]
+        assert test_case_repo.find_linked("a", [str(tests_file)], "nonexistent") is None
+
 
 class TestAgentRepositoryTestsPaths:
     """Tests for tests_paths field on Agent."""
@@ -983,3 +1102,202 @@ class TestAddResultFromCall:
         assert len(metrics) == 1
         assert metrics[0]["metric"] == "[Politeness]"
         assert metrics[0]["passed"] is False
+
+
+def _judged_result(status: str, nodes: list[str], metrics: dict[str, bool], tools=()) -> TestResult:
+    """Build a finished TestResult with the given nodes, metric verdicts and tool calls."""
+    return TestResult(
+        test_name=f"{status} test",
+        status=status,
+        nodes_visited=nodes,
+        metric_results=[
+            MetricResult(metric=name, passed=passed, reasoning="", score=1.0 if passed else 0.0)
+            for name, passed in metrics.items()
+        ],
+        tools_called=[ToolCall(name=t, arguments={}) for t in tools],
+    )
+
+
+class TestRunAnalytics:
+    """Tests for the normalized result-analytics tables and aggregates."""
+
+    def test_add_result_writes_side_rows(self, run_repo, agent_repo, session):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+
+        result = _judged_result("fail", ["a", "b", "a"], {"polite": False}, tools=["lookup"])
+        result.audio_metric_results = [MetricResult(metric="polite", passed=True, reasoning="")]
+        result_id = run_repo.add_result(run["id"], result)
+
+        visits = session.query(ResultNodeVisit).filter_by(result_id=result_id).all()
+        assert sorted((v.position, v.node_id) for v in visits) == [(0, "a"), (1, "b"), (2, "a")]
+        outcomes = session.query(ResultMetricOutcome).filter_by(result_id=result_id).all()
+        assert sorted((o.audio, o.passed) for o in outcomes) == [(False, False), (True, True)]
+        tools = session.query(ResultToolCall).filter_by(result_id=result_id).all()
+        assert [t.name for t in tools] == ["lookup"]
+
+    def test_complete_result_replaces_side_rows(self, run_repo, agent_repo, session):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+        result_id = run_repo.create_pending_result(run["id"], "tc-1", "Test")
+
+        run_repo.complete_result(result_id, _judged_result("fail", ["a"], {"m": False}))
+        run_repo.complete_result(result_id, _judged_result("pass", ["a", "b"], {"m": True}))
+
+        assert session.query(ResultNodeVisit).filter_by(result_id=result_id).count() == 2
+        outcomes = session.query(ResultMetricOutcome).filter_by(result_id=result_id).all()
+        assert [o.passed for o in outcomes] == [True]
+
+    def test_add_results_writes_batch_with_side_rows(self, run_repo, agent_repo, session):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+        batch = [_judged_result("pass", ["a", "b"], {"m": True}) for _ in range(3)]
+
+        assert run_repo.add_results(run["id"], batch) == 3
+
+        assert len(run_repo.get_with_results(run["id"])["results"]) == 3
+        assert session.query(ResultNodeVisit).filter_by(run_id=run["id"]).count() == 6
+        assert session.query(ResultMetricOutcome).filter_by(run_id=run["id"]).count() == 3
+
+    def test_add_results_rolls_back_whole_batch(self, run_repo, agent_repo, session):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+
+        def results():
+            yield _judged_result("pass", ["a"], {"m": True})
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError):
+            run_repo.add_results(run["id"], results())
+
+        assert run_repo.get_with_results(run["id"])["results"] == []
+        assert session.query(ResultNodeVisit).count() == 0
+
+    def test_get_returns_record_without_results(self, run_repo, agent_repo):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+
+        record = run_repo.get(run["id"])
+
+        assert record["id"] == run["id"]
+        assert "results" not in record
+        assert run_repo.get("missing") is None
+
+    def test_delete_run_removes_side_rows(self, run_repo, agent_repo, session):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+        run_repo.add_result(run["id"], _judged_result("pass", ["a"], {"m": True}, tools=["t"]))
+
+        run_repo.delete(run["id"])
+
+        for model in (ResultNodeVisit, ResultMetricOutcome, ResultToolCall):
+            assert session.query(model).count() == 0
+
+    def test_node_stats_ranks_by_failure_rate(self, run_repo, agent_repo):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+        run_repo.add_result(run["id"], _judged_result("pass", ["greet", "book"], {}))
+        run_repo.add_result(run["id"], _judged_result("fail", ["greet", "refund"], {}))
+        run_repo.add_result(run["id"], _judged_result("imported", ["refund"], {}))
+
+        stats = run_repo.node_stats(run_repo.recent_run_ids(agent["id"]))
+
+        by_node = {s["node_id"]: s for s in stats}
+        assert stats[0]["node_id"] == "refund"
+        assert by_node["refund"]["failure_rate"] == 1.0
+        assert by_node["refund"]["results"] == 1
+        assert by_node["greet"]["failure_rate"] == 0.5
+        assert by_node["book"]["failure_rate"] == 0.0
+
+    def test_metric_stats_flags_regression_in_latest_run(self, run_repo, agent_repo, session):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        older = run_repo.create(agent["id"])
+        newer = run_repo.create(agent["id"])
+        session.get(Run, older["id"]).started_at = datetime(2020, 1, 1)
+        session.commit()
+
+        run_repo.add_result(older["id"], _judged_result("pass", [], {"polite": True, "ok": True}))
+        run_repo.add_result(newer["id"], _judged_result("fail", [], {"polite": False, "ok": True}))
+
+        stats = run_repo.metric_stats(run_repo.recent_run_ids(agent["id"]))
+
+        assert stats[0]["metric"] == "polite"
+        assert stats[0]["latest_pass_rate"] == 0.0
+        assert stats[0]["previous_pass_rate"] == 1.0
+        assert stats[0]["delta"] == -1.0
+        assert stats[1]["delta"] == 0.0
+
+    def test_tool_stats_counts_calls(self, run_repo, agent_repo):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+        run_repo.add_result(run["id"], _judged_result("pass", [], {}, tools=["a", "a", "b"]))
+        run_repo.add_result(run["id"], _judged_result("pass", [], {}, tools=["a"]))
+
+        stats = run_repo.tool_stats([run["id"]])
+
+        assert stats == [
+            {"name": "a", "calls": 3, "results": 2},
+            {"name": "b", "calls": 1, "results": 1},
+        ]
+
+    def test_stats_empty_without_runs(self, run_repo):
+        assert run_repo.node_stats([]) == []
+        assert run_repo.metric_stats([]) == []
+        assert run_repo.tool_stats([]) == []
+
+    def test_backfill_populates_history_once(self, run_repo, agent_repo, session):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+        run_repo.add_result(run["id"], _judged_result("pass", ["a"], {"m": True}, tools=["t"]))
+        run_repo.add_result(run["id"], _judged_result("pass", [], {}))
+        for model in (ResultNodeVisit, ResultMetricOutcome, ResultToolCall):
+            session.query(model).delete()
+        session.commit()
+
+        first = run_repo.backfill_analytics(batch_size=1)
+        second = run_repo.backfill_analytics()
+
+        assert first == {"results_scanned": 2, "results_backfilled": 1}
+        assert second == {"results_scanned": 1, "results_backfilled": 0}
+        assert session.query(ResultNodeVisit).count() == 1
+        assert session.query(ResultMetricOutcome).count() == 1
+        assert session.query(ResultToolCall).count() == 1
+
+
+class TestRunExportQueries:
+    """Tests for the run-selection and batched-read helpers behind Parquet export."""
+
+    def test_find_run_ids_filters_agent_and_age(self, run_repo, agent_repo, session):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        other = agent_repo.create(name="Other", source_type="test", graph_json="{}")
+        old = run_repo.create(agent["id"])
+        run_repo.complete(old["id"])
+        in_flight = run_repo.create(agent["id"])
+        recent = run_repo.create(other["id"])
+        run_repo.complete(recent["id"])
+        for run_id in (old["id"], in_flight["id"]):
+            session.get(Run, run_id).started_at = datetime(2020, 1, 1, tzinfo=UTC)
+        session.commit()
+
+        assert set(run_repo.find_run_ids(agent_id=agent["id"])) == {old["id"], in_flight["id"]}
+        assert run_repo.find_run_ids(started_before=datetime(2021, 1, 1, tzinfo=UTC)) == [old["id"]]
+
+    def test_iter_export_batches_pages_results(self, run_repo, agent_repo):
+        agent = agent_repo.create(name="Agent", source_type="test", graph_json="{}")
+        run = run_repo.create(agent["id"])
+        for status in ("pass", "fail", "pass"):
+            run_repo.add_result(run["id"], _judged_result(status, ["a"], {"m": True}))
+        skipped = run_repo.create(agent["id"])
+        run_repo.add_result(skipped["id"], _judged_result("pass", [], {}))
+
+        batches = list(run_repo.iter_export_batches([run["id"]], batch_size=2))
+
+        assert [len(b) for b in batches] == [2, 1]
+        rows = [row for b in batches for row in b]
+        assert {row["run_id"] for row in rows} == {run["id"]}
+        assert rows[0]["agent_id"] == agent["id"]
+        assert rows[0]["run_started_at"] is not None
+        assert rows[0]["metrics_json"][0]["metric"] == "m"
+
+    def test_iter_export_batches_empty(self, run_repo):
+        assert list(run_repo.iter_export_batches([])) == []
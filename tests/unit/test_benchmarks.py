@@ -0,0 +1,140 @@
+"""Tests for the benchmark harness and suites."""
+
+import json
+
+import pytest
+
+from voicetest.benchmarks import BENCHMARKS
+from voicetest.benchmarks import SkipBenchmark
+from voicetest.benchmarks import compare_results
+from voicetest.benchmarks import load_results
+from voicetest.benchmarks import run_benchmarks
+from voicetest.benchmarks import save_results
+from voicetest.benchmarks import select
+from voicetest.benchmarks.harness import Benchmark
+
+
+def _results(**medians: float) -> dict:
+    return {
+        "version": 1,
+        "scale": 1.0,
+        "benchmarks": {name: {"median_ms": ms} for name, ms in medians.items()},
+    }
+
+
+class TestRegistry:
+    def test_one_benchmark_per_parameter_value(self):
+        ids = {b.id for b in BENCHMARKS}
+
+        assert {
+            "formatting/engine_transcript[turns=10]",
+            "formatting/engine_transcript[turns=50]",
+            "formatting/engine_transcript[turns=200]",
+        } <= ids
+        assert "storage/list_runs_with_summary" in ids
+        assert "cache/tiered_hit" in ids
+        assert "import/auto_detect_fixtures[mode=warm]" in ids
+
+    def test_ids_are_unique(self):
+        ids = [b.id for b in BENCHMARKS]
+        assert len(ids) == len(set(ids))
+
+    def test_select_matches_substrings(self):
+        selected = select(["broadcast", "engine/advance"])
+
+        assert {b.group for b in selected} == {"broadcast", "engine"}
+        assert all("advance" in b.id for b in selected if b.group == "engine")
+
+    def test_select_without_patterns_returns_all(self):
+        assert select() == BENCHMARKS
+
+
+class TestRunBenchmarks:
+    def test_every_benchmark_runs_at_quick_scale(self, fixtures_dir):
+        results = run_benchmarks(
+            select(), scale=0.01, fixtures_dir=fixtures_dir, min_time=0, min_rounds=1, max_rounds=1
+        )
+
+        entries = results["benchmarks"]
+        assert set(entries) == {b.id for b in BENCHMARKS}
+        skipped = {k: v["skipped"] for k, v in entries.items() if "skipped" in v}
+        # The Postgres bus benchmark needs a PostgreSQL DATABASE_URL.
+        assert all("fan_out_postgres" in k for k in skipped)
+        ran = [e for e in entries.values() if "skipped" not in e]
+        assert all(e["rounds"] == 1 and e["median_ms"] >= 0 for e in ran)
+        assert results["scale"] == 0.01
+
+    def test_missing_fixtures_are_skipped(self):
+        results = run_benchmarks(
+            select(["import_fixture[source_type=retell]"]), min_time=0, max_rounds=1
+        )
+
+        entry = results["benchmarks"]["import/import_fixture[source_type=retell]"]
+        assert "not found" in entry["skipped"]
+
+    def test_async_setup_and_callable(self):
+        calls = []
+
+        async def setup(ctx):
+            async def op():
+                calls.append(1)
+
+            return op
+
+        bench = Benchmark("test", "async_op", setup)
+        results = run_benchmarks([bench], min_time=0, min_rounds=3, max_rounds=3)
+
+        # One warm-up call plus three timed rounds.
+        assert len(calls) == 4
+        assert results["benchmarks"]["test/async_op"]["rounds"] == 3
+
+    def test_skip_from_setup(self):
+        def setup(ctx):
+            raise SkipBenchmark("not here")
+
+        results = run_benchmarks([Benchmark("test", "skipped", setup)])
+
+        assert results["benchmarks"]["test/skipped"] == {"skipped": "not here", "group": "test"}
+
+
+class TestResultsFiles:
+    def test_save_and_load_round_trip(self, tmp_path):
+        results = _results(a=1.0)
+        path = tmp_path / "nested" / "results.json"
+
+        save_results(results, path)
+
+        assert load_results(path) == results
+
+    def test_load_rejects_other_json(self, tmp_path):
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"hello": "world"}))
+
+        with pytest.raises(ValueError, match="Not a benchmark results file"):
+            load_results(path)
+
+    def test_load_rejects_missing_file(self, tmp_path):
+        with pytest.raises(ValueError, match="Cannot read"):
+            load_results(tmp_path / "missing.json")
+
+
+class TestCompareResults:
+    def test_flags_changes_beyond_threshold(self):
+        rows = compare_results(
+            _results(slow=10.0, fast=10.0, same=10.0),
+            _results(slow=12.0, fast=8.0, same=10.5),
+            threshold=0.1,
+        )
+
+        by_id = {r["id"]: r for r in rows}
+        assert by_id["slow"]["status"] == "regressed"
+        assert by_id["slow"]["change"] == pytest.approx(0.2)
+        assert by_id["fast"]["status"] == "improved"
+        assert by_id["same"]["status"] == ""
+
+    def test_ignores_benchmarks_missing_from_either_run(self):
+        baseline = _results(old=1.0, both=1.0)
+        current = _results(new=1.0, both=1.0)
+        current["benchmarks"]["skipped"] = {"skipped": "no fixtures"}
+
+        assert [r["id"] for r in compare_results(baseline, current)] == ["both"]
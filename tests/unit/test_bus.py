@@ -0,0 +1,240 @@
+"""Tests for the cross-process broadcast bus backends (voicetest.web.bus)."""
+
+import asyncio
+import json
+from pathlib import Path
+import shutil
+import tempfile
+
+import pytest
+
+from voicetest.web import bus as bus_module
+from voicetest.web.broadcast import BroadcastBus
+from voicetest.web.bus import BusBroker
+from voicetest.web.bus import PostgresTransport
+from voicetest.web.bus import RelayedBroadcastBus
+from voicetest.web.bus import UnixSocketTransport
+from voicetest.web.bus import _OriginDedup
+from voicetest.web.bus import create_bus
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.messages: list[dict] = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(json.loads(text))
+
+
+async def _until(condition, timeout: float = 5) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes, which pytest's tmp_path can exceed.
+    socket_dir = Path(tempfile.mkdtemp(prefix="vtb"))
+    yield socket_dir / "bus.sock"
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+@pytest.fixture
+async def broker(socket_path):
+    broker = BusBroker()
+    task = asyncio.create_task(broker.serve(socket_path))
+    await _until(socket_path.exists)
+    yield broker
+    broker.stop()
+    await task
+
+
+@pytest.fixture
+async def make_bus(broker, socket_path):
+    """Factory for buses that stand in for separate server processes."""
+    buses = []
+
+    def make(topic: str = "run") -> RelayedBroadcastBus:
+        bus = RelayedBroadcastBus(UnixSocketTransport(socket_path, topic))
+        buses.append(bus)
+        return bus
+
+    yield make
+    for bus in buses:
+        await bus.close()
+
+
+class TestRelayedBroadcastBus:
+    @pytest.mark.asyncio
+    async def test_events_reach_other_process(self, make_bus):
+        producer, consumer = make_bus(), make_bus()
+        await consumer.open()
+        websocket = FakeWebSocket()
+
+        producer.start("run-1")
+        await _until(lambda: consumer.is_active("run-1"))
+        await consumer.attach("run-1", websocket)
+        for i in range(50):
+            await producer.broadcast("run-1", {"type": "update", "i": i})
+        producer.end("run-1")
+
+        await _until(lambda: not consumer.is_active("run-1"))
+        assert [m["i"] for m in websocket.messages] == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_attach_waits_for_start_in_flight(self, make_bus):
+        producer, consumer = make_bus(), make_bus()
+        await producer.open()
+        await consumer.open()
+        websocket = FakeWebSocket()
+
+        producer.start("run-1")
+        await consumer.attach("run-1", websocket)
+        await producer.broadcast("run-1", {"type": "test_started"})
+
+        await _until(lambda: websocket.messages == [{"type": "test_started"}])
+
+    @pytest.mark.asyncio
+    async def test_broadcast_returns_after_local_delivery(self, make_bus):
+        bus = make_bus()
+        websocket = FakeWebSocket()
+        bus.start("run-1")
+        await bus.attach("run-1", websocket)
+
+        await bus.broadcast("run-1", {"type": "test_started"})
+
+        assert websocket.messages == [{"type": "test_started"}]
+
+    @pytest.mark.asyncio
+    async def test_late_joiner_replays_backlog(self, make_bus):
+        producer = make_bus()
+        producer.start("run-1")
+        await producer.broadcast("run-1", {"type": "test_started"})
+        await producer.broadcast("run-1", {"type": "test_completed"})
+
+        late = make_bus()
+        websocket = FakeWebSocket()
+        await late.attach("run-1", websocket)
+
+        assert [m["type"] for m in websocket.messages] == ["test_started", "test_completed"]
+
+    @pytest.mark.asyncio
+    async def test_reconnect_does_not_redeliver(self, make_bus, monkeypatch):
+        monkeypatch.setattr(bus_module, "RECONNECT_DELAY_SECONDS", 0.01)
+        producer, consumer = make_bus(), make_bus()
+        websocket = FakeWebSocket()
+        producer.start("run-1")
+        await consumer.attach("run-1", websocket)
+        await producer.broadcast("run-1", {"i": 0})
+        await _until(lambda: len(websocket.messages) == 1)
+
+        consumer._transport._writer.close()
+        await asyncio.sleep(0.05)
+        await producer.broadcast("run-1", {"i": 1})
+
+        await _until(lambda: len(websocket.messages) == 2)
+        await asyncio.sleep(0.05)
+        assert [m["i"] for m in websocket.messages] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_topics_are_separate(self, make_bus):
+        runs, chats = make_bus("run"), make_bus("chat")
+        await chats.open()
+
+        runs.start("shared-id")
+        await runs.broadcast("shared-id", {"type": "x"})
+
+        assert not chats.is_active("shared-id")
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_still_delivers_locally(self, make_bus, broker):
+        bus = make_bus()
+        websocket = FakeWebSocket()
+        bus.start("run-1")
+        await bus.attach("run-1", websocket)
+        bus._transport._writer.close()
+
+        await bus.broadcast("run-1", {"type": "test_started"})
+
+        assert websocket.messages == [{"type": "test_started"}]
+
+    @pytest.mark.asyncio
+    async def test_open_failure_delivers_locally(self, monkeypatch):
+        class UnreachableTransport(bus_module.BusTransport):
+            async def open(self, deliver):
+                raise ConnectionRefusedError("no broker")
+
+        monkeypatch.setattr(bus_module, "DELIVERY_TIMEOUT_SECONDS", 30)
+        bus = RelayedBroadcastBus(UnreachableTransport())
+        websocket = FakeWebSocket()
+        bus.start("run-1")
+        await bus.attach("run-1", websocket)
+
+        await asyncio.wait_for(bus.broadcast("run-1", {"type": "test_started"}), 1)
+        bus.end("run-1")
+        await _until(lambda: not bus.is_active("run-1"))
+
+        assert websocket.messages == [{"type": "test_started"}]
+        await bus.close()
+
+
+class TestOriginDedup:
+    @pytest.mark.asyncio
+    async def test_interleaved_publishers_lose_nothing(self):
+        delivered = []
+
+        async def deliver(event):
+            delivered.append((event["origin"], event["seq"]))
+
+        dedup = _OriginDedup(deliver)
+        # Two publishers insert concurrently; the later insert (higher row id)
+        # commits, and so is notified, first.
+        a = [{"origin": "a", "seq": i} for i in range(3)]
+        b = [{"origin": "b", "seq": i} for i in range(3)]
+        for event in [a[0], b[0], a[1], b[1], b[2], a[2]]:
+            await dedup(event)
+        # A reconnect replays the backlog in id order.
+        for event in [a[0], b[0], a[1], b[1], a[2], b[2]]:
+            await dedup(event)
+
+        assert delivered == [
+            ("a", 0),
+            ("b", 0),
+            ("a", 1),
+            ("b", 1),
+            ("b", 2),
+            ("a", 2),
+        ]
+
+
+class TestCreateBus:
+    def test_local_by_default(self, monkeypatch):
+        monkeypatch.delenv("VOICETEST_BUS", raising=False)
+
+        assert type(create_bus("run")) is BroadcastBus
+
+    def test_unix(self, monkeypatch):
+        monkeypatch.setenv("VOICETEST_BUS", "unix:/tmp/bus.sock")
+
+        bus = create_bus("chat")
+
+        assert isinstance(bus, RelayedBroadcastBus)
+        assert bus._transport.socket_path == Path("/tmp/bus.sock")
+        assert bus._transport.topic == "chat"
+
+    def test_postgres_uses_database_url(self, monkeypatch):
+        monkeypatch.setenv("VOICETEST_BUS", "postgres")
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/voicetest")
+
+        transport = create_bus("run")._transport
+
+        assert isinstance(transport, PostgresTransport)
+        assert transport.notify_channel == "voicetest_bus_run"
+
+    def test_unknown_backend(self, monkeypatch):
+        monkeypatch.setenv("VOICETEST_BUS", "redis")
+
+        with pytest.raises(ValueError, match="Unknown VOICETEST_BUS"):
+            create_bus("run")
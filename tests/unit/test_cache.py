@@ -1,22 +1,39 @@
 """Tests for the pluggable DSPy cache backend."""
 
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
 import subprocess
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from botocore.exceptions import ClientError
 import cloudpickle
+import diskcache
 import dspy
 from dspy.clients.cache import Cache
 import dspy.clients.lm as dspy_lm_module
 import pytest
 
+from voicetest.exceptions import CacheMissError
 from voicetest.llm.claudecode import ClaudeCodeLM
+from voicetest.models.test_case import TestCase
 from voicetest.settings import CacheSettings
+from voicetest.util.cache import MANIFEST_PREFIX
 from voicetest.util.cache import CacheBackend
+from voicetest.util.cache import CacheManifest
+from voicetest.util.cache import DiskCacheBackend
 from voicetest.util.cache import S3Cache
 from voicetest.util.cache import S3CacheBackend
+from voicetest.util.cache import SizedMemoryCache
+from voicetest.util.cache import TieredCacheBackend
+from voicetest.util.cache import bounded_disk_cache
+from voicetest.util.cache import cache_stats
+from voicetest.util.cache import is_strict_offline
+from voicetest.util.cache import run_cache_manifest
 from voicetest.util.cache import setup_cache_from_settings
+from voicetest.util.cache import strict_offline
+from voicetest.util.cache import suite_cache_id
 from voicetest.util.cache import try_evict_last_call
 
 
@@ -152,6 +169,485 @@ class TestS3CacheBackend:
             mock_client.assert_called_once_with("s3", region_name="us-west-2")
 
 
+@pytest.fixture
+def manifest_dir(tmp_path, monkeypatch):
+    path = tmp_path / "manifests"
+    monkeypatch.setattr("voicetest.util.cache.get_manifest_dir", lambda: path)
+    return path
+
+
+class _DictS3Client:
+    """In-memory stand-in for the S3 client calls the backends make."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.modified: dict[str, datetime] = {}
+        self.gets = 0
+        self.heads = 0
+
+    def _missing(self, op: str) -> ClientError:
+        return ClientError({"Error": {"Code": "NoSuchKey", "Message": "Not Found"}}, op)
+
+    def get_object(self, Bucket, Key):
+        self.gets += 1
+        if Key not in self.objects:
+            raise self._missing("GetObject")
+        data = self.objects[Key]
+        return {"Body": MagicMock(read=lambda: data)}
+
+    def head_object(self, Bucket, Key):
+        self.heads += 1
+        if Key not in self.objects:
+            raise self._missing("HeadObject")
+        return {}
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[Key] = Body
+        self.modified[Key] = datetime.now(UTC)
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+        return {}
+
+    def get_paginator(self, name):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                contents = [
+                    {"Key": key, "LastModified": client.modified[key]}
+                    for key in sorted(client.objects)
+                    if key.startswith(Prefix)
+                ]
+                yield {"Contents": contents} if contents else {}
+
+        return Paginator()
+
+    def age(self, key: str, days: float) -> None:
+        self.modified[key] = datetime.now(UTC) - timedelta(days=days)
+
+
+class TestTieredCacheBackend:
+    """Tests for TieredCacheBackend (local disk tier in front of S3)."""
+
+    def _make_backend(self, tmp_path, client=None, **kwargs) -> TieredCacheBackend:
+        remote = S3CacheBackend(
+            bucket="b", prefix="p/", client=client or _DictS3Client(), compress=True
+        )
+        return TieredCacheBackend(remote, tmp_path / "local", **kwargs)
+
+    def test_set_writes_local_and_remote(self, tmp_path):
+        client = _DictS3Client()
+        backend = self._make_backend(tmp_path, client)
+
+        backend["k"] = {"response": "hello"}
+        backend.flush()
+
+        assert backend.local.get("k") is not None
+        assert "p/k" in client.objects
+        assert backend.get("k") == {"response": "hello"}
+        assert client.gets == 0
+
+    def test_remote_values_are_compressed(self, tmp_path):
+        client = _DictS3Client()
+        backend = self._make_backend(tmp_path, client)
+        value = {"text": "x" * 10_000}
+
+        backend["k"] = value
+        backend.flush()
+
+        assert len(client.objects["p/k"]) < len(cloudpickle.dumps(value))
+
+    def test_remote_hit_is_single_get_and_promoted(self, tmp_path):
+        client = _DictS3Client()
+        client.objects["p/k"] = cloudpickle.dumps("legacy value")
+        backend = self._make_backend(tmp_path, client)
+
+        assert backend.get("k") == "legacy value"
+        assert backend.get("k") == "legacy value"
+
+        assert client.gets == 1
+        assert client.heads == 0
+        assert backend.stats["remote_hits"] == 1
+        assert backend.stats["local_hits"] == 1
+
+    def test_miss_is_negatively_cached(self, tmp_path):
+        client = _DictS3Client()
+        backend = self._make_backend(tmp_path, client)
+
+        assert backend.get("missing") is None
+        assert "missing" not in backend
+
+        assert client.gets == 1
+        assert backend.stats["negative_hits"] == 1
+
+    def test_negative_cache_can_be_disabled(self, tmp_path):
+        client = _DictS3Client()
+        backend = self._make_backend(tmp_path, client, negative_ttl=0)
+
+        backend.get("missing")
+        backend.get("missing")
+
+        assert client.gets == 2
+
+    def test_set_clears_negative_entry(self, tmp_path):
+        backend = self._make_backend(tmp_path)
+
+        assert backend.get("k") is None
+        backend["k"] = "now present"
+
+        assert backend.get("k") == "now present"
+
+    def test_sync_writes(self, tmp_path):
+        client = _DictS3Client()
+        backend = self._make_backend(tmp_path, client, async_writes=False)
+
+        backend["k"] = 1
+
+        assert "p/k" in client.objects
+
+    def test_remote_put_failure_keeps_local_copy(self, tmp_path, caplog):
+        client = MagicMock()
+        client.put_object.side_effect = ClientError(
+            {"Error": {"Code": "InternalError", "Message": "S3 down"}},
+            "PutObject",
+        )
+        backend = self._make_backend(tmp_path, client)
+
+        backend["k"] = "value"
+        backend.flush()
+
+        assert "Failed to write cache" in caplog.text
+        assert backend.get("k") == "value"
+
+    def test_delete_removes_both_tiers(self, tmp_path):
+        client = _DictS3Client()
+        backend = self._make_backend(tmp_path, client, negative_ttl=0)
+        backend["k"] = "value"
+
+        del backend["k"]
+
+        assert "p/k" not in client.objects
+        assert backend.get("k") is None
+
+    def test_local_tier_survives_new_instance(self, tmp_path):
+        client = _DictS3Client()
+        first = self._make_backend(tmp_path, client)
+        first["k"] = "value"
+        first.flush()
+
+        second = self._make_backend(tmp_path, client)
+
+        assert second.get("k") == "value"
+        assert client.gets == 0
+
+
+class TestSizedMemoryCache:
+    """Tests for the byte-bounded memory tier."""
+
+    def test_evicts_least_recent_by_size(self):
+        cache = SizedMemoryCache(max_bytes=3 * len(cloudpickle.dumps("x" * 100)))
+        for key in "abcd":
+            cache[key] = "x" * 100
+
+        assert "a" not in cache
+        assert cache.get("d") == "x" * 100
+        assert cache.snapshot()["evictions"] == 1
+
+    def test_value_larger_than_budget_is_rejected(self):
+        cache = SizedMemoryCache(max_bytes=64)
+        cache["big"] = "x" * 1000
+
+        assert cache.get("big") is None
+        assert cache.snapshot()["rejected"] == 1
+
+    def test_counts_hits_and_misses(self):
+        cache = SizedMemoryCache(max_bytes=1 << 20)
+        cache["k"] = "v"
+
+        assert cache.get("k") == "v"
+        assert "k" in cache
+        assert cache["k"] == "v"
+        assert cache.get("missing") is None
+        assert "missing" not in cache
+
+        stats = cache.snapshot()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["entries"] == 1
+        assert stats["bytes"] > 0
+
+    def test_peek_is_not_counted(self):
+        cache = SizedMemoryCache(max_bytes=1 << 20)
+        assert cache.peek("k") is False
+        assert cache.snapshot()["misses"] == 0
+
+
+class TestDiskCacheBackend:
+    """Tests for the TTL'd, eviction-counting disk tier."""
+
+    def test_round_trip_and_counters(self, tmp_path):
+        backend = DiskCacheBackend(diskcache.Cache(str(tmp_path)))
+        backend["k"] = {"a": 1}
+
+        assert backend.get("k") == {"a": 1}
+        assert backend.get("missing") is None
+        assert backend.stats["hits"] == 1
+        assert backend.stats["misses"] == 1
+
+    def test_ttl_expires_entries(self, tmp_path):
+        backend = DiskCacheBackend(diskcache.Cache(str(tmp_path)), ttl=60)
+        with patch("diskcache.core.time.time", return_value=1_000.0):
+            backend["k"] = "v"
+        with patch("diskcache.core.time.time", return_value=1_030.0):
+            assert backend.get("k") == "v"
+        with patch("diskcache.core.time.time", return_value=1_061.0):
+            assert backend.get("k") is None
+            assert backend.cull() == 1
+        assert backend.stats["expired"] == 1
+
+    def test_cull_evicts_to_size_limit(self, tmp_path):
+        store = diskcache.Cache(str(tmp_path), size_limit=0)
+        backend = DiskCacheBackend(store, cull_every=1_000)
+        for i in range(5):
+            backend[f"k{i}"] = "x" * 10_000
+
+        assert len(backend) == 5
+        backend.cull()
+
+        assert len(backend) < 5
+        assert backend.stats["evictions"] > 0
+
+    def test_culls_every_n_writes(self, tmp_path):
+        store = diskcache.Cache(str(tmp_path), size_limit=0)
+        backend = DiskCacheBackend(store, cull_every=2)
+        backend["a"] = "x" * 10_000
+        backend["b"] = "x" * 10_000
+
+        assert backend.stats["evictions"] > 0
+
+    def test_bounded_disk_cache_round_trip(self, tmp_path):
+        cache = bounded_disk_cache(tmp_path, memory_max_bytes=1 << 20, disk_ttl_seconds=60)
+        request = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+        cache.put(request, {"answer": 42})
+        cache.reset_memory_cache()
+
+        assert cache.get(request) == {"answer": 42}
+        stats = cache_stats(cache)
+        assert stats["disk"]["hits"] == 1
+        assert stats["disk"]["ttl_seconds"] == 60
+        assert stats["memory"]["max_bytes"] == 1 << 20
+
+
+class TestS3Expiry:
+    """Tests for S3CacheBackend.ensure_expiry lifecycle rules."""
+
+    def _backend(self, client):
+        return S3CacheBackend(bucket="b", prefix="cache/", client=client)
+
+    def test_adds_rule_and_keeps_others(self):
+        client = MagicMock()
+        other = {"ID": "logs", "Filter": {"Prefix": "logs/"}, "Status": "Enabled"}
+        client.get_bucket_lifecycle_configuration.return_value = {"Rules": [other]}
+
+        assert self._backend(client).ensure_expiry(7) is True
+
+        rules = client.put_bucket_lifecycle_configuration.call_args[1]["LifecycleConfiguration"][
+            "Rules"
+        ]
+        assert rules[0] == other
+        assert rules[1]["Filter"] == {"Prefix": "cache/"}
+        assert rules[1]["Expiration"] == {"Days": 7}
+
+    def test_no_existing_configuration(self):
+        client = MagicMock()
+        client.get_bucket_lifecycle_configuration.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchLifecycleConfiguration", "Message": "none"}},
+            "GetBucketLifecycleConfiguration",
+        )
+
+        assert self._backend(client).ensure_expiry(7) is True
+        client.put_bucket_lifecycle_configuration.assert_called_once()
+
+    def test_unchanged_rule_is_not_rewritten(self):
+        client = MagicMock()
+        backend = self._backend(client)
+        client.get_bucket_lifecycle_configuration.return_value = {"Rules": []}
+        backend.ensure_expiry(7)
+        rules = client.put_bucket_lifecycle_configuration.call_args[1]["LifecycleConfiguration"][
+            "Rules"
+        ]
+        client.reset_mock()
+        client.get_bucket_lifecycle_configuration.return_value = {"Rules": rules}
+
+        assert backend.ensure_expiry(7) is False
+        client.put_bucket_lifecycle_configuration.assert_not_called()
+
+    def test_access_denied_warns(self, caplog):
+        client = MagicMock()
+        client.get_bucket_lifecycle_configuration.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "no"}},
+            "GetBucketLifecycleConfiguration",
+        )
+
+        assert self._backend(client).ensure_expiry(7) is False
+        assert "Failed to read lifecycle rules" in caplog.text
+
+    def test_empty_prefix_is_refused(self, caplog):
+        client = MagicMock()
+        backend = S3CacheBackend(bucket="b", prefix="", client=client)
+
+        assert backend.ensure_expiry(7) is False
+        client.get_bucket_lifecycle_configuration.assert_not_called()
+        client.put_bucket_lifecycle_configuration.assert_not_called()
+        assert "Not setting cache expiry" in caplog.text
+
+
+class TestCacheManifest:
+    """Tests for CacheManifest serialization and suite ids."""
+
+    def test_roundtrip(self):
+        manifest = CacheManifest(suite_id="s", run_id="r", reads={"a", "b"}, writes={"b", "c"})
+
+        loaded = CacheManifest.from_bytes(manifest.to_bytes())
+
+        assert loaded == manifest
+        assert loaded.keys == {"a", "b", "c"}
+
+    def test_object_key_sorts_by_creation_time(self):
+        early = CacheManifest("s", "zzz", created_at=datetime(2026, 1, 1, tzinfo=UTC))
+        late = CacheManifest("s", "aaa", created_at=datetime(2026, 1, 2, tzinfo=UTC))
+
+        assert early.object_key.startswith(f"{MANIFEST_PREFIX}s/")
+        assert early.object_key < late.object_key
+
+    def test_suite_id_ignores_test_order(self, simple_graph):
+        a = TestCase(name="a", user_prompt="hi")
+        b = TestCase(name="b", user_prompt="bye")
+
+        assert suite_cache_id(simple_graph, [a, b]) == suite_cache_id(simple_graph, [b, a])
+        assert suite_cache_id(simple_graph, [a]) != suite_cache_id(simple_graph, [a, b])
+
+
+class TestRunCacheManifest:
+    """Tests for run-scoped manifest recording, prefetch and gc on S3Cache."""
+
+    @pytest.fixture
+    def s3_client(self):
+        return _DictS3Client()
+
+    @pytest.fixture
+    def s3_cache(self, s3_client, manifest_dir):
+        original = dspy.cache
+        dspy.cache = S3Cache(s3_bucket="b", s3_prefix="p/", s3_client=s3_client)
+        yield dspy.cache
+        dspy.cache = original
+
+    @pytest.fixture
+    def tests(self):
+        return [TestCase(name="t", user_prompt="hi")]
+
+    def _request(self, n: int) -> dict:
+        return {"messages": [{"role": "user", "content": f"hello {n}"}]}
+
+    async def test_records_reads_and_writes(self, s3_cache, s3_client, simple_graph, tests):
+        async with run_cache_manifest(simple_graph, tests, run_id="run1") as manifest:
+            s3_cache.get(self._request(1))
+            s3_cache.put(self._request(1), "one")
+
+        key = s3_cache.cache_key(self._request(1))
+        assert manifest.reads == {key}
+        assert manifest.writes == {key}
+        saved = s3_cache.latest_manifest(suite_cache_id(simple_graph, tests))
+        assert saved.run_id == "run1"
+        assert saved.keys == {key}
+
+    async def test_no_recording_outside_a_run(self, s3_cache, s3_client):
+        s3_cache.put(self._request(1), "one")
+
+        assert not any(key.startswith(f"p/{MANIFEST_PREFIX}") for key in s3_client.objects)
+
+    async def test_empty_manifest_not_saved(self, s3_cache, s3_client, simple_graph, tests):
+        async with run_cache_manifest(simple_graph, tests):
+            pass
+
+        assert s3_client.objects == {}
+
+    async def test_next_run_prefetches_into_memory(self, s3_cache, s3_client, simple_graph, tests):
+        async with run_cache_manifest(simple_graph, tests):
+            s3_cache.put(self._request(1), "one")
+            s3_cache.put(self._request(2), "two")
+        s3_cache.reset_memory_cache()
+        s3_client.gets = 0
+
+        async with run_cache_manifest(simple_graph, tests):
+            gets_after_prefetch = s3_client.gets
+            assert s3_cache.get(self._request(1)) == "one"
+
+        # One GET for the manifest, then one per entry; the lookup is a memory hit.
+        assert gets_after_prefetch == 3
+        assert s3_client.gets == 3
+
+    async def test_prefetch_skipped_when_disabled(self, s3_cache, s3_client, simple_graph, tests):
+        async with run_cache_manifest(simple_graph, tests):
+            s3_cache.put(self._request(1), "one")
+        s3_client.gets = 0
+
+        async with run_cache_manifest(simple_graph, tests, prefetch=False):
+            pass
+
+        assert s3_client.gets == 0
+
+    async def test_noop_without_s3_cache(self, simple_graph, tests):
+        original = dspy.cache
+        dspy.cache = MagicMock(spec=Cache)
+        try:
+            async with run_cache_manifest(simple_graph, tests) as manifest:
+                assert manifest is None
+        finally:
+            dspy.cache = original
+
+    def _save_manifest(self, s3_cache, run_id: str, keys: set[str], days_ago: float) -> None:
+        created = datetime.now(UTC) - timedelta(days=days_ago)
+        s3_cache.save_manifest(CacheManifest("suite", run_id, created_at=created, reads=keys))
+
+    def test_gc_deletes_unreferenced_entries(self, s3_cache, s3_client):
+        for key in ("live", "dead", "young"):
+            s3_cache.s3_backend.store(key, b"x")
+        s3_client.age("p/live", 5)
+        s3_client.age("p/dead", 5)
+        self._save_manifest(s3_cache, "old", {"dead"}, days_ago=3)
+        self._save_manifest(s3_cache, "new", {"live"}, days_ago=1)
+
+        summary = s3_cache.gc(keep=1)
+
+        assert {"p/live", "p/young"} <= set(s3_client.objects)
+        assert "p/dead" not in s3_client.objects
+        assert summary["entries_deleted"] == 1
+        assert summary["manifests_deleted"] == 1
+        manifests = [k for k in s3_client.objects if k.startswith(f"p/{MANIFEST_PREFIX}")]
+        assert len(manifests) == 1 and "new" in manifests[0]
+
+    def test_gc_dry_run_deletes_nothing(self, s3_cache, s3_client):
+        s3_cache.s3_backend.store("dead", b"x")
+        s3_client.age("p/dead", 5)
+        self._save_manifest(s3_cache, "r", set(), days_ago=0)
+        before = dict(s3_client.objects)
+
+        summary = s3_cache.gc(dry_run=True)
+
+        assert summary["entries_deleted"] == 1
+        assert s3_client.objects == before
+
+    def test_gc_refuses_without_manifests(self, s3_cache):
+        with pytest.raises(ValueError, match="No cache manifests"):
+            s3_cache.gc()
+
+
 class TestS3Cache:
     """Tests for S3Cache (dspy.clients.Cache subclass)."""
 
@@ -172,6 +668,14 @@ class TestS3Cache:
         assert cache.disk_cache.prefix == "pfx/"
         assert cache.enable_disk_cache is True
 
+    def test_local_cache_dir_uses_tiered_backend(self, tmp_path):
+        """S3Cache with local_cache_dir puts a local tier in front of S3."""
+        with patch("boto3.client", return_value=MagicMock()):
+            cache = S3Cache(s3_bucket="b", local_cache_dir=tmp_path, negative_ttl_seconds=5)
+        assert isinstance(cache.disk_cache, TieredCacheBackend)
+        assert cache.disk_cache.remote.compress is True
+        assert cache.disk_cache._misses.ttl == 5
+
     def test_memory_cache_enabled_by_default(self):
         """S3Cache enables memory cache by default."""
         with patch("boto3.client", return_value=MagicMock()):
@@ -229,18 +733,39 @@ class TestS3Cache:
 class TestSetupCacheFromSettings:
     """Tests for setup_cache_from_settings()."""
 
-    def test_disk_backend_does_nothing(self):
-        settings = CacheSettings(cache_backend="disk")
-        with patch("voicetest.util.cache.S3Cache") as mock_cls:
-            setup_cache_from_settings(settings)
-            mock_cls.assert_not_called()
+    def test_disk_backend_installs_bounded_cache(self):
+        settings = CacheSettings(
+            cache_backend="disk", memory_max_bytes=4096, disk_max_bytes=8192, disk_ttl_seconds=60
+        )
+        original_cache = dspy.cache
+        try:
+            with (
+                patch("voicetest.util.cache.S3Cache") as mock_cls,
+                patch("voicetest.util.cache.bounded_disk_cache") as mock_bounded,
+            ):
+                setup_cache_from_settings(settings)
+                mock_cls.assert_not_called()
+                mock_bounded.assert_called_once_with(
+                    disk_max_bytes=8192, disk_ttl_seconds=60, memory_max_bytes=4096
+                )
+                assert dspy.cache is mock_bounded.return_value
+        finally:
+            dspy.cache = original_cache
 
     def test_s3_backend_without_bucket_warns(self, caplog):
         settings = CacheSettings(cache_backend="s3", s3_bucket="")
-        with patch("voicetest.util.cache.S3Cache") as mock_cls:
-            setup_cache_from_settings(settings)
-            mock_cls.assert_not_called()
-            assert "no s3_bucket configured" in caplog.text
+        original_cache = dspy.cache
+        try:
+            with (
+                patch("voicetest.util.cache.S3Cache") as mock_cls,
+                patch("voicetest.util.cache.bounded_disk_cache") as mock_bounded,
+            ):
+                setup_cache_from_settings(settings)
+                mock_cls.assert_not_called()
+                mock_bounded.assert_called_once()
+                assert "no s3_bucket configured" in caplog.text
+        finally:
+            dspy.cache = original_cache
 
     def test_s3_backend_with_bucket_sets_dspy_cache(self):
         settings = CacheSettings(
@@ -259,10 +784,51 @@ class TestSetupCacheFromSettings:
                     s3_bucket="my-bucket",
                     s3_prefix="cache/",
                     s3_region="us-west-2",
+                    memory_max_bytes=256 << 20,
                 )
         finally:
             dspy.cache = original_cache
 
+    def test_tiered_backend_passes_local_tier_settings(self, tmp_path):
+        settings = CacheSettings(
+            cache_backend="tiered",
+            s3_bucket="my-bucket",
+            local_cache_dir=str(tmp_path),
+            local_cache_max_bytes=1024,
+            negative_ttl_seconds=5.0,
+            disk_ttl_seconds=600,
+            memory_max_bytes=2048,
+        )
+        original_cache = dspy.cache
+        try:
+            with patch("voicetest.util.cache.S3Cache") as mock_cls:
+                setup_cache_from_settings(settings)
+                mock_cls.assert_called_once_with(
+                    s3_bucket="my-bucket",
+                    s3_prefix="dspy-cache/",
+                    s3_region=None,
+                    memory_max_bytes=2048,
+                    local_cache_dir=str(tmp_path),
+                    local_cache_max_bytes=1024,
+                    local_cache_ttl_seconds=600,
+                    negative_ttl_seconds=5.0,
+                )
+        finally:
+            dspy.cache = original_cache
+
+    def test_tiered_backend_defaults_local_dir(self):
+        settings = CacheSettings(cache_backend="tiered", s3_bucket="my-bucket")
+        original_cache = dspy.cache
+        try:
+            with (
+                patch("voicetest.util.cache.S3Cache") as mock_cls,
+                patch("voicetest.util.cache.get_cache_dir", return_value="/x/cache"),
+            ):
+                setup_cache_from_settings(settings)
+                assert mock_cls.call_args[1]["local_cache_dir"] == "/x/cache"
+        finally:
+            dspy.cache = original_cache
+
     def test_s3_backend_assigns_to_dspy_cache(self):
         settings = CacheSettings(
             cache_backend="s3",
@@ -278,6 +844,88 @@ class TestSetupCacheFromSettings:
         finally:
             dspy.cache = original_cache
 
+    def test_s3_expire_days_installs_lifecycle_rule(self):
+        settings = CacheSettings(cache_backend="s3", s3_bucket="my-bucket", s3_expire_days=14)
+        original_cache = dspy.cache
+        try:
+            with patch("voicetest.util.cache.S3Cache") as mock_cls:
+                setup_cache_from_settings(settings)
+                mock_cls.return_value.s3_backend.ensure_expiry.assert_called_once_with(14)
+        finally:
+            dspy.cache = original_cache
+
+    def test_no_expiry_leaves_bucket_rules_alone(self):
+        settings = CacheSettings(cache_backend="s3", s3_bucket="my-bucket")
+        original_cache = dspy.cache
+        try:
+            with patch("voicetest.util.cache.S3Cache") as mock_cls:
+                setup_cache_from_settings(settings)
+                mock_cls.return_value.s3_backend.ensure_expiry.assert_not_called()
+        finally:
+            dspy.cache = original_cache
+
+
+class TestRecordingCache:
+    """Tests for local manifests and strict-offline lookups."""
+
+    @pytest.fixture
+    def disk_cache(self, tmp_path, manifest_dir):
+        original = dspy.cache
+        dspy.cache = bounded_disk_cache(tmp_path / "dspy")
+        yield dspy.cache
+        dspy.cache = original
+
+    @pytest.fixture
+    def tests(self):
+        return [TestCase(name="t", user_prompt="hi")]
+
+    def _request(self, n: int) -> dict:
+        return {"model": "openai/m", "messages": [{"role": "user", "content": f"hello {n}"}]}
+
+    async def test_disk_cache_saves_local_manifest(
+        self, disk_cache, manifest_dir, simple_graph, tests
+    ):
+        async with run_cache_manifest(simple_graph, tests, run_id="run1"):
+            disk_cache.put(self._request(1), "one")
+
+        assert (manifest_dir / "run1.json").exists()
+        manifest = disk_cache.find_manifest("run1")
+        assert manifest.keys == {disk_cache.cache_key(self._request(1))}
+        assert disk_cache.find_manifest("other") is None
+
+    def test_strict_offline_miss_raises(self, disk_cache):
+        with strict_offline(), pytest.raises(CacheMissError, match="openai/m"):
+            disk_cache.get(self._request(1))
+
+    def test_strict_offline_hit_returns(self, disk_cache):
+        disk_cache.put(self._request(1), {"answer": 1})
+        with strict_offline():
+            assert disk_cache.get(self._request(1)) is not None
+
+    def test_strict_offline_is_scoped(self, disk_cache):
+        with strict_offline():
+            assert is_strict_offline()
+        assert not is_strict_offline()
+        assert disk_cache.get(self._request(1)) is None
+
+    def test_lookup_and_store_raw_keys(self, disk_cache):
+        disk_cache.store("k", "v")
+        disk_cache.reset_memory_cache()
+        assert disk_cache.lookup("k") == "v"
+        assert disk_cache.lookup("missing") is None
+
+    async def test_s3_find_manifest_falls_back_to_bucket(self, manifest_dir, simple_graph, tests):
+        client = _DictS3Client()
+        cache = S3Cache(s3_bucket="b", s3_prefix="p/", s3_client=client)
+        manifest = CacheManifest(suite_id="s", run_id="remote-run", writes={"k"})
+        cache.save_manifest(manifest)
+        (manifest_dir / "remote-run.json").unlink()
+
+        found = cache.find_manifest("remote-run")
+
+        assert found.keys == {"k"}
+        assert cache.find_manifest("nope") is None
+
 
 class TestTryEvictLastCall:
     """Tests for try_evict_last_call(): reconstructs the cache key that dspy.LM
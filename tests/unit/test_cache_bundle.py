@@ -0,0 +1,100 @@
+"""Tests for voicetest.util.cache_bundle module."""
+
+import json
+import zipfile
+
+import pytest
+
+from voicetest.util.cache import CacheManifest
+from voicetest.util.cache import bounded_disk_cache
+from voicetest.util.cache_bundle import export_bundle
+from voicetest.util.cache_bundle import import_bundle
+
+
+@pytest.fixture
+def source(tmp_path):
+    cache = bounded_disk_cache(tmp_path / "source")
+    cache.store("k1", {"answer": "same"})
+    cache.store("k2", {"answer": "same"})
+    cache.store("k3", {"answer": "other"})
+    return cache
+
+
+@pytest.fixture
+def target(tmp_path):
+    return bounded_disk_cache(tmp_path / "target")
+
+
+@pytest.fixture
+def manifest():
+    return CacheManifest(suite_id="suite", run_id="run1", reads={"k1", "k3"}, writes={"k2"})
+
+
+class TestExportBundle:
+    def test_dedupes_identical_values(self, source, manifest, tmp_path):
+        summary = export_bundle(source, manifest, tmp_path / "b.zip")
+
+        assert summary["entries"] == 3
+        assert summary["objects"] == 2
+        assert summary["missing"] == 0
+
+    def test_missing_keys_are_counted(self, source, tmp_path):
+        manifest = CacheManifest(suite_id="s", run_id="r", reads={"k1", "gone"})
+
+        summary = export_bundle(source, manifest, tmp_path / "b.zip")
+
+        assert summary["entries"] == 1
+        assert summary["missing"] == 1
+
+    def test_same_entries_same_bytes(self, source, manifest, tmp_path):
+        first = export_bundle(source, manifest, tmp_path / "a.zip")
+        second = export_bundle(source, manifest, tmp_path / "b.zip")
+
+        assert first["digest"] == second["digest"]
+        assert (tmp_path / "a.zip").read_bytes() == (tmp_path / "b.zip").read_bytes()
+
+    def test_default_path_is_content_addressed(self, source, manifest, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        summary = export_bundle(source, manifest)
+
+        assert summary["path"] == f"voicetest-cache-{summary['digest'][:16]}.zip"
+        assert (tmp_path / summary["path"]).exists()
+
+
+class TestImportBundle:
+    def test_round_trip(self, source, target, manifest, tmp_path):
+        export_bundle(source, manifest, tmp_path / "b.zip")
+
+        summary = import_bundle(target, tmp_path / "b.zip")
+
+        assert summary == {"run_id": "run1", "digest": summary["digest"], "entries": 3}
+        assert target.lookup("k1") == {"answer": "same"}
+        assert target.lookup("k3") == {"answer": "other"}
+
+    def test_corrupt_object_rejected_before_writing(self, source, target, manifest, tmp_path):
+        export_bundle(source, manifest, tmp_path / "b.zip")
+        with zipfile.ZipFile(tmp_path / "b.zip") as zf:
+            index = zf.read("index.json")
+            names = [n for n in zf.namelist() if n.startswith("objects/")]
+        with zipfile.ZipFile(tmp_path / "bad.zip", "w") as zf:
+            zf.writestr("index.json", index)
+            for name in names:
+                zf.writestr(name, b"tampered")
+
+        with pytest.raises(ValueError, match="Corrupt cache bundle"):
+            import_bundle(target, tmp_path / "bad.zip")
+        assert target.lookup("k1") is None
+
+    def test_unsupported_version(self, target, tmp_path):
+        with zipfile.ZipFile(tmp_path / "b.zip", "w") as zf:
+            zf.writestr("index.json", json.dumps({"version": 99, "entries": {}}))
+
+        with pytest.raises(ValueError, match="Unsupported cache bundle version"):
+            import_bundle(target, tmp_path / "b.zip")
+
+    def test_not_a_zip(self, target, tmp_path):
+        (tmp_path / "b.zip").write_text("nope")
+
+        with pytest.raises(ValueError, match="Not a valid cache bundle"):
+            import_bundle(target, tmp_path / "b.zip")
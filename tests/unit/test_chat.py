@@ -7,7 +7,9 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from voicetest.engine.conversation import ConversationEngine
 from voicetest.exceptions import QuotaExhaustedError
+from voicetest.models.results import Message
 from voicetest.settings import Settings
 from voicetest.web.chat import ActiveChat
 from voicetest.web.chat import ChatManager
@@ -426,6 +428,44 @@ class TestChatManagerQuotaExhausted:
         assert len(error_msgs) == 0
 
 
+class TestChatManagerResumeChat:
+    """Tests for restoring chats left active by a server restart."""
+
+    def test_resume_from_checkpoint(self, chat_manager, call_repo, single_node_graph):
+        engine = ConversationEngine(single_node_graph, "openai/gpt-4o-mini")
+        engine._transcript.append(Message(role="user", content="Hello"))
+        engine._transcript.append(Message(role="assistant", content="Hi there"))
+        call_repo.get_checkpoint.return_value = {
+            "model": "openai/gpt-4o-mini",
+            "engine": engine.snapshot(),
+        }
+        call = call_repo.get.return_value
+
+        assert chat_manager.resume_chat(call, single_node_graph, call_repo)
+
+        active = chat_manager._sessions.get("test-chat-id")
+        assert active.engine.model == "openai/gpt-4o-mini"
+        assert [m["content"] for m in active.transcript] == ["Hello", "Hi there"]
+
+    def test_no_checkpoint(self, chat_manager, call_repo, single_node_graph):
+        call_repo.get_checkpoint.return_value = None
+
+        assert not chat_manager.resume_chat(
+            call_repo.get.return_value, single_node_graph, call_repo
+        )
+        assert chat_manager._sessions.get("test-chat-id") is None
+
+    def test_checkpoint_for_changed_graph(self, chat_manager, call_repo, single_node_graph):
+        call_repo.get_checkpoint.return_value = {
+            "model": "openai/gpt-4o-mini",
+            "engine": {"v": 1, "node": "removed", "transcript": [], "visited": ["removed"]},
+        }
+
+        assert not chat_manager.resume_chat(
+            call_repo.get.return_value, single_node_graph, call_repo
+        )
+
+
 class TestActiveChatDataclass:
     """Tests for ActiveChat dataclass."""
 
@@ -99,3 +99,43 @@ class TestChatWebSocket:
                 ws.send_json({"type": "end_chat"})
 
         assert chat_manager.get_active_chat(chat_id) is None
+
+    def _chat_left_by_restart(self, db_client, make_agent, single_node_graph) -> str:
+        """A chat with one exchange whose session the server no longer holds."""
+        agent_id = make_agent(graph=single_node_graph)["id"]
+        chat_id = _start_chat(db_client, agent_id)
+        with (
+            patch("voicetest.engine.conversation.call_llm", side_effect=_stub_llm),
+            db_client.websocket_connect(f"/api/chats/{chat_id}/ws") as ws,
+        ):
+            ws.receive_json()  # state
+            ws.send_json({"type": "message", "content": "hello there"})
+            ws.receive_json()
+            ws.receive_json()
+        chat_manager = db_client.app.state.container.resolve(ChatManager)
+        chat_manager._sessions._sessions.pop(chat_id)
+        return chat_id
+
+    def test_chat_ws_resumes_chat_after_restart(self, db_client, make_agent, single_node_graph):
+        chat_id = self._chat_left_by_restart(db_client, make_agent, single_node_graph)
+
+        with db_client.websocket_connect(f"/api/chats/{chat_id}/ws") as ws:
+            ws.receive_json()  # state
+
+        active = db_client.app.state.container.resolve(ChatManager).get_active_chat(chat_id)
+        assert [m["content"] for m in active.transcript] == ["hello there", "canned reply"]
+
+    def test_message_to_unrecoverable_chat_reports_error(
+        self, db_client, make_agent, single_node_graph
+    ):
+        chat_id = self._chat_left_by_restart(db_client, make_agent, single_node_graph)
+
+        with (
+            patch.object(ChatManager, "resume_chat", return_value=False),
+            db_client.websocket_connect(f"/api/chats/{chat_id}/ws") as ws,
+        ):
+            ws.receive_json()  # state
+            ws.send_json({"type": "message", "content": "still there?"})
+            reply = ws.receive_json()
+
+        assert reply == {"type": "error", "message": "Chat is no longer active"}
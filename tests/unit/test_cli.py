@@ -2,6 +2,9 @@
 
 import dataclasses
 import json
+import os
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import click
@@ -13,9 +16,15 @@ from voicetest.cli import LazyExportChoice
 from voicetest.cli import main
 from voicetest.compose import get_compose_path
 from voicetest.importers.transcripts.retell import parse_retell
+from voicetest.models.test_case import RunOptions
 from voicetest.services import AgentService
 from voicetest.services import DiscoveryService
 from voicetest.services import RunService
+from voicetest.services.run_runner import RunJob
+from voicetest.services.run_runner import RunRunner
+from voicetest.util.cache import CacheManifest
+from voicetest.util.cache import S3Cache
+from voicetest.util.cache import bounded_disk_cache
 
 
 @pytest.fixture
@@ -166,6 +175,58 @@ class TestCLIRunSaveOption:
         assert result.exit_code != 0
         assert "--agent-id" in result.output
 
+    def test_save_run_unknown_agent_fails_before_running(
+        self, cli_runner, temp_agent_file, temp_tests_file
+    ):
+        with patch("voicetest.runner.TestRunContext") as ctx_cls:
+            result = cli_runner.invoke(
+                main,
+                ["run", "--agent", str(temp_agent_file), "--tests", str(temp_tests_file)]
+                + ["--all", "--save-run", "--agent-id", "missing", "--no-daemon"],
+            )
+
+        assert result.exit_code == 1
+        assert "Agent not found: missing" in result.output
+        ctx_cls.assert_not_called()
+
+    def test_interrupted_save_run_leaves_no_run(
+        self, cli_runner, temp_agent_file, temp_tests_file, sample_retell_config, container
+    ):
+        agent_id = _create_agent_for_cli(container, sample_retell_config)
+
+        with patch(
+            "voicetest.runner.TestRunContext.run_all", side_effect=RuntimeError("interrupted")
+        ):
+            result = cli_runner.invoke(
+                main,
+                ["run", "--agent", str(temp_agent_file), "--tests", str(temp_tests_file)]
+                + ["--all", "--save-run", "--agent-id", agent_id, "--no-daemon"],
+            )
+
+        assert str(result.exception) == "interrupted"
+        assert container.resolve(RunService).list_runs(agent_id) == []
+
+
+class TestCLIRunOffline:
+    """Tests for the --offline option on the run command."""
+
+    def test_offline_sets_strict_offline(self, cli_runner, temp_agent_file, temp_tests_file):
+        with patch("voicetest.runner.TestRunContext", side_effect=RuntimeError("stop")) as ctx_cls:
+            cli_runner.invoke(
+                main,
+                [
+                    "run",
+                    "--agent",
+                    str(temp_agent_file),
+                    "--tests",
+                    str(temp_tests_file),
+                    "--all",
+                    "--offline",
+                ],
+            )
+
+        assert ctx_cls.call_args.kwargs["options"].strict_offline is True
+
 
 class TestCLIMain:
     """Tests for main entry point."""
@@ -213,7 +274,7 @@ class TestCLIServe:
         The fix made `_services()` lazy — this test pins that behavior.
         """
         with (
-            patch("voicetest.cli.build_app_services") as build_services,
+            patch("voicetest.services.build_app_services") as build_services,
             patch("voicetest.cli._start_server") as start_server,
         ):
             result = cli_runner.invoke(main, ["serve"])
@@ -222,6 +283,50 @@ class TestCLIServe:
         start_server.assert_called_once()
         build_services.assert_not_called()
 
+    def test_serve_rejects_several_workers(self, cli_runner, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/voicetest")
+
+        with patch("voicetest.cli._start_server") as start_server:
+            result = cli_runner.invoke(main, ["serve", "--workers", "2"])
+
+        assert result.exit_code == 2
+        assert "--executors" in result.output
+        start_server.assert_not_called()
+
+    def test_serve_executors_require_postgres(self, cli_runner, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+
+        with patch("voicetest.cli._start_server") as start_server:
+            result = cli_runner.invoke(main, ["serve", "--executors", "1"])
+
+        assert result.exit_code == 2
+        assert "PostgreSQL" in result.output
+        start_server.assert_not_called()
+
+    def test_serve_spawns_executors(self, cli_runner, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/voicetest")
+        seen = {}
+
+        def start_server(host, port, reload):
+            seen["executors"] = os.environ["VOICETEST_EXECUTORS"].split(",")
+
+        with (
+            patch("voicetest.cli.subprocess.Popen") as popen,
+            patch("voicetest.cli._start_server", side_effect=start_server),
+        ):
+            result = cli_runner.invoke(main, ["serve", "--executors", "1"])
+
+        assert result.exit_code == 0, result.output
+        assert len(seen["executors"]) == 1
+        assert popen.call_args.args[0][-4:] == [
+            "executor",
+            "--socket",
+            seen["executors"][0],
+            "--resume",
+        ]
+        popen.return_value.terminate.assert_called_once()
+        assert "VOICETEST_EXECUTORS" not in os.environ
+
 
 class TestCLIUp:
     """Tests for the up command."""
@@ -643,6 +748,111 @@ class TestCLIRuns:
         assert "RUN_ID" in result.output
         assert "--yes" in result.output
 
+    def test_runs_stats_help(self, cli_runner):
+        result = cli_runner.invoke(main, ["runs", "stats", "--help"])
+
+        assert result.exit_code == 0
+        assert "AGENT_ID" in result.output
+        assert "--last" in result.output
+
+    def test_runs_stats_json(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        with patch.object(
+            RunService,
+            "get_stats",
+            return_value={"agent_id": "a", "run_count": 0, "nodes": [], "metrics": [], "tools": []},
+        ):
+            result = cli_runner.invoke(main, ["--json", "runs", "stats", "a"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["run_count"] == 0
+
+    def test_runs_usage_table(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        day = {
+            "date": "2026-01-02",
+            "runs": 2,
+            "results": 6,
+            "prompt_tokens": 12000,
+            "completion_tokens": 800,
+            "cost_usd": 0.042,
+        }
+        usage = {
+            "agent_id": "a",
+            "days": 7,
+            "total": {k: v for k, v in day.items() if k != "date"},
+            "daily": [day],
+        }
+        with patch.object(RunService, "get_usage", return_value=usage) as get_usage:
+            result = cli_runner.invoke(main, ["runs", "usage", "a", "--days", "7"])
+
+        assert result.exit_code == 0
+        get_usage.assert_called_once_with("a", 7)
+        assert "2026-01-02" in result.output
+        assert "12,000 in / 800 out tokens, $0.0420" in result.output
+
+    def test_runs_resume_unknown_run(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = cli_runner.invoke(main, ["runs", "resume", "missing"])
+
+        assert result.exit_code == 1
+        assert "Run not found" in result.output
+
+    def test_runs_resume_executes_unfinished_tests(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        job = RunJob(
+            run_id="r1",
+            agent_id="a",
+            test_records=[{"id": "t1"}],
+            result_ids={"t1": "res1"},
+            options=RunOptions(),
+        )
+        run = {"id": "r1", "started_at": "", "completed_at": "", "results": []}
+        with (
+            patch.object(RunRunner, "resume_job", return_value=job),
+            patch.object(RunRunner, "execute", new_callable=AsyncMock) as execute,
+            patch.object(RunService, "get_run", return_value=run),
+        ):
+            result = cli_runner.invoke(main, ["runs", "resume", "r1"])
+
+        assert result.exit_code == 0, result.output
+        execute.assert_awaited_once_with(job)
+        assert "Resuming 1 test(s) of run r1" in result.output
+
+    def test_runs_backfill_stats(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = cli_runner.invoke(main, ["--json", "runs", "backfill-stats"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {"results_scanned": 0, "results_backfilled": 0}
+
+    def test_runs_export_requires_selection(self, cli_runner, tmp_path):
+        result = cli_runner.invoke(main, ["runs", "export", "-o", str(tmp_path)])
+
+        assert result.exit_code != 0
+        assert "RUN_IDS or --agent" in result.output
+
+    def test_runs_export_json(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        summary = {"runs": 1, "results": 2, "metrics": 0, "messages": 4, "output_dir": "out"}
+        with patch.object(RunService, "export_runs", return_value=summary) as export:
+            result = cli_runner.invoke(
+                main, ["--json", "runs", "export", "run-1", "--format", "parquet", "-o", "out"]
+            )
+
+        assert result.exit_code == 0
+        assert json.loads(result.output) == summary
+        assert export.call_args.kwargs["run_ids"] == ["run-1"]
+
+    def test_runs_archive_without_retention_fails(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".voicetest").mkdir()
+
+        result = cli_runner.invoke(main, ["runs", "archive", "--yes"])
+
+        assert result.exit_code == 1
+        assert "retention" in result.output
+
     def test_runs_shown_in_main_help(self, cli_runner):
         result = cli_runner.invoke(main, ["--help"])
 
@@ -1008,6 +1218,34 @@ class TestCLIImportCall:
         assert len(run["results"]) == 1
         assert run["results"][0]["status"] == "imported"
 
+    def test_streams_json_lines_in_batches(
+        self, cli_runner, tmp_path, monkeypatch, sample_retell_config, retell_call, container
+    ):
+        monkeypatch.chdir(tmp_path)
+        agent_id = _create_agent_for_cli(container, sample_retell_config)
+
+        transcript_path = tmp_path / "calls.jsonl"
+        transcript_path.write_text(
+            "\n".join(json.dumps(retell_call(f"call_{i}")) for i in range(5)) + "\n"
+        )
+
+        result = cli_runner.invoke(
+            main,
+            [
+                "import-call",
+                "--agent",
+                agent_id,
+                "--transcript",
+                str(transcript_path),
+                "--batch-size",
+                "2",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Imported 4 conversation(s)..." in result.output
+        assert "Imported 5 conversation(s) into run" in result.output
+
     def test_unknown_agent_fails(self, cli_runner, tmp_path, monkeypatch, retell_call):
         monkeypatch.chdir(tmp_path)
 
@@ -1092,3 +1330,228 @@ class TestCLIReplay:
 
         assert result.exit_code == 0, result.output
         assert "Replayed 1 conversation" in result.output
+
+
+class TestCLICache:
+    """Tests for the cache command group."""
+
+    def test_gc_requires_s3_backend(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = cli_runner.invoke(main, ["cache", "gc"])
+
+        assert result.exit_code == 1
+        assert "cache_backend" in result.output
+
+    def test_gc_json_summary(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        s3_cache = MagicMock(spec=S3Cache)
+        s3_cache.gc.return_value = {"entries_deleted": 3, "dry_run": True}
+
+        with (
+            patch("voicetest.util.cache.setup_cache_from_settings"),
+            patch("dspy.cache", s3_cache),
+        ):
+            result = cli_runner.invoke(main, ["--json", "cache", "gc", "--keep", "5", "--dry-run"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["entries_deleted"] == 3
+        assert s3_cache.gc.call_args.kwargs["keep"] == 5
+        assert s3_cache.gc.call_args.kwargs["dry_run"] is True
+
+    def test_gc_reports_missing_manifests(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        s3_cache = MagicMock(spec=S3Cache)
+        s3_cache.gc.side_effect = ValueError("No cache manifests found.")
+
+        with (
+            patch("voicetest.util.cache.setup_cache_from_settings"),
+            patch("dspy.cache", s3_cache),
+        ):
+            result = cli_runner.invoke(main, ["cache", "gc"])
+
+        assert result.exit_code == 1
+        assert "No cache manifests found" in result.output
+
+    def test_export_and_import_bundle(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("voicetest.util.cache.get_manifest_dir", lambda: tmp_path / "m")
+        source = bounded_disk_cache(tmp_path / "source")
+        source.store("k1", {"answer": 1})
+        source.save_manifest(CacheManifest(suite_id="s", run_id="run1", reads={"k1"}))
+        bundle = tmp_path / "bundle.zip"
+
+        with (
+            patch("voicetest.util.cache.setup_cache_from_settings"),
+            patch("dspy.cache", source),
+        ):
+            result = cli_runner.invoke(
+                main, ["--json", "cache", "export", "--run", "run1", "-o", str(bundle)]
+            )
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["entries"] == 1
+
+        target = bounded_disk_cache(tmp_path / "target")
+        with (
+            patch("voicetest.util.cache.setup_cache_from_settings"),
+            patch("dspy.cache", target),
+        ):
+            result = cli_runner.invoke(main, ["cache", "import", str(bundle)])
+        assert result.exit_code == 0, result.output
+        assert "Imported 1 cache entries from run run1" in result.output
+        assert target.lookup("k1") == {"answer": 1}
+
+    def test_export_unknown_run(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("voicetest.util.cache.get_manifest_dir", lambda: tmp_path / "m")
+
+        with (
+            patch("voicetest.util.cache.setup_cache_from_settings"),
+            patch("dspy.cache", bounded_disk_cache(tmp_path / "c")),
+        ):
+            result = cli_runner.invoke(main, ["cache", "export", "--run", "nope"])
+
+        assert result.exit_code == 1
+        assert "No cache manifest for run nope" in result.output
+
+    def test_import_rejects_bad_bundle(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "bad.zip").write_text("nope")
+
+        with (
+            patch("voicetest.util.cache.setup_cache_from_settings"),
+            patch("dspy.cache", bounded_disk_cache(tmp_path / "c")),
+        ):
+            result = cli_runner.invoke(main, ["cache", "import", str(tmp_path / "bad.zip")])
+
+        assert result.exit_code == 1
+        assert "Not a valid cache bundle" in result.output
+
+    def test_stats_json(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cache = bounded_disk_cache(tmp_path / "dspy", memory_max_bytes=4096)
+
+        with (
+            patch("voicetest.util.cache.setup_cache_from_settings"),
+            patch("voicetest.util.cache.dspy.cache", cache),
+        ):
+            result = cli_runner.invoke(main, ["--json", "cache", "stats"])
+
+        assert result.exit_code == 0, result.output
+        stats = json.loads(result.output)
+        assert stats["memory"]["max_bytes"] == 4096
+        assert stats["disk"]["entries"] == 0
+
+    def test_stats_table(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cache = bounded_disk_cache(tmp_path / "dspy")
+
+        with (
+            patch("voicetest.util.cache.setup_cache_from_settings"),
+            patch("voicetest.util.cache.dspy.cache", cache),
+        ):
+            result = cli_runner.invoke(main, ["cache", "stats"])
+
+        assert result.exit_code == 0, result.output
+        assert "memory" in result.output
+        assert "disk" in result.output
+
+
+class TestCLIBench:
+    """Tests for the bench command."""
+
+    def test_list_json(self, cli_runner):
+        result = cli_runner.invoke(main, ["--json", "bench", "--list", "-k", "broadcast/fan_out["])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == [
+            "broadcast/fan_out[subscribers=1]",
+            "broadcast/fan_out[subscribers=10]",
+            "broadcast/fan_out[subscribers=100]",
+        ]
+
+    def test_unknown_filter(self, cli_runner):
+        result = cli_runner.invoke(main, ["bench", "-k", "nope"])
+
+        assert result.exit_code == 1
+        assert "No benchmarks match" in result.output
+
+    def test_run_writes_results(self, cli_runner, tmp_path):
+        output = tmp_path / "bench.json"
+
+        result = cli_runner.invoke(
+            main,
+            ["bench", "--quick", "--min-time", "0", "-k", "subscribers=1]", "-o", str(output)],
+        )
+
+        assert result.exit_code == 0, result.output
+        results = json.loads(output.read_text())
+        assert list(results["benchmarks"]) == ["broadcast/fan_out[subscribers=1]"]
+        assert "Saved 1 results" in result.output
+
+    def test_default_output_under_voicetest_dir(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".voicetest").mkdir()
+
+        result = cli_runner.invoke(
+            main, ["--json", "bench", "--quick", "--min-time", "0", "-k", "subscribers=1]"]
+        )
+
+        assert result.exit_code == 0, result.output
+        output = json.loads(result.stdout)["output"]
+        assert output.startswith(str(tmp_path / ".voicetest" / "benchmarks"))
+
+    def test_fail_on_regression(self, cli_runner, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "scale": 0.01,
+                    "benchmarks": {"broadcast/fan_out[subscribers=1]": {"median_ms": 1e-9}},
+                }
+            )
+        )
+
+        result = cli_runner.invoke(
+            main,
+            [
+                "--json",
+                "bench",
+                "--quick",
+                "--min-time",
+                "0",
+                "-k",
+                "subscribers=1]",
+                "-o",
+                str(tmp_path / "current.json"),
+                "--compare",
+                str(baseline),
+                "--fail-on-regression",
+            ],
+        )
+
+        assert result.exit_code == 1
+        comparison = json.loads(result.stdout)["comparison"]
+        assert comparison[0]["status"] == "regressed"
+
+    def test_compare_rejects_invalid_baseline(self, cli_runner, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text("{}")
+
+        result = cli_runner.invoke(main, ["bench", "--compare", str(baseline)])
+
+        assert result.exit_code == 1
+        assert "Not a benchmark results file" in result.output
+
+
+class TestCLITrace:
+    """Tests for the global --trace option."""
+
+    def test_writes_trace_file(self, cli_runner, tmp_path):
+        trace = tmp_path / "trace.json"
+
+        result = cli_runner.invoke(main, ["--trace", str(trace), "bench", "--list"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(trace.read_text())["traceEvents"] == []
+        assert "Trace written to" in result.output
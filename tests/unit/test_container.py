@@ -1,5 +1,7 @@
 """Tests for dependency injection container."""
 
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -11,9 +13,17 @@ from sqlalchemy.orm import sessionmaker
 
 from voicetest.container import _is_postgres_url
 from voicetest.container import create_container
+from voicetest.exporters.registry import ExporterRegistry
+from voicetest.importers.registry import ImporterRegistry
+from voicetest.platforms.registry import PlatformRegistry
+from voicetest.registries import _EXPORTERS
+from voicetest.registries import _IMPORTERS
+from voicetest.registries import _PLATFORMS
 from voicetest.storage.repositories import AgentRepository
 from voicetest.storage.repositories import RunRepository
 from voicetest.storage.repositories import TestCaseRepository
+from voicetest.util.lazy import LazyEntries
+from voicetest.util.lazy import import_object
 from voicetest.web.calls import CallManager
 
 
@@ -160,3 +170,52 @@ class TestLiveCallManagerResolution:
         # /livekit/status endpoint can introspect connection settings.
         assert manager.config is not None
         assert manager.config.url
+
+
+class TestLazyRegistries:
+    """Importers, exporters and platforms are registered by import path."""
+
+    def test_registered_names_match_instances(self, fresh_container):
+        importers = fresh_container.resolve(ImporterRegistry)
+        exporters = fresh_container.resolve(ExporterRegistry)
+        platforms = fresh_container.resolve(PlatformRegistry)
+
+        for source_type in _IMPORTERS:
+            assert importers.get(source_type).source_type == source_type
+        for format_id in _EXPORTERS:
+            assert exporters.get(format_id).format_id == format_id
+        for platform in _PLATFORMS:
+            assert platforms.get(platform).platform_name == platform
+
+    def test_entries_built_once_on_first_lookup(self):
+        entries = LazyEntries()
+        entries.add_lazy("counter", "collections:Counter", "aab")
+
+        assert "counter" in entries
+        assert entries.names() == ["counter"]
+        first = entries.get("counter")
+        assert first == {"a": 2, "b": 1}
+        assert entries.get("counter") is first
+        assert entries.get("missing") is None
+
+    def test_bad_path_rejected(self):
+        with pytest.raises(ValueError, match="package.module:attribute"):
+            import_object("collections.Counter")
+
+    def test_container_does_not_import_platform_sdks(self):
+        """Resolving registries must not pull in vendor SDKs (checked in a clean interpreter)."""
+        code = (
+            "import sys\n"
+            "from voicetest.container import create_container\n"
+            "from voicetest.importers.registry import ImporterRegistry\n"
+            "from voicetest.platforms.registry import PlatformRegistry\n"
+            "c = create_container()\n"
+            "c.resolve(ImporterRegistry).list_importers()\n"
+            "c.resolve(PlatformRegistry).list_platforms()\n"
+            "sdks = ('retell', 'telnyx', 'vapi', 'bland')\n"
+            "print(' '.join(m for m in sdks if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
@@ -137,3 +137,25 @@ class TestRunCoordinatorCancellation:
         # After the first context exits, a new caller can claim again.
         with coordinator.claim_orphan_cleanup(run_id) as again:
             assert again is True
+
+
+class TestRunCoordinatorStats:
+    """stats() feeds the /metrics gauges."""
+
+    @pytest.mark.asyncio
+    async def test_counts_queued_runs_subscribers_and_backlog(self, coordinator):
+        coordinator.start("queued")
+        coordinator.start("running")
+        coordinator.mark_started("running")
+        await coordinator.broadcast("queued", {"type": "test_started"})
+        await coordinator.attach("running", AsyncMock())
+
+        assert coordinator.stats() == {
+            "runs": 2,
+            "queued_runs": 1,
+            "channels": 2,
+            "subscribers": 1,
+            "queued_messages": 1,
+        }
+        coordinator.end("queued")
+        coordinator.end("running")
@@ -0,0 +1,222 @@
+"""Tests for the voicetest daemon and the CLI's use of it."""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from click.testing import CliRunner
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from voicetest.cli import main
+from voicetest.container import create_container
+from voicetest.daemon import VoicetestDaemon
+from voicetest.daemon import send_request
+from voicetest.web.rest import app
+
+
+def _open_db_elsewhere() -> subprocess.CompletedProcess:
+    """Open the project database from another process, as `voicetest runs` would."""
+    return subprocess.run(
+        [sys.executable, "-c", "import duckdb, sys; duckdb.connect(sys.argv[1]).close()"]
+        + [os.environ["VOICETEST_DB_PATH"]],
+        capture_output=True,
+        text=True,
+    )
+
+
+SETTINGS = """\
+[models]
+agent = "mock/agent"
+simulator = "mock/simulator"
+judge = "mock/judge"
+
+[run]
+max_turns = 2
+"""
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    # AF_UNIX paths are limited to ~100 bytes, which pytest's tmp_path can exceed.
+    socket_dir = Path(tempfile.mkdtemp(prefix="vtd"))
+    path = socket_dir / "daemon.sock"
+    monkeypatch.setenv("VOICETEST_DAEMON_SOCKET", str(path))
+    yield path
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch, sample_retell_config, sample_test_cases):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".voicetest").mkdir()
+    (tmp_path / ".voicetest" / "settings.toml").write_text(SETTINGS)
+    agent = tmp_path / "agent.json"
+    agent.write_text(json.dumps(sample_retell_config))
+    tests = tmp_path / "tests.json"
+    tests.write_text(json.dumps(sample_test_cases[:1]))
+    return agent, tests
+
+
+@pytest.fixture
+def daemon(project, socket_path):
+    """A daemon serving on its own event loop thread."""
+    server = VoicetestDaemon(create_container())
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_until_complete, args=(server.serve(socket_path),), daemon=True
+    )
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not socket_path.exists():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    yield server
+    loop.call_soon_threadsafe(server.stop)
+    thread.join(10)
+    loop.close()
+
+
+class TestDaemonProtocol:
+    def test_status(self, daemon, socket_path):
+        (event,) = asyncio.run(send_request({"op": "status"}, socket_path))
+
+        assert event["event"] == "status"
+        assert event["runs_served"] == 0
+
+    def test_unknown_op(self, daemon, socket_path):
+        (event,) = asyncio.run(send_request({"op": "nope"}, socket_path))
+
+        assert event == {"event": "error", "message": "Unknown op: nope"}
+
+    def test_run_streams_results(self, daemon, socket_path, project):
+        agent, tests = project
+
+        events = asyncio.run(
+            send_request(
+                {"op": "run", "agent": str(agent), "tests": str(tests), "run_all": True},
+                socket_path,
+            )
+        )
+
+        kinds = [e["event"] for e in events]
+        assert kinds == ["loaded", "started", "result", "done"]
+        assert events[0]["source_type"] == "retell"
+        assert events[-1]["run"]["results"][0]["test_name"] == events[2]["result"]["test_name"]
+        assert daemon.runs_served == 1
+
+    def test_unchanged_agent_parsed_once(self, daemon, socket_path, project):
+        agent, tests = project
+        request = {"op": "run", "agent": str(agent), "tests": str(tests)}
+
+        with patch.object(
+            daemon._importers, "import_agent", wraps=daemon._importers.import_agent
+        ) as import_agent:
+            asyncio.run(send_request(request, socket_path))
+            asyncio.run(send_request(request, socket_path))
+            assert import_agent.call_count == 1
+
+            agent.write_text(agent.read_text() + "\n")
+            asyncio.run(send_request(request, socket_path))
+            assert import_agent.call_count == 2
+
+    def test_database_free_between_saved_runs(self, daemon, socket_path, project):
+        agent, tests = project
+        agent_id = daemon.services.agents.create_agent("Agent", path=str(agent))["id"]
+        daemon._release_database()
+        # The autouse web app container holds the database too; close it.
+        app.state.container.resolve(Session).close()
+        app.state.container.resolve(Engine).dispose()
+        assert _open_db_elsewhere().returncode == 0
+
+        events = asyncio.run(
+            send_request(
+                {
+                    "op": "run",
+                    "agent": str(agent),
+                    "tests": str(tests),
+                    "run_all": True,
+                    "save_run": True,
+                    "agent_id": agent_id,
+                },
+                socket_path,
+            )
+        )
+
+        run_id = events[-1]["saved_run_id"]
+        opened = _open_db_elsewhere()
+        assert opened.returncode == 0, opened.stderr
+        assert daemon.services.runs.get_run(run_id)["completed_at"] is not None
+
+    def test_refuses_second_daemon(self, daemon, socket_path):
+        with pytest.raises(RuntimeError, match="already listening"):
+            asyncio.run(VoicetestDaemon(create_container()).serve(socket_path))
+
+
+class TestDaemonCLI:
+    def test_run_uses_daemon(self, daemon, project):
+        agent, tests = project
+
+        result = CliRunner().invoke(
+            main, ["run", "--agent", str(agent), "--tests", str(tests), "--all"]
+        )
+
+        assert "Running 1 tests" in result.output
+        assert daemon.runs_served == 1
+
+    def test_traced_run_stays_in_process(self, daemon, project, tmp_path):
+        agent, tests = project
+
+        result = CliRunner().invoke(
+            main,
+            ["--trace", str(tmp_path / "trace.json"), "run", "--agent", str(agent)]
+            + ["--tests", str(tests), "--all"],
+        )
+
+        assert "Running 1 tests" in result.output
+        assert daemon.runs_served == 0
+        spans = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+        assert spans
+
+    def test_run_falls_back_on_stale_socket(self, project, socket_path):
+        agent, tests = project
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        with patch("voicetest.runner.TestRunContext", side_effect=RuntimeError("local")):
+            result = CliRunner().invoke(
+                main, ["run", "--agent", str(agent), "--tests", str(tests), "--all"]
+            )
+
+        assert str(result.exception) == "local"
+
+    def test_status_and_stop(self, daemon, socket_path):
+        runner = CliRunner()
+
+        status = runner.invoke(main, ["--json", "daemon", "status"])
+        assert json.loads(status.output)["running"] is True
+
+        stop = runner.invoke(main, ["daemon", "stop"])
+        assert stop.exit_code == 0, stop.output
+
+        deadline = time.monotonic() + 10
+        while socket_path.exists():
+            assert time.monotonic() < deadline, "daemon did not stop"
+            time.sleep(0.01)
+
+    def test_status_when_not_running(self, socket_path):
+        result = CliRunner().invoke(main, ["--json", "daemon", "status"])
+
+        assert result.exit_code == 1
+        assert json.loads(result.output) == {"running": False}
@@ -0,0 +1,240 @@
+"""Tests for running test runs in executor processes (voicetest.web.executor)."""
+
+import asyncio
+import json
+from pathlib import Path
+import shutil
+import tempfile
+
+import pytest
+
+from voicetest.models.results import TestResult
+from voicetest.models.test_case import RunOptions
+from voicetest.services.run_runner import RunJob
+from voicetest.services.runs import RunService
+from voicetest.services.testing.cases import TestCaseService
+from voicetest.web import executor as executor_module
+from voicetest.web.executor import ExecutorServer
+from voicetest.web.executor import RemoteRunCoordinator
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.messages: list[dict] = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(json.loads(text))
+
+    def types(self) -> list[str]:
+        return [message["type"] for message in self.messages]
+
+
+async def _until(condition, timeout: float = 10) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes, which pytest's tmp_path can exceed.
+    socket_dir = Path(tempfile.mkdtemp(prefix="vte"))
+    yield socket_dir / "executor.sock"
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def container(db_client):
+    return db_client.app.state.container
+
+
+@pytest.fixture
+def job(db_client, container, sample_retell_config) -> RunJob:
+    """A RunJob over two tests, prepared the way start_run does."""
+    agent_id = db_client.post(
+        "/api/agents", json={"name": "Executor Agent", "config": sample_retell_config}
+    ).json()["id"]
+    for i in range(2):
+        db_client.post(
+            f"/api/agents/{agent_id}/tests",
+            json={"name": f"Test {i + 1}", "user_prompt": "Hi", "metrics": []},
+        )
+
+    run_svc = container.resolve(RunService)
+    test_records = container.resolve(TestCaseService).list_tests(agent_id)
+    run = run_svc.create_run(agent_id)
+    result_ids = {
+        record["id"]: run_svc.create_pending_result(run["id"], record["id"], record["name"])
+        for record in test_records
+    }
+    return RunJob(
+        run_id=run["id"],
+        agent_id=agent_id,
+        test_records=test_records,
+        result_ids=result_ids,
+        options=RunOptions(max_turns=3),
+    )
+
+
+@pytest.fixture
+async def executor(container, socket_path):
+    server = ExecutorServer(container)
+    task = asyncio.create_task(server.serve(socket_path))
+    yield server
+    server.stop()
+    await task
+
+
+@pytest.fixture
+async def coordinator(executor, socket_path):
+    coordinator = RemoteRunCoordinator([socket_path])
+    await coordinator.open(timeout=5)
+    yield coordinator
+    await coordinator.close()
+
+
+def _patch_run_test(executor: ExecutorServer, monkeypatch, gate: asyncio.Event | None = None):
+    """Make each test report one turn, then wait for `gate` (if given) and pass."""
+
+    async def fake_run_test(graph, test_case, *, on_turn, **kwargs):
+        await on_turn([])
+        while gate is not None and not gate.is_set():
+            await asyncio.sleep(0.01)
+            await on_turn([])
+        return TestResult(test_name=test_case.name, status="pass", transcript=[])
+
+    monkeypatch.setattr(executor._runner._exec, "run_test", fake_run_test)
+
+
+class TestRunJobSerialization:
+    def test_round_trip(self, job):
+        data = json.loads(json.dumps(job.to_dict(), default=str))
+
+        restored = RunJob.from_dict(data)
+
+        assert restored.run_id == job.run_id
+        assert restored.result_ids == job.result_ids
+        assert restored.options == job.options
+        assert [r["id"] for r in restored.test_records] == [r["id"] for r in job.test_records]
+
+
+class TestRemoteRunCoordinator:
+    @pytest.mark.asyncio
+    async def test_events_relayed_to_websocket(self, executor, coordinator, job, monkeypatch):
+        _patch_run_test(executor, monkeypatch)
+        websocket = FakeWebSocket()
+        coordinator.start(job.run_id)
+        await coordinator.attach(job.run_id, websocket)
+
+        await coordinator.submit(job)
+        await _until(lambda: not coordinator.is_active(job.run_id))
+
+        assert websocket.types() == [
+            "test_started",
+            "transcript_update",
+            "test_completed",
+            "test_started",
+            "transcript_update",
+            "test_completed",
+            "run_completed",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancel_forwarded_to_executor(self, executor, coordinator, job, monkeypatch):
+        _patch_run_test(executor, monkeypatch, gate=asyncio.Event())
+        websocket = FakeWebSocket()
+        coordinator.start(job.run_id)
+        await coordinator.attach(job.run_id, websocket)
+
+        await coordinator.submit(job)
+        await _until(lambda: "test_started" in websocket.types())
+        coordinator.cancel_run(job.run_id)
+        await _until(lambda: not coordinator.is_active(job.run_id))
+
+        assert websocket.types().count("test_cancelled") == 2
+        assert websocket.types()[-1] == "run_completed"
+
+    @pytest.mark.asyncio
+    async def test_other_worker_sees_active_run(
+        self, executor, coordinator, job, socket_path, monkeypatch
+    ):
+        gate = asyncio.Event()
+        _patch_run_test(executor, monkeypatch, gate=gate)
+        coordinator.start(job.run_id)
+        await coordinator.submit(job)
+        await _until(lambda: executor.coordinator.is_active(job.run_id))
+
+        other = RemoteRunCoordinator([socket_path])
+        await other.open(timeout=5)
+        try:
+            await _until(lambda: other.is_active(job.run_id))
+            assert other.stats()["queued_runs"] == 0
+
+            gate.set()
+            await _until(lambda: not other.is_active(job.run_id))
+        finally:
+            await other.close()
+
+    @pytest.mark.asyncio
+    async def test_lost_executor_ends_its_runs_until_reconnected(
+        self, executor, coordinator, job, monkeypatch
+    ):
+        monkeypatch.setattr(executor_module, "RECONNECT_DELAY_SECONDS", 0.01)
+        gate = asyncio.Event()
+        _patch_run_test(executor, monkeypatch, gate=gate)
+        coordinator.start(job.run_id)
+        await coordinator.submit(job)
+        await _until(lambda: executor.coordinator.is_active(job.run_id))
+
+        for writer in list(executor.coordinator._writers):
+            writer.close()
+        await _until(lambda: not coordinator.is_active(job.run_id))
+
+        # On reconnect the executor's snapshot restores the still-running run.
+        await _until(lambda: coordinator.is_active(job.run_id))
+        gate.set()
+        await _until(lambda: not coordinator.is_active(job.run_id))
+
+    @pytest.mark.asyncio
+    async def test_run_submitted_by_other_worker_is_not_orphaned(
+        self, executor, coordinator, job, socket_path, monkeypatch
+    ):
+        gate = asyncio.Event()
+        _patch_run_test(executor, monkeypatch, gate=gate)
+        other = RemoteRunCoordinator([socket_path])
+        await other.open(timeout=5)
+        try:
+            coordinator.start(job.run_id)
+            await coordinator.submit(job)
+            # The executor's run_started has not reached the other worker yet.
+            assert not other.is_active(job.run_id)
+
+            assert not await other.is_orphaned(job.run_id)
+            assert other.is_active(job.run_id)
+
+            gate.set()
+            await _until(lambda: not other.is_active(job.run_id))
+            assert await other.is_orphaned(job.run_id)
+        finally:
+            await other.close()
+
+    @pytest.mark.asyncio
+    async def test_not_orphaned_while_an_executor_is_disconnected(
+        self, executor, coordinator, job, monkeypatch
+    ):
+        monkeypatch.setattr(executor_module, "RECONNECT_DELAY_SECONDS", 10)
+        for writer in list(executor.coordinator._writers):
+            writer.close()
+        await _until(lambda: not coordinator._links[0].connected)
+
+        assert not await coordinator.is_orphaned(job.run_id)
+
+    @pytest.mark.asyncio
+    async def test_submit_without_executor(self, socket_path, job):
+        coordinator = RemoteRunCoordinator([socket_path])
+        coordinator.start(job.run_id)
+
+        with pytest.raises(ConnectionError, match="No run executor"):
+            await coordinator.submit(job)
+        assert not coordinator.is_active(job.run_id)
@@ -2,16 +2,25 @@
 
 from datetime import datetime
 
+from voicetest.models.results import LLMRoleStats
 from voicetest.models.results import MetricResult
+from voicetest.models.results import SpanTiming
 from voicetest.models.results import TestResult
 from voicetest.models.results import TestRun
+from voicetest.util.formatting import format_cache_hit_rate
 from voicetest.util.formatting import format_flow
+from voicetest.util.formatting import format_llm_stats
 from voicetest.util.formatting import format_result_detail
 from voicetest.util.formatting import format_result_line
 from voicetest.util.formatting import format_run
 from voicetest.util.formatting import format_run_summary
+from voicetest.util.formatting import format_timings
+from voicetest.util.formatting import format_usage
+from voicetest.util.formatting import slowest_span
 from voicetest.util.formatting import status_color
 from voicetest.util.formatting import status_icon
+from voicetest.util.formatting import total_llm_stats
+from voicetest.util.formatting import total_timings
 
 
 class TestStatusIcon:
@@ -146,6 +155,18 @@ class TestFormatResultDetail:
         lines = format_result_detail(result)
         assert any("Failed to visit end node" in line for line in lines)
 
+    def test_result_with_llm_stats(self):
+        result = TestResult(
+            test_id="test-1",
+            test_name="Test One",
+            status="pass",
+            turn_count=5,
+            duration_ms=100,
+            llm_stats={"agent": LLMRoleStats(calls=3, cache_hits=2, cache_misses=1, latency_ms=40)},
+        )
+        lines = format_result_detail(result)
+        assert any("LLM: agent 3 (2 cached, 40ms)" in line for line in lines)
+
 
 class TestFormatRunSummary:
     """Tests for format_run_summary function."""
@@ -186,3 +207,110 @@ class TestFormatRun:
         assert any("Test B" in line for line in lines)
         assert any("1 passed" in line for line in lines)
         assert any("1 failed" in line for line in lines)
+
+    def test_format_run_with_llm_stats(self):
+        stats = {"agent": LLMRoleStats(calls=2, cache_hits=1, cache_misses=1, latency_ms=500)}
+        run = TestRun(
+            run_id="run-1",
+            started_at=datetime.now(),
+            results=[
+                TestResult(
+                    test_id="1",
+                    test_name="Test A",
+                    status="pass",
+                    turn_count=1,
+                    duration_ms=10,
+                    llm_stats=stats,
+                ),
+                TestResult(
+                    test_id="2",
+                    test_name="Test B",
+                    status="pass",
+                    turn_count=1,
+                    duration_ms=10,
+                    llm_stats=stats,
+                ),
+            ],
+        )
+        lines = format_run(run)
+        assert any("LLM calls: 4, 2/4 cached (50%), 1.0s total" in line for line in lines)
+
+
+class TestLLMStatsFormatting:
+    """Tests for LLM cache stat helpers."""
+
+    def test_total_across_roles(self):
+        total = total_llm_stats(
+            [
+                {"agent": LLMRoleStats(calls=2, cache_hits=2)},
+                {"judge": LLMRoleStats(calls=1, cache_misses=1, latency_ms=9)},
+            ]
+        )
+        assert total.calls == 3
+        assert total.cache_hits == 2
+        assert total.latency_ms == 9
+
+    def test_hit_rate_bypassed(self):
+        assert format_cache_hit_rate(LLMRoleStats(calls=2, cache_bypassed=2)) == "cache bypassed"
+
+    def test_hit_rate_no_calls(self):
+        assert format_cache_hit_rate(LLMRoleStats()) == "no LLM calls"
+
+    def test_shared_calls_shown(self):
+        stats = {"agent": LLMRoleStats(calls=3, cache_hits=2, coalesced=2, latency_ms=5)}
+        assert format_llm_stats(stats) == "agent 3 (2 cached, 2 shared, 5ms)"
+
+    def test_usage_totals_tokens_and_cost(self):
+        total = total_llm_stats(
+            [
+                {"agent": LLMRoleStats(calls=1, prompt_tokens=1200, completion_tokens=80)},
+                {"judge": LLMRoleStats(calls=1, prompt_tokens=300, cost_usd=0.0125)},
+            ]
+        )
+        assert format_usage(total) == "1,500 in / 80 out tokens, $0.0125"
+
+    def test_result_detail_includes_usage(self):
+        result = TestResult(
+            test_id="1",
+            test_name="Test",
+            status="pass",
+            llm_stats={"agent": LLMRoleStats(calls=1, prompt_tokens=10, completion_tokens=5)},
+        )
+        lines = format_result_detail(result)
+        assert any("Usage: 10 in / 5 out tokens, $0.0000" in line for line in lines)
+
+
+class TestTimingsFormatting:
+    """Tests for per-span timing helpers."""
+
+    def test_total_across_results(self):
+        totals = total_timings(
+            [
+                {"response": SpanTiming(count=2, total_ms=300, max_ms=200)},
+                {"response": SpanTiming(count=1, total_ms=500, max_ms=500)},
+            ]
+        )
+        assert totals["response"] == SpanTiming(count=3, total_ms=800, max_ms=500)
+
+    def test_slowest_first(self):
+        timings = {
+            "transition": SpanTiming(count=2, total_ms=400, max_ms=300),
+            "response": SpanTiming(count=2, total_ms=2500, max_ms=1500),
+        }
+        assert format_timings(timings) == (
+            "response 2.5s (2x, max 1.5s), transition 0.4s (2x, max 0.3s)"
+        )
+        assert slowest_span(timings) == "response 2.5s"
+
+    def test_slowest_span_empty(self):
+        assert slowest_span({}) == ""
+
+    def test_result_detail_includes_timings(self):
+        result = TestResult(
+            test_id="1",
+            test_name="Test",
+            status="pass",
+            timings={"simulator": SpanTiming(count=1, total_ms=1200, max_ms=1200)},
+        )
+        lines = format_result_detail(result)
+        assert any("Time: simulator 1.2s (1x, max 1.2s)" in line for line in lines)
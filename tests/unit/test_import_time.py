@@ -0,0 +1,86 @@
+"""Import-time budget for the CLI entry point.
+
+`voicetest --help` and commands that don't talk to an LLM or a platform must
+not pay for dspy, litellm, uvicorn, textual or vendor SDKs at startup. The
+check runs `python -X importtime` in a clean interpreter, both for importing
+the CLI and for running `voicetest importers`, which lists every importer."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# Loose enough for slow CI machines; set VOICETEST_IMPORT_BUDGET_MS to tighten locally.
+BUDGET_MS = float(os.environ.get("VOICETEST_IMPORT_BUDGET_MS", "1500"))
+
+HEAVY_MODULES = [
+    "dspy",
+    "litellm",
+    "openai",
+    "uvicorn",
+    "fastapi",
+    "textual",
+    "sqlalchemy",
+    "retell",
+    "telnyx",
+    "vapi",
+    "bland",
+    "livekit",
+]
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module `python *args` loads.
+
+    Top-level imports are also summed under the key "total"."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {"total": 0}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            times["total"] += int(cumulative)
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def cli_import_times() -> dict[str, int]:
+    _import_times("-c", "import voicetest.cli")  # Warm the bytecode cache.
+    return _import_times("-c", "import voicetest.cli")
+
+
+@pytest.fixture(scope="module")
+def importers_import_times() -> dict[str, int]:
+    _import_times("-m", "voicetest.cli", "importers")  # Warm the bytecode cache.
+    return _import_times("-m", "voicetest.cli", "importers")
+
+
+class TestCliImportTime:
+    @pytest.mark.parametrize("module", HEAVY_MODULES)
+    def test_heavy_module_not_imported(self, cli_import_times, module):
+        assert module not in cli_import_times
+
+    def test_within_budget(self, cli_import_times):
+        elapsed_ms = cli_import_times["voicetest.cli"] / 1000
+        assert elapsed_ms < BUDGET_MS, f"import voicetest.cli took {elapsed_ms:.0f}ms"
+
+
+class TestImportersCommandImportTime:
+    """`voicetest importers` builds the registries but not the container."""
+
+    @pytest.mark.parametrize("module", HEAVY_MODULES)
+    def test_heavy_module_not_imported(self, importers_import_times, module):
+        assert module not in importers_import_times
+
+    def test_within_budget(self, importers_import_times):
+        elapsed_ms = importers_import_times["total"] / 1000
+        assert elapsed_ms < BUDGET_MS, f"voicetest importers imports took {elapsed_ms:.0f}ms"
@@ -0,0 +1,106 @@
+"""Tests for voicetest.util.metrics module."""
+
+import asyncio
+
+import litellm
+import pytest
+
+from voicetest.llm.stats import record_llm_call
+from voicetest.util.metrics import EVENT_LOOP_LAG_SECONDS
+from voicetest.util.metrics import LLM_CACHE_HIT_RATIO
+from voicetest.util.metrics import LLM_CALL_SECONDS
+from voicetest.util.metrics import LLM_RETRIES
+from voicetest.util.metrics import Counter
+from voicetest.util.metrics import Gauge
+from voicetest.util.metrics import Histogram
+from voicetest.util.metrics import MetricsRegistry
+from voicetest.util.metrics import monitor_event_loop_lag
+from voicetest.util.retry import with_retry
+
+
+class TestExposition:
+    def test_counter_and_gauge(self):
+        registry = MetricsRegistry()
+        calls = registry.register(Counter("calls_total", "Calls.", ["role"]))
+        depth = registry.register(Gauge("depth", "Queue depth."))
+
+        calls.inc(role="agent")
+        calls.inc(2, role='say "hi"')
+        depth.set(1.5)
+
+        assert registry.render().splitlines() == [
+            "# HELP calls_total Calls.",
+            "# TYPE calls_total counter",
+            'calls_total{role="agent"} 1',
+            'calls_total{role="say \\"hi\\""} 2',
+            "# HELP depth Queue depth.",
+            "# TYPE depth gauge",
+            "depth 1.5",
+        ]
+
+    def test_histogram_buckets_are_cumulative(self):
+        latency = Histogram("latency_seconds", "Latency.", buckets=[0.1, 1])
+
+        for value in (0.05, 0.5, 0.7, 3):
+            latency.observe(value)
+
+        assert latency.render()[2:] == [
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 4.25",
+            "latency_seconds_count 4",
+        ]
+
+    def test_wrong_labels_rejected(self):
+        with pytest.raises(ValueError, match="expects labels"):
+            Counter("calls_total", "Calls.", ["role"]).inc(model="x")
+
+    def test_duplicate_names_rejected(self):
+        registry = MetricsRegistry()
+        registry.register(Gauge("depth", "Queue depth."))
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(Gauge("depth", "Again."))
+
+    def test_gauge_tracks_block(self):
+        gauge = Gauge("in_flight", "In flight.")
+
+        with gauge.track():
+            assert gauge.value() == 1
+        assert gauge.value() == 0
+
+
+class TestInstrumentation:
+    def test_llm_calls_observed(self):
+        before = LLM_CALL_SECONDS.count(model="metrics/test", role="judge")
+
+        record_llm_call("judge", True, 12, model="metrics/test")
+        record_llm_call("judge", None, 900, model="metrics/test")
+
+        assert LLM_CALL_SECONDS.count(model="metrics/test", role="judge") == before + 2
+        assert 0 < LLM_CACHE_HIT_RATIO.value() <= 1
+
+    @pytest.mark.asyncio
+    async def test_retries_counted_by_type(self):
+        before = LLM_RETRIES.value(error_type="RateLimitError")
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise litellm.RateLimitError("slow down", "openai", "gpt-4o")
+            return "ok"
+
+        await with_retry(flaky, base_delay=0, max_delay=0)
+
+        assert LLM_RETRIES.value(error_type="RateLimitError") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_event_loop_lag_sampled(self):
+        EVENT_LOOP_LAG_SECONDS.set(-1)
+        task = asyncio.create_task(monitor_event_loop_lag(interval=0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        assert EVENT_LOOP_LAG_SECONDS.value() >= 0
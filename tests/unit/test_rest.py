@@ -8,6 +8,7 @@ import pytest
 
 from voicetest.importers.retell import RetellImporter
 from voicetest.models.results import MetricResult
+from voicetest.util.cache import bounded_disk_cache
 from voicetest.web.rest import app
 
 
@@ -26,6 +27,35 @@ class TestHealthEndpoint:
         assert response.json() == {"status": "ok"}
 
 
+class TestCacheStatsEndpoint:
+    """Tests for the LLM cache stats endpoint."""
+
+    def test_reports_tier_stats(self, client, tmp_path):
+        cache = bounded_disk_cache(tmp_path, memory_max_bytes=4096)
+        with patch("voicetest.util.cache.dspy.cache", cache):
+            response = client.get("/api/cache/stats")
+
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["backend"] == "RecordingCache"
+        assert stats["memory"]["max_bytes"] == 4096
+        assert "evictions" in stats["disk"]
+
+
+class TestMetricsEndpoint:
+    """Tests for the Prometheus-style /metrics endpoint."""
+
+    def test_text_exposition(self, client):
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE voicetest_llm_call_seconds histogram" in response.text
+        assert "voicetest_runs_in_flight 0" in response.text
+        assert 'voicetest_sessions_active{kind="chat"} 0' in response.text
+        assert 'voicetest_websocket_subscribers{channel="run"} 0' in response.text
+
+
 class TestImportersEndpoint:
     """Tests for importers endpoint."""
 
@@ -58,6 +58,24 @@ class TestImportCallEndpoint:
         assert len(run["results"]) == 1
         assert run["results"][0]["test_name"] == "call_wh"
 
+    def test_import_json_lines_without_results(
+        self, db_client, make_agent, sample_retell_config, retell_call
+    ):
+        agent_id = make_agent(config=sample_retell_config)["id"]
+        payload = "\n".join(json.dumps(retell_call(f"call_{i}")) for i in range(3))
+
+        response = db_client.post(
+            f"/api/agents/{agent_id}/import-call?batch_size=2&include_results=false",
+            files={"file": ("calls.jsonl", payload, "application/x-ndjson")},
+        )
+
+        assert response.status_code == 200
+        run = response.json()
+        assert run["imported"] == 3
+        assert "results" not in run
+        full = db_client.get(f"/api/runs/{run['id']}").json()
+        assert {r["test_name"] for r in full["results"]} == {"call_0", "call_1", "call_2"}
+
     def test_unknown_agent_returns_404(self, db_client, retell_call):
         payload = json.dumps(retell_call())
         response = db_client.post(
@@ -6,13 +6,23 @@ to force the lifespan to fire.
 """
 
 import contextlib
+from datetime import UTC
+from datetime import datetime
+import threading
 from unittest.mock import patch
 
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import pytest
 from sqlalchemy import Engine
+from sqlalchemy.orm import Session
 
 from voicetest.container import create_container
+from voicetest.services.runs import RunService
+from voicetest.services.runs import write_runs_parquet
+from voicetest.settings import Settings
+from voicetest.storage.models import Run
+from voicetest.storage.repositories import AgentRepository
 from voicetest.web import rest as rest_module
 
 
@@ -83,3 +93,88 @@ def test_lifespan_reuses_preset_container(monkeypatch, tmp_path, restore_app_sta
         client.get("/api/agents")
         assert rest_module.app.state.container is preset
         init_storage.assert_called_once_with(preset)
+
+
+def test_lifespan_applies_retention_when_configured(monkeypatch, tmp_path, restore_app_state):
+    """With archive.retention_days set, startup archives old runs via RunService."""
+    monkeypatch.setenv("VOICETEST_LINKED_AGENTS", "")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".voicetest").mkdir()
+    Settings(archive={"retention_days": 30}).save()
+    rest_module.app.state.container = create_container()
+
+    summary = {"runs": 0, "results": 0, "metrics": 0, "messages": 0, "output_dir": "x"}
+    with (
+        patch.object(rest_module, "init_storage"),
+        patch.object(rest_module, "setup_cache_from_settings"),
+        patch.object(RunService, "archive_runs", return_value=summary) as archive,
+        TestClient(rest_module.app) as client,
+    ):
+        client.get("/api/agents")
+        archive.assert_called_once_with()
+
+
+def test_lifespan_survives_retention_failure(monkeypatch, tmp_path, restore_app_state):
+    """A failing archive pass is logged, not raised, so the server still starts."""
+    monkeypatch.setenv("VOICETEST_LINKED_AGENTS", "")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".voicetest").mkdir()
+    Settings(archive={"retention_days": 30}).save()
+    rest_module.app.state.container = create_container()
+
+    with (
+        patch.object(rest_module, "init_storage"),
+        patch.object(rest_module, "setup_cache_from_settings"),
+        patch.object(RunService, "archive_runs", side_effect=OSError("disk full")),
+        TestClient(rest_module.app) as client,
+    ):
+        assert client.get("/api/agents").status_code == 200
+
+
+def test_retention_runs_once_across_concurrent_lifespans(
+    monkeypatch, tmp_path, restore_app_state, imported_test_result
+):
+    """Two servers starting against one database archive each expired run once."""
+    monkeypatch.setenv("VOICETEST_LINKED_AGENTS", "")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".voicetest").mkdir()
+    Settings(archive={"retention_days": 30}).save()
+    container = create_container()
+    rest_module.app.state.container = container
+    agent = container.resolve(AgentRepository).create(name="a", source_type="custom")
+    run_svc = container.resolve(RunService)
+    run_id = run_svc.import_calls(agent["id"], [imported_test_result()])["id"]
+    session = container.resolve(Session)
+    session.get(Run, run_id).started_at = datetime(2020, 1, 1, tzinfo=UTC)
+    session.commit()
+
+    archiving, release = threading.Event(), threading.Event()
+    writes = []
+
+    def slow_write(batches, output_dir, runs):
+        writes.append(output_dir)
+        archiving.set()
+        release.wait(timeout=10)
+        return write_runs_parquet(batches, output_dir, runs)
+
+    def start_server():
+        app = FastAPI(lifespan=rest_module._lifespan)
+        app.state.container = container
+        with TestClient(app):
+            pass
+
+    with (
+        patch.object(rest_module, "init_storage"),
+        patch.object(rest_module, "setup_cache_from_settings"),
+        patch("voicetest.services.runs.write_runs_parquet", side_effect=slow_write),
+    ):
+        first = threading.Thread(target=start_server)
+        first.start()
+        assert archiving.wait(timeout=10)
+        start_server()
+        release.set()
+        first.join(timeout=10)
+
+    assert len(writes) == 1
+    assert run_svc.run_exists(run_id) is False
+    assert len(list((tmp_path / ".voicetest" / "archive" / "results").rglob("*.parquet"))) == 1
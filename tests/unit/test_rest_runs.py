@@ -1,11 +1,13 @@
 """Tests for WebSocket, run management, orphan detection, and diagnosis endpoints."""
 
 import asyncio
+import io
 import json
 import threading
 import time
 from unittest.mock import AsyncMock
 from unittest.mock import patch
+import zipfile
 
 import pytest
 
@@ -16,6 +18,7 @@ from voicetest.models.diagnosis import FaultLocation
 from voicetest.models.diagnosis import FixAttemptResult
 from voicetest.models.diagnosis import FixSuggestion
 from voicetest.models.diagnosis import PromptChange
+from voicetest.models.results import LLMRoleStats
 from voicetest.models.results import Message
 from voicetest.models.results import MetricResult
 from voicetest.models.results import TestResult
@@ -285,6 +288,136 @@ class TestOrphanedRunDetection:
             coordinator.end(run_id)
 
 
+class TestRunResumption:
+    """Tests for resuming runs interrupted by a server stop."""
+
+    @pytest.fixture
+    def interrupted_run(self, db_client, sample_retell_config):
+        """A run over two tests: the first finished, the second still `running`."""
+        agent_id = db_client.post(
+            "/api/agents", json={"name": "Resume Agent", "config": sample_retell_config}
+        ).json()["id"]
+        test_ids = [
+            db_client.post(
+                f"/api/agents/{agent_id}/tests",
+                json={"name": f"Test {i + 1}", "user_prompt": "Hi", "metrics": []},
+            ).json()["id"]
+            for i in range(2)
+        ]
+
+        run_svc = db_client.app.state.container.resolve(RunService)
+        run = run_svc.create_run(agent_id, RunOptions(max_turns=3))
+        result_ids = [
+            run_svc.create_pending_result(run["id"], test_id, f"Test {i + 1}")
+            for i, test_id in enumerate(test_ids)
+        ]
+        run_svc.complete_result(
+            result_ids[0], TestResult(test_name="Test 1", status="pass", transcript=[])
+        )
+        return {
+            "run_id": run["id"],
+            "agent_id": agent_id,
+            "test_ids": test_ids,
+            "result_ids": result_ids,
+        }
+
+    @staticmethod
+    def _patch_run_test():
+        async def fake_run_test(graph, test_case, **kwargs):
+            return TestResult(test_name=test_case.name, status="pass", transcript=[])
+
+        return patch(
+            "voicetest.services.testing.execution.TestExecutionService.run_test",
+            side_effect=fake_run_test,
+        )
+
+    def test_resume_job_rebuilds_unfinished_tests(self, db_client, interrupted_run):
+        runner = db_client.app.state.container.resolve(RunRunner)
+
+        job = runner.resume_job(interrupted_run["run_id"])
+
+        assert [r["id"] for r in job.test_records] == [interrupted_run["test_ids"][1]]
+        assert job.result_ids == {interrupted_run["test_ids"][1]: interrupted_run["result_ids"][1]}
+        assert job.options.max_turns == 3
+
+    def test_resume_reruns_orphaned_results(self, db_client, interrupted_run):
+        run_id = interrupted_run["run_id"]
+        orphaned = db_client.get(f"/api/runs/{run_id}").json()
+        assert orphaned["results"][1]["status"] == "error"
+
+        with self._patch_run_test():
+            response = db_client.post(f"/api/runs/{run_id}/resume")
+
+        assert response.status_code == 200
+        assert response.json()["test_count"] == 1
+        run = db_client.get(f"/api/runs/{run_id}").json()
+        assert run["completed_at"] is not None
+        assert [r["status"] for r in run["results"]] == ["pass", "pass"]
+        assert [r["id"] for r in run["results"]] == interrupted_run["result_ids"]
+
+    def test_resume_job_carries_checkpoint(self, db_client, interrupted_run):
+        container = db_client.app.state.container
+        run_svc = container.resolve(RunService)
+        result_id = interrupted_run["result_ids"][1]
+        checkpoint = {"turns": 1, "engine": {"v": 1, "node": "greeting", "transcript": []}}
+        run_svc.save_checkpoint(result_id, interrupted_run["run_id"], checkpoint)
+
+        job = container.resolve(RunRunner).resume_job(interrupted_run["run_id"])
+
+        assert job.checkpoints == {result_id: checkpoint}
+        run_svc.complete_result(
+            result_id, TestResult(test_name="Test 2", status="pass", transcript=[])
+        )
+        assert run_svc.get_checkpoints([result_id]) == {}
+
+    def test_deleted_test_case_is_marked_error(self, db_client, interrupted_run):
+        db_client.delete(f"/api/tests/{interrupted_run['test_ids'][1]}")
+
+        response = db_client.post(f"/api/runs/{interrupted_run['run_id']}/resume")
+
+        assert response.status_code == 400
+        run = db_client.get(f"/api/runs/{interrupted_run['run_id']}").json()
+        assert run["completed_at"] is not None
+        assert run["results"][1]["error_message"] == "Test case no longer exists"
+
+    def test_resume_finished_run_400(self, db_client, sample_retell_config):
+        agent_id = db_client.post(
+            "/api/agents", json={"name": "Done Agent", "config": sample_retell_config}
+        ).json()["id"]
+        run_repo = _get_run_repo(db_client)
+        run_id = run_repo.create(agent_id)["id"]
+        run_repo.complete(run_id)
+
+        response = db_client.post(f"/api/runs/{run_id}/resume")
+
+        assert response.status_code == 400
+        assert "no unfinished tests" in response.json()["detail"]
+
+    def test_resume_active_run_400(self, db_client, interrupted_run):
+        coordinator = _get_coordinator(db_client)
+        coordinator.start(interrupted_run["run_id"])
+        try:
+            response = db_client.post(f"/api/runs/{interrupted_run['run_id']}/resume")
+            assert response.status_code == 400
+        finally:
+            coordinator.end(interrupted_run["run_id"])
+
+    def test_resume_unknown_run_404(self, db_client):
+        assert db_client.post("/api/runs/nonexistent/resume").status_code == 404
+
+    def test_startup_resumes_interrupted_runs(self, db_client, interrupted_run):
+        run_repo = _get_run_repo(db_client)
+
+        with self._patch_run_test(), db_client:
+            deadline = time.monotonic() + 5
+            while run_repo.get_with_results(interrupted_run["run_id"])["completed_at"] is None:
+                assert time.monotonic() < deadline, "resumed run never completed"
+                time.sleep(0.02)
+
+        run = run_repo.get_with_results(interrupted_run["run_id"])
+        assert [r["status"] for r in run["results"]] == ["pass", "pass"]
+
+
 class TestRunDeletion:
     """Tests for run deletion endpoint."""
 
@@ -337,6 +470,166 @@ class TestRunDeletion:
             coordinator.end(run_id)
 
 
+class TestAgentStats:
+    """Tests for the result-analytics endpoint."""
+
+    def test_stats_aggregates_recent_runs(self, db_client, sample_retell_config):
+        agent_id = db_client.post(
+            "/api/agents",
+            json={"name": "Test Agent", "config": sample_retell_config},
+        ).json()["id"]
+
+        run_repo = _get_run_repo(db_client)
+        run = run_repo.create(agent_id)
+        run_repo.add_result(
+            run["id"],
+            TestResult(
+                test_name="t",
+                status="fail",
+                nodes_visited=["greeting"],
+                metric_results=[MetricResult(metric="polite", passed=False, reasoning="")],
+            ),
+        )
+
+        response = db_client.get(f"/api/agents/{agent_id}/stats?last_runs=5")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["run_count"] == 1
+        assert data["nodes"][0] == {
+            "node_id": "greeting",
+            "visits": 1,
+            "results": 1,
+            "failures": 1,
+            "failure_rate": 1.0,
+        }
+        assert data["metrics"][0]["metric"] == "polite"
+        assert data["metrics"][0]["pass_rate"] == 0.0
+
+    def test_stats_unknown_agent_404(self, db_client):
+        response = db_client.get("/api/agents/nonexistent/stats")
+        assert response.status_code == 404
+
+
+class TestAgentUsage:
+    """Tests for the token and cost endpoint."""
+
+    def test_usage_sums_results_per_day(self, db_client, sample_retell_config):
+        agent_id = db_client.post(
+            "/api/agents",
+            json={"name": "Test Agent", "config": sample_retell_config},
+        ).json()["id"]
+
+        run_repo = _get_run_repo(db_client)
+        run = run_repo.create(agent_id)
+        for cost in (0.25, 0.5):
+            run_repo.add_result(
+                run["id"],
+                TestResult(
+                    test_name="t",
+                    status="pass",
+                    llm_stats={
+                        "agent": LLMRoleStats(
+                            calls=1, prompt_tokens=100, completion_tokens=20, cost_usd=cost
+                        )
+                    },
+                ),
+            )
+        run_repo.add_result(run["id"], TestResult(test_name="imported", status="imported"))
+
+        response = db_client.get(f"/api/agents/{agent_id}/usage?days=7")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == {
+            "runs": 1,
+            "results": 3,
+            "prompt_tokens": 200,
+            "completion_tokens": 40,
+            "cost_usd": 0.75,
+        }
+        assert len(data["daily"]) == 1
+        assert data["daily"][0]["cost_usd"] == 0.75
+
+    def test_usage_unknown_agent_404(self, db_client):
+        response = db_client.get("/api/agents/nonexistent/usage")
+        assert response.status_code == 404
+
+
+class TestRunExportAndArchive:
+    """Tests for Parquet export and archival endpoints."""
+
+    def _agent_with_run(self, db_client, sample_retell_config) -> tuple[str, str]:
+        agent_id = db_client.post(
+            "/api/agents",
+            json={"name": "Test Agent", "config": sample_retell_config},
+        ).json()["id"]
+        run_repo = _get_run_repo(db_client)
+        run = run_repo.create(agent_id)
+        run_repo.add_result(
+            run["id"],
+            TestResult(
+                test_name="t",
+                status="pass",
+                transcript=[Message(role="user", content="hi")],
+            ),
+        )
+        run_repo.complete(run["id"])
+        return agent_id, run["id"]
+
+    def test_export_returns_parquet_zip(self, db_client, sample_retell_config):
+        agent_id, run_id = self._agent_with_run(db_client, sample_retell_config)
+
+        response = db_client.get(f"/api/runs/{run_id}/export?format=parquet")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        names = zipfile.ZipFile(io.BytesIO(response.content)).namelist()
+        assert {n.split("/")[0] for n in names} == {"runs", "results", "messages"}
+        assert all(f"agent_id={agent_id}" in n and n.endswith(".parquet") for n in names)
+
+    def test_export_does_not_load_the_run(self, db_client, sample_retell_config):
+        _agent_id, run_id = self._agent_with_run(db_client, sample_retell_config)
+
+        with patch.object(RunService, "get_run", side_effect=AssertionError("loaded whole run")):
+            response = db_client.get(f"/api/runs/{run_id}/export")
+
+        assert response.status_code == 200
+
+    def test_export_unknown_run_404(self, db_client):
+        response = db_client.get("/api/runs/nonexistent/export")
+        assert response.status_code == 404
+
+    def test_export_unsupported_format_400(self, db_client, sample_retell_config):
+        _agent_id, run_id = self._agent_with_run(db_client, sample_retell_config)
+
+        response = db_client.get(f"/api/runs/{run_id}/export?format=csv")
+
+        assert response.status_code == 400
+
+    def test_archive_with_zero_days_moves_completed_runs(
+        self, db_client, sample_retell_config, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".voicetest").mkdir()
+        _agent_id, run_id = self._agent_with_run(db_client, sample_retell_config)
+
+        response = db_client.post("/api/runs/archive", json={"older_than_days": 0})
+
+        assert response.status_code == 200
+        assert response.json()["runs"] == 1
+        assert db_client.get(f"/api/runs/{run_id}").status_code == 404
+        assert list((tmp_path / ".voicetest" / "archive").rglob("*.parquet"))
+
+    def test_archive_without_retention_400(self, db_client, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".voicetest").mkdir()
+
+        response = db_client.post("/api/runs/archive", json={})
+
+        assert response.status_code == 400
+
+
 class TestWebSocketStateMessage:
     """Tests for WebSocket state message with pending results."""
 
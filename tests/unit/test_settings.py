@@ -2,7 +2,10 @@
 
 import os
 
+import pytest
+
 from voicetest.settings import DEFAULT_MODEL
+from voicetest.settings import ModelPrice
 from voicetest.settings import Settings
 from voicetest.settings import load_settings
 from voicetest.settings import resolve_model
@@ -182,6 +185,81 @@ class TestExportSettings:
         assert loaded.export.layout is True
 
 
+class TestArchiveSettings:
+    """Tests for ArchiveSettings and the [archive] TOML section."""
+
+    def test_retention_disabled_by_default(self, tmp_path):
+        settings_file = tmp_path / ".voicetest.toml"
+        save_settings(Settings(), settings_file)
+
+        assert Settings().archive.retention_days is None
+        assert "[archive]" not in settings_file.read_text()
+
+    def test_archive_roundtrip_toml(self, tmp_path):
+        settings_file = tmp_path / ".voicetest.toml"
+
+        original = Settings(archive={"retention_days": 90, "directory": "/data/archive"})
+        save_settings(original, settings_file)
+
+        loaded = load_settings(settings_file)
+        assert loaded.archive.retention_days == 90
+        assert loaded.archive.directory == "/data/archive"
+
+
+class TestCacheSettings:
+    """Tests for CacheSettings and the [cache] TOML section."""
+
+    def test_tiered_roundtrip_toml(self, tmp_path):
+        settings_file = tmp_path / ".voicetest.toml"
+
+        original = Settings(
+            cache={
+                "cache_backend": "tiered",
+                "s3_bucket": "bucket",
+                "local_cache_dir": "/data/cache",
+                "local_cache_max_bytes": 1024,
+                "negative_ttl_seconds": 5.0,
+            }
+        )
+        save_settings(original, settings_file)
+
+        loaded = load_settings(settings_file)
+        assert loaded.cache == original.cache
+
+    def test_default_tier_settings_not_written(self, tmp_path):
+        settings_file = tmp_path / ".voicetest.toml"
+
+        save_settings(Settings(cache={"cache_backend": "s3", "s3_bucket": "b"}), settings_file)
+
+        text = settings_file.read_text()
+        assert "local_cache_max_bytes" not in text
+        assert "negative_ttl_seconds" not in text
+
+    def test_eviction_policy_roundtrip_toml(self, tmp_path):
+        settings_file = tmp_path / ".voicetest.toml"
+
+        original = Settings(
+            cache={
+                "memory_max_bytes": 1 << 20,
+                "disk_max_bytes": 1 << 30,
+                "disk_ttl_seconds": 86400.0,
+                "s3_expire_days": 30,
+            }
+        )
+        save_settings(original, settings_file)
+
+        loaded = load_settings(settings_file)
+        assert loaded.cache == original.cache
+        assert loaded.cache.cache_backend == "disk"
+
+    def test_default_cache_section_not_written(self, tmp_path):
+        settings_file = tmp_path / ".voicetest.toml"
+
+        save_settings(Settings(), settings_file)
+
+        assert "[cache]" not in settings_file.read_text()
+
+
 class TestResolveModel:
     """Tests for resolve_model utility."""
 
@@ -218,3 +296,30 @@ class TestResolveModel:
     def test_test_model_precedence_no_settings_no_role_returns_default(self):
         result = resolve_model(test_model_precedence=True)
         assert result == DEFAULT_MODEL
+
+
+class TestPricingSettings:
+    """Tests for the [pricing] TOML section."""
+
+    def test_pricing_roundtrip_toml(self, tmp_path):
+        settings_file = tmp_path / ".voicetest.toml"
+
+        original = Settings(
+            pricing={"openai/gpt-4o-mini": {"input_per_mtok": 0.15, "output_per_mtok": 0.6}}
+        )
+        save_settings(original, settings_file)
+
+        loaded = load_settings(settings_file)
+        assert loaded.pricing == original.pricing
+
+    def test_no_pricing_section_when_empty(self, tmp_path):
+        settings_file = tmp_path / ".voicetest.toml"
+        save_settings(Settings(), settings_file)
+
+        assert "[pricing]" not in settings_file.read_text()
+
+    def test_model_price_cost(self):
+        price = ModelPrice(input_per_mtok=3.0, output_per_mtok=15.0)
+
+        assert price.cost(1_000_000, 0) == 3.0
+        assert price.cost(2000, 1000) == pytest.approx(0.021)
@@ -104,6 +104,10 @@ REST_SURFACED = {
     "RunService.delete_run",
     "RunService.import_calls",
     "RunService.replay_run",
+    "RunService.get_stats",
+    "RunService.get_usage",
+    "RunService.export_runs",
+    "RunService.archive_runs",
     # Platforms
     "PlatformService.list_platforms",
     "PlatformService.get_status",
@@ -149,12 +153,18 @@ CLI_SURFACED = {
     "TestExecutionService.run_tests",
     # Run history
     "RunService.create_run",
+    "RunService.save_run",
     "RunService.add_result",
     "RunService.list_runs",
     "RunService.get_run",
     "RunService.delete_run",
     "RunService.import_calls",
     "RunService.replay_run",
+    "RunService.get_stats",
+    "RunService.get_usage",
+    "RunService.backfill_stats",
+    "RunService.export_runs",
+    "RunService.archive_runs",
     # Snippets
     "SnippetService.get_snippets",
     "SnippetService.update_all_snippets",
@@ -203,11 +213,17 @@ INTERNAL_ONLY = {
     "RunService.mark_result_error": "Called by REST _execute_run background task",
     "RunService.mark_result_cancelled": "Called by REST _execute_run background task",
     "RunService.complete": "Called by REST _execute_run background task",
+    "RunService.run_exists": "Existence check for GET /runs/{id}/export",
     "RunService.update_transcript": "Called by call WebSocket handler",
     "RunService.update_audio_eval": "Called by REST audio_eval_result handler",
     "RunService.add_result_from_call": "Called by RunService.save_call_as_run internally",
     "RunService.result_to_dict": "ORM-to-dict helper called by REST result/diagnosis handlers",
     "RunService.save_call_as_run": "Called by REST end_call/end_chat handlers",
+    "RunService.get_run_options": "Called by RunRunner.resume_job",
+    "RunService.interrupted_run_ids": "Called by RunRunner.interrupted_jobs on startup",
+    "RunService.reopen_results": "Called by RunRunner.resume_job",
+    "RunService.save_checkpoint": "Called by RunRunner after each completed turn",
+    "RunService.get_checkpoints": "Called by RunRunner.resume_job",
     # DecomposeService — helpers called by decompose pipeline
     "DecomposeService.build_sub_graph": "Called by decompose internally for each sub-agent",
     "DecomposeService.build_manifest": "Called by decompose internally to build manifest",
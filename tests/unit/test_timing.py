@@ -0,0 +1,63 @@
+"""Tests for voicetest.util.timing module."""
+
+import pytest
+
+from voicetest.judges.rule import RuleJudge
+from voicetest.models.results import Message
+from voicetest.util.timing import TimingCollector
+from voicetest.util.timing import collect_timings
+from voicetest.util.timing import timed
+
+
+class TestTimingCollector:
+    def test_accumulates_count_total_and_max(self):
+        collector = TimingCollector()
+        collector.record("response", 100.04)
+        collector.record("response", 250.0)
+        collector.record("transition", 5.0)
+
+        spans = collector.snapshot()
+        assert spans["response"].count == 2
+        assert spans["response"].total_ms == 350.0
+        assert spans["response"].max_ms == 250.0
+        assert spans["transition"].count == 1
+
+
+class TestTimed:
+    def test_records_to_active_collector(self):
+        with collect_timings() as collector, timed("simulator") as span:
+            pass
+
+        assert span.ms >= 0
+        assert collector.snapshot()["simulator"].count == 1
+
+    def test_no_collector_is_a_no_op(self):
+        with timed("simulator") as span:
+            pass
+
+        assert span.ms >= 0
+
+    def test_failed_span_still_recorded(self):
+        with collect_timings() as collector, pytest.raises(RuntimeError), timed("metric_judge"):
+            raise RuntimeError("boom")
+
+        assert collector.snapshot()["metric_judge"].count == 1
+
+    def test_collectors_do_not_leak(self):
+        with collect_timings() as outer:
+            with collect_timings() as inner, timed("response"):
+                pass
+            with timed("transition"):
+                pass
+
+        assert set(inner.snapshot()) == {"response"}
+        assert set(outer.snapshot()) == {"transition"}
+
+    @pytest.mark.asyncio
+    async def test_rule_judge_span(self):
+        transcript = [Message(role="assistant", content="Hello")]
+
+        with collect_timings() as collector:
+            await RuleJudge().evaluate(transcript, ["hello"], [], [])
+
+        assert collector.snapshot()["rule_judge"].count == 1
@@ -0,0 +1,178 @@
+"""Tests for voicetest.util.tracing module."""
+
+import json
+
+import litellm
+import pytest
+
+from voicetest.models.agent import AgentGraph
+from voicetest.models.agent import AgentNode
+from voicetest.models.agent import NodeType
+from voicetest.models.test_case import RunOptions
+from voicetest.models.test_case import TestCase
+from voicetest.services.settings import SettingsService
+from voicetest.services.testing.execution import TestExecutionService
+from voicetest.util.retry import with_retry
+from voicetest.util.tracing import start_tracing
+from voicetest.util.tracing import stop_tracing
+from voicetest.util.tracing import trace_event
+from voicetest.util.tracing import trace_span
+from voicetest.util.tracing import traced
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    tracer = start_tracing(tmp_path / "trace.json")
+    yield tracer
+    stop_tracing()
+
+
+def _spans(tracer) -> dict:
+    return {s.name: s for s in tracer.spans}
+
+
+class TestDisabled:
+    def test_span_yields_none(self):
+        with trace_span("run") as span:
+            trace_event("retry", attempt=1)
+
+        assert span is None
+        assert stop_tracing() is None
+
+    @pytest.mark.asyncio
+    async def test_traced_passes_through(self):
+        @traced("db.sync")
+        def sync(x):
+            return x + 1
+
+        @traced("db.async")
+        async def async_(x):
+            return x * 2
+
+        assert sync(1) == 2
+        assert await async_(2) == 4
+
+
+class TestSpans:
+    def test_children_share_trace_and_lane(self, tracer):
+        with (
+            trace_span("run", run_id="r1"),
+            trace_span("test", new_lane=True, test="t1"),
+            trace_span("turn") as turn,
+        ):
+            turn.set(end_node="done")
+
+        spans = _spans(tracer)
+        assert spans["test"].parent_id == spans["run"].span_id
+        assert spans["turn"].parent_id == spans["test"].span_id
+        assert len({s.trace_id for s in tracer.spans}) == 1
+        assert spans["test"].lane != spans["run"].lane
+        assert spans["turn"].lane == spans["test"].lane
+        assert spans["turn"].attributes == {"end_node": "done"}
+
+    def test_exception_recorded_and_reraised(self, tracer):
+        with pytest.raises(ValueError), trace_span("llm"):
+            raise ValueError("bad output")
+
+        assert tracer.spans[0].error == "ValueError: bad output"
+
+    @pytest.mark.asyncio
+    async def test_traced_async_and_sync(self, tracer):
+        @traced("db.write")
+        def write():
+            pass
+
+        @traced("db.read")
+        async def read():
+            write()
+
+        await read()
+
+        spans = _spans(tracer)
+        assert spans["db.write"].parent_id == spans["db.read"].span_id
+
+    @pytest.mark.asyncio
+    async def test_retries_become_events(self, tracer):
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise litellm.RateLimitError("slow down", "openai", "gpt-4o")
+            return "ok"
+
+        with trace_span("llm"):
+            assert await with_retry(flaky, base_delay=0, max_delay=0) == "ok"
+
+        events = tracer.spans[0].events
+        assert [name for name, _, _ in events] == ["retry", "retry"]
+        assert [attrs["attempt"] for _, _, attrs in events] == [1, 2]
+        assert events[0][2]["error_type"] == "RateLimitError"
+
+
+class TestExport:
+    def test_chrome_trace(self, tmp_path):
+        start_tracing(tmp_path / "trace.json")
+        with trace_span("test", test="greeting"):
+            trace_event("retry", attempt=1)
+
+        path = stop_tracing()
+
+        events = json.loads(path.read_text())["traceEvents"]
+        by_phase = {e["ph"]: e for e in events}
+        assert by_phase["M"]["args"] == {"name": "test: greeting"}
+        assert by_phase["X"]["name"] == "test"
+        assert by_phase["X"]["dur"] >= 0
+        assert by_phase["i"]["args"] == {"attempt": 1}
+        assert len({e["tid"] for e in events}) == 1
+
+    def test_otlp_json(self, tmp_path):
+        start_tracing(tmp_path / "trace.otlp.json")
+        with trace_span("run"), pytest.raises(RuntimeError), trace_span("llm", cache_hit=False):
+            raise RuntimeError("boom")
+
+        path = stop_tracing()
+
+        document = json.loads(path.read_text())
+        spans = document["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        run, llm = spans
+        assert "parentSpanId" not in run
+        assert llm["parentSpanId"] == run["spanId"]
+        assert llm["traceId"] == run["traceId"]
+        assert llm["attributes"] == [{"key": "cache_hit", "value": {"boolValue": False}}]
+        assert llm["status"] == {"code": 2, "message": "RuntimeError: boom"}
+        assert int(llm["endTimeUnixNano"]) >= int(llm["startTimeUnixNano"])
+
+
+class TestInstrumentation:
+    @pytest.mark.asyncio
+    async def test_run_test_and_turn_spans(self, tracer):
+        graph = AgentGraph(
+            nodes={
+                "main": AgentNode(
+                    id="main",
+                    state_prompt="You are a helpful assistant.",
+                    transitions=[],
+                    node_type=NodeType.CONVERSATION,
+                ),
+            },
+            entry_node_id="main",
+            source_type="custom",
+        )
+        test_case = TestCase(name="traced", user_prompt="Ask for help.", metrics=[])
+        options = RunOptions(
+            agent_model="mock/agent",
+            simulator_model="mock/sim",
+            judge_model="mock/judge",
+            max_turns=1,
+            no_cache=True,
+        )
+
+        await TestExecutionService(SettingsService()).run_tests(graph, [test_case], options)
+
+        spans = _spans(tracer)
+        assert spans["test"].parent_id == spans["run"].span_id
+        assert spans["test"].attributes["test"] == "traced"
+        assert spans["turn"].parent_id == spans["test"].span_id
+        roles = {s.attributes["role"] for s in tracer.spans if s.name == "llm"}
+        assert "agent" in roles
@@ -0,0 +1,42 @@
+"""Performance benchmarks for voicetest's hot paths.
+
+Run with `voicetest bench`. Each suite module registers its benchmarks on
+import; results are JSON documents that can be compared across commits.
+"""
+
+from voicetest.benchmarks import broadcast
+from voicetest.benchmarks import cache
+from voicetest.benchmarks import engine
+from voicetest.benchmarks import formats
+from voicetest.benchmarks import judges
+from voicetest.benchmarks import storage
+from voicetest.benchmarks.harness import BENCHMARKS
+from voicetest.benchmarks.harness import BenchContext
+from voicetest.benchmarks.harness import Benchmark
+from voicetest.benchmarks.harness import SkipBenchmark
+from voicetest.benchmarks.harness import benchmark
+from voicetest.benchmarks.harness import compare_results
+from voicetest.benchmarks.harness import load_results
+from voicetest.benchmarks.harness import run_benchmarks
+from voicetest.benchmarks.harness import save_results
+from voicetest.benchmarks.harness import select
+
+
+__all__ = [
+    "BENCHMARKS",
+    "Benchmark",
+    "BenchContext",
+    "SkipBenchmark",
+    "benchmark",
+    "broadcast",
+    "cache",
+    "compare_results",
+    "engine",
+    "formats",
+    "judges",
+    "load_results",
+    "run_benchmarks",
+    "save_results",
+    "select",
+    "storage",
+]
@@ -0,0 +1,117 @@
+"""BroadcastBus fan-out of one run update to many WebSocket subscribers.
+
+The relayed variants add the cross-process transports from voicetest.web.bus.
+"""
+
+import asyncio
+import importlib.util
+import os
+from uuid import uuid4
+
+from voicetest.benchmarks.data import synthetic_result
+from voicetest.benchmarks.harness import BenchContext
+from voicetest.benchmarks.harness import SkipBenchmark
+from voicetest.benchmarks.harness import benchmark
+from voicetest.web.broadcast import BroadcastBus
+from voicetest.web.bus import BusBroker
+from voicetest.web.bus import PostgresTransport
+from voicetest.web.bus import RelayedBroadcastBus
+from voicetest.web.bus import UnixSocketTransport
+
+
+class _NullWebSocket:
+    """Accepts every message and drops it, so only the bus itself is timed."""
+
+    async def send_text(self, message: str) -> None:
+        pass
+
+
+@benchmark("broadcast", subscribers=[1, 10, 100])
+async def fan_out(ctx: BenchContext, subscribers: int):
+    """One result update (a typical run-progress message) to every subscriber."""
+    bus = BroadcastBus()
+    bus.start("run")
+    message = {"type": "result_completed", "result": synthetic_result(0).model_dump(mode="json")}
+    for _ in range(subscribers):
+        await bus.attach("run", _NullWebSocket())
+
+    async def send():
+        await bus.broadcast("run", message)
+
+    return send
+
+
+class _CountingWebSocket:
+    """Drops messages but counts them, so a fan-out can wait for every delivery."""
+
+    def __init__(self, received: "_Received") -> None:
+        self._received = received
+
+    async def send_text(self, message: str) -> None:
+        self._received.add()
+
+
+class _Received:
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+        self._count = 0
+        self.done = asyncio.Event()
+
+    def reset(self) -> None:
+        self._count = 0
+        self.done.clear()
+
+    def add(self) -> None:
+        self._count += 1
+        if self._count == self.expected:
+            self.done.set()
+
+
+async def _relayed_fan_out(make_transport, processes: int, subscribers: int):
+    """Time one broadcast until every subscriber of every bus has it.
+
+    Each bus stands in for a server process with its own transport connection."""
+    buses = [RelayedBroadcastBus(make_transport()) for _ in range(processes)]
+    received = _Received(processes * subscribers)
+    buses[0].start("run")
+    for bus in buses:
+        await bus.open()
+    for bus in buses:
+        for _ in range(subscribers):
+            await bus.attach("run", _CountingWebSocket(received))
+    message = {"type": "result_completed", "result": synthetic_result(0).model_dump(mode="json")}
+
+    async def send():
+        received.reset()
+        await buses[0].broadcast("run", message)
+        await received.done.wait()
+
+    return send
+
+
+@benchmark("broadcast", processes=[1, 4], subscribers=[10])
+async def fan_out_unix_broker(ctx: BenchContext, processes: int, subscribers: int):
+    """One result update through a Unix-socket broker to subscribers in several processes."""
+    socket_path = ctx.shared.get("bus_socket")
+    if socket_path is None:
+        socket_path = ctx.shared["bus_socket"] = ctx.tmp_dir / "bus.sock"
+        asyncio.create_task(BusBroker().serve(socket_path))
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+    ctx.shared["bus_runs"] = ctx.shared.get("bus_runs", 0) + 1
+    topic = f"bench-{ctx.shared['bus_runs']}"
+    return await _relayed_fan_out(
+        lambda: UnixSocketTransport(socket_path, topic), processes, subscribers
+    )
+
+
+@benchmark("broadcast", processes=[1, 4], subscribers=[10])
+async def fan_out_postgres(ctx: BenchContext, processes: int, subscribers: int):
+    """One result update through Postgres LISTEN/NOTIFY (needs DATABASE_URL and psycopg)."""
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql://", "postgres://")):
+        raise SkipBenchmark("DATABASE_URL is not a PostgreSQL URL")
+    if importlib.util.find_spec("psycopg") is None:
+        raise SkipBenchmark("psycopg is not installed")
+    topic = f"bench_{uuid4().hex[:8]}"
+    return await _relayed_fan_out(lambda: PostgresTransport(url, topic), processes, subscribers)
@@ -0,0 +1,131 @@
+"""S3 cache lookups, plain S3 backend against the tiered backend.
+
+S3 is a filesystem-backed fake that sleeps `S3_LATENCY_MS` per request, so
+times reflect round trips rather than a real network. Each timed call is one
+lookup, cycling over the stored keys.
+"""
+
+import itertools
+from pathlib import Path
+import time
+
+from voicetest.benchmarks.harness import BenchContext
+from voicetest.benchmarks.harness import SkipBenchmark
+from voicetest.benchmarks.harness import benchmark
+from voicetest.util.cache import S3CacheBackend
+from voicetest.util.cache import TieredCacheBackend
+
+
+KEYS = 200
+S3_LATENCY_MS = 20
+
+
+class _Body:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+
+class _FakeS3Client:
+    """Stores objects as files; reads sleep `latency` seconds like an S3 request."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.latency = 0.0
+        root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key.replace("/", "__")
+
+    def _read(self, key: str, operation: str) -> bytes:
+        time.sleep(self.latency)
+        path = self._path(key)
+        if not path.exists():
+            raise _client_error(operation)
+        return path.read_bytes()
+
+    def head_object(self, Bucket, Key):  # noqa: N803
+        self._read(Key, "HeadObject")
+        return {}
+
+    def get_object(self, Bucket, Key):  # noqa: N803
+        return {"Body": _Body(self._read(Key, "GetObject"))}
+
+    def put_object(self, Bucket, Key, Body, ContentType):  # noqa: N803
+        time.sleep(self.latency)
+        self._path(Key).write_bytes(Body)
+
+
+def _client_error(operation: str) -> Exception:
+    # botocore comes with boto3, which S3CacheBackend already requires.
+    from botocore.exceptions import ClientError  # noqa: PLC0415
+
+    return ClientError({"Error": {"Code": "NoSuchKey", "Message": "Not Found"}}, operation)
+
+
+def _sample_response(i: int) -> dict:
+    """Roughly the shape and size of a cached LiteLLM completion."""
+    text = f"Agent reply {i}: " + "Thanks for calling, how can I help you today? " * 40
+    return {
+        "choices": [{"message": {"role": "assistant", "content": text}}],
+        "usage": {"prompt_tokens": 900, "completion_tokens": 400},
+    }
+
+
+def _s3(ctx: BenchContext, compress: bool) -> tuple[S3CacheBackend, list[str]]:
+    """A fake-S3 backend holding the sample keys, shared across benchmarks."""
+    name = "s3_compressed" if compress else "s3_plain"
+    if name not in ctx.shared:
+        client = _FakeS3Client(ctx.tmp_dir / name)
+        try:
+            backend = S3CacheBackend("bench", "dspy-cache/", client=client, compress=compress)
+        except ImportError as e:
+            raise SkipBenchmark(str(e)) from e
+        keys = [f"key{i:05d}" for i in range(ctx.size(KEYS))]
+        for i, key in enumerate(keys):
+            backend[key] = _sample_response(i)
+        client.latency = S3_LATENCY_MS / 1000
+        ctx.shared[name] = (backend, keys)
+    return ctx.shared[name]
+
+
+@benchmark("cache")
+def s3_head_then_get(ctx: BenchContext):
+    """The pre-tiered lookup: `key in backend`, then a GET."""
+    backend, keys = _s3(ctx, compress=False)
+    cycle = itertools.cycle(keys)
+
+    def lookup():
+        key = next(cycle)
+        return backend[key] if key in backend else None  # noqa: SIM401 (HEAD, then GET)
+
+    return lookup
+
+
+@benchmark("cache")
+def s3_get(ctx: BenchContext):
+    """One conditional GET per lookup."""
+    backend, keys = _s3(ctx, compress=False)
+    cycle = itertools.cycle(keys)
+    return lambda: backend.get(next(cycle))
+
+
+@benchmark("cache")
+def tiered_hit(ctx: BenchContext):
+    """Keys already copied to the local tier, so no S3 request is made."""
+    remote, keys = _s3(ctx, compress=True)
+    tiered = TieredCacheBackend(remote, ctx.tmp_dir / "tiered_hit", async_writes=False)
+    for key in keys:
+        tiered.get(key)
+    cycle = itertools.cycle(keys)
+    return lambda: tiered.get(next(cycle))
+
+
+@benchmark("cache")
+def tiered_miss(ctx: BenchContext):
+    """Repeated lookups of an absent key, answered by the negative cache."""
+    remote, _ = _s3(ctx, compress=True)
+    tiered = TieredCacheBackend(remote, ctx.tmp_dir / "tiered_miss", async_writes=False)
+    return lambda: tiered.get("absent")
@@ -0,0 +1,86 @@
+"""Synthetic graphs, transcripts and results sized for benchmarking."""
+
+from voicetest.models.agent import AgentGraph
+from voicetest.models.agent import AgentNode
+from voicetest.models.agent import NodeType
+from voicetest.models.agent import Transition
+from voicetest.models.agent import TransitionCondition
+from voicetest.models.results import Message
+from voicetest.models.results import MetricResult
+from voicetest.models.results import TestResult
+from voicetest.models.results import ToolCall
+
+
+_PROMPT = (
+    "You are a friendly receptionist for a dental clinic. Confirm the caller's name and date "
+    "of birth, then help them book, move or cancel an appointment. Keep replies short."
+)
+
+
+def synthetic_graph(num_nodes: int) -> AgentGraph:
+    """A chain of conversation nodes, each branching to the next two, ending in an end node."""
+    nodes: dict[str, AgentNode] = {}
+    for i in range(num_nodes):
+        node_id = f"node_{i}"
+        last = i == num_nodes - 1
+        transitions = [
+            Transition(
+                target_node_id=f"node_{j}",
+                condition=TransitionCondition(
+                    type="llm_prompt", value=f"Caller has finished step {i} and wants step {j}"
+                ),
+            )
+            for j in (i + 1, i + 2)
+            if j < num_nodes
+        ]
+        nodes[node_id] = AgentNode(
+            id=node_id,
+            state_prompt=f"Step {i}. {_PROMPT}",
+            node_type=NodeType.END if last else NodeType.CONVERSATION,
+            transitions=transitions,
+        )
+    return AgentGraph(
+        nodes=nodes,
+        entry_node_id="node_0",
+        source_type="custom",
+        source_metadata={"general_prompt": _PROMPT},
+    )
+
+
+def synthetic_transcript(turns: int) -> list[Message]:
+    """`turns` user/assistant exchanges of typical phone-call length."""
+    messages: list[Message] = []
+    for i in range(turns):
+        messages.append(
+            Message(
+                role="user",
+                content=f"Hi, this is caller {i}. I'd like to move my appointment to Tuesday.",
+            )
+        )
+        messages.append(
+            Message(
+                role="assistant",
+                content="Sure, I can help with that. Can you confirm your date of birth first?",
+                metadata={"node_id": f"node_{i % 5}"},
+            )
+        )
+    return messages
+
+
+def synthetic_result(i: int, turns: int = 3) -> TestResult:
+    """A completed test result with transcript, metrics, node visits and a tool call."""
+    return TestResult(
+        test_id=f"test_{i % 50}",
+        test_name=f"Test {i % 50}",
+        status="pass" if i % 4 else "fail",
+        transcript=synthetic_transcript(turns),
+        metric_results=[
+            MetricResult(metric=f"Metric {m}", passed=bool((i + m) % 3), reasoning="ok", score=0.8)
+            for m in range(3)
+        ],
+        nodes_visited=["node_0", "node_1", f"node_{i % 5}"],
+        tools_called=[ToolCall(name="lookup_patient", arguments={"id": i})],
+        turn_count=turns,
+        duration_ms=1200 + i % 300,
+        end_reason="max_turns",
+    )
@@ -0,0 +1,50 @@
+"""ConversationEngine turn overhead and transcript formatting."""
+
+from voicetest.benchmarks.data import synthetic_graph
+from voicetest.benchmarks.data import synthetic_transcript
+from voicetest.benchmarks.harness import BenchContext
+from voicetest.benchmarks.harness import benchmark
+from voicetest.engine.conversation import ConversationEngine
+from voicetest.judges.metric import MetricJudge
+from voicetest.models.test_case import RunOptions
+from voicetest.simulator.user_sim import UserSimulator
+
+
+# Zero-latency mock LM: timings are voicetest + DSPy overhead, not the provider.
+MOCK_MODEL = "mock/bench"
+
+
+@benchmark("engine", nodes=[5, 500])
+def advance(ctx: BenchContext, nodes: int):
+    """One user turn: transition evaluation plus the agent response (two LLM calls)."""
+    engine = ConversationEngine(
+        synthetic_graph(nodes), MOCK_MODEL, options=RunOptions(no_cache=True)
+    )
+
+    async def turn():
+        engine.reset()
+        await engine.add_user_message("Hi, I'd like to move my appointment to Tuesday.")
+        await engine.advance()
+
+    return turn
+
+
+@benchmark("formatting", turns=[10, 50, 200])
+def engine_transcript(ctx: BenchContext, turns: int):
+    engine = ConversationEngine(synthetic_graph(2), MOCK_MODEL)
+    transcript = synthetic_transcript(turns)
+    return lambda: engine._format_transcript(transcript)
+
+
+@benchmark("formatting", turns=[10, 50, 200])
+def simulator_transcript(ctx: BenchContext, turns: int):
+    simulator = UserSimulator("## Identity\nA caller", MOCK_MODEL)
+    transcript = synthetic_transcript(turns)
+    return lambda: simulator._format_transcript(transcript)
+
+
+@benchmark("formatting", turns=[10, 50, 200])
+def judge_transcript(ctx: BenchContext, turns: int):
+    judge = MetricJudge(MOCK_MODEL)
+    transcript = synthetic_transcript(turns)
+    return lambda: judge._format_transcript(transcript)
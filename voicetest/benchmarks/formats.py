@@ -0,0 +1,132 @@
+"""Importers and exporters, on the test fixtures and on a large synthetic graph."""
+
+from contextlib import suppress
+import json
+
+from voicetest.benchmarks.data import synthetic_graph
+from voicetest.benchmarks.harness import BenchContext
+from voicetest.benchmarks.harness import SkipBenchmark
+from voicetest.benchmarks.harness import benchmark
+from voicetest.container import create_container
+from voicetest.demo import get_demo_agent
+from voicetest.exporters.registry import ExporterRegistry
+from voicetest.importers.registry import ImporterRegistry
+from voicetest.registries import create_importer_registry
+
+
+# Largest fixture per importer, relative to tests/fixtures.
+FIXTURES = {
+    "retell": "retell/sample_config_complex.json",
+    "retell-llm": "retell/sample_llm_config.json",
+    "vapi": "vapi/sample_squad.json",
+    "livekit": "livekit/sample_agent.py",
+    "telnyx": "telnyx/sample_assistant_with_handoff.json",
+    "xlsform": "xlsform/sample_survey.xlsx",
+    "agentgraph": "graphs/simple_graph.json",
+}
+
+# Export format -> importer that reads it back.
+ROUND_TRIP = {
+    "retell-llm": "retell-llm",
+    "retell-cf": "retell",
+    "vapi-squad": "vapi",
+    "livekit": "livekit",
+    "bland": "bland",
+    "telnyx": "telnyx",
+    "voicetest": "agentgraph",
+}
+
+EXPORT_FORMATS = ["mermaid", "vapi-assistant", *ROUND_TRIP]
+
+SYNTHETIC_NODES = 500
+
+DETECTION_SUFFIXES = (".json", ".py", ".xlsx")
+
+
+def _registries(ctx: BenchContext) -> tuple[ImporterRegistry, ExporterRegistry]:
+    if "registries" not in ctx.shared:
+        container = create_container()
+        ctx.shared["registries"] = (
+            container.resolve(ImporterRegistry),
+            container.resolve(ExporterRegistry),
+        )
+    return ctx.shared["registries"]
+
+
+def _large_graph(ctx: BenchContext):
+    if "large_graph" not in ctx.shared:
+        ctx.shared["large_graph"] = synthetic_graph(SYNTHETIC_NODES)
+    return ctx.shared["large_graph"]
+
+
+@benchmark("import", source_type=list(FIXTURES))
+def import_fixture(ctx: BenchContext, source_type: str):
+    if ctx.fixtures_dir is None or not (ctx.fixtures_dir / FIXTURES[source_type]).exists():
+        raise SkipBenchmark(f"fixture {FIXTURES[source_type]} not found")
+    importers, _ = _registries(ctx)
+    path = ctx.fixtures_dir / FIXTURES[source_type]
+    return lambda: importers.import_agent(path, source_type)
+
+
+@benchmark("import")
+def auto_detect(ctx: BenchContext):
+    """Auto-detection plus import of the bundled demo agent."""
+    importers, _ = _registries(ctx)
+    config = get_demo_agent()
+    return lambda: importers.import_agent(config)
+
+
+@benchmark("import", mode=["probe_each", "cold", "warm"])
+def auto_detect_fixtures(ctx: BenchContext, mode: str):
+    """Import every fixture file without a source type.
+
+    `probe_each` asks each importer's `can_import` in turn, each loading the
+    file itself (the flow before `ImportSource`). `cold` uses a new registry,
+    so nothing is in its detection cache; `warm` reuses one whose cache
+    already knows every file."""
+    if ctx.fixtures_dir is None:
+        raise SkipBenchmark("fixtures not found")
+    paths = sorted(p for p in ctx.fixtures_dir.rglob("*") if p.suffix in DETECTION_SUFFIXES)
+    importers, _ = _registries(ctx)
+    source_types = [info.source_type for info in importers.list_importers()]
+
+    def probe_each():
+        for path in paths:
+            for source_type in source_types:
+                importer = importers.get(source_type)
+                if importer.can_import(path):
+                    importer.import_agent(path)
+                    break
+
+    def detect(registry: ImporterRegistry):
+        for path in paths:
+            with suppress(ValueError):
+                registry.import_agent(path)
+
+    if mode == "probe_each":
+        return probe_each
+    if mode == "cold":
+        return lambda: detect(create_importer_registry())
+    detect(importers)
+    return lambda: detect(importers)
+
+
+@benchmark("export", format_id=EXPORT_FORMATS)
+def export_large(ctx: BenchContext, format_id: str):
+    _, exporters = _registries(ctx)
+    graph = _large_graph(ctx)
+    return lambda: exporters.export(graph, format_id)
+
+
+@benchmark("import", format_id=list(ROUND_TRIP))
+def import_large(ctx: BenchContext, format_id: str):
+    """Re-import of the synthetic graph exported in `format_id`."""
+    importers, exporters = _registries(ctx)
+    exported = exporters.export(_large_graph(ctx), format_id)
+    if format_id == "livekit":
+        source = ctx.tmp_dir / "large_agent.py"
+        source.write_text(exported)
+    else:
+        source = json.loads(exported)
+    source_type = ROUND_TRIP[format_id]
+    return lambda: importers.import_agent(source, source_type)
@@ -0,0 +1,228 @@
+"""Registry, timing loop and result files for the benchmark suite."""
+
+import asyncio
+from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import UTC
+from datetime import datetime
+import inspect
+import itertools
+import json
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from typing import Any
+
+
+RESULTS_VERSION = 1
+
+
+class SkipBenchmark(Exception):
+    """Raised from a benchmark's setup when it can't run here (e.g. no fixtures)."""
+
+
+@dataclass
+class BenchContext:
+    """What a benchmark's setup gets: size scaling, scratch space and shared state."""
+
+    scale: float = 1.0
+    tmp_dir: Path = field(default_factory=Path.cwd)
+    fixtures_dir: Path | None = None
+    # Expensive state reused across benchmarks in one run (e.g. the populated database).
+    shared: dict[str, Any] = field(default_factory=dict)
+
+    def size(self, n: int) -> int:
+        """`n` scaled down for quick runs, never below 1."""
+        return max(1, int(n * self.scale))
+
+
+@dataclass
+class Benchmark:
+    """One timed operation. `setup` builds state and returns the callable to time."""
+
+    group: str
+    name: str
+    setup: Callable[..., Callable[[], Any]]
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def id(self) -> str:
+        suffix = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.group}/{self.name}" + (f"[{suffix}]" if suffix else "")
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(group: str, **param_values: Iterable[Any]) -> Callable:
+    """Register a setup function, once per combination of the given parameter values.
+
+    The setup (sync or async) is called as `setup(ctx, **params)` and returns
+    a sync or async callable; only that callable is timed."""
+
+    def decorator(setup: Callable) -> Callable:
+        names = list(param_values)
+        for combo in itertools.product(*(param_values[n] for n in names)):
+            BENCHMARKS.append(
+                Benchmark(group, setup.__name__, setup, dict(zip(names, combo, strict=True)))
+            )
+        return setup
+
+    return decorator
+
+
+def select(patterns: Iterable[str] = ()) -> list[Benchmark]:
+    """Benchmarks whose id contains any of `patterns` (all when none given)."""
+    patterns = list(patterns)
+    return [b for b in BENCHMARKS if not patterns or any(p in b.id for p in patterns)]
+
+
+def _summarize(durations: list[float]) -> dict[str, Any]:
+    ms = [d * 1000 for d in durations]
+    median = statistics.median(ms)
+    return {
+        "rounds": len(ms),
+        "min_ms": round(min(ms), 4),
+        "median_ms": round(median, 4),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "stdev_ms": round(statistics.stdev(ms), 4) if len(ms) > 1 else 0.0,
+        "max_ms": round(max(ms), 4),
+        "ops_per_sec": round(1000 / median, 2) if median else None,
+    }
+
+
+async def _measure(
+    op: Callable[[], Any], min_time: float, min_rounds: int, max_rounds: int
+) -> list[float]:
+    """Time `op` after one warm-up call, for at least `min_time` seconds."""
+    is_async = inspect.iscoroutinefunction(op)
+
+    async def once() -> float:
+        start = time.perf_counter()
+        if is_async:
+            await op()
+        else:
+            op()
+        return time.perf_counter() - start
+
+    await once()
+    durations: list[float] = []
+    deadline = time.perf_counter() + min_time
+    while len(durations) < max_rounds and (
+        len(durations) < min_rounds or time.perf_counter() < deadline
+    ):
+        durations.append(await once())
+    return durations
+
+
+async def _run(
+    benchmarks: list[Benchmark],
+    ctx: BenchContext,
+    min_time: float,
+    min_rounds: int,
+    max_rounds: int,
+    on_result: Callable[[str, dict[str, Any]], None] | None,
+) -> dict[str, dict[str, Any]]:
+    results: dict[str, dict[str, Any]] = {}
+    for bench in benchmarks:
+        try:
+            op = bench.setup(ctx, **bench.params)
+            if inspect.isawaitable(op):
+                op = await op
+            entry = _summarize(await _measure(op, min_time, min_rounds, max_rounds))
+        except SkipBenchmark as e:
+            entry = {"skipped": str(e)}
+        entry["group"] = bench.group
+        results[bench.id] = entry
+        if on_result:
+            on_result(bench.id, entry)
+    return results
+
+
+def run_benchmarks(
+    benchmarks: list[Benchmark],
+    *,
+    scale: float = 1.0,
+    fixtures_dir: Path | None = None,
+    min_time: float = 0.5,
+    min_rounds: int = 5,
+    max_rounds: int = 10_000,
+    on_result: Callable[[str, dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run `benchmarks` on one event loop and return a results document.
+
+    Each benchmark is warmed up once, then timed for at least `min_rounds`
+    rounds and `min_time` seconds."""
+    with tempfile.TemporaryDirectory(prefix="voicetest-bench-") as tmp:
+        ctx = BenchContext(scale=scale, tmp_dir=Path(tmp), fixtures_dir=fixtures_dir)
+        results = asyncio.run(_run(benchmarks, ctx, min_time, min_rounds, max_rounds, on_result))
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "benchmarks": results,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def save_results(results: dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Read a results file. Raises ValueError if it isn't one."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cannot read benchmark results {path}: {e}") from e
+    if not isinstance(data, dict) or data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Not a benchmark results file (version {RESULTS_VERSION}): {path}")
+    return data
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.1
+) -> list[dict[str, Any]]:
+    """Median time change for each benchmark timed in both runs.
+
+    `change` is current/baseline - 1; a benchmark regressed when its change
+    exceeds `threshold` and improved when it is below -threshold."""
+    rows = []
+    for bench_id, entry in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(bench_id, {})
+        if "median_ms" not in entry or not before.get("median_ms"):
+            continue
+        change = entry["median_ms"] / before["median_ms"] - 1
+        status = "regressed" if change > threshold else "improved" if change < -threshold else ""
+        rows.append(
+            {
+                "id": bench_id,
+                "baseline_ms": before["median_ms"],
+                "current_ms": entry["median_ms"],
+                "change": round(change, 4),
+                "status": status,
+            }
+        )
+    return rows
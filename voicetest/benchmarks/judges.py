@@ -0,0 +1,23 @@
+"""Deterministic judges on large transcripts."""
+
+from voicetest.benchmarks.data import synthetic_transcript
+from voicetest.benchmarks.harness import BenchContext
+from voicetest.benchmarks.harness import benchmark
+from voicetest.judges.rule import RuleJudge
+
+
+INCLUDES = ["appointment", "date of birth", "Tuesday", "confirm", "help"]
+EXCLUDES = ["social security", "credit card", "password", "I don't know", "goodbye forever"]
+PATTERNS = ["*caller ? *", "*move my * to *", "*[0-9][0-9][0-9]-[0-9][0-9][0-9][0-9]*"]
+
+
+@benchmark("judges", turns=[200, 2000])
+def rule_judge(ctx: BenchContext, turns: int):
+    """Five includes, five excludes and three wildcard patterns over the transcript."""
+    judge = RuleJudge()
+    transcript = synthetic_transcript(turns)
+
+    async def evaluate():
+        await judge.evaluate(transcript, INCLUDES, EXCLUDES, PATTERNS)
+
+    return evaluate
@@ -0,0 +1,108 @@
+"""RunRepository reads and writes against a DuckDB file with many results."""
+
+from sqlalchemy import text
+
+from voicetest.benchmarks.data import synthetic_result
+from voicetest.benchmarks.harness import BenchContext
+from voicetest.benchmarks.harness import benchmark
+from voicetest.storage.engine import create_db_engine
+from voicetest.storage.engine import get_session_factory
+from voicetest.storage.models import Result
+from voicetest.storage.models import ResultMetricOutcome
+from voicetest.storage.models import ResultNodeVisit
+from voicetest.storage.models import ResultToolCall
+from voicetest.storage.repositories import AgentRepository
+from voicetest.storage.repositories import RunRepository
+
+
+TOTAL_RESULTS = 100_000
+RESULTS_PER_RUN = 100
+RECENT_RUNS = 30
+
+
+def _database(ctx: BenchContext) -> tuple[RunRepository, str, list[str]]:
+    """Create and fill the shared database once: (repository, agent id, run ids).
+
+    One template run is written through `add_results`; the rest are copies
+    made in SQL, which fills 100k rows in seconds rather than many minutes."""
+    if "database" in ctx.shared:
+        return ctx.shared["database"]
+
+    engine = create_db_engine(f"duckdb:///{ctx.tmp_dir / 'bench.duckdb'}")
+    session = get_session_factory(engine)()
+    agent = AgentRepository(session).create(name="bench", source_type="custom")
+    runs = RunRepository(session)
+
+    total = ctx.size(TOTAL_RESULTS)
+    template = runs.create(agent["id"])["id"]
+    runs.add_results(template, (synthetic_result(i) for i in range(min(RESULTS_PER_RUN, total))))
+    runs.complete(template)
+    copies = -(-total // RESULTS_PER_RUN) - 1
+    if copies:
+        _copy_run(session, agent["id"], template, copies)
+
+    run_ids = [template] + [f"{template}-{k}" for k in range(1, copies + 1)]
+    ctx.shared["database"] = (runs, agent["id"], run_ids)
+    return ctx.shared["database"]
+
+
+def _copy_run(session, agent_id: str, run_id: str, copies: int) -> None:
+    """Duplicate a run and its results `copies` times, suffixing every id with `-k`."""
+    params = {"agent_id": agent_id, "run_id": run_id, "n": copies + 1}
+    session.execute(
+        text(
+            "INSERT INTO runs (id, agent_id, started_at, completed_at) "
+            "SELECT :run_id || '-' || k, :agent_id, "
+            "CAST(now() AS TIMESTAMP) + k * INTERVAL 1 SECOND, "
+            "CAST(now() AS TIMESTAMP) + k * INTERVAL 1 SECOND "
+            "FROM range(1, :n) AS t(k)"
+        ),
+        params,
+    )
+    for model in (Result, ResultNodeVisit, ResultMetricOutcome, ResultToolCall):
+        columns = [c.name for c in model.__table__.columns]
+        suffixed = {"id", "run_id", "result_id"}
+        select = ", ".join(f"{c} || '-' || k" if c in suffixed else c for c in columns)
+        session.execute(
+            text(
+                f"INSERT INTO {model.__tablename__} ({', '.join(columns)}) "
+                f"SELECT {select} FROM {model.__tablename__}, range(1, :n) AS t(k) "
+                "WHERE run_id = :run_id"
+            ),
+            params,
+        )
+    session.commit()
+
+
+@benchmark("storage", rows=[RESULTS_PER_RUN])
+def add_results(ctx: BenchContext, rows: int):
+    runs, agent_id, _ = _database(ctx)
+    run_id = runs.create(agent_id)["id"]
+    batch = [synthetic_result(i) for i in range(rows)]
+    return lambda: runs.add_results(run_id, batch)
+
+
+@benchmark("storage")
+def list_runs_with_summary(ctx: BenchContext):
+    runs, agent_id, _ = _database(ctx)
+    return lambda: runs.list_for_agent_with_summary(agent_id)
+
+
+@benchmark("storage")
+def get_run_with_results(ctx: BenchContext):
+    runs, _, run_ids = _database(ctx)
+    return lambda: runs.get_with_results(run_ids[-1])
+
+
+@benchmark("storage", runs=[RECENT_RUNS])
+def node_stats(ctx: BenchContext, runs: int):
+    repo, agent_id, _ = _database(ctx)
+    run_ids = repo.recent_run_ids(agent_id, limit=runs)
+    return lambda: repo.node_stats(run_ids)
+
+
+@benchmark("storage", runs=[RECENT_RUNS])
+def metric_stats(ctx: BenchContext, runs: int):
+    repo, agent_id, _ = _database(ctx)
+    run_ids = repo.recent_run_ids(agent_id, limit=runs)
+    return lambda: repo.metric_stats(run_ids)
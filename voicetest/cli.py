@@ -3,6 +3,9 @@
 import asyncio
 import contextlib
 import dataclasses
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
 import faulthandler
 import importlib.resources
 import json
@@ -10,50 +13,101 @@ import os
 from pathlib import Path
 import shutil
 import subprocess
+import sys
 import tempfile
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 from rich.tree import Tree
-import uvicorn
 
 from voicetest.compose import get_compose_path
-from voicetest.container import create_container
+from voicetest.config import get_benchmark_dir
+from voicetest.config import get_daemon_socket_path
 from voicetest.demo import get_demo_agent
 from voicetest.demo import get_demo_tests
-from voicetest.engine.conversation import ConversationEngine
-from voicetest.importers.transcripts.retell import parse_retell_file
+from voicetest.exceptions import ArchiveInProgressError
+from voicetest.models.results import LLMRoleStats
 from voicetest.models.results import Message
 from voicetest.models.results import MetricResult
+from voicetest.models.results import SpanTiming
 from voicetest.models.results import TestResult
+from voicetest.models.results import TestRun
 from voicetest.models.test_case import RunOptions
 from voicetest.models.test_case import TestCase
-from voicetest.runner import TestRunContext
-from voicetest.services import AppServices
-from voicetest.services import build_app_services
 from voicetest.settings import Settings
-from voicetest.tui import VoicetestApp
-from voicetest.tui import VoicetestShell
-from voicetest.util.cache import setup_cache_from_settings
+from voicetest.util.formatting import format_cache_hit_rate
+from voicetest.util.formatting import format_cost
 from voicetest.util.formatting import format_run
+from voicetest.util.formatting import format_timings
+from voicetest.util.formatting import format_usage
+from voicetest.util.formatting import slowest_span
+from voicetest.util.formatting import total_llm_stats
+from voicetest.util.formatting import total_timings
 from voicetest.util.retry import RetryError
 from voicetest.util.snippets import suggest_snippets
+from voicetest.util.tracing import start_tracing
+from voicetest.util.tracing import stop_tracing
+from voicetest.util.tracing import tracing_enabled
 
 
-def _services() -> AppServices:
+# Commands import heavy modules (dspy, the service layer, uvicorn, textual,
+# platform SDKs) inside their own bodies, so `voicetest --help` and commands
+# that don't need them start quickly. tests/unit/test_import_time.py guards this.
+if TYPE_CHECKING:
+    import punq
+
+    from voicetest.services import AppServices
+    from voicetest.services.discovery import DiscoveryService
+    from voicetest.util.cache import RecordingCache
+    from voicetest.util.cache import S3Cache
+
+
+def _container() -> "punq.Container":
+    """Lazily build (and cache) the DI container on the current Click context."""
+    from voicetest.container import create_container  # noqa: PLC0415
+
+    ctx = click.get_current_context()
+    if "container" not in ctx.obj:
+        ctx.obj["container"] = create_container()
+    return ctx.obj["container"]
+
+
+def _services() -> "AppServices":
     """Lazily build (and cache) the AppServices bag on the current Click context.
 
     Lazy so that subcommands like `serve` — which delegate DB work to a uvicorn
     worker process — don't open the DuckDB file in the CLI process. Otherwise
     the CLI and the uvicorn worker both grab a write lock and the worker fails
     its lifespan with `Conflicting lock is held in ... (PID N)`."""
+    from voicetest.services import build_app_services  # noqa: PLC0415
+
     ctx = click.get_current_context()
     if "services" not in ctx.obj:
-        ctx.obj["services"] = build_app_services(create_container())
+        ctx.obj["services"] = build_app_services(_container())
     return ctx.obj["services"]
 
 
+def _discovery() -> "DiscoveryService":
+    """Build just the registries behind `importers`, `exporters` and `platforms`.
+
+    Listing them needs neither the database nor the LLM stack, so these
+    commands skip the container entirely."""
+    from voicetest.registries import create_exporter_registry  # noqa: PLC0415
+    from voicetest.registries import create_importer_registry  # noqa: PLC0415
+    from voicetest.registries import create_platform_registry  # noqa: PLC0415
+    from voicetest.services.discovery import DiscoveryService  # noqa: PLC0415
+    from voicetest.services.settings import SettingsService  # noqa: PLC0415
+
+    return DiscoveryService(
+        create_importer_registry(),
+        create_exporter_registry(SettingsService()),
+        create_platform_registry(),
+    )
+
+
 console = Console()
 err_console = Console(stderr=True)
 
@@ -71,31 +125,79 @@ def _echo(msg: str) -> None:
         console.print(msg)
 
 
+def _write_trace() -> None:
+    path = stop_tracing()
+    if path:
+        _echo(f"[dim]Trace written to {path}[/dim]")
+
+
 def _start_server(host: str, port: int, reload: bool = False) -> None:
     """Start the uvicorn web server."""
     # Print a C-level stack trace to stderr if a native extension (DuckDB,
     # anyio's threadpool, etc.) crashes the interpreter. Without this a
     # segfault produces a silent kill that is very hard to diagnose.
     faulthandler.enable()
+    import uvicorn  # noqa: PLC0415
 
     console.print("[bold]Starting voicetest API server...[/bold]")
     console.print(f"  URL: http://{host}:{port}")
     console.print(f"  Docs: http://{host}:{port}/docs")
     console.print()
 
-    uvicorn.run(
-        "voicetest.web.rest:app",
-        host=host,
-        port=port,
-        reload=reload,
-    )
+    uvicorn.run("voicetest.web.rest:app", host=host, port=port, reload=reload)
+
+
+@contextlib.contextmanager
+def _executor_processes(count: int):
+    """Spawn `count` executor processes and point API workers at their sockets."""
+    socket_dir = Path(tempfile.mkdtemp(prefix="voicetest-exec-"))
+    sockets = [socket_dir / f"executor-{i}.sock" for i in range(count)]
+    env = {k: v for k, v in os.environ.items() if k != "VOICETEST_EXECUTORS"}
+    processes = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "from voicetest.cli import main; main()",
+                "executor",
+                "--socket",
+                str(path),
+                # One executor picks up runs a previous server left unfinished.
+                *(["--resume"] if i == 0 else []),
+            ],
+            env=env,
+        )
+        for i, path in enumerate(sockets)
+    ]
+    os.environ["VOICETEST_EXECUTORS"] = ",".join(str(path) for path in sockets)
+    console.print(f"  Run executors: {count}")
+    try:
+        yield
+    finally:
+        os.environ.pop("VOICETEST_EXECUTORS", None)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        shutil.rmtree(socket_dir, ignore_errors=True)
 
 
 @click.group(invoke_without_command=True)
 @click.version_option(version="0.1.0", prog_name="voicetest")
 @click.option("--json", "json_mode", is_flag=True, help="Output as JSON (for programmatic use)")
+@click.option(
+    "--trace",
+    "trace_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar="VOICETEST_TRACE",
+    help="Write a trace of runs, tests, turns, LLM calls and DB writes to this file "
+    "(Chrome trace JSON, or OTLP/JSON if it ends in .otlp.json)",
+)
 @click.pass_context
-def main(ctx, json_mode):
+def main(ctx, json_mode, trace_path):
     """voicetest - Voice agent test harness.
 
     Test voice agents from multiple platforms using a unified
@@ -104,8 +206,13 @@ def main(ctx, json_mode):
     Run without arguments to launch interactive shell."""
     ctx.ensure_object(dict)
     ctx.obj["json"] = json_mode
+    if trace_path:
+        start_tracing(trace_path)
+        ctx.call_on_close(_write_trace)
     if ctx.invoked_subcommand is None:
         # No subcommand - launch interactive shell
+        from voicetest.tui import VoicetestShell  # noqa: PLC0415
+
         app = VoicetestShell(_services())
         app.run()
 
@@ -136,6 +243,16 @@ def main(ctx, json_mode):
 @click.option("--max-turns", type=int, default=None, help="Maximum conversation turns")
 @click.option("--save-run", is_flag=True, help="Save run to database (requires --agent-id)")
 @click.option("--agent-id", default=None, help="Agent ID in database (for --save-run)")
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Fail on any LLM cache miss instead of calling the provider",
+)
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    help="Run in this process even if a voicetest daemon is listening",
+)
 @click.pass_context
 def run(
     ctx,
@@ -150,14 +267,36 @@ def run(
     max_turns: int | None,
     save_run: bool,
     agent_id: str | None,
+    offline: bool,
+    no_daemon: bool,
 ):
-    """Run tests against an agent definition."""
+    """Run tests against an agent definition.
+
+    When `voicetest daemon start` is running for this project the run is
+    sent to it, skipping start-up costs; --no-daemon runs it here instead,
+    as does --trace, since a trace only records this process."""
     if save_run and not agent_id:
         raise click.UsageError("--save-run requires --agent-id")
     json_mode = ctx.obj.get("json", False)
     if interactive:
         _run_tui(agent, tests, source, verbose)
-    else:
+        return
+
+    request = {
+        "op": "run",
+        "agent": str(agent.resolve()),
+        "tests": str(tests.resolve()),
+        "source": source,
+        "verbose": verbose,
+        "run_all": run_all,
+        "test_names": list(test_names),
+        "max_turns": max_turns,
+        "save_run": save_run,
+        "agent_id": agent_id,
+        "offline": offline,
+    }
+    in_process = no_daemon or tracing_enabled()
+    if in_process or not asyncio.run(_run_via_daemon(request, output, json_mode=json_mode)):
         asyncio.run(
             _run_cli(
                 agent,
@@ -171,6 +310,7 @@ def run(
                 json_mode=json_mode,
                 save_run=save_run,
                 agent_id=agent_id,
+                offline=offline,
             )
         )
 
@@ -182,6 +322,9 @@ def _run_tui(
     verbose: bool,
 ) -> None:
     """Launch interactive TUI."""
+    from voicetest.tui import VoicetestApp  # noqa: PLC0415
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
     svc = _services()
     settings = svc.settings.get_settings()
     setup_cache_from_settings(settings.cache)
@@ -216,9 +359,16 @@ async def _run_cli(
     json_mode: bool = False,
     save_run: bool = False,
     agent_id: str | None = None,
+    offline: bool = False,
 ) -> None:
     """Run tests in CLI mode."""
+    from voicetest.runner import TestRunContext  # noqa: PLC0415
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
     svc = _services()
+    if save_run and not svc.agents.get_agent(agent_id):
+        _echo(f"[red]Agent not found: {agent_id}[/red]")
+        raise SystemExit(1)
     settings = svc.settings.get_settings()
     setup_cache_from_settings(settings.cache)
     options = RunOptions(
@@ -227,6 +377,7 @@ async def _run_cli(
         judge_model=settings.models.judge,
         max_turns=max_turns if max_turns is not None else settings.run.max_turns,
         verbose=verbose or settings.run.verbose,
+        strict_offline=offline,
     )
     run_ctx = TestRunContext(
         services=svc,
@@ -237,40 +388,94 @@ async def _run_cli(
     )
 
     # Load
-    _echo("[bold]Importing agent definition...[/bold]")
     await run_ctx.load()
-    _echo(f"  Source: {run_ctx.graph.source_type}")
-    _echo(f"  Nodes: {len(run_ctx.graph.nodes)}")
-    _echo(f"  Entry: {run_ctx.graph.entry_node_id}")
-    _echo("")
+    _echo_loaded(run_ctx.graph.source_type, len(run_ctx.graph.nodes), run_ctx.graph.entry_node_id)
 
     # Filter tests if specific ones requested
     if test_names:
         run_ctx.filter_tests(list(test_names))
     elif not run_all:
-        _echo("[yellow]Warning: No tests selected. Use --all or --test NAME[/yellow]")
+        _echo_no_tests_selected()
         return
 
     # Run
-    _echo(f"[bold]Running {run_ctx.total_tests} tests...[/bold]")
-    _echo("")
+    _echo_running(run_ctx.total_tests)
 
     def on_error(error: RetryError) -> None:
-        _echo(
-            f"[yellow]Rate limited - retrying ({error.attempt}/{error.max_attempts})... "
-            f"waiting {error.retry_after:.1f}s[/yellow]"
-        )
+        _echo_retry(error.attempt, error.max_attempts, error.retry_after)
 
     run_result = await run_ctx.run_all(on_error=on_error)
 
-    # Save to database if requested
-    if save_run and agent_id:
-        run_svc = svc.runs
-        db_run = run_svc.create_run(agent_id)
-        for result in run_result.results:
-            run_svc.add_result(db_run["id"], result)
-        run_svc.complete(db_run["id"])
-        _echo(f"[dim]Run saved to database: {db_run['id']}[/dim]")
+    # Save to database if requested, only now so an interrupted run leaves no empty run
+    db_run = svc.runs.save_run(agent_id, run_result) if save_run and agent_id else None
+
+    _finish_run(run_result, output, json_mode=json_mode, saved_run_id=db_run and db_run["id"])
+
+
+async def _run_via_daemon(request: dict, output: Path | None, *, json_mode: bool) -> bool:
+    """Send a run to the project's daemon and render its events like a local run.
+
+    Returns False, having printed nothing, when no daemon is listening."""
+    from voicetest.daemon import DaemonClient  # noqa: PLC0415
+
+    try:
+        client = await DaemonClient.connect()
+    except OSError:
+        return False
+
+    async for event in client.request(request):
+        kind = event["event"]
+        if kind == "loaded":
+            _echo_loaded(event["source_type"], event["nodes"], event["entry_node_id"])
+        elif kind == "started":
+            _echo_running(event["tests"])
+        elif kind == "retry":
+            _echo_retry(event["attempt"], event["max_attempts"], event["retry_after"])
+        elif kind == "error":
+            _echo(f"[red]Daemon error: {escape(event['message'])}[/red]")
+            raise SystemExit(1)
+        elif kind == "done":
+            if event["run"] is None:
+                _echo_no_tests_selected()
+                return True
+            run_result = TestRun.model_validate(event["run"])
+            _finish_run(run_result, output, json_mode=json_mode, saved_run_id=event["saved_run_id"])
+            return True
+
+    _echo("[red]Daemon closed the connection before the run finished.[/red]")
+    raise SystemExit(1)
+
+
+def _echo_loaded(source_type: str, nodes: int, entry_node_id: str) -> None:
+    _echo("[bold]Importing agent definition...[/bold]")
+    _echo(f"  Source: {source_type}")
+    _echo(f"  Nodes: {nodes}")
+    _echo(f"  Entry: {entry_node_id}")
+    _echo("")
+
+
+def _echo_no_tests_selected() -> None:
+    _echo("[yellow]Warning: No tests selected. Use --all or --test NAME[/yellow]")
+
+
+def _echo_running(total_tests: int) -> None:
+    _echo(f"[bold]Running {total_tests} tests...[/bold]")
+    _echo("")
+
+
+def _echo_retry(attempt: int, max_attempts: int, retry_after: float) -> None:
+    _echo(
+        f"[yellow]Rate limited - retrying ({attempt}/{max_attempts})... "
+        f"waiting {retry_after:.1f}s[/yellow]"
+    )
+
+
+def _finish_run(
+    run_result: TestRun, output: Path | None, *, json_mode: bool, saved_run_id: str | None
+) -> None:
+    """Report a finished run, write --output, and exit 1 if any test failed."""
+    if saved_run_id:
+        _echo(f"[dim]Run saved to database: {saved_run_id}[/dim]")
 
     # Display
     if json_mode:
@@ -403,7 +608,7 @@ async def _export(
 @click.pass_context
 def importers(ctx):
     """List available importers."""
-    svc = _services().discovery
+    svc = _discovery()
     importer_list = svc.list_importers()
 
     if ctx.obj.get("json"):
@@ -429,7 +634,7 @@ def importers(ctx):
 @click.pass_context
 def exporters(ctx):
     """List available export formats."""
-    svc = _services().discovery
+    svc = _discovery()
     format_list = svc.list_export_formats()
 
     if ctx.obj.get("json"):
@@ -506,6 +711,8 @@ def demo(serve: bool, host: str, port: int):
         console.print(f"  Tests: {tests_path}")
         console.print()
 
+        from voicetest.tui import VoicetestShell  # noqa: PLC0415
+
         app = VoicetestShell(svc, agent_path=agent_path, tests_path=tests_path)
         app.run()
 
@@ -524,6 +731,8 @@ def smoke_test(ctx, max_turns: int):
 
 async def _smoke_test(max_turns: int, *, json_mode: bool = False) -> None:
     """Run smoke test with bundled demo data."""
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
     svc = _services()
     settings = svc.settings.get_settings()
     setup_cache_from_settings(settings.cache)
@@ -589,6 +798,15 @@ async def _smoke_test(max_turns: int, *, json_mode: bool = False) -> None:
     help="Test file(s) to link (paired with preceding --agent)",
 )
 @click.option("--verbose", "-v", is_flag=True, help="Enable debug logging")
+@click.option(
+    "--workers", default=1, type=click.IntRange(min=1), help="Number of API worker processes"
+)
+@click.option(
+    "--executors",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Execute runs in this many separate processes",
+)
 def serve(
     host: str,
     port: int,
@@ -596,13 +814,36 @@ def serve(
     agent: tuple[Path, ...],
     tests: tuple[Path, ...],
     verbose: bool,
+    workers: int,
+    executors: int,
 ):
     """Start the REST API server.
 
     Use --agent to link agent files, and --tests to link test files.
     Test files are associated with the last specified --agent.
     If multiple agents need different tests, specify them in order:
-      --agent a1.json --tests t1.json --agent a2.json --tests t2.json"""
+      --agent a1.json --tests t1.json --agent a2.json --tests t2.json
+
+    With --executors, test runs execute in separate executor processes so a
+    busy run doesn't slow the API. Every process opens the database, so this
+    needs DATABASE_URL set to a PostgreSQL URL."""
+    from voicetest.container import _is_postgres_url  # noqa: PLC0415
+
+    if workers > 1:
+        # Chat and call sessions live in the worker that started them, and
+        # uvicorn can't route a chat's messages back to that worker.
+        raise click.UsageError(
+            "--workers > 1 is not supported yet: chats and calls only work in the "
+            "API worker that started them. Use --executors to run tests in "
+            "separate processes."
+        )
+    if executors and not _is_postgres_url(os.environ.get("DATABASE_URL")):
+        raise click.UsageError(
+            "--executors needs DATABASE_URL set to a PostgreSQL URL; "
+            "a DuckDB file can only be opened by one process."
+        )
+    if executors and reload:
+        raise click.UsageError("--reload cannot be combined with --executors.")
     os.environ["VOICETEST_LOG_LEVEL"] = "DEBUG" if verbose else "INFO"
 
     os.environ["VOICETEST_LINKED_AGENTS"] = ",".join(str(p) for p in agent)
@@ -623,7 +864,115 @@ def serve(
         for t in tests:
             console.print(f"    - {t}")
 
-    _start_server(host, port, reload)
+    with _executor_processes(executors) if executors else contextlib.nullcontext():
+        _start_server(host, port, reload)
+
+
+@main.command(hidden=True)
+@click.option(
+    "--socket",
+    "socket_path",
+    required=True,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to accept API workers on",
+)
+@click.option("--resume", is_flag=True, help="Resume runs a stopped server left unfinished")
+def executor(socket_path: Path, resume: bool):
+    """Execute test runs submitted by `voicetest serve` API workers."""
+    from voicetest.web.executor import run_executor  # noqa: PLC0415
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(run_executor(socket_path, resume=resume))
+
+
+@main.command("bus-broker")
+@click.option(
+    "--socket",
+    "socket_path",
+    required=True,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to listen on",
+)
+def bus_broker(socket_path: Path):
+    """Relay WebSocket events between voicetest server processes on this host.
+
+    Point each server at it with VOICETEST_BUS=unix:<socket>."""
+    from voicetest.web.bus import BusBroker  # noqa: PLC0415
+
+    console.print(f"[bold]voicetest bus broker[/bold] listening on {socket_path}")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(BusBroker().serve(socket_path))
+
+
+@main.group()
+def daemon():
+    """Keep voicetest warm for fast repeated runs.
+
+    The daemon holds the LLM cache and parsed agent and test files in one
+    process and serves `voicetest run` over a Unix socket in the project's
+    .voicetest directory. It opens the database only while saving a run,
+    so other commands can use it in between."""
+
+
+@daemon.command("start")
+def daemon_start():
+    """Run the daemon in the foreground until stopped or interrupted."""
+    from voicetest.container import create_container  # noqa: PLC0415
+    from voicetest.daemon import VoicetestDaemon  # noqa: PLC0415
+
+    socket_path = get_daemon_socket_path()
+    console.print("[bold]Starting voicetest daemon...[/bold]")
+    server = VoicetestDaemon(create_container())
+    server.warm()
+    console.print(f"  Socket: {socket_path}")
+    console.print("[dim]Stop with Ctrl+C or `voicetest daemon stop`.[/dim]")
+    try:
+        asyncio.run(server.serve(socket_path))
+    except RuntimeError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+    except KeyboardInterrupt:
+        pass
+    console.print(f"Daemon stopped after {server.runs_served} run(s).")
+
+
+@daemon.command("stop")
+def daemon_stop():
+    """Stop the running daemon."""
+    from voicetest.daemon import send_request  # noqa: PLC0415
+
+    try:
+        asyncio.run(send_request({"op": "stop"}))
+    except OSError:
+        _echo("[yellow]No voicetest daemon is running.[/yellow]")
+        raise SystemExit(1) from None
+    _echo("Daemon stopping.")
+
+
+@daemon.command("status")
+@click.pass_context
+def daemon_status(ctx):
+    """Show whether the daemon is running, its PID, uptime and runs served."""
+    from voicetest.daemon import send_request  # noqa: PLC0415
+
+    json_mode = ctx.find_root().obj.get("json")
+    try:
+        (status,) = asyncio.run(send_request({"op": "status"}))
+    except OSError:
+        if json_mode:
+            click.echo(json.dumps({"running": False}))
+        else:
+            _echo("Daemon: [yellow]not running[/yellow]")
+        raise SystemExit(1) from None
+
+    status.pop("event")
+    if json_mode:
+        click.echo(json.dumps({"running": True, **status}))
+        return
+    _echo(f"Daemon: [green]running[/green] (pid {status['pid']})")
+    _echo(f"  Socket: {get_daemon_socket_path()}")
+    _echo(f"  Uptime: {status['uptime_seconds']:.0f}s")
+    _echo(f"  Runs served: {status['runs_served']}")
 
 
 def _check_docker_compose() -> None:
@@ -722,7 +1071,7 @@ _TRANSCRIPT_FORMATS = {"retell"}
     "--transcript",
     required=True,
     type=click.Path(exists=True, path_type=Path),
-    help="Path to a transcript file (JSON)",
+    help="Path to a transcript file (JSON array, JSON object or JSON lines)",
 )
 @click.option(
     "--format",
@@ -731,40 +1080,52 @@ _TRANSCRIPT_FORMATS = {"retell"}
     type=click.Choice(sorted(_TRANSCRIPT_FORMATS)),
     help="Source platform format",
 )
+@click.option(
+    "--batch-size",
+    default=500,
+    type=click.IntRange(min=1),
+    help="Conversations written per database transaction",
+)
 @click.pass_context
-def import_call(ctx, agent_id: str, transcript: Path, format_: str):
+def import_call(ctx, agent_id: str, transcript: Path, format_: str, batch_size: int):
     """Import call transcripts from a platform export and persist as a Run.
 
     Each conversation in the transcript file becomes a Result inside the
-    created Run, with status="imported" and no test_case_id linkage."""
+    created Run, with status="imported" and no test_case_id linkage. The
+    file is streamed, so multi-GB exports import in constant memory."""
+    from voicetest.importers.transcripts.retell import iter_retell_file  # noqa: PLC0415
+
     json_mode = ctx.obj.get("json", False)
 
     if format_ != "retell":
         _echo(f"[red]Unsupported format: {format_}[/red]")
         raise SystemExit(1)
 
-    try:
-        results = parse_retell_file(transcript)
-    except ValueError as e:
-        _echo(f"[red]Failed to parse transcript: {e}[/red]")
-        raise SystemExit(1) from None
-
-    if not results:
-        _echo("[red]No conversations found in transcript file.[/red]")
-        raise SystemExit(1)
-
     svc = _services()
     if not svc.agents.get_agent(agent_id):
         _echo(f"[red]Agent not found: {agent_id}[/red]")
         raise SystemExit(1)
 
-    run = svc.runs.import_calls(agent_id, results)
+    def on_progress(count: int) -> None:
+        _echo(f"[dim]Imported {count} conversation(s)...[/dim]")
+
+    try:
+        run = svc.runs.import_calls(
+            agent_id,
+            iter_retell_file(transcript),
+            batch_size=batch_size,
+            on_progress=None if json_mode else on_progress,
+            include_results=json_mode,
+        )
+    except ValueError as e:
+        _echo(f"[red]Failed to parse transcript: {e}[/red]")
+        raise SystemExit(1) from None
 
     if json_mode:
         click.echo(json.dumps(run, default=str))
     else:
         _echo(
-            f"[green]Imported {len(results)} conversation(s) into run "
+            f"[green]Imported {run['imported']} conversation(s) into run "
             f"[bold]{run['id']}[/bold][/green]"
         )
 
@@ -806,6 +1167,8 @@ def replay(ctx, source_run_id: str):
 
     Drives a fresh conversation per source Result using the source's recorded
     user turns as a script. Persists the live conversations as a new Run."""
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
     json_mode = ctx.obj.get("json", False)
 
     svc = _services()
@@ -846,6 +1209,144 @@ def replay(ctx, source_run_id: str):
         )
 
 
+# ---------------------------------------------------------------------------
+# bench (top-level)
+# ---------------------------------------------------------------------------
+
+
+def _default_bench_output(results: dict) -> Path:
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    commit = (results.get("commit") or "nogit")[:8]
+    return get_benchmark_dir() / f"{stamp}-{commit}.json"
+
+
+@main.command("bench")
+@click.option(
+    "--filter", "-k", "patterns", multiple=True, help="Only benchmarks whose id contains this"
+)
+@click.option("--list", "list_only", is_flag=True, help="List benchmark ids and exit")
+@click.option("--quick", is_flag=True, help="Small data sizes and short timing (smoke check)")
+@click.option("--min-time", default=None, type=float, help="Seconds to time each benchmark")
+@click.option(
+    "--fixtures",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Importer fixtures directory (default: ./tests/fixtures if present)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Results file (default: .voicetest/benchmarks/<time>-<commit>.json)",
+)
+@click.option(
+    "--compare",
+    "baseline_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Compare against an earlier results file",
+)
+@click.option("--threshold", default=0.1, type=float, help="Change counted as a regression")
+@click.option("--fail-on-regression", is_flag=True, help="Exit 1 if any benchmark regressed")
+@click.pass_context
+def bench(
+    ctx,
+    patterns,
+    list_only,
+    quick,
+    min_time,
+    fixtures,
+    output,
+    baseline_path,
+    threshold,
+    fail_on_regression,
+):
+    """Time engine turns, formatting, judges, importers/exporters, storage and broadcast.
+
+    LLM calls go to a zero-latency mock/ model, so the numbers are voicetest's
+    own overhead. Results are saved as JSON; pass --compare with an earlier
+    file to see the median change per benchmark."""
+    from voicetest.benchmarks import compare_results  # noqa: PLC0415
+    from voicetest.benchmarks import load_results  # noqa: PLC0415
+    from voicetest.benchmarks import run_benchmarks  # noqa: PLC0415
+    from voicetest.benchmarks import save_results  # noqa: PLC0415
+    from voicetest.benchmarks import select  # noqa: PLC0415
+
+    json_mode = ctx.obj.get("json", False)
+    selected = select(patterns)
+    if not selected:
+        _echo(f"[red]No benchmarks match: {', '.join(patterns)}[/red]")
+        raise SystemExit(1)
+
+    if list_only:
+        ids = [b.id for b in selected]
+        if json_mode:
+            click.echo(json.dumps(ids))
+        else:
+            for bench_id in ids:
+                console.print(escape(bench_id))
+        return
+
+    baseline = None
+    if baseline_path:
+        try:
+            baseline = load_results(baseline_path)
+        except ValueError as e:
+            _echo(f"[red]{e}[/red]")
+            raise SystemExit(1) from None
+
+    if fixtures is None and Path("tests/fixtures").is_dir():
+        fixtures = Path("tests/fixtures")
+
+    def report(bench_id: str, entry: dict) -> None:
+        if "skipped" in entry:
+            _echo(f"[dim]{escape(bench_id)}: skipped ({escape(entry['skipped'])})[/dim]")
+        else:
+            _echo(f"{escape(bench_id)}: {entry['median_ms']:.3f} ms ({entry['rounds']} rounds)")
+
+    results = run_benchmarks(
+        selected,
+        scale=0.01 if quick else 1.0,
+        fixtures_dir=fixtures,
+        min_time=min_time if min_time is not None else (0.05 if quick else 0.5),
+        min_rounds=1 if quick else 5,
+        on_result=report,
+    )
+    output = output or _default_bench_output(results)
+    save_results(results, output)
+
+    rows = compare_results(baseline, results, threshold) if baseline else []
+    regressed = [r for r in rows if r["status"] == "regressed"]
+
+    if json_mode:
+        click.echo(json.dumps({"output": str(output), "results": results, "comparison": rows}))
+    else:
+        _echo(f"Saved {len(results['benchmarks'])} results to {output}")
+        if baseline:
+            if baseline.get("scale") != results["scale"]:
+                _echo("[yellow]Baseline was run at a different scale; sizes differ.[/yellow]")
+            table = Table(title=f"Median vs. {baseline_path.name}")
+            table.add_column("Benchmark", style="cyan")
+            table.add_column("Baseline ms", justify="right")
+            table.add_column("Current ms", justify="right")
+            table.add_column("Change", justify="right")
+            for r in rows:
+                color = {"regressed": "red", "improved": "green"}.get(r["status"])
+                change = f"{r['change']:+.1%}"
+                table.add_row(
+                    escape(r["id"]),
+                    f"{r['baseline_ms']:.3f}",
+                    f"{r['current_ms']:.3f}",
+                    f"[{color}]{change}[/{color}]" if color else change,
+                )
+            console.print(table)
+
+    if fail_on_regression and regressed:
+        _echo(f"[red]{len(regressed)} benchmark(s) regressed by more than {threshold:.0%}[/red]")
+        raise SystemExit(1)
+
+
 # ---------------------------------------------------------------------------
 # Agent subgroup
 # ---------------------------------------------------------------------------
@@ -1243,12 +1744,114 @@ def runs_get(ctx, run_id):
         table = Table(title="Results")
         table.add_column("Test", style="cyan")
         table.add_column("Status")
+        table.add_column("LLM cache")
+        table.add_column("Cost", justify="right")
+        table.add_column("Slowest span")
+        all_stats = []
+        all_timings = []
         for r in results:
             status = r.get("status", "")
             color = "green" if status == "pass" else "red"
-            table.add_row(r.get("test_name", ""), f"[{color}]{status}[/{color}]")
+            stats = {
+                role: LLMRoleStats.model_validate(s)
+                for role, s in (r.get("llm_stats") or {}).items()
+            }
+            all_stats.append(stats)
+            timings = {
+                name: SpanTiming.model_validate(t) for name, t in (r.get("timings") or {}).items()
+            }
+            all_timings.append(timings)
+            cache = format_cache_hit_rate(total_llm_stats([stats])) if stats else ""
+            cost = r.get("cost_usd")
+            table.add_row(
+                r.get("test_name", ""),
+                f"[{color}]{status}[/{color}]",
+                cache,
+                format_cost(cost) if cost is not None else "",
+                slowest_span(timings),
+            )
         console.print(table)
 
+        totals = total_llm_stats(all_stats)
+        if totals.calls:
+            console.print(
+                f"[bold]LLM calls:[/bold] {totals.calls}, {format_cache_hit_rate(totals)}"
+            )
+        saved = sum(r.get("llm_calls_saved") or 0 for r in results)
+        if saved:
+            console.print(f"[bold]Provider calls saved by shared openings:[/bold] {saved}")
+        if totals.prompt_tokens or totals.completion_tokens:
+            console.print(f"[bold]Usage:[/bold] {format_usage(totals)}")
+        timing_totals = total_timings(all_timings)
+        if timing_totals:
+            console.print(f"[bold]Time by span:[/bold] {format_timings(timing_totals)}")
+
+
+@runs.command("resume")
+@click.argument("run_id")
+@click.pass_context
+def runs_resume(ctx, run_id):
+    """Re-run the unfinished tests of a run whose server stopped mid-run.
+
+    Finished results are kept. Stop any server using the database first."""
+    from voicetest.services.run_runner import RunRunner  # noqa: PLC0415
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+    from voicetest.web.coordinator import RunCoordinator  # noqa: PLC0415
+
+    setup_cache_from_settings(_services().settings.get_settings().cache)
+    coordinator = RunCoordinator()
+    runner = _container().resolve(RunRunner, coordinator=coordinator)
+    try:
+        job = runner.resume_job(run_id)
+    except ValueError as e:
+        _echo(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+    if job is None:
+        _echo(f"[yellow]Run {run_id} has no unfinished tests[/yellow]")
+    else:
+        _echo(f"Resuming {len(job.test_records)} test(s) of run {run_id}...")
+        coordinator.start(run_id)
+        asyncio.run(runner.execute(job))
+
+    ctx.invoke(runs_get, run_id=run_id)
+
+
+@runs.command("usage")
+@click.argument("agent_id")
+@click.option("--days", default=30, type=int, help="Number of days to include")
+@click.pass_context
+def runs_usage(ctx, agent_id, days):
+    """Show LLM token usage and cost per day for an agent."""
+    usage = _services().runs.get_usage(agent_id, days)
+
+    if ctx.find_root().obj.get("json"):
+        click.echo(json.dumps(usage, indent=2))
+        return
+
+    table = Table(title=f"LLM usage (last {days} days)")
+    table.add_column("Date", style="cyan")
+    table.add_column("Runs", justify="right")
+    table.add_column("Results", justify="right")
+    table.add_column("Prompt tokens", justify="right")
+    table.add_column("Completion tokens", justify="right")
+    table.add_column("Cost", justify="right")
+    for day in usage["daily"]:
+        table.add_row(
+            day["date"],
+            str(day["runs"]),
+            str(day["results"]),
+            f"{day['prompt_tokens']:,}",
+            f"{day['completion_tokens']:,}",
+            format_cost(day["cost_usd"]),
+        )
+    console.print(table)
+
+    total = usage["total"]
+    console.print(
+        f"[bold]Total:[/bold] {total['runs']} runs, {total['prompt_tokens']:,} in / "
+        f"{total['completion_tokens']:,} out tokens, {format_cost(total['cost_usd'])}"
+    )
+
 
 @runs.command("delete")
 @click.argument("run_id")
@@ -1269,6 +1872,324 @@ def runs_delete(ctx, run_id, yes):
     console.print(f"[dim]Deleted run {run_id}[/dim]")
 
 
+def _pct(rate: float | None) -> str:
+    """Format a 0-1 rate as a percentage, or '-' when undefined."""
+    return "-" if rate is None else f"{rate:.0%}"
+
+
+@runs.command("stats")
+@click.argument("agent_id")
+@click.option("--last", "last_runs", default=30, type=int, help="Number of recent runs to include")
+@click.pass_context
+def runs_stats(ctx, agent_id, last_runs):
+    """Show node failure rates, metric regressions and tool usage over recent runs."""
+    stats = _services().runs.get_stats(agent_id, last_runs)
+
+    if ctx.find_root().obj.get("json"):
+        click.echo(json.dumps(stats, indent=2))
+        return
+
+    console.print(f"[bold]Runs analyzed:[/bold] {stats['run_count']}")
+
+    nodes = Table(title="Nodes by failure rate")
+    nodes.add_column("Node", style="cyan")
+    nodes.add_column("Visits", justify="right")
+    nodes.add_column("Results", justify="right")
+    nodes.add_column("Failure rate", justify="right")
+    for n in stats["nodes"]:
+        nodes.add_row(n["node_id"], str(n["visits"]), str(n["results"]), _pct(n["failure_rate"]))
+    console.print(nodes)
+
+    metrics = Table(title="Metrics (latest run vs. previous)")
+    metrics.add_column("Metric", style="cyan")
+    metrics.add_column("Pass rate", justify="right")
+    metrics.add_column("Latest", justify="right")
+    metrics.add_column("Previous", justify="right")
+    metrics.add_column("Delta", justify="right")
+    for m in stats["metrics"]:
+        delta = m["delta"]
+        if delta is None:
+            delta_str = "-"
+        else:
+            color = "red" if delta < 0 else "green"
+            delta_str = f"[{color}]{delta:+.0%}[/{color}]"
+        metrics.add_row(
+            m["metric"],
+            _pct(m["pass_rate"]),
+            _pct(m["latest_pass_rate"]),
+            _pct(m["previous_pass_rate"]),
+            delta_str,
+        )
+    console.print(metrics)
+
+    if stats["tools"]:
+        tools = Table(title="Tool calls")
+        tools.add_column("Tool", style="cyan")
+        tools.add_column("Calls", justify="right")
+        tools.add_column("Results", justify="right")
+        for t in stats["tools"]:
+            tools.add_row(t["name"], str(t["calls"]), str(t["results"]))
+        console.print(tools)
+
+
+@runs.command("backfill-stats")
+@click.pass_context
+def runs_backfill_stats(ctx):
+    """Populate analytics tables for results recorded before they existed.
+
+    Idempotent — results that already have analytics rows are skipped."""
+    result = _services().runs.backfill_stats()
+
+    if ctx.find_root().obj.get("json"):
+        click.echo(json.dumps(result))
+        return
+
+    _echo(
+        f"Scanned {result['results_scanned']} results, backfilled {result['results_backfilled']}."
+    )
+
+
+def _print_export_summary(ctx, summary: dict, verb: str) -> None:
+    """Report a Parquet export/archive summary as JSON or one status line."""
+    if ctx.find_root().obj.get("json"):
+        click.echo(json.dumps(summary))
+        return
+
+    _echo(
+        f"{verb} {summary['runs']} runs ({summary['results']} results, "
+        f"{summary['metrics']} metric rows, {summary['messages']} messages) "
+        f"to {summary['output_dir']}"
+    )
+
+
+@runs.command("export")
+@click.argument("run_ids", nargs=-1)
+@click.option("--agent", "agent_id", help="Export every run of this agent")
+@click.option(
+    "--format", "fmt", type=click.Choice(["parquet"]), default="parquet", help="Output format"
+)
+@click.option(
+    "--output", "-o", required=True, type=click.Path(file_okay=False), help="Output directory"
+)
+@click.option("--batch-size", default=500, type=int, help="Results read per batch")
+@click.pass_context
+def runs_export(ctx, run_ids, agent_id, fmt, output, batch_size):
+    """Export runs as partitioned Parquet (runs, results, metrics, messages).
+
+    Pass RUN_IDS or --agent. Query the output with DuckDB, e.g.
+    read_parquet('OUTPUT/results/**/*.parquet', hive_partitioning = true)."""
+    if not run_ids and not agent_id:
+        raise click.UsageError("Provide RUN_IDS or --agent.")
+
+    summary = _services().runs.export_runs(
+        output,
+        run_ids=list(run_ids) or None,
+        agent_id=agent_id,
+        batch_size=batch_size,
+    )
+    _print_export_summary(ctx, summary, "Exported")
+
+
+@runs.command("archive")
+@click.option(
+    "--older-than",
+    "older_than_days",
+    type=int,
+    default=None,
+    help="Archive completed runs older than N days (default: archive.retention_days)",
+)
+@click.option(
+    "--dir",
+    "archive_dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Archive directory (default: archive.directory or .voicetest/archive)",
+)
+@click.option("--yes", is_flag=True, help="Skip confirmation")
+@click.pass_context
+def runs_archive(ctx, older_than_days, archive_dir, yes):
+    """Move old runs to the Parquet archive and delete them from the database."""
+    if not yes:
+        click.confirm("Archive old runs and delete them from the database?", abort=True)
+
+    try:
+        summary = _services().runs.archive_runs(older_than_days, archive_dir)
+    except (ValueError, ArchiveInProgressError) as e:
+        _echo(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+    _print_export_summary(ctx, summary, "Archived")
+
+
+# ---------------------------------------------------------------------------
+# Cache subgroup
+# ---------------------------------------------------------------------------
+
+
+@main.group()
+def cache():
+    """Manage the shared LLM response cache."""
+
+
+def _require_s3_cache() -> "S3Cache":
+    """Configure the cache from settings; exit unless it is S3-backed."""
+    import dspy  # noqa: PLC0415
+
+    from voicetest.util.cache import S3Cache  # noqa: PLC0415
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
+    setup_cache_from_settings(_services().settings.get_settings().cache)
+    if not isinstance(dspy.cache, S3Cache):
+        _echo("[red]This command needs cache_backend = 's3' or 'tiered' with an s3_bucket.[/red]")
+        raise SystemExit(1)
+    return dspy.cache
+
+
+@cache.command("gc")
+@click.option(
+    "--keep",
+    default=10,
+    type=int,
+    help="Keep entries referenced by the newest N run manifests",
+)
+@click.option(
+    "--min-age-hours",
+    default=24.0,
+    type=float,
+    help="Never delete entries written more recently than this",
+)
+@click.option("--dry-run", is_flag=True, help="Report what would be deleted")
+@click.pass_context
+def cache_gc(ctx, keep, min_age_hours, dry_run):
+    """Delete cache entries no recent run manifest references."""
+    s3_cache = _require_s3_cache()
+    try:
+        summary = s3_cache.gc(keep=keep, min_age=timedelta(hours=min_age_hours), dry_run=dry_run)
+    except ValueError as e:
+        _echo(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+
+    if ctx.find_root().obj.get("json"):
+        click.echo(json.dumps(summary))
+        return
+
+    verb = "Would delete" if dry_run else "Deleted"
+    _echo(
+        f"{verb} {summary['entries_deleted']} of {summary['entries_scanned']} cache entries "
+        f"({summary['entries_referenced']} referenced by {summary['manifests_kept']} manifests, "
+        f"{summary['manifests_deleted']} older manifests removed)"
+    )
+
+
+def _require_recording_cache() -> "RecordingCache":
+    """Configure the cache from settings; exit unless it records run manifests."""
+    import dspy  # noqa: PLC0415
+
+    from voicetest.util.cache import RecordingCache  # noqa: PLC0415
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
+    setup_cache_from_settings(_services().settings.get_settings().cache)
+    if not isinstance(dspy.cache, RecordingCache):
+        _echo("[red]The configured LLM cache does not support bundles.[/red]")
+        raise SystemExit(1)
+    return dspy.cache
+
+
+@cache.command("export")
+@click.option("--run", "run_id", required=True, help="Run whose cache entries to bundle")
+@click.option(
+    "--output",
+    "-o",
+    default=None,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Bundle path (default: voicetest-cache-<digest>.zip)",
+)
+@click.pass_context
+def cache_export(ctx, run_id, output):
+    """Pack every LLM cache entry a run touched into one bundle."""
+    from voicetest.util.cache_bundle import export_bundle  # noqa: PLC0415
+
+    recording_cache = _require_recording_cache()
+    manifest = recording_cache.find_manifest(run_id)
+    if manifest is None:
+        _echo(f"[red]No cache manifest for run {run_id}.[/red]")
+        raise SystemExit(1)
+
+    summary = export_bundle(recording_cache, manifest, output)
+
+    if ctx.find_root().obj.get("json"):
+        click.echo(json.dumps(summary))
+        return
+
+    _echo(f"Wrote {summary['entries']} cache entries to {summary['path']}")
+    if summary["missing"]:
+        _echo(
+            f"[yellow]{summary['missing']} entries the run touched are no longer cached; "
+            "an offline re-run will miss them.[/yellow]"
+        )
+
+
+@cache.command("import")
+@click.argument("bundle", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.pass_context
+def cache_import(ctx, bundle):
+    """Load a cache bundle into the configured cache."""
+    from voicetest.util.cache_bundle import import_bundle  # noqa: PLC0415
+
+    recording_cache = _require_recording_cache()
+    try:
+        summary = import_bundle(recording_cache, bundle)
+    except ValueError as e:
+        _echo(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+
+    if ctx.find_root().obj.get("json"):
+        click.echo(json.dumps(summary))
+        return
+
+    _echo(f"Imported {summary['entries']} cache entries from run {summary['run_id']}")
+
+
+@cache.command("stats")
+@click.pass_context
+def cache_stats_cmd(ctx):
+    """Show size and hit/miss/eviction counters for each cache tier.
+
+    Counters start at zero in each process; `voicetest serve` reports its
+    running totals at GET /api/cache/stats."""
+    from voicetest.util.cache import cache_stats  # noqa: PLC0415
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
+    setup_cache_from_settings(_services().settings.get_settings().cache)
+    stats = cache_stats()
+
+    if ctx.find_root().obj.get("json"):
+        click.echo(json.dumps(stats))
+        return
+
+    table = Table(title=f"LLM cache ({stats['backend']})")
+    table.add_column("Tier", style="cyan")
+    table.add_column("Entries", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Limit", justify="right")
+    table.add_column("Hits", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Evictions", justify="right")
+    for tier in ("memory", "disk"):
+        if tier not in stats:
+            continue
+        t = stats[tier]
+        table.add_row(
+            tier,
+            str(t["entries"]),
+            str(t["bytes"]),
+            str(t.get("max_bytes", "")),
+            str(t["hits"]),
+            str(t["misses"]),
+            str(t["evictions"]),
+        )
+    console.print(table)
+
+
 # ---------------------------------------------------------------------------
 # Snippet subgroup
 # ---------------------------------------------------------------------------
@@ -1585,8 +2506,9 @@ def _display_settings(s) -> None:
 @click.pass_context
 def platforms(ctx):
     """List available platforms with configuration status."""
-    svc = _services().platforms
-    platform_list = svc.list_platforms()
+    from voicetest.services.settings import SettingsService  # noqa: PLC0415
+
+    platform_list = _discovery().list_platforms(SettingsService().get_settings())
 
     if ctx.obj.get("json"):
         click.echo(json.dumps(platform_list, indent=2))
@@ -2069,6 +2991,8 @@ async def _chat(
     json_mode: bool = False,
 ) -> None:
     """Async implementation of chat command."""
+    from voicetest.engine.conversation import ConversationEngine  # noqa: PLC0415
+
     svc = _services()
     settings = svc.settings.get_settings()
 
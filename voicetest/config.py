@@ -7,6 +7,11 @@ from pathlib import Path
 VOICETEST_DIR = ".voicetest"
 SETTINGS_FILE = "settings.toml"
 DB_FILE = "data.duckdb"
+ARCHIVE_DIR = "archive"
+CACHE_DIR = "cache"
+MANIFEST_DIR = "cache-manifests"
+BENCHMARK_DIR = "benchmarks"
+DAEMON_SOCKET = "daemon.sock"
 
 
 def get_global_dir() -> Path:
@@ -48,6 +53,34 @@ def get_db_path() -> Path:
     return get_voicetest_dir() / DB_FILE
 
 
+def get_archive_dir() -> Path:
+    """Get the default directory for archived runs."""
+    return get_voicetest_dir() / ARCHIVE_DIR
+
+
+def get_cache_dir() -> Path:
+    """Get the default directory for the local LLM cache tier."""
+    return get_voicetest_dir() / CACHE_DIR
+
+
 def is_project_mode() -> bool:
     """Check if running in project-local mode."""
     return get_local_dir() is not None
+
+
+def get_manifest_dir() -> Path:
+    """Get the directory holding per-run LLM cache manifests."""
+    return get_voicetest_dir() / MANIFEST_DIR
+
+
+def get_benchmark_dir() -> Path:
+    """Get the default directory for `voicetest bench` result files."""
+    return get_voicetest_dir() / BENCHMARK_DIR
+
+
+def get_daemon_socket_path() -> Path:
+    """Get the Unix socket path `voicetest daemon` listens on."""
+    if env_path := os.environ.get("VOICETEST_DAEMON_SOCKET"):
+        return Path(env_path)
+
+    return get_voicetest_dir() / DAEMON_SOCKET
@@ -1,38 +1,19 @@
 """Dependency injection container using Punq."""
 
 import os
+from pathlib import Path
 
 import punq
 from sqlalchemy import Engine
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 
-from voicetest.exporters.bland import BlandExporter
-from voicetest.exporters.graph_viz import MermaidExporter
-from voicetest.exporters.livekit_codegen import LiveKitExporter
 from voicetest.exporters.registry import ExporterRegistry
-from voicetest.exporters.retell_cf import RetellCFExporter
-from voicetest.exporters.retell_llm import RetellLLMExporter
-from voicetest.exporters.telnyx import TelnyxExporter
-from voicetest.exporters.vapi import VAPIAssistantExporter
-from voicetest.exporters.vapi import VAPISquadExporter
-from voicetest.exporters.voicetest_ir import VoicetestIRExporter
-from voicetest.importers.agentgraph import AgentGraphImporter
-from voicetest.importers.bland import BlandImporter
-from voicetest.importers.custom import CustomImporter
-from voicetest.importers.livekit import LiveKitImporter
 from voicetest.importers.registry import ImporterRegistry
-from voicetest.importers.retell import RetellImporter
-from voicetest.importers.retell_llm import RetellLLMImporter
-from voicetest.importers.telnyx import TelnyxImporter
-from voicetest.importers.vapi import VapiImporter
-from voicetest.importers.xlsform import XLSFormImporter
-from voicetest.platforms.bland import BlandPlatformClient
-from voicetest.platforms.livekit import LiveKitPlatformClient
 from voicetest.platforms.registry import PlatformRegistry
-from voicetest.platforms.retell import RetellPlatformClient
-from voicetest.platforms.telnyx import TelnyxPlatformClient
-from voicetest.platforms.vapi import VapiPlatformClient
+from voicetest.registries import create_exporter_registry
+from voicetest.registries import create_importer_registry
+from voicetest.registries import create_platform_registry
 from voicetest.services.settings import SettingsService
 from voicetest.storage.engine import create_db_engine
 from voicetest.storage.engine import get_session_factory
@@ -42,47 +23,6 @@ from voicetest.storage.repositories import RunRepository
 from voicetest.storage.repositories import TestCaseRepository
 
 
-def _create_importer_registry() -> ImporterRegistry:
-    """Create and configure the importer registry."""
-    registry = ImporterRegistry()
-    registry.register(RetellImporter())
-    registry.register(RetellLLMImporter())
-    registry.register(VapiImporter())
-    registry.register(LiveKitImporter())
-    registry.register(BlandImporter())
-    registry.register(TelnyxImporter())
-    registry.register(XLSFormImporter())
-    registry.register(CustomImporter())
-    registry.register(AgentGraphImporter())
-    return registry
-
-
-def _create_exporter_registry(settings_service: SettingsService) -> ExporterRegistry:
-    """Create and configure the exporter registry."""
-    registry = ExporterRegistry()
-    registry.register(MermaidExporter())
-    registry.register(LiveKitExporter())
-    registry.register(RetellLLMExporter())
-    registry.register(RetellCFExporter(settings_service))
-    registry.register(VAPIAssistantExporter())
-    registry.register(VAPISquadExporter())
-    registry.register(BlandExporter())
-    registry.register(TelnyxExporter())
-    registry.register(VoicetestIRExporter())
-    return registry
-
-
-def _create_platform_registry() -> PlatformRegistry:
-    """Create and configure the platform registry."""
-    registry = PlatformRegistry()
-    registry.register(RetellPlatformClient())
-    registry.register(VapiPlatformClient())
-    registry.register(LiveKitPlatformClient())
-    registry.register(BlandPlatformClient())
-    registry.register(TelnyxPlatformClient())
-    return registry
-
-
 def _is_postgres_url(url: str | None) -> bool:
     """Check if the given URL is a PostgreSQL connection string."""
     if not url:
@@ -128,15 +68,15 @@ def create_container() -> punq.Container:
     container.register(SettingsService, scope=punq.Scope.singleton)
 
     container.register(
-        ImporterRegistry, factory=_create_importer_registry, scope=punq.Scope.singleton
+        ImporterRegistry, factory=create_importer_registry, scope=punq.Scope.singleton
     )
     container.register(
         ExporterRegistry,
-        factory=lambda: _create_exporter_registry(container.resolve(SettingsService)),
+        factory=lambda: create_exporter_registry(container.resolve(SettingsService)),
         scope=punq.Scope.singleton,
     )
     container.register(
-        PlatformRegistry, factory=_create_platform_registry, scope=punq.Scope.singleton
+        PlatformRegistry, factory=create_platform_registry, scope=punq.Scope.singleton
     )
 
     container.register(AgentRepository)
@@ -178,6 +118,14 @@ def create_container() -> punq.Container:
     container.register(LiveKitConfig, instance=LiveKitConfig.from_env())
     container.register(CallManager, scope=punq.Scope.singleton)
     container.register(ChatManager, scope=punq.Scope.singleton)
-    container.register(RunCoordinator, scope=punq.Scope.singleton)
+    executors = os.environ.get("VOICETEST_EXECUTORS")
+    if executors:
+        # `voicetest serve --executors N`: runs execute in executor processes.
+        from voicetest.web.executor import RemoteRunCoordinator  # noqa: PLC0415
+
+        coordinator = RemoteRunCoordinator([Path(p) for p in executors.split(",")])
+        container.register(RunCoordinator, instance=coordinator)
+    else:
+        container.register(RunCoordinator, scope=punq.Scope.singleton)
 
     return container
@@ -0,0 +1,294 @@
+"""Long-lived local process that keeps voicetest warm between CLI runs.
+
+`voicetest daemon start` builds the container, runs the schema checks,
+configures the LLM cache and imports dspy and litellm once, then serves run
+requests on a Unix socket in the project's .voicetest directory.
+`voicetest run` sends its request there when the daemon is up and streams
+the results back. Repeated runs then skip interpreter start-up, imports and
+migration checks, and re-parse agent and test files only when they change.
+The daemon opens the database only while it saves a run (`save_run`), so
+`voicetest runs`, `serve` and other processes can use it in between.
+
+The protocol is one JSON object per line. The client sends one request and
+reads events until the daemon closes the connection:
+
+    {"op": "run", "agent": "/abs/agent.json", "tests": "/abs/tests.json", ...}
+    {"event": "loaded", "source_type": "retell", "nodes": 4, "entry_node_id": "start"}
+    {"event": "retry", "error_type": "RateLimitError", "attempt": 1, ...}
+    {"event": "result", "result": {...TestResult...}}
+    {"event": "done", "run": {...TestRun...}, "saved_run_id": null}
+
+Any failure ends the stream with `{"event": "error", "message": ...}`.
+`{"op": "status"}` and `{"op": "stop"}` answer with a single event.
+
+This module is imported by the CLI on every `voicetest run`, so the client
+half must stay light: the server imports the service layer lazily."""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Generator
+import contextlib
+import dataclasses
+import json
+import os
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+
+from voicetest.config import get_daemon_socket_path
+from voicetest.models.test_case import RunOptions
+
+
+if TYPE_CHECKING:
+    import punq
+
+    from voicetest.models.agent import AgentGraph
+    from voicetest.models.results import TestResult
+    from voicetest.services.runs import RunService
+    from voicetest.settings import Settings
+    from voicetest.util.retry import RetryError
+
+
+# Transcripts and judge reasoning make result lines large.
+STREAM_LIMIT = 64 << 20
+
+# Agent graphs and test files kept parsed, per source type.
+_FILE_CACHE_SIZE = 64
+
+
+class DaemonClient:
+    """One connection to a running daemon, good for a single request."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, socket_path: Path | None = None) -> "DaemonClient":
+        """Connect to the daemon. Raises OSError if none is listening."""
+        path = socket_path or get_daemon_socket_path()
+        reader, writer = await asyncio.open_unix_connection(str(path), limit=STREAM_LIMIT)
+        return cls(reader, writer)
+
+    async def request(self, payload: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Send `payload` and yield each event until the daemon closes the stream."""
+        try:
+            self._writer.write(json.dumps(payload).encode() + b"\n")
+            await self._writer.drain()
+            while line := await self._reader.readline():
+                yield json.loads(line)
+        finally:
+            self._writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self._writer.wait_closed()
+
+
+async def send_request(
+    payload: dict[str, Any], socket_path: Path | None = None
+) -> list[dict[str, Any]]:
+    """Send a request and collect every event it produces."""
+    client = await DaemonClient.connect(socket_path)
+    return [event async for event in client.request(payload)]
+
+
+class VoicetestDaemon:
+    """Serves run requests from one warm container."""
+
+    def __init__(self, container: "punq.Container"):
+        from voicetest.importers.registry import ImporterRegistry  # noqa: PLC0415
+        from voicetest.services import build_app_services  # noqa: PLC0415
+        from voicetest.storage.linked_file import FileCache  # noqa: PLC0415
+
+        self._container = container
+        self.services = build_app_services(container)
+        self._release_database()
+        self._importers = container.resolve(ImporterRegistry)
+        # Parsed graphs per source type, then by agent file path.
+        self._graphs: defaultdict[str | None, FileCache] = defaultdict(
+            lambda: FileCache(maxsize=_FILE_CACHE_SIZE)
+        )
+        self._tests = FileCache(maxsize=_FILE_CACHE_SIZE)
+        self._cache_settings = None
+        self._server: asyncio.Server | None = None
+        self.started_at = time.monotonic()
+        self.runs_served = 0
+
+    def warm(self) -> None:
+        """Pay the one-off import and cache set-up costs before the first request."""
+        import litellm  # noqa: F401, PLC0415
+
+        import voicetest.services.testing.execution  # noqa: F401, PLC0415
+
+        self._settings()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.monotonic() - self.started_at, 1),
+            "runs_served": self.runs_served,
+        }
+
+    async def serve(self, socket_path: Path | None = None) -> None:
+        """Listen on `socket_path` until `stop()` is called."""
+        path = socket_path or get_daemon_socket_path()
+        if path.exists():
+            if await _is_listening(path):
+                raise RuntimeError(f"A voicetest daemon is already listening on {path}")
+            path.unlink()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._server = await asyncio.start_unix_server(
+            self._handle, path=str(path), limit=STREAM_LIMIT
+        )
+        os.chmod(path, 0o600)
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def send(event: dict[str, Any]) -> None:
+            writer.write(json.dumps(event).encode() + b"\n")
+            await writer.drain()
+
+        try:
+            request = json.loads(await reader.readline())
+            op = request.get("op")
+            if op == "run":
+                await self._run(request, send)
+            elif op == "status":
+                await send({"event": "status", **self.status()})
+            elif op == "stop":
+                await send({"event": "stopping"})
+                self.stop()
+            else:
+                await send({"event": "error", "message": f"Unknown op: {op}"})
+        except Exception as e:
+            with contextlib.suppress(ConnectionError):
+                await send({"event": "error", "message": str(e) or type(e).__name__})
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def _settings(self) -> "Settings":
+        """Current settings, reconfiguring the LLM cache only when its section changed."""
+        from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
+        settings = self.services.settings.get_settings()
+        if settings.cache != self._cache_settings:
+            setup_cache_from_settings(settings.cache)
+            self._cache_settings = settings.cache
+        return settings
+
+    @contextlib.contextmanager
+    def _database(self) -> Generator["RunService"]:
+        """Run storage, with the database closed again on exit."""
+        try:
+            yield self.services.runs
+        finally:
+            self._release_database()
+
+    def _release_database(self) -> None:
+        """Close the database connection so other processes can open the database.
+
+        The session and engine reconnect on their next use."""
+        from sqlalchemy import Engine  # noqa: PLC0415
+        from sqlalchemy.orm import Session  # noqa: PLC0415
+
+        self._container.resolve(Session).close()
+        self._container.resolve(Engine).dispose()
+
+    def _load_graph(self, agent_path: str, source: str | None) -> "AgentGraph":
+        return self._graphs[source].get(
+            agent_path, lambda path: self._importers.import_agent(Path(path), source_type=source)
+        )
+
+    async def _run(self, request: dict[str, Any], send: Callable[[dict[str, Any]], Any]) -> None:
+        from voicetest.runner import TestRunContext  # noqa: PLC0415
+        from voicetest.runner import load_test_cases  # noqa: PLC0415
+
+        agent_id = request.get("agent_id")
+        if request.get("save_run"):
+            with self._database():
+                if not self.services.agents.get_agent(agent_id):
+                    raise ValueError(f"Agent not found: {agent_id}")
+        settings = self._settings()
+        max_turns = request.get("max_turns")
+        options = RunOptions(
+            agent_model=settings.models.agent,
+            simulator_model=settings.models.simulator,
+            judge_model=settings.models.judge,
+            max_turns=max_turns if max_turns is not None else settings.run.max_turns,
+            verbose=request.get("verbose", False) or settings.run.verbose,
+            strict_offline=request.get("offline", False),
+        )
+        agent_path, tests_path = request["agent"], request["tests"]
+        run_ctx = TestRunContext(
+            services=self.services,
+            agent_path=Path(agent_path),
+            tests_path=Path(tests_path),
+            source=request.get("source"),
+            options=options,
+        )
+        run_ctx.graph = self._load_graph(agent_path, run_ctx.source)
+        run_ctx.test_cases = list(
+            self._tests.get(tests_path, lambda path: load_test_cases(Path(path)))
+        )
+        await send(
+            {
+                "event": "loaded",
+                "source_type": run_ctx.graph.source_type,
+                "nodes": len(run_ctx.graph.nodes),
+                "entry_node_id": run_ctx.graph.entry_node_id,
+            }
+        )
+
+        if request.get("test_names"):
+            run_ctx.filter_tests(request["test_names"])
+        elif not request.get("run_all"):
+            await send({"event": "done", "run": None, "saved_run_id": None})
+            return
+        await send({"event": "started", "tests": run_ctx.total_tests})
+
+        async def on_error(error: "RetryError") -> None:
+            await send({"event": "retry", **dataclasses.asdict(error)})
+
+        async def on_result(result: "TestResult") -> None:
+            await send({"event": "result", "result": result.model_dump(mode="json")})
+
+        run_result = await run_ctx.run_all(on_error=on_error, on_result=on_result)
+        db_run = None
+        if request.get("save_run"):
+            with self._database() as runs:
+                db_run = runs.save_run(agent_id, run_result)
+
+        self.runs_served += 1
+        await send(
+            {
+                "event": "done",
+                "run": run_result.model_dump(mode="json"),
+                "saved_run_id": db_run["id"] if db_run else None,
+            }
+        )
+
+
+async def _is_listening(socket_path: Path) -> bool:
+    try:
+        _, writer = await asyncio.open_unix_connection(str(socket_path))
+    except OSError:
+        return False
+    writer.close()
+    with contextlib.suppress(ConnectionError):
+        await writer.wait_closed()
+    return True
@@ -2,12 +2,14 @@
 
 from voicetest.engine.conversation import ConversationEngine
 from voicetest.engine.conversation import TurnResult
+from voicetest.engine.forking import ConversationForks
 from voicetest.engine.session import ConversationRunner
 from voicetest.engine.session import ConversationState
 
 
 __all__ = [
     "ConversationEngine",
+    "ConversationForks",
     "ConversationRunner",
     "ConversationState",
     "TurnResult",
@@ -27,10 +27,16 @@ from voicetest.models.test_case import RunOptions
 from voicetest.util.retry import OnErrorCallback
 from voicetest.util.templating import expand_snippets
 from voicetest.util.templating import substitute_variables
+from voicetest.util.timing import Span
+from voicetest.util.timing import timed
+from voicetest.util.tracing import trace_span
 
 
 logger = logging.getLogger(__name__)
 
+# Bump when the `ConversationEngine.snapshot()` layout changes incompatibly.
+SNAPSHOT_VERSION = 1
+
 
 @dataclass
 class TurnResult:
@@ -67,6 +73,8 @@ class ConversationEngine:
         self._tools_called: list[ToolCall] = []
         self._end_call_invoked = False
         self._originator_stack: list[str] = []
+        # Spans timed since the last agent message; attached to the next one.
+        self._turn_timings: dict[str, float] = {}
 
     @property
     def current_node(self) -> str:
@@ -109,19 +117,17 @@ class ConversationEngine:
         if self._on_turn:
             await _invoke_callback(self._on_turn, self._transcript)
 
-    async def add_user_message(self, content: str) -> None:
+    async def add_user_message(self, content: str, timings: dict[str, float] | None = None) -> None:
         """Add a user message to the transcript.
 
         Args:
             content: The user's message content.
+            timings: Time spent producing it by span name (e.g. the simulator).
         """
-        await self._append_message(
-            Message(
-                role="user",
-                content=content,
-                metadata={"node_id": self._current_node},
-            )
-        )
+        metadata: dict = {"node_id": self._current_node}
+        if timings:
+            metadata["timings"] = timings
+        await self._append_message(Message(role="user", content=content, metadata=metadata))
 
     def _last_user_message(self) -> str:
         """Extract the most recent user message from the transcript."""
@@ -130,6 +136,10 @@ class ConversationEngine:
                 return msg.content
         return ""
 
+    def _note_span(self, span: Span) -> None:
+        """Add a finished span to the timings of the turn in progress."""
+        self._turn_timings[span.name] = round(self._turn_timings.get(span.name, 0) + span.ms, 1)
+
     def _expand(self, text: str) -> str:
         """Expand snippet refs and substitute dynamic variables."""
         return substitute_variables(
@@ -142,7 +152,22 @@ class ConversationEngine:
         on_token: OnTokenCallback | None = None,
         on_error: OnErrorCallback | None = None,
     ) -> TurnResult:
-        """Advance through silent nodes to a conversation node, then respond from it."""
+        """Advance through silent nodes to a conversation node, then respond from it.
+
+        Time spent in transition checks, extract calls and the response is
+        recorded as `timings` in the agent message's metadata."""
+        with trace_span("turn", node=self._current_node) as trace:
+            result = await self._advance(on_token, on_error)
+            if trace:
+                trace.set(end_node=self._current_node, end_call=result.end_call_invoked)
+        return result
+
+    async def _advance(
+        self,
+        on_token: OnTokenCallback | None,
+        on_error: OnErrorCallback | None,
+    ) -> TurnResult:
+        self._turn_timings = {}
         max_hops = 20
         accumulated_tool_calls: list[ToolCall] = []
         end_call_invoked = False
@@ -156,7 +181,11 @@ class ConversationEngine:
                 raise ValueError(f"Unknown node: {self._current_node}")
 
             if node.is_extract_node():
-                result = await self._evaluate_extract_node(node, state_module, on_error=on_error)
+                with timed("extract") as span:
+                    result = await self._evaluate_extract_node(
+                        node, state_module, on_error=on_error
+                    )
+                self._note_span(span)
                 accumulated_tool_calls.extend(result.tool_calls)
                 if result.end_call_invoked:
                     end_call_invoked = True
@@ -193,7 +222,9 @@ class ConversationEngine:
                 )
 
             if not has_advanced and self._last_user_message():
-                result = await self._evaluate_transition(node, on_error=on_error)
+                with timed("transition") as span:
+                    result = await self._evaluate_transition(node, on_error=on_error)
+                self._note_span(span)
                 if result.transitioned_to:
                     accumulated_tool_calls.extend(result.tool_calls)
                     last_transition_target = result.transitioned_to
@@ -268,6 +299,7 @@ class ConversationEngine:
             on_error=on_error,
             no_cache=self._no_cache,
             predictor_class=dspy.ChainOfThought,
+            role="transition",
             current_state_prompt=state_prompt,
             conversation_history=conversation_history,
             last_agent_message=last_agent_message,
@@ -304,6 +336,41 @@ class ConversationEngine:
         node = self.graph.nodes[self._current_node]
         user_message = self._last_user_message()
 
+        with timed("response") as span:
+            result = await self._call_response_llm(state_module, user_message, on_token, on_error)
+        self._note_span(span)
+        timings, self._turn_timings = self._turn_timings, {}
+
+        turn_result = TurnResult(response=result.response)
+
+        await self._append_message(
+            Message(
+                role="assistant",
+                content=result.response,
+                metadata={"node_id": self._current_node, "timings": timings},
+            )
+        )
+
+        # On conversation nodes, always-edges fire AFTER the agent speaks
+        # (linear advance), not as a pre-response transition.
+        always_target = self._find_always_transition(node)
+        if always_target:
+            await self._apply_transition(turn_result, always_target)
+
+        if (node.is_end_node() or node.is_transfer_node()) and not turn_result.transitioned_to:
+            turn_result.end_call_invoked = True
+            self._end_call_invoked = True
+
+        return turn_result
+
+    async def _call_response_llm(
+        self,
+        state_module: StateModule,
+        user_message: str,
+        on_token: OnTokenCallback | None,
+        on_error: OnErrorCallback | None,
+    ) -> dspy.Prediction:
+        """Build the response prompt for the current node and call the agent model."""
         general_instructions = self._expand(self._module.instructions)
         state_instructions = self._expand(state_module.instructions)
 
@@ -327,7 +394,7 @@ class ConversationEngine:
                 json.dumps([t.model_dump() for t in available_transitions], sort_keys=True).encode()
             ).hexdigest()[:16]
 
-        result = await call_llm(
+        return await call_llm(
             self.model,
             response_sig,
             on_token=on_token,
@@ -336,31 +403,10 @@ class ConversationEngine:
             cache_salt=cache_salt,
             no_cache=self._no_cache,
             predictor_class=dspy.Predict,
+            role="agent",
             **response_kwargs,
         )
 
-        turn_result = TurnResult(response=result.response)
-
-        await self._append_message(
-            Message(
-                role="assistant",
-                content=result.response,
-                metadata={"node_id": self._current_node},
-            )
-        )
-
-        # On conversation nodes, always-edges fire AFTER the agent speaks
-        # (linear advance), not as a pre-response transition.
-        always_target = self._find_always_transition(node)
-        if always_target:
-            await self._apply_transition(turn_result, always_target)
-
-        if (node.is_end_node() or node.is_transfer_node()) and not turn_result.transitioned_to:
-            turn_result.end_call_invoked = True
-            self._end_call_invoked = True
-
-        return turn_result
-
     async def _apply_transition(self, turn_result: TurnResult, target: str) -> None:
         """Record a transition; manages the originator stack for global nodes."""
         source_node = self.graph.nodes[self._current_node]
@@ -484,6 +530,7 @@ class ConversationEngine:
             on_error=on_error,
             no_cache=self._no_cache,
             predictor_class=dspy.Predict,
+            role="extract",
             conversation_history=self._format_transcript(self._transcript),
             user_message=user_message,
         )
@@ -528,6 +575,50 @@ class ConversationEngine:
             lines.append(f"{msg.role.upper()}: {msg.content}")
         return "\n".join(lines)
 
+    def snapshot(self) -> dict:
+        """JSON-ready conversation state, for `restore()` after an interruption.
+
+        Graph, model and options are not included; they come from the engine
+        the snapshot is restored into. Empty fields are left out."""
+        data: dict[str, Any] = {
+            "v": SNAPSHOT_VERSION,
+            "node": self._current_node,
+            "transcript": [
+                m.model_dump(mode="json", exclude_defaults=True) for m in self._transcript
+            ],
+            "visited": list(self._nodes_visited),
+        }
+        if self._tools_called:
+            data["tools"] = [t.model_dump(mode="json") for t in self._tools_called]
+        if self._originator_stack:
+            data["stack"] = list(self._originator_stack)
+        if self._dynamic_variables:
+            data["vars"] = dict(self._dynamic_variables)
+        if self._end_call_invoked:
+            data["ended"] = True
+        return data
+
+    def restore(self, data: dict) -> None:
+        """Replace the conversation state with one taken by `snapshot()`.
+
+        Raises ValueError for an unknown snapshot version or one that refers
+        to nodes this engine's graph does not have."""
+        if data.get("v") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported engine snapshot version: {data.get('v')!r}")
+        stack = data.get("stack", [])
+        missing = [n for n in (data["node"], *stack) if n not in self.graph.nodes]
+        if missing:
+            raise ValueError(f"Snapshot refers to nodes not in the graph: {', '.join(missing)}")
+
+        self._current_node = data["node"]
+        self._transcript = [Message.model_validate(m) for m in data["transcript"]]
+        self._nodes_visited = list(data["visited"])
+        self._tools_called = [ToolCall.model_validate(t) for t in data.get("tools", [])]
+        self._originator_stack = list(stack)
+        self._dynamic_variables = dict(data.get("vars", {}))
+        self._end_call_invoked = data.get("ended", False)
+        self._turn_timings = {}
+
     def reset(self) -> None:
         """Reset the engine to initial state."""
         self._current_node = self.graph.entry_node_id
@@ -536,3 +627,4 @@ class ConversationEngine:
         self._tools_called = []
         self._end_call_invoked = False
         self._originator_stack = []
+        self._turn_timings = {}
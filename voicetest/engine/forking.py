@@ -0,0 +1,62 @@
+"""Shared conversation openings across the tests of a run.
+
+Before the simulated user says anything, the agent speaks from the entry
+node. That opening turn depends only on the graph, the run options and the
+test's dynamic variables, so every test that agrees on those opens the same
+way. `ConversationForks` lets the first such test run the opening and hands
+each later one a private copy of the resulting engine state (a
+`ConversationRunner` checkpoint) to continue from. Turns after the opening
+are driven by each test's own simulated user and are never shared.
+"""
+
+import copy
+from dataclasses import dataclass
+import json
+
+from voicetest.models.test_case import TestCase
+
+
+@dataclass
+class _Fork:
+    checkpoint: dict
+    llm_calls: int
+    uses: int = 0
+
+
+class ConversationForks:
+    """Conversation openings recorded during one run, by dynamic variables.
+
+    Scope an instance to a single graph and set of run options: the key
+    only distinguishes tests by the variables their opening is rendered
+    with."""
+
+    def __init__(self):
+        self._forks: dict[str, _Fork] = {}
+
+    @property
+    def llm_calls_saved(self) -> int:
+        """Provider calls not made because a test started from a shared opening."""
+        return sum(fork.llm_calls * fork.uses for fork in self._forks.values())
+
+    def fork(self, test_case: TestCase) -> tuple[dict, int] | None:
+        """A copy of the opening shared by `test_case` and the provider calls it
+        cost to produce, or None if no test with its prefix has got that far."""
+        fork = self._forks.get(_prefix_key(test_case))
+        if fork is None:
+            return None
+        fork.uses += 1
+        return copy.deepcopy(fork.checkpoint), fork.llm_calls
+
+    def record(self, test_case: TestCase, checkpoint: dict, llm_calls: int) -> None:
+        """Offer a checkpoint taken while running `test_case`.
+
+        Only the opening (turn 0) is kept, and only the first one per prefix."""
+        if checkpoint["turns"] != 0:
+            return
+        key = _prefix_key(test_case)
+        if key not in self._forks:
+            self._forks[key] = _Fork(copy.deepcopy(checkpoint), llm_calls)
+
+
+def _prefix_key(test_case: TestCase) -> str:
+    return json.dumps(test_case.dynamic_variables, sort_keys=True, default=str)
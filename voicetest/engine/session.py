@@ -17,6 +17,8 @@ from voicetest.util.retry import OnErrorCallback
 
 OnTurnCallback = Callable[[list[Message]], Awaitable[None] | None]
 OnTokenCallback = Callable[[str, str], Awaitable[None] | None]
+# Receives a checkpoint dict after the greeting and after every completed turn.
+OnCheckpointCallback = Callable[[dict], Awaitable[None] | None]
 
 
 @dataclass
@@ -75,8 +77,15 @@ class ConversationRunner:
         on_turn: OnTurnCallback | None = None,
         on_token: OnTokenCallback | None = None,
         on_error: OnErrorCallback | None = None,
+        checkpoint: dict | None = None,
+        on_checkpoint: OnCheckpointCallback | None = None,
     ) -> ConversationState:
-        """Run a complete conversation."""
+        """Run a complete conversation.
+
+        `on_checkpoint` receives `{"turns": n, "engine": snapshot}` after the
+        greeting and after each completed turn. Passing one of those back as
+        `checkpoint` continues that conversation from where it stopped instead
+        of starting over. Mock mode ignores both."""
         if self._mock_mode:
             return await self._run_mock(test_case, user_simulator, on_turn, on_token, on_error)
 
@@ -90,14 +99,50 @@ class ConversationRunner:
 
         self._engine._on_turn = on_turn
 
-        await self._engine.advance(
-            on_token=agent_token_cb,
-            on_error=on_error,
-        )
+        if checkpoint is not None:
+            self._engine.restore(checkpoint["engine"])
+            state.turn_count = checkpoint["turns"]
+        else:
+            await self._engine.advance(
+                on_token=agent_token_cb,
+                on_error=on_error,
+            )
+            await self._checkpoint(state, on_checkpoint)
+
+        if checkpoint is not None and self._engine.end_call_invoked:
+            state.end_reason = "agent_ended"
+        else:
+            await self._run_turns(
+                state, user_simulator, agent_token_cb, on_token, on_error, on_checkpoint
+            )
+
+        state.transcript = self._engine.transcript
+        state.nodes_visited = self._engine.nodes_visited
+        state.tools_called = self._engine.tools_called
+        state.end_call_invoked = self._engine.end_call_invoked
+        return state
+
+    async def _checkpoint(
+        self, state: ConversationState, on_checkpoint: OnCheckpointCallback | None
+    ) -> None:
+        if on_checkpoint:
+            await _invoke_callback(
+                on_checkpoint, {"turns": state.turn_count, "engine": self._engine.snapshot()}
+            )
 
+    async def _run_turns(
+        self,
+        state: ConversationState,
+        user_simulator,
+        agent_token_cb,
+        on_token: OnTokenCallback | None,
+        on_error: OnErrorCallback | None,
+        on_checkpoint: OnCheckpointCallback | None,
+    ) -> None:
+        """Alternate simulator and agent turns until the conversation ends."""
         turn_timeout = self.options.turn_timeout_seconds
 
-        for _turn in range(self.options.max_turns):
+        for _turn in range(state.turn_count, self.options.max_turns):
             try:
                 sim_response = await asyncio.wait_for(
                     user_simulator.generate(
@@ -115,7 +160,10 @@ class ConversationRunner:
                 state.end_reason = "simulator_exhausted"
                 break
 
-            await self._engine.add_user_message(sim_response.message)
+            timings = None
+            if sim_response.duration_ms is not None:
+                timings = {"simulator": sim_response.duration_ms}
+            await self._engine.add_user_message(sim_response.message, timings=timings)
 
             try:
                 await asyncio.wait_for(
@@ -130,6 +178,7 @@ class ConversationRunner:
                 break
 
             state.turn_count += 1
+            await self._checkpoint(state, on_checkpoint)
 
             if self._engine.end_call_invoked:
                 state.end_reason = "agent_ended"
@@ -137,12 +186,6 @@ class ConversationRunner:
         else:
             state.end_reason = "max_turns"
 
-        state.transcript = self._engine.transcript
-        state.nodes_visited = self._engine.nodes_visited
-        state.tools_called = self._engine.tools_called
-        state.end_call_invoked = self._engine.end_call_invoked
-        return state
-
     async def _run_mock(
         self,
         test_case,
@@ -9,8 +9,16 @@ class QuotaExhaustedError(Exception):
         self.reset_message = reset_message
 
 
+class CacheMissError(Exception):
+    """Raised in strict-offline mode when an LLM request has no cache entry."""
+
+
 class StaleGraphSchemaError(Exception):
     """Raised when a stored graph_json predates a required schema change.
 
     Surfaces as a 400 with an actionable message at the REST layer.
     Run `voicetest migrate-node-types` to bring stored graphs forward."""
+
+
+class ArchiveInProgressError(Exception):
+    """Raised when another process is already archiving runs from the same database."""
@@ -3,17 +3,24 @@
 from voicetest.exporters.base import Exporter
 from voicetest.exporters.base import ExporterInfo
 from voicetest.models.agent import AgentGraph
+from voicetest.util.lazy import LazyEntries
 
 
 class ExporterRegistry:
-    """Registry for discovering and selecting exporters."""
+    """Registry for discovering and selecting exporters.
+
+    Exporters added with `register_lazy` are imported on first use."""
 
     def __init__(self):
-        self._exporters: dict[str, Exporter] = {}
+        self._exporters: LazyEntries[Exporter] = LazyEntries()
 
     def register(self, exporter: Exporter) -> None:
         """Register an exporter."""
-        self._exporters[exporter.format_id] = exporter
+        self._exporters.add(exporter.format_id, exporter)
+
+    def register_lazy(self, format_id: str, path: str, *args) -> None:
+        """Register an exporter by `"package.module:Class"`, built with `args` on first use."""
+        self._exporters.add_lazy(format_id, path, *args)
 
     def get(self, format_id: str) -> Exporter | None:
         """Get an exporter by format ID."""
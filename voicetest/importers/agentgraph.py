@@ -1,10 +1,10 @@
 """AgentGraph JSON importer for files already in AgentGraph format."""
 
-import json
 from pathlib import Path
 from typing import Any
 
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.models.agent import AgentGraph
 
 
@@ -24,20 +24,14 @@ class AgentGraphImporter:
 
     def can_import(self, path_or_config: str | Path | dict[str, Any]) -> bool:
         """Check if the input is AgentGraph JSON (has nodes and entry_node_id)."""
-        if isinstance(path_or_config, dict):
-            return "nodes" in path_or_config and "entry_node_id" in path_or_config
-
-        if isinstance(path_or_config, str | Path):
-            path = Path(path_or_config)
-            if not path.exists() or path.suffix != ".json":
-                return False
-            try:
-                data = json.loads(path.read_text())
-                return isinstance(data, dict) and "nodes" in data and "entry_node_id" in data
-            except (json.JSONDecodeError, OSError):
-                return False
-
-        return False
+        return self.can_import_source(ImportSource(path_or_config))
+
+    def can_import_source(self, source: ImportSource) -> bool:
+        """Check a shared, already-loaded input for AgentGraph JSON."""
+        if source.path is not None and source.path.suffix != ".json":
+            return False
+        config = source.config
+        return config is not None and "nodes" in config and "entry_node_id" in config
 
     def import_agent(self, path_or_config: str | Path | dict[str, Any]) -> AgentGraph:
         """Import AgentGraph from JSON file or dict."""
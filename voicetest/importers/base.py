@@ -1,7 +1,12 @@
 """Base protocol and types for source importers."""
 
 from dataclasses import dataclass
+from functools import cached_property
+import hashlib
+from io import BytesIO
+import json
 from pathlib import Path
+from typing import Any
 from typing import Protocol
 from typing import runtime_checkable
 
@@ -10,7 +15,12 @@ from voicetest.models.agent import AgentGraph
 
 @runtime_checkable
 class SourceImporter(Protocol):
-    """Protocol for agent config importers."""
+    """Protocol for agent config importers.
+
+    Importers may also define `can_import_source(source: ImportSource) -> bool`.
+    The registry then probes them with the shared `ImportSource` instead of
+    the raw input, and hands them the already-parsed `source.config` when the
+    input was a JSON object file, so `import_agent` must accept that dict."""
 
     @property
     def source_type(self) -> str:
@@ -37,3 +47,78 @@ class ImporterInfo:
     source_type: str
     description: str
     file_patterns: list[str]
+
+
+_WORKBOOK_SUFFIXES = (".xlsx", ".xls")
+
+
+class ImportSource:
+    """An import input loaded once and shared by every importer's probe.
+
+    File bytes, decoded text, parsed JSON and the openpyxl workbook are each
+    produced lazily on first access and reused, so auto-detection reads and
+    parses a file at most once no matter how many importers inspect it."""
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.path = Path(value) if isinstance(value, str | Path) else None
+
+    @property
+    def suffix(self) -> str:
+        return self.path.suffix.lower() if self.path else ""
+
+    @cached_property
+    def raw(self) -> bytes | None:
+        """File contents, or None for non-path inputs and unreadable files."""
+        if self.path is None:
+            return None
+        try:
+            return self.path.read_bytes()
+        except OSError:
+            return None
+
+    @cached_property
+    def text(self) -> str | None:
+        """File contents decoded as UTF-8, or None if missing or binary."""
+        if self.raw is None:
+            return None
+        try:
+            return self.raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    @cached_property
+    def config(self) -> dict[str, Any] | None:
+        """The input as a JSON object: the dict itself, or the parsed file."""
+        if isinstance(self.value, dict):
+            return self.value
+        if self.text is None:
+            return None
+        try:
+            data = json.loads(self.text)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    @cached_property
+    def workbook(self) -> Any:
+        """Read-only openpyxl workbook for spreadsheet paths, else None."""
+        if self.suffix not in _WORKBOOK_SUFFIXES or self.raw is None:
+            return None
+        from openpyxl import load_workbook  # noqa: PLC0415
+
+        try:
+            return load_workbook(BytesIO(self.raw), read_only=True, data_only=True)
+        except Exception:
+            return None
+
+    @cached_property
+    def content_hash(self) -> str | None:
+        """Digest of the file's suffix and bytes, or None for non-file inputs.
+
+        The suffix is part of the key because some probes (`.json`, `.py`,
+        `.xlsx`) decide on it as well as on the contents."""
+        if self.raw is None:
+            return None
+        digest = hashlib.sha256(self.raw).hexdigest()
+        return f"{self.suffix}:{digest}"
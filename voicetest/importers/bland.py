@@ -9,6 +9,7 @@ from pydantic import ConfigDict
 from pydantic import Field
 
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import AgentNode
 from voicetest.models.agent import NodeType
@@ -63,9 +64,14 @@ class BlandImporter:
 
     def can_import(self, path_or_config: str | Path | dict) -> bool:
         """Detect Bland format by checking for characteristic fields."""
+        return self.can_import_source(ImportSource(path_or_config))
+
+    def can_import_source(self, source: ImportSource) -> bool:
+        """Detect Bland format from a shared, already-loaded input."""
+        if source.config is None:
+            return False
         try:
-            config = self._load_config(path_or_config)
-            return self._is_bland_config(config)
+            return self._is_bland_config(source.config)
         except Exception:
             return False
 
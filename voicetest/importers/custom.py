@@ -4,6 +4,7 @@ from collections.abc import Callable
 from pathlib import Path
 
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.models.agent import AgentGraph
 
 
@@ -25,6 +26,10 @@ class CustomImporter:
         """Custom importer handles callable objects."""
         return callable(path_or_config)
 
+    def can_import_source(self, source: ImportSource) -> bool:
+        """Custom importer handles callable objects."""
+        return callable(source.value)
+
     def import_agent(self, path_or_config: str | Path | dict | Callable) -> AgentGraph:
         """Call the function to get AgentGraph."""
         if not callable(path_or_config):
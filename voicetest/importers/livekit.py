@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import AgentNode
 from voicetest.models.agent import NodeType
@@ -29,16 +30,16 @@ class LiveKitImporter:
 
     def can_import(self, path_or_config: str | Path | dict) -> bool:
         """Detect LiveKit agent Python files."""
-        if isinstance(path_or_config, dict):
-            return self._can_import_dict(path_or_config)
+        return self.can_import_source(ImportSource(path_or_config))
 
+    def can_import_source(self, source: ImportSource) -> bool:
+        """Detect LiveKit agent code from a shared, already-loaded input."""
+        if isinstance(source.value, dict):
+            return self._can_import_dict(source.value)
+        if source.path is None or source.path.suffix != ".py" or source.text is None:
+            return False
         try:
-            path = Path(path_or_config)
-            if path.suffix != ".py":
-                return False
-
-            content = path.read_text()
-            return self._looks_like_livekit_agent(content)
+            return self._looks_like_livekit_agent(source.text)
         except Exception:
             return False
 
@@ -1,21 +1,41 @@
 """Importer registry for discovering and selecting importers."""
 
 from pathlib import Path
+import threading
+
+from cachetools import LRUCache
 
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.importers.base import SourceImporter
 from voicetest.models.agent import AgentGraph
+from voicetest.util.lazy import LazyEntries
 
 
 class ImporterRegistry:
-    """Registry for discovering and selecting importers."""
+    """Registry for discovering and selecting importers.
+
+    Auto-detection loads the input once into an `ImportSource` shared by every
+    probe, and remembers which importer matched each file by content hash so
+    re-importing unchanged content skips probing entirely. Importers added with
+    `register_lazy` are imported the first time they are looked up or probed."""
 
-    def __init__(self):
-        self._importers: dict[str, SourceImporter] = {}
+    def __init__(self, detection_cache_size: int = 256):
+        self._importers: LazyEntries[SourceImporter] = LazyEntries()
+        self._detected: LRUCache = LRUCache(maxsize=detection_cache_size)
+        self._lock = threading.Lock()
 
     def register(self, importer: SourceImporter) -> None:
         """Register an importer."""
-        self._importers[importer.source_type] = importer
+        self._importers.add(importer.source_type, importer)
+        with self._lock:
+            self._detected.clear()
+
+    def register_lazy(self, source_type: str, path: str, *args) -> None:
+        """Register an importer by `"package.module:Class"`, built with `args` on first use."""
+        self._importers.add_lazy(source_type, path, *args)
+        with self._lock:
+            self._detected.clear()
 
     def get(self, source_type: str) -> SourceImporter | None:
         """Get an importer by source type."""
@@ -27,10 +47,7 @@ class ImporterRegistry:
 
     def auto_detect(self, path_or_config: str | Path | dict) -> SourceImporter | None:
         """Find the first importer that can handle the input."""
-        for importer in self._importers.values():
-            if importer.can_import(path_or_config):
-                return importer
-        return None
+        return self._detect(ImportSource(path_or_config))
 
     def import_agent(
         self,
@@ -42,9 +59,32 @@ class ImporterRegistry:
             importer = self.get(source_type)
             if not importer:
                 raise ValueError(f"Unknown importer: {source_type}")
-        else:
-            importer = self.auto_detect(path_or_config)
-            if not importer:
-                raise ValueError("Could not auto-detect source type")
+            return importer.import_agent(path_or_config)
 
+        source = ImportSource(path_or_config)
+        importer = self._detect(source)
+        if not importer:
+            raise ValueError("Could not auto-detect source type")
+
+        if hasattr(importer, "can_import_source") and source.config is not None:
+            return importer.import_agent(source.config)
         return importer.import_agent(path_or_config)
+
+    def _detect(self, source: ImportSource) -> SourceImporter | None:
+        """Probe importers in registration order, consulting the content-hash cache."""
+        key = source.content_hash
+        if key is not None:
+            with self._lock:
+                cached = self._detected.get(key)
+            if cached is not None and cached in self._importers:
+                return self._importers.get(cached)
+
+        for importer in self._importers.values():
+            probe = getattr(importer, "can_import_source", None)
+            matched = probe(source) if probe else importer.can_import(source.value)
+            if matched:
+                if key is not None:
+                    with self._lock:
+                        self._detected[key] = importer.source_type
+                return importer
+        return None
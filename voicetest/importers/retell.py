@@ -11,6 +11,7 @@ from pydantic import Field
 from pydantic import field_validator
 
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import AgentNode
 from voicetest.models.agent import EquationClause
@@ -204,8 +205,14 @@ class RetellImporter:
 
     def can_import(self, path_or_config: str | Path | dict) -> bool:
         """Detect Retell format by checking for characteristic fields."""
+        return self.can_import_source(ImportSource(path_or_config))
+
+    def can_import_source(self, source: ImportSource) -> bool:
+        """Detect Retell format from a shared, already-loaded input."""
+        if source.config is None:
+            return False
         try:
-            config, _ = self._load_config(path_or_config)
+            config, _ = _unwrap_agent_envelope(source.config)
             return "start_node_id" in config and "nodes" in config
         except Exception:
             return False
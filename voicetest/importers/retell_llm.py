@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import AgentNode
 from voicetest.models.agent import NodeType
@@ -117,9 +118,14 @@ class RetellLLMImporter:
 
     def can_import(self, path_or_config: str | Path | dict) -> bool:
         """Detect Retell LLM format by checking for characteristic fields."""
+        return self.can_import_source(ImportSource(path_or_config))
+
+    def can_import_source(self, source: ImportSource) -> bool:
+        """Detect Retell LLM format from a shared, already-loaded input."""
+        if source.config is None:
+            return False
         try:
-            config = self._load_config(path_or_config)
-            config = self._unwrap_config(config)
+            config = self._unwrap_config(source.config)
             has_general_prompt = "general_prompt" in config
             has_llm_id = "llm_id" in config
             has_states = "states" in config
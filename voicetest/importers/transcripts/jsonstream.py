@@ -0,0 +1,122 @@
+"""Incremental reader for large JSON-array and JSON-lines exports.
+
+Platform call exports can run to several GB, so transcript adapters read
+them record by record instead of `json.loads`-ing the whole file. Memory is
+bounded by the largest single record, not by the file, and a record may not
+grow past `max_record_size` characters, so a malformed one cannot pull the
+rest of the file into memory.
+"""
+
+from collections.abc import Iterator
+import json
+from typing import Any
+from typing import TextIO
+
+
+_WHITESPACE = " \t\n\r"
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+DEFAULT_MAX_RECORD_SIZE = 64 << 20
+
+# A decode error this far before the end of the window cannot be a value cut
+# off by the window edge (the longest partial token is "-Infinit"), except an
+# unterminated string, which only the record size limit stops.
+_TRUNCATION_SLACK = 16
+
+
+class _Buffer:
+    """Sliding text window over a file, refilled on demand."""
+
+    def __init__(self, fp: TextIO, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, min_chars: int = 0) -> bool:
+        """Read at least one chunk (or `min_chars`) more; False at end of file."""
+        if self.eof:
+            return False
+        if self.pos:
+            self.text = self.text[self.pos :]
+            self.pos = 0
+        chunk = self._fp.read(max(self._chunk_size, min_chars))
+        if not chunk:
+            self.eof = True
+            return False
+        self.text += chunk
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ("" at end of file)."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+
+def iter_json_records(
+    fp: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_record_size: int = DEFAULT_MAX_RECORD_SIZE,
+) -> Iterator[Any]:
+    """Yield records from a JSON array, or from whitespace-separated JSON values.
+
+    A top-level array yields its elements one at a time; anything else
+    (a single object, JSON lines, concatenated objects) yields each top-level
+    value. Raises ValueError with a "Not valid JSON" message on malformed input,
+    including a record longer than `max_record_size` characters."""
+    decoder = json.JSONDecoder()
+    buf = _Buffer(fp, chunk_size)
+
+    def decode() -> Any:
+        if not buf.peek():
+            raise ValueError("Not valid JSON: unexpected end of input")
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf.text, buf.pos)
+            except json.JSONDecodeError as e:
+                truncated = e.msg.startswith("Unterminated string") or (
+                    e.pos >= len(buf.text) - _TRUNCATION_SLACK
+                )
+                if truncated and len(buf.text) - buf.pos > max_record_size:
+                    raise ValueError(
+                        f"Not valid JSON: record at line {e.lineno} is longer than "
+                        f"{max_record_size} characters"
+                    ) from e
+                # Incomplete value at the window edge: grow the window and retry.
+                # Doubling keeps re-parsing of one large record linear overall.
+                if truncated and buf.fill(len(buf.text) - buf.pos):
+                    continue
+                raise ValueError(f"Not valid JSON: {e}") from e
+            # A number ending exactly at the window edge may continue in the next chunk.
+            if end == len(buf.text) and not isinstance(value, dict | list) and buf.fill():
+                continue
+            buf.pos = end
+            return value
+
+    if buf.peek() != "[":
+        while buf.peek():
+            yield decode()
+        return
+
+    buf.pos += 1
+    if buf.peek() == "]":
+        buf.pos += 1
+    else:
+        while True:
+            yield decode()
+            separator = buf.peek()
+            buf.pos += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                raise ValueError(f"Not valid JSON: expected ',' or ']' but found {separator!r}")
+
+    if buf.peek():
+        raise ValueError("Not valid JSON: extra data after top-level array")
@@ -4,15 +4,21 @@ Accepts Retell call records in the shape produced by the Retell API and
 the post-call webhook payload. Input may be a single call object, an array
 of call objects, a webhook payload, an array of webhook payloads, or the
 v3 list-calls envelope ({"items": [...], "pagination_key": ..., "has_more": ...}).
+
+Files are read incrementally: a top-level array or a JSON-lines export is
+consumed one call at a time (see `iter_retell_file`), so bulk exports import
+in constant memory. A single envelope object is still decoded whole.
 """
 
 from __future__ import annotations
 
 from collections.abc import Iterable
-import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from voicetest.importers.transcripts.jsonstream import DEFAULT_CHUNK_SIZE
+from voicetest.importers.transcripts.jsonstream import iter_json_records
 from voicetest.models.results import Message
 from voicetest.models.results import TestResult
 
@@ -28,13 +34,22 @@ _ROLE_MAP = {
 
 def parse_retell_file(path: Path) -> list[TestResult]:
     """Parse a Retell transcript file (JSON) into TestResult objects."""
-    raw = path.read_text(encoding="utf-8")
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Not valid JSON: {e}") from e
+    return list(iter_retell_file(path))
+
 
-    return parse_retell(data)
+def iter_retell_file(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[TestResult]:
+    """Stream a Retell export (JSON, JSON array or JSON lines) as TestResults.
+
+    Raises ValueError on malformed JSON, or once the file is exhausted if it
+    held no call objects — callers consuming lazily see that error last."""
+    found = False
+    with path.open(encoding="utf-8") as fp:
+        for record in iter_json_records(fp, chunk_size):
+            for call in _iter_call_objects(record):
+                found = True
+                yield _call_to_result(call)
+    if not found:
+        raise ValueError("No Retell call objects found in payload.")
 
 
 def parse_retell(data: Any) -> list[TestResult]:
@@ -10,6 +10,7 @@ from pydantic import Field
 from pydantic import field_validator
 
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import AgentNode
 from voicetest.models.agent import NodeType
@@ -152,9 +153,14 @@ class VapiImporter:
 
     def can_import(self, path_or_config: str | Path | dict) -> bool:
         """Detect VAPI format by checking for characteristic fields."""
-        try:
-            config = self._load_config(path_or_config)
+        return self.can_import_source(ImportSource(path_or_config))
 
+    def can_import_source(self, source: ImportSource) -> bool:
+        """Detect VAPI format from a shared, already-loaded input."""
+        config = source.config
+        if config is None:
+            return False
+        try:
             if "members" in config and isinstance(config.get("members"), list):
                 return self._is_vapi_squad(config)
 
@@ -4,9 +4,8 @@ from pathlib import Path
 import re
 from typing import Any
 
-from openpyxl import load_workbook
-
 from voicetest.importers.base import ImporterInfo
+from voicetest.importers.base import ImportSource
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import AgentNode
 from voicetest.models.agent import NodeType
@@ -30,15 +29,15 @@ class XLSFormImporter:
 
     def can_import(self, path_or_config: str | Path | dict) -> bool:
         """Detect XLSForm by checking for survey sheet with required columns."""
-        if isinstance(path_or_config, dict):
-            return False
+        return self.can_import_source(ImportSource(path_or_config))
 
-        path = Path(path_or_config)
-        if not path.exists() or path.suffix.lower() not in (".xlsx", ".xls"):
+    def can_import_source(self, source: ImportSource) -> bool:
+        """Detect XLSForm from a shared, already-loaded input."""
+        wb = source.workbook
+        if wb is None:
             return False
 
         try:
-            wb = load_workbook(path, read_only=True, data_only=True)
             if "survey" not in wb.sheetnames:
                 return False
 
@@ -54,6 +53,8 @@ class XLSFormImporter:
         if isinstance(path_or_config, dict):
             raise ValueError("XLSForm importer requires a file path, not a dict")
 
+        from openpyxl import load_workbook  # noqa: PLC0415
+
         path = Path(path_or_config)
         wb = load_workbook(path, data_only=True)
 
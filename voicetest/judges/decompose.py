@@ -122,6 +122,7 @@ class DecomposeJudge:
             AnalyzeGraphSignature,
             on_error=on_error,
             predictor_class=dspy.ChainOfThought,
+            role="decompose",
             graph_structure=formatted_graph,
             num_nodes=len(graph.nodes),
             is_monolithic=is_monolithic,
@@ -164,6 +165,7 @@ class DecomposeJudge:
             RefineGeneralPromptSignature,
             on_error=on_error,
             predictor_class=dspy.ChainOfThought,
+            role="decompose",
             no_cache=True,
             original_graph_structure=formatted_graph,
             sub_agent_spec=json.dumps(spec_dump),
@@ -182,6 +184,7 @@ class DecomposeJudge:
                 RefineNodePromptSignature,
                 on_error=on_error,
                 predictor_class=dspy.ChainOfThought,
+                role="decompose",
                 no_cache=True,
                 original_graph_structure=formatted_graph,
                 sub_agent_description=sub_agent_spec.description,
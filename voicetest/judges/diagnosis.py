@@ -145,6 +145,7 @@ class DiagnosisJudge:
             DiagnoseFailureSignature,
             on_error=on_error,
             predictor_class=dspy.ChainOfThought,
+            role="diagnosis",
             graph_structure=formatted_graph,
             transcript=formatted_transcript,
             nodes_visited=nodes_visited,
@@ -187,6 +188,7 @@ class DiagnosisJudge:
             SuggestFixSignature,
             on_error=on_error,
             predictor_class=dspy.ChainOfThought,
+            role="diagnosis",
             graph_structure=formatted_graph,
             diagnosis_summary=diagnosis_summary,
             failed_metrics=formatted_metrics,
@@ -221,6 +223,7 @@ class DiagnosisJudge:
             ReviseFixSignature,
             on_error=on_error,
             predictor_class=dspy.ChainOfThought,
+            role="diagnosis",
             graph_structure=formatted_graph,
             original_diagnosis=diagnosis.root_cause,
             previous_changes=prev_changes_json,
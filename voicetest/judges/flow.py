@@ -8,6 +8,7 @@ from voicetest.llm import call_llm
 from voicetest.models.agent import AgentGraph
 from voicetest.models.results import Message
 from voicetest.util.retry import OnErrorCallback
+from voicetest.util.timing import timed
 
 
 class FlowValidationSignature(dspy.Signature):
@@ -69,7 +70,8 @@ class FlowJudge:
         if not nodes_visited:
             return FlowResult(valid=True, issues=[], reasoning="No nodes visited")
 
-        return await self._evaluate_with_llm(graph, transcript, nodes_visited, on_error)
+        with timed("flow_judge"):
+            return await self._evaluate_with_llm(graph, transcript, nodes_visited, on_error)
 
     async def _evaluate_with_llm(
         self,
@@ -87,6 +89,7 @@ class FlowJudge:
             FlowValidationSignature,
             on_error=on_error,
             predictor_class=dspy.ChainOfThought,
+            role="judge",
             graph_structure=formatted_graph,
             transcript=formatted_transcript,
             nodes_visited=nodes_visited,
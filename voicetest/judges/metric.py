@@ -6,6 +6,7 @@ from voicetest.llm import call_llm
 from voicetest.models.results import Message
 from voicetest.models.results import MetricResult
 from voicetest.util.retry import OnErrorCallback
+from voicetest.util.timing import timed
 
 
 DEFAULT_THRESHOLD = 0.7
@@ -56,9 +57,10 @@ class MetricJudge:
             self._mock_index += 1
             return result
 
-        return await self._evaluate_with_llm(
-            transcript, criterion, threshold, on_error, use_heard=use_heard
-        )
+        with timed("metric_judge"):
+            return await self._evaluate_with_llm(
+                transcript, criterion, threshold, on_error, use_heard=use_heard
+            )
 
     async def evaluate_all(
         self,
@@ -93,6 +95,7 @@ class MetricJudge:
             MetricJudgeSignature,
             on_error=on_error,
             predictor_class=dspy.ChainOfThought,
+            role="judge",
             transcript=formatted_transcript,
             criterion=criterion,
         )
@@ -5,6 +5,7 @@ import re
 from voicetest.judges.pattern import compile_pattern
 from voicetest.models.results import Message
 from voicetest.models.results import MetricResult
+from voicetest.util.timing import timed
 
 
 class RuleJudge:
@@ -22,6 +23,17 @@ class RuleJudge:
         use_heard: bool = False,
     ) -> list[MetricResult]:
         """Evaluate transcript against rules."""
+        with timed("rule_judge"):
+            return self._evaluate_rules(transcript, includes, excludes, patterns, use_heard)
+
+    def _evaluate_rules(
+        self,
+        transcript: list[Message],
+        includes: list[str],
+        excludes: list[str],
+        patterns: list[str],
+        use_heard: bool,
+    ) -> list[MetricResult]:
         text = self._format_transcript(transcript, use_heard=use_heard)
         results = []
 
@@ -3,31 +3,53 @@
 import asyncio
 from collections.abc import Awaitable
 from collections.abc import Callable
+import functools
+import time
+from typing import Any
+from weakref import WeakKeyDictionary
 
 import dspy
 from dspy.adapters.baml_adapter import BAMLAdapter
 from dspy.streaming import StreamListener
 from dspy.streaming import streamify
-import litellm
-import openai
 
+from voicetest.exceptions import CacheMissError
 from voicetest.llm.claudecode import ClaudeCodeLM
+from voicetest.llm.mock import MOCK_PREFIX
+from voicetest.llm.mock import MockLM
+from voicetest.llm.stats import record_llm_call
+from voicetest.util.cache import is_strict_offline
 from voicetest.util.retry import OnErrorCallback
 from voicetest.util.retry import with_retry
+from voicetest.util.tracing import trace_span
 
 
-# Timeouts cost the full request timeout per attempt (unlike rate limits which
-# fail fast), so we cap them tightly to bound worst-case wallclock. Other
-# retryable errors keep the default budget.
-_MAX_ATTEMPTS_BY_EXCEPTION: dict[type, int] = {
-    litellm.Timeout: 2,
-    openai.APITimeoutError: 2,
-}
+@functools.cache
+def _max_attempts_by_exception() -> dict[type, int]:
+    """Timeouts cost the full request timeout per attempt (unlike rate limits
+    which fail fast), so we cap them tightly to bound worst-case wallclock.
+    Other retryable errors keep the default budget."""
+    import litellm  # noqa: PLC0415
+    import openai  # noqa: PLC0415
+
+    return {litellm.Timeout: 2, openai.APITimeoutError: 2}
 
 
 OnTokenCallback = Callable[[str], Awaitable[None] | None]
 
 
+# Requests currently awaiting a provider response, per event loop, keyed by
+# _request_key. Identical concurrent calls join the first one instead of each
+# reaching the provider before the cache is populated.
+_in_flight: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Future]] = (
+    WeakKeyDictionary()
+)
+
+# Result handed to joined callers when the first caller was cancelled: they
+# retry, and one of them issues the request itself.
+_RETRY = object()
+
+
 def _create_lm(model: str, cache_salt: str | None = None, no_cache: bool = False) -> dspy.LM:
     """Create an LM instance for the given model string.
 
@@ -46,6 +68,8 @@ def _create_lm(model: str, cache_salt: str | None = None, no_cache: bool = False
         extra["metadata"] = {"_cache_salt": cache_salt}
     if no_cache:
         extra["cache"] = False
+    if model.startswith(MOCK_PREFIX):
+        return MockLM(model, **extra)
     return dspy.LM(model, **extra)
 
 
@@ -56,6 +80,42 @@ async def _invoke_callback(callback: Callable, *args) -> None:
         await result
 
 
+def _served_from_cache(lm: dspy.LM | None) -> bool:
+    """Whether every request behind the LM's calls so far came from dspy.cache.
+
+    Each call_llm builds a fresh LM, so its history holds only this call's
+    requests (more than one if the adapter retried). DSPy marks responses
+    returned by its cache with `cache_hit`; ClaudeCodeLM and MockLM track
+    their own flag because they bypass dspy.LM's history."""
+    if isinstance(lm, ClaudeCodeLM | MockLM):
+        return lm._voicetest_last_cache_hit
+    history = getattr(lm, "history", None) or []
+    return bool(history) and all(
+        getattr(entry.get("response"), "cache_hit", False) for entry in history
+    )
+
+
+def _billed_usage(lm: dspy.LM | None) -> tuple[int, int, float | None]:
+    """Prompt tokens, completion tokens and provider-reported USD cost of the
+    requests behind the LM's calls that actually reached the provider.
+
+    Cached responses keep their original usage in dspy.LM's history but cost
+    nothing, so they are skipped. The cost is None when the provider (or
+    litellm's price map) reported none."""
+    if isinstance(lm, ClaudeCodeLM | MockLM):
+        entries = lm._voicetest_usage
+    else:
+        entries = [
+            {**(entry.get("usage") or {}), "cost": entry.get("cost")}
+            for entry in getattr(lm, "history", None) or []
+            if not getattr(entry.get("response"), "cache_hit", False)
+        ]
+    prompt_tokens = sum(e.get("prompt_tokens") or 0 for e in entries)
+    completion_tokens = sum(e.get("completion_tokens") or 0 for e in entries)
+    costs = [e["cost"] for e in entries if e.get("cost") is not None]
+    return prompt_tokens, completion_tokens, sum(costs) if costs else None
+
+
 async def call_llm(
     model: str,
     signature_class: type,
@@ -66,6 +126,7 @@ async def call_llm(
     cache_salt: str | None = None,
     no_cache: bool = False,
     predictor_class: type,
+    role: str = "other",
     **kwargs,
 ) -> dspy.Prediction:
     """Call an LLM and return its Prediction.
@@ -73,10 +134,158 @@ async def call_llm(
     The returned Prediction has a `_voicetest_lm` attribute holding the LM
     instance used for the call, so callers can pass it to
     `voicetest.util.cache.try_evict_last_call` if downstream validation detects a
-    poisoned cache entry."""
+    poisoned cache entry.
+
+    `role` labels the call (agent, simulator, judge, transition, extract) in
+    the per-test `TestResult.llm_stats` totals and on its "llm" trace span.
+    Token usage is counted only for requests that reached the provider; a
+    call joining an identical in-flight request counts none, since the first
+    caller already paid for it."""
+    if on_token and not stream_field:
+        raise ValueError("stream_field required when on_token is provided")
+    if no_cache and is_strict_offline():
+        raise CacheMissError(f"Strict offline: {role} call to {model} bypasses the cache")
+
+    def dispatch() -> Awaitable[dspy.Prediction]:
+        return _dispatch_llm_call(
+            model,
+            signature_class,
+            on_token,
+            stream_field,
+            on_error,
+            cache_salt=cache_salt,
+            no_cache=no_cache,
+            predictor_class=predictor_class,
+            **kwargs,
+        )
+
+    key = None
+    if not no_cache:
+        key = _request_key(
+            model,
+            signature_class,
+            predictor_class,
+            cache_salt=cache_salt,
+            streaming=on_token is not None,
+            inputs=kwargs,
+        )
+
+    with trace_span("llm", role=role, model=model) as trace:
+        start = time.perf_counter()
+        if key is None:
+            result, joined = await dispatch(), False
+        else:
+            result, joined = await _single_flight(key, dispatch)
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        if joined:
+            # The first caller streamed its tokens; deliver the finished text at once.
+            text = getattr(result, stream_field, None) if on_token else None
+            if text:
+                await _invoke_callback(on_token, text)
+            record_llm_call(role, True, latency_ms, coalesced=True)
+            if trace:
+                trace.set(cache_hit=True, coalesced=True)
+            return result
+
+        lm = getattr(result, "_voicetest_lm", None)
+        cache_hit = None if no_cache else _served_from_cache(lm)
+        prompt_tokens, completion_tokens, provider_cost = _billed_usage(lm)
+        record_llm_call(
+            role,
+            cache_hit,
+            latency_ms,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            provider_cost=provider_cost,
+        )
+        if trace:
+            trace.set(
+                cache_hit=cache_hit,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
+        return result
+
+
+def _request_key(
+    model: str,
+    signature_class: type,
+    predictor_class: type,
+    *,
+    cache_salt: str | None,
+    streaming: bool,
+    inputs: dict[str, Any],
+) -> str | None:
+    """Key identifying a call_llm request, or None if the inputs can't be hashed.
+
+    Hashed with dspy.cache.cache_key over everything that shapes the LM
+    request: the same model, signature (fields and instructions), predictor,
+    adapter (streaming or not), salt and inputs produce the same DSPy cache
+    key. Strict-offline calls get their own keys so they never share a
+    result fetched from the provider."""
+    request = {
+        "model": model,
+        "signature": signature_class,
+        "predictor": f"{predictor_class.__module__}.{predictor_class.__qualname__}",
+        "cache_salt": cache_salt,
+        "streaming": streaming,
+        "strict_offline": is_strict_offline(),
+        "inputs": inputs,
+    }
+    try:
+        return dspy.cache.cache_key(request)
+    except TypeError:
+        return None
+
+
+async def _single_flight(
+    key: str, call: Callable[[], Awaitable[dspy.Prediction]]
+) -> tuple[dspy.Prediction, bool]:
+    """Run `call`, or await the identical request already in flight.
+
+    Returns the result and whether it was joined rather than issued. Joined
+    callers share the first caller's Prediction, or its exception. Cancelling
+    a joined caller leaves the request running for the others."""
+    loop = asyncio.get_running_loop()
+    in_flight = _in_flight.setdefault(loop, {})
+    while (pending := in_flight.get(key)) is not None:
+        result = await asyncio.shield(pending)
+        if result is not _RETRY:
+            return result, True
+
+    future = loop.create_future()
+    in_flight[key] = future
+    try:
+        result = await call()
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved so a failure nobody joined isn't logged
+        raise
+    except BaseException:
+        future.set_result(_RETRY)  # cancelled: a joined caller takes over
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        del in_flight[key]
+    return result, False
+
+
+async def _dispatch_llm_call(
+    model: str,
+    signature_class: type,
+    on_token: OnTokenCallback | None,
+    stream_field: str | None,
+    on_error: OnErrorCallback | None,
+    *,
+    cache_salt: str | None,
+    no_cache: bool,
+    predictor_class: type,
+    **kwargs,
+) -> dspy.Prediction:
     if on_token:
-        if not stream_field:
-            raise ValueError("stream_field required when on_token is provided")
         return await _call_llm_streaming(
             model,
             signature_class,
@@ -126,7 +335,7 @@ async def _call_llm_sync(
     result = await with_retry(
         call_in_thread,
         on_error=on_error,
-        max_attempts_by_exception=_MAX_ATTEMPTS_BY_EXCEPTION,
+        max_attempts_by_exception=_max_attempts_by_exception(),
     )
     result._voicetest_lm = lm
     return result
@@ -178,5 +387,5 @@ async def _call_llm_streaming(
     return await with_retry(
         stream,
         on_error=on_error,
-        max_attempts_by_exception=_MAX_ATTEMPTS_BY_EXCEPTION,
+        max_attempts_by_exception=_max_attempts_by_exception(),
     )
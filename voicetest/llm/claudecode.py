@@ -11,7 +11,6 @@ from typing import Any
 import dspy
 from dspy.adapters.chat_adapter import ChatAdapter
 from dspy.clients.cache import request_cache
-import litellm
 
 from voicetest.exceptions import QuotaExhaustedError
 
@@ -39,6 +38,9 @@ class ClaudeCodeLM(dspy.LM):
     def __init__(self, model: str = "claudecode/sonnet", **kwargs):
         super().__init__(model=model, **kwargs)
         self.variant = model.split("/", 1)[1] if "/" in model else model
+        self._voicetest_last_cache_hit = False
+        # Token usage of each CLI call that ran (cache misses), for call_llm.
+        self._voicetest_usage: list[dict[str, Any]] = []
         self._check_available()
 
     def _check_available(self):
@@ -95,6 +97,9 @@ class ClaudeCodeLM(dspy.LM):
             f"{ClaudeCodeLM.__module__}.{ClaudeCodeLM.__qualname__}._run_cli"
         )
 
+        # _run_cli clears this when it actually runs, i.e. on a cache miss.
+        self._voicetest_last_cache_hit = bool(self.cache)
+
         completion = self._run_cli
         if self.cache:
             completion = request_cache(cache_arg_name="request")(completion)
@@ -111,6 +116,7 @@ class ClaudeCodeLM(dspy.LM):
         **kwargs,
     ) -> list[dict[str, Any]]:
         """Execute the Claude CLI subprocess."""
+        self._voicetest_last_cache_hit = False
         messages = request.get("messages", [])
         prompt_text = self._messages_to_prompt(messages)
 
@@ -129,8 +135,10 @@ class ClaudeCodeLM(dspy.LM):
                 env=env,
             )
         except subprocess.TimeoutExpired as err:
+            import litellm  # noqa: PLC0415
+
             # Translate to litellm.Timeout so with_retry treats it as retryable
-            # alongside other timeout errors (see voicetest/retry.py:RETRYABLE_EXCEPTIONS).
+            # alongside other timeout errors (see voicetest/util/retry.py:retryable_exceptions).
             raise litellm.Timeout(
                 message=f"Claude Code CLI timed out after {timeout}s",
                 model=self.model,
@@ -158,11 +166,13 @@ class ClaudeCodeLM(dspy.LM):
                 raise QuotaExhaustedError(detail, reset_message=reset_message)
             # Translate transient upstream errors to retryable litellm
             # exceptions so with_retry catches them; bare RuntimeError is
-            # not in RETRYABLE_EXCEPTIONS and would kill the run on a
+            # not in retryable_exceptions() and would kill the run on a
             # single 5xx. `api_error_status` is the upstream HTTP status
             # surfaced by the CLI.
             api_status = response.get("api_error_status")
             if isinstance(api_status, int):
+                import litellm  # noqa: PLC0415
+
                 detail = f"Claude Code transient error {api_status}: {error_msg}"
                 if api_status in (408, 504, 524):
                     logger.warning(
@@ -192,4 +202,14 @@ class ClaudeCodeLM(dspy.LM):
                     )
             raise RuntimeError(f"Claude Code error: {error_msg}")
 
+        usage = response.get("usage") or {}
+        self._voicetest_usage.append(
+            {
+                "prompt_tokens": (usage.get("input_tokens") or 0)
+                + (usage.get("cache_creation_input_tokens") or 0)
+                + (usage.get("cache_read_input_tokens") or 0),
+                "completion_tokens": usage.get("output_tokens") or 0,
+                "cost": response.get("total_cost_usd"),
+            }
+        )
         return [{"text": response["result"]}]
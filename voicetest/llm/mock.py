@@ -0,0 +1,239 @@
+"""Deterministic in-process LLM provider for load, retry and concurrency tests.
+
+`mock/<name>` models never touch the network. Options go in a query string:
+
+    mock/fast
+    mock/slow?latency_ms=800&jitter_ms=200&token_ms=15
+    mock/flaky?seed=7&rate_limit=0.1&timeout=0.05&parse_error=0.02
+
+Outputs are derived from a hash of the seed and the request, so the same
+prompt always gets the same answer (and the same DSPy cache key). Latency and
+injected errors are drawn per attempt, so a retried call can succeed where
+the first attempt failed; injected errors, unparseable completions included,
+are never cached. Injected errors use the exception types the retry
+layer already handles: litellm.RateLimitError (429), litellm.Timeout, and an
+unparseable completion that surfaces as AdapterParseError.
+"""
+
+import ast
+import hashlib
+import json
+import random
+import re
+import time
+from typing import Any
+from urllib.parse import parse_qsl
+
+import anyio
+import dspy
+from dspy.adapters.chat_adapter import ChatAdapter
+from dspy.clients.cache import request_cache
+
+
+MOCK_PREFIX = "mock/"
+
+_OPTIONS: dict[str, type] = {
+    "seed": int,
+    "latency_ms": float,  # mean delay before the first token
+    "jitter_ms": float,  # standard deviation of that delay
+    "token_ms": float,  # delay between tokens
+    "words": int,  # length of generated text fields
+    "rate_limit": float,  # probability of a 429 per attempt
+    "timeout": float,  # probability of a timeout per attempt
+    "parse_error": float,  # probability of an unparseable completion per attempt
+}
+
+_OUTPUT_FIELD = re.compile(r"^\d+\. `(\w+)` \((.+?)\)(?::|$)", re.MULTILINE)
+_INPUT_VALUE = re.compile(r"\[\[ ## (\w+) ## \]\]\n(.*?)(?=\n\n\[\[ ## |\n\nRespond with|\Z)", re.S)
+_TARGET = re.compile(r'"target":\s*"([^"]+)"')
+
+_WORDS = ("sure", "okay", "thanks", "let", "me", "check", "that", "for", "you", "yes", "the")
+
+
+class _UnparseableCompletion(Exception):  # noqa: N818 - carries a result, not an error
+    """An injected parse error, raised through the response cache so it is not stored."""
+
+    def __init__(self, completion: list[dict[str, Any]]):
+        super().__init__("injected unparseable completion")
+        self.completion = completion
+
+
+def parse_mock_model(model: str) -> tuple[str, dict[str, Any]]:
+    """Split `mock/<name>?opt=value&...` into the name and typed options.
+
+    Raises ValueError for an unknown option or a value of the wrong type."""
+    spec = model.removeprefix(MOCK_PREFIX)
+    name, _, query = spec.partition("?")
+    options: dict[str, Any] = {}
+    for key, value in parse_qsl(query, keep_blank_values=True, strict_parsing=bool(query)):
+        if key not in _OPTIONS:
+            raise ValueError(f"Unknown mock model option '{key}' in {model!r}")
+        try:
+            options[key] = _OPTIONS[key](value)
+        except ValueError as e:
+            raise ValueError(f"Invalid value for mock model option '{key}': {value!r}") from e
+    return name or "default", options
+
+
+class MockLM(dspy.LM):
+    """LLM provider that fabricates schema-valid outputs for any signature.
+
+    Uses ChatAdapter, whose prompt lists every output field with its type;
+    the mock answers each field with a value of that type. A transition
+    target is picked from the `available_transitions` input, so mock runs
+    still move through the graph."""
+
+    # No JSON fallback: an injected parse error must surface as one, not as
+    # a second request in a different format.
+    preferred_adapter = ChatAdapter(use_json_adapter_fallback=False)
+
+    def __init__(self, model: str = "mock/default", **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.variant, options = parse_mock_model(model)
+        self.seed: int = options.get("seed", 0)
+        self.latency_ms: float = options.get("latency_ms", 0.0)
+        self.jitter_ms: float = options.get("jitter_ms", 0.0)
+        self.token_ms: float = options.get("token_ms", 0.0)
+        self.words: int = options.get("words", 12)
+        self.rate_limit: float = options.get("rate_limit", 0.0)
+        self.timeout: float = options.get("timeout", 0.0)
+        self.parse_error: float = options.get("parse_error", 0.0)
+        self._attempts = 0
+        self._voicetest_last_cache_hit = False
+        self._voicetest_usage: list[dict[str, Any]] = []
+
+    def __call__(
+        self,
+        prompt: str | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """Return a fabricated completion, with DSPy cache integration."""
+        messages = messages or [{"role": "user", "content": prompt}]
+        request = {"model": self.model, "messages": messages, **self.kwargs}
+
+        # Same bookkeeping as ClaudeCodeLM, so try_evict_last_call and the
+        # per-role cache stats work for mock models too.
+        self._voicetest_last_request = request
+        self._voicetest_last_cache_fn_identifier = (
+            f"{MockLM.__module__}.{MockLM.__qualname__}._complete"
+        )
+        self._voicetest_last_cache_hit = bool(self.cache)
+
+        self._attempts += 1
+        completion = self._complete
+        if self.cache:
+            completion = request_cache(cache_arg_name="request")(completion)
+        try:
+            return completion(request=request, attempt=self._attempts)
+        except _UnparseableCompletion as e:
+            return e.completion
+
+    def _rng(self, request: dict[str, Any], *salt: Any) -> random.Random:
+        digest = hashlib.sha256(
+            json.dumps(
+                [self.seed, request["messages"], *salt], sort_keys=True, default=str
+            ).encode()
+        ).digest()
+        return random.Random(digest)
+
+    def _complete(self, request: dict[str, Any], attempt: int = 1) -> list[dict[str, Any]]:
+        """Sleep, maybe fail, then answer every output field the prompt asks for."""
+        self._voicetest_last_cache_hit = False
+        chance = self._rng(request, "attempt", attempt)
+        latency = max(0.0, chance.gauss(self.latency_ms, self.jitter_ms)) / 1000
+        failure = chance.random()
+        time.sleep(latency)
+
+        if failure < self.rate_limit:
+            import litellm  # noqa: PLC0415
+
+            raise litellm.RateLimitError(
+                message="Mock rate limit (429)", model=self.model, llm_provider="mock"
+            )
+        failure -= self.rate_limit
+        if failure < self.timeout:
+            import litellm  # noqa: PLC0415
+
+            raise litellm.Timeout(
+                message="Mock request timed out", model=self.model, llm_provider="mock"
+            )
+        failure -= self.timeout
+
+        unparseable = failure < self.parse_error
+        if unparseable:
+            text = "Sorry, I lost track of the format there."
+        else:
+            text = self._render(request["messages"], self._rng(request, "content"))
+
+        tokens = re.findall(r"\S+\s*|\s+", text)
+        if dspy.settings.send_stream is not None:
+            self._stream(tokens)
+        else:
+            time.sleep(self.token_ms * len(tokens) / 1000)
+        # Whitespace-delimited words stand in for tokens; no cost is reported.
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in request["messages"])
+        self._voicetest_usage.append(
+            {"prompt_tokens": prompt_tokens, "completion_tokens": len(text.split()), "cost": None}
+        )
+        if unparseable:
+            raise _UnparseableCompletion([{"text": text}])
+        return [{"text": text}]
+
+    def _render(self, messages: list[dict[str, Any]], rng: random.Random) -> str:
+        """Build a ChatAdapter completion for the output fields in the prompt."""
+        system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        user = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+        _, _, output_section = system.partition("Your output fields are:")
+        fields = _OUTPUT_FIELD.findall(output_section.split("\n\n", 1)[0])
+        inputs = dict(_INPUT_VALUE.findall(user))
+
+        values: dict[str, str] = {}
+        for name, type_name in fields:
+            values[name] = self._value(type_name.strip(), rng)
+        if "transition_to" in values:
+            # The transition signature declares objectives_complete through a
+            # `type=bool` field extra, so the prompt lists it as a str.
+            complete = rng.random() < 0.5
+            if "objectives_complete" in values:
+                values["objectives_complete"] = str(complete)
+            targets = _TARGET.findall(inputs.get("available_transitions", ""))
+            values["transition_to"] = rng.choice(targets) if targets and complete else "none"
+
+        parts = [f"[[ ## {name} ## ]]\n{value}" for name, value in values.items()]
+        parts.append("[[ ## completed ## ]]")
+        return "\n\n".join(parts)
+
+    def _value(self, type_name: str, rng: random.Random) -> str:
+        """A value of the named type, as ChatAdapter expects to parse it."""
+        if type_name == "bool":
+            return str(rng.random() < 0.5)
+        if type_name == "int":
+            return str(rng.randint(1, 5))
+        if type_name == "float":
+            return f"{rng.random():.2f}"
+        if type_name.startswith(("list[", "tuple[", "set[")):
+            return "[]"
+        if type_name.startswith("dict["):
+            return "{}"
+        if type_name.startswith("Literal["):
+            return str(rng.choice(ast.literal_eval(f"({type_name[8:-1]},)")))
+        words = [rng.choice(_WORDS) for _ in range(self.words)]
+        return " ".join(words).capitalize() + "."
+
+    def _stream(self, tokens: list[str]) -> None:
+        """Send tokens to the active dspy.streamify listener, like litellm streaming."""
+        import litellm  # noqa: PLC0415
+
+        stream = dspy.settings.send_stream
+        caller_predict = dspy.settings.caller_predict
+        for i, token in enumerate(tokens):
+            if i:
+                time.sleep(self.token_ms / 1000)
+            chunk = litellm.ModelResponseStream(
+                model=self.model,
+                choices=[litellm.utils.StreamingChoices(delta=litellm.utils.Delta(content=token))],
+            )
+            if caller_predict is not None:
+                chunk.predict_id = id(caller_predict)
+            anyio.from_thread.run(stream.send, chunk)
@@ -0,0 +1,117 @@
+"""Per-role LLM call statistics.
+
+`call_llm` reports every call (role, cache hit or miss, latency, token usage)
+to the collector active in the current context. `TestExecutionService.run_test`
+opens one per test, with the settings price table, and stores the totals on
+`TestResult.llm_stats`.
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import threading
+
+from voicetest.models.results import LLMRoleStats
+from voicetest.settings import ModelPrice
+from voicetest.util.metrics import observe_llm_call
+
+
+class LLMStatsCollector:
+    """Accumulates LLMRoleStats by role; safe to share across tasks and threads.
+
+    `prices` maps model strings to a `ModelPrice`; calls to other models are
+    charged whatever cost the provider reported."""
+
+    def __init__(self, prices: dict[str, ModelPrice] | None = None):
+        self._stats: dict[str, LLMRoleStats] = {}
+        self._prices = prices or {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        role: str,
+        cache_hit: bool | None,
+        latency_ms: float,
+        coalesced: bool = False,
+        *,
+        model: str = "",
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        provider_cost: float | None = None,
+    ) -> None:
+        """Add one call. `cache_hit` is None when the call bypassed the cache;
+        `coalesced` marks a hit served by an identical request already in flight."""
+        price = self._prices.get(model)
+        cost = price.cost(prompt_tokens, completion_tokens) if price else provider_cost or 0.0
+        with self._lock:
+            stats = self._stats.setdefault(role, LLMRoleStats())
+            stats.calls += 1
+            stats.latency_ms += latency_ms
+            if cache_hit is None:
+                stats.cache_bypassed += 1
+            elif cache_hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+            if coalesced:
+                stats.coalesced += 1
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            stats.cost_usd += cost
+
+    def snapshot(self) -> dict[str, LLMRoleStats]:
+        """Copy of the current totals, keyed by role."""
+        with self._lock:
+            return {
+                role: stats.model_copy(
+                    update={
+                        "latency_ms": round(stats.latency_ms, 1),
+                        "cost_usd": round(stats.cost_usd, 6),
+                    }
+                )
+                for role, stats in self._stats.items()
+            }
+
+
+_collector: ContextVar[LLMStatsCollector | None] = ContextVar("voicetest_llm_stats", default=None)
+
+
+@contextmanager
+def collect_llm_stats(
+    prices: dict[str, ModelPrice] | None = None,
+) -> Generator[LLMStatsCollector]:
+    """Collect stats for every `call_llm` made inside the block, pricing
+    calls with `prices` where it lists the model."""
+    collector = LLMStatsCollector(prices)
+    token = _collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _collector.reset(token)
+
+
+def record_llm_call(
+    role: str,
+    cache_hit: bool | None,
+    latency_ms: float,
+    coalesced: bool = False,
+    *,
+    model: str = "",
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    provider_cost: float | None = None,
+) -> None:
+    """Report a call to the process metrics and to the active collector, if any."""
+    observe_llm_call(model, role, latency_ms, cache_hit)
+    collector = _collector.get()
+    if collector is not None:
+        collector.record(
+            role,
+            cache_hit,
+            latency_ms,
+            coalesced,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            provider_cost=provider_cost,
+        )
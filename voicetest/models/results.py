@@ -44,6 +44,39 @@ class ModelsUsed(BaseModel):
     judge: str
 
 
+class LLMRoleStats(BaseModel):
+    """LLM call counts and latency for one role (agent, simulator, judge, ...)."""
+
+    calls: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_bypassed: int = 0  # calls made with no_cache
+    coalesced: int = 0  # cache hits that joined an identical in-flight request
+    latency_ms: float = 0.0  # summed across calls
+    prompt_tokens: int = 0  # provider requests only; cache hits cost nothing
+    completion_tokens: int = 0
+    cost_usd: float = 0.0  # settings price table, else the provider-reported cost
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Fraction of cache-eligible calls served from cache."""
+        eligible = self.cache_hits + self.cache_misses
+        return self.cache_hits / eligible if eligible else None
+
+    @property
+    def provider_calls(self) -> int:
+        """Calls that reached the provider: cache misses and cache-bypassing calls."""
+        return self.calls - self.cache_hits
+
+
+class SpanTiming(BaseModel):
+    """Wall-clock time spent in one kind of span (transition, response, judge, ...)."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
 class ModelOverride(BaseModel):
     """Record of a model override."""
 
@@ -71,6 +104,11 @@ class TestResult(BaseModel):
     error_message: str | None = None
     models_used: ModelsUsed | None = None
     model_overrides: list[ModelOverride] = Field(default_factory=list)
+    llm_stats: dict[str, LLMRoleStats] = Field(default_factory=dict)
+    timings: dict[str, SpanTiming] = Field(default_factory=dict)
+    # Provider calls skipped by starting from an opening shared with an earlier
+    # test. Openings the LLM cache answered cost nothing, so they count as 0.
+    llm_calls_saved: int = 0
 
 
 class TestRun(BaseModel):
@@ -21,6 +21,7 @@ class RunOptions(BaseModel):
     test_model_precedence: bool = False
     audio_eval: bool = False
     no_cache: bool = False
+    strict_offline: bool = False  # fail on any LLM cache miss instead of calling the provider
     pattern_engine: str = "fnmatch"
 
     agent_model: str | None = None
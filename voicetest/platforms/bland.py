@@ -11,7 +11,6 @@ import os
 from typing import TYPE_CHECKING
 from typing import Any
 
-from bland.client import BlandAI
 import httpx
 
 from voicetest.exporters.bland import export_bland_config
@@ -19,6 +18,8 @@ from voicetest.importers.bland import BlandImporter
 
 
 if TYPE_CHECKING:
+    from bland.client import BlandAI
+
     from voicetest.importers.base import SourceImporter
     from voicetest.models.agent import AgentGraph
 
@@ -56,6 +57,8 @@ class BlandPlatformClient:
         key = api_key or os.environ.get(self.env_key)
         if not key:
             raise ValueError(f"{self.env_key} not set")
+        from bland.client import BlandAI  # noqa: PLC0415
+
         return BlandAI(api_key=key)
 
     def _get_api_key(self, client: BlandAI) -> str:
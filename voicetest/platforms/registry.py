@@ -9,6 +9,7 @@ from typing import Any
 
 from voicetest.importers.base import SourceImporter
 from voicetest.platforms.base import PlatformClient
+from voicetest.util.lazy import LazyEntries
 
 
 if TYPE_CHECKING:
@@ -17,24 +18,31 @@ if TYPE_CHECKING:
 
 
 class PlatformRegistry:
-    """Registry of platform clients for dependency injection."""
+    """Registry of platform clients for dependency injection.
+
+    Clients added with `register_lazy` (and their vendor SDKs) are imported
+    the first time `get` asks for them."""
 
     def __init__(self):
-        self._clients: dict[str, PlatformClient] = {}
+        self._clients: LazyEntries[PlatformClient] = LazyEntries()
 
     def register(self, client: PlatformClient) -> None:
         """Register a platform client."""
-        self._clients[client.platform_name] = client
+        self._clients.add(client.platform_name, client)
+
+    def register_lazy(self, platform: str, path: str, *args) -> None:
+        """Register a client by `"package.module:Class"`, built with `args` on first use."""
+        self._clients.add_lazy(platform, path, *args)
 
     def get(self, platform: str) -> PlatformClient:
         """Get a platform client by name."""
         if platform not in self._clients:
             raise ValueError(f"Unknown platform: {platform}")
-        return self._clients[platform]
+        return self._clients.get(platform)
 
     def list_platforms(self) -> list[str]:
         """List all registered platform names."""
-        return list(self._clients.keys())
+        return self._clients.names()
 
     def has_platform(self, platform: str) -> bool:
         """Check if a platform is registered."""
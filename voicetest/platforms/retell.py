@@ -1,6 +1,7 @@
 """Retell AI client management.
 
-Handles credential loading and SDK client creation.
+Handles credential loading and SDK client creation. The SDK is imported when
+a client is first created, so listing platforms does not load it.
 Requires: pip install voicetest[platforms]
 """
 
@@ -11,13 +12,13 @@ import os
 from typing import TYPE_CHECKING
 from typing import Any
 
-from retell import Retell
-
 from voicetest.exporters.retell_cf import export_retell_cf
 from voicetest.importers.retell import RetellImporter
 
 
 if TYPE_CHECKING:
+    from retell import Retell
+
     from voicetest.importers.base import SourceImporter
     from voicetest.models.agent import AgentGraph
 
@@ -85,6 +86,8 @@ class RetellPlatformClient:
         key = api_key or os.environ.get(self.env_key)
         if not key:
             raise ValueError(f"{self.env_key} not set")
+        from retell import Retell  # noqa: PLC0415
+
         return Retell(api_key=key)
 
     def list_agents(self, client: Retell) -> list[dict[str, Any]]:
@@ -11,13 +11,13 @@ import os
 from typing import TYPE_CHECKING
 from typing import Any
 
-import telnyx
-
 from voicetest.exporters.telnyx import export_telnyx_config
 from voicetest.importers.telnyx import TelnyxImporter
 
 
 if TYPE_CHECKING:
+    import telnyx
+
     from voicetest.importers.base import SourceImporter
     from voicetest.models.agent import AgentGraph
 
@@ -53,6 +53,8 @@ class TelnyxPlatformClient:
         key = api_key or os.environ.get(self.env_key)
         if not key:
             raise ValueError(f"{self.env_key} not set")
+        import telnyx  # noqa: PLC0415
+
         return telnyx.Telnyx(api_key=key)
 
     def list_agents(self, client: telnyx.Telnyx) -> list[dict[str, Any]]:
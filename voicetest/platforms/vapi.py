@@ -11,13 +11,13 @@ import os
 from typing import TYPE_CHECKING
 from typing import Any
 
-from vapi import Vapi
-
 from voicetest.exporters.vapi import export_vapi_assistant
 from voicetest.importers.vapi import VapiImporter
 
 
 if TYPE_CHECKING:
+    from vapi import Vapi
+
     from voicetest.importers.base import SourceImporter
     from voicetest.models.agent import AgentGraph
 
@@ -53,6 +53,8 @@ class VapiPlatformClient:
         key = api_key or os.environ.get(self.env_key)
         if not key:
             raise ValueError(f"{self.env_key} not set")
+        from vapi import Vapi  # noqa: PLC0415
+
         return Vapi(token=key)
 
     def list_agents(self, client: Vapi) -> list[dict[str, Any]]:
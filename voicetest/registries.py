@@ -0,0 +1,70 @@
+"""Importer, exporter and platform registries with the built-in entries.
+
+Kept apart from the DI container so commands that only list these (such as
+`voicetest importers`) can build them without the database or LLM stack."""
+
+from voicetest.exporters.registry import ExporterRegistry
+from voicetest.importers.registry import ImporterRegistry
+from voicetest.platforms.registry import PlatformRegistry
+from voicetest.services.settings import SettingsService
+
+
+# Importers, exporters and platform clients are registered by import path so
+# only the ones a command uses are imported, along with their vendor SDKs.
+# Registration order is auto-detection probe order.
+_IMPORTERS = {
+    "retell": "voicetest.importers.retell:RetellImporter",
+    "retell-llm": "voicetest.importers.retell_llm:RetellLLMImporter",
+    "vapi": "voicetest.importers.vapi:VapiImporter",
+    "livekit": "voicetest.importers.livekit:LiveKitImporter",
+    "bland": "voicetest.importers.bland:BlandImporter",
+    "telnyx": "voicetest.importers.telnyx:TelnyxImporter",
+    "xlsform": "voicetest.importers.xlsform:XLSFormImporter",
+    "custom": "voicetest.importers.custom:CustomImporter",
+    "agentgraph": "voicetest.importers.agentgraph:AgentGraphImporter",
+}
+
+_EXPORTERS = {
+    "mermaid": "voicetest.exporters.graph_viz:MermaidExporter",
+    "livekit": "voicetest.exporters.livekit_codegen:LiveKitExporter",
+    "retell-llm": "voicetest.exporters.retell_llm:RetellLLMExporter",
+    "retell-cf": "voicetest.exporters.retell_cf:RetellCFExporter",
+    "vapi-assistant": "voicetest.exporters.vapi:VAPIAssistantExporter",
+    "vapi-squad": "voicetest.exporters.vapi:VAPISquadExporter",
+    "bland": "voicetest.exporters.bland:BlandExporter",
+    "telnyx": "voicetest.exporters.telnyx:TelnyxExporter",
+    "voicetest": "voicetest.exporters.voicetest_ir:VoicetestIRExporter",
+}
+
+_PLATFORMS = {
+    "retell": "voicetest.platforms.retell:RetellPlatformClient",
+    "vapi": "voicetest.platforms.vapi:VapiPlatformClient",
+    "livekit": "voicetest.platforms.livekit:LiveKitPlatformClient",
+    "bland": "voicetest.platforms.bland:BlandPlatformClient",
+    "telnyx": "voicetest.platforms.telnyx:TelnyxPlatformClient",
+}
+
+
+def create_importer_registry() -> ImporterRegistry:
+    """Create and configure the importer registry."""
+    registry = ImporterRegistry()
+    for source_type, path in _IMPORTERS.items():
+        registry.register_lazy(source_type, path)
+    return registry
+
+
+def create_exporter_registry(settings_service: SettingsService) -> ExporterRegistry:
+    """Create and configure the exporter registry."""
+    registry = ExporterRegistry()
+    for format_id, path in _EXPORTERS.items():
+        args = (settings_service,) if format_id == "retell-cf" else ()
+        registry.register_lazy(format_id, path, *args)
+    return registry
+
+
+def create_platform_registry() -> PlatformRegistry:
+    """Create and configure the platform registry."""
+    registry = PlatformRegistry()
+    for platform, path in _PLATFORMS.items():
+        registry.register_lazy(platform, path)
+    return registry
@@ -1,6 +1,8 @@
 """Shared test runner logic for CLI and TUI."""
 
 from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
 from datetime import datetime
 import json
 from pathlib import Path
@@ -12,6 +14,7 @@ from voicetest.models.results import TestRun
 from voicetest.models.test_case import RunOptions
 from voicetest.models.test_case import TestCase
 from voicetest.services import AppServices
+from voicetest.util.cache import run_cache_manifest
 from voicetest.util.retry import OnErrorCallback
 
 
@@ -89,17 +92,24 @@ class TestRunContext:
         """Filter test cases to only include those with matching names."""
         self.test_cases = [tc for tc in self.test_cases if tc.name in test_names]
 
-    async def run_all(self, on_error: OnErrorCallback | None = None) -> TestRun:
-        """Run all tests at once."""
+    async def run_all(
+        self,
+        on_error: OnErrorCallback | None = None,
+        run_id: str | None = None,
+        on_result: Callable[[TestResult], Awaitable[None]] | None = None,
+    ) -> TestRun:
+        """Run all tests at once, awaiting `on_result` as each one finishes."""
         if not self.graph:
             await self.load()
 
-        run_id = str(uuid.uuid4())
+        run_id = run_id or str(uuid.uuid4())
         started_at = datetime.now()
         results = []
 
-        async for result in self.run_streaming(on_error=on_error):
+        async for result in self.run_streaming(on_error=on_error, run_id=run_id):
             results.append(result)
+            if on_result:
+                await on_result(result)
 
         return TestRun(
             run_id=run_id,
@@ -109,21 +119,29 @@ class TestRunContext:
         )
 
     async def run_streaming(
-        self, on_error: OnErrorCallback | None = None
+        self, on_error: OnErrorCallback | None = None, run_id: str | None = None
     ) -> AsyncIterator[TestResult]:
-        """Run tests with streaming results."""
+        """Run tests with streaming results.
+
+        `run_id` names the run's cache manifest (for `voicetest cache export`)."""
         if not self.graph:
             await self.load()
-        async for result in run_tests_streaming(
-            self.services,
+        async with run_cache_manifest(
             self.graph,
             self.test_cases,
-            self.options,
-            self.mock_mode,
-            on_error=on_error,
+            run_id=run_id,
+            prefetch=not (self.mock_mode or self.options.no_cache),
         ):
-            self.results.append(result)
-            yield result
+            async for result in run_tests_streaming(
+                self.services,
+                self.graph,
+                self.test_cases,
+                self.options,
+                self.mock_mode,
+                on_error=on_error,
+            ):
+                self.results.append(result)
+                yield result
 
     @property
     def total_tests(self) -> int:
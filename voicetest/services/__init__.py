@@ -1,18 +1,53 @@
-"""Service layer for voicetest."""
-
-from voicetest.services.agents import AgentService
-from voicetest.services.app_services import AppServices
-from voicetest.services.app_services import build_app_services
-from voicetest.services.decompose import DecomposeService
-from voicetest.services.diagnosis import DiagnosisService
-from voicetest.services.discovery import DiscoveryService
-from voicetest.services.evaluation import EvaluationService
-from voicetest.services.platforms import PlatformService
-from voicetest.services.runs import RunService
-from voicetest.services.settings import SettingsService
-from voicetest.services.snippets import SnippetService
-from voicetest.services.testing import TestCaseService
-from voicetest.services.testing import TestExecutionService
+"""Service layer for voicetest.
+
+Names below resolve on first access, so importing one service module (the
+exporters import `voicetest.services.settings`, for instance) does not load
+the whole layer and the LLM stack behind it."""
+
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from voicetest.services.agents import AgentService
+    from voicetest.services.app_services import AppServices
+    from voicetest.services.app_services import build_app_services
+    from voicetest.services.decompose import DecomposeService
+    from voicetest.services.diagnosis import DiagnosisService
+    from voicetest.services.discovery import DiscoveryService
+    from voicetest.services.evaluation import EvaluationService
+    from voicetest.services.platforms import PlatformService
+    from voicetest.services.runs import RunService
+    from voicetest.services.settings import SettingsService
+    from voicetest.services.snippets import SnippetService
+    from voicetest.services.testing import TestCaseService
+    from voicetest.services.testing import TestExecutionService
+
+
+_EXPORTS = {
+    "AgentService": "voicetest.services.agents",
+    "AppServices": "voicetest.services.app_services",
+    "DecomposeService": "voicetest.services.decompose",
+    "DiagnosisService": "voicetest.services.diagnosis",
+    "DiscoveryService": "voicetest.services.discovery",
+    "EvaluationService": "voicetest.services.evaluation",
+    "PlatformService": "voicetest.services.platforms",
+    "RunService": "voicetest.services.runs",
+    "SettingsService": "voicetest.services.settings",
+    "SnippetService": "voicetest.services.snippets",
+    "TestCaseService": "voicetest.services.testing",
+    "TestExecutionService": "voicetest.services.testing",
+    "build_app_services": "voicetest.services.app_services",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
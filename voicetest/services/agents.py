@@ -2,8 +2,11 @@
 
 import json
 from pathlib import Path
+import threading
 from typing import Any
 
+from cachetools import LRUCache
+
 from voicetest.exporters.registry import ExporterRegistry
 from voicetest.importers.registry import ImporterRegistry
 from voicetest.models.agent import AgentGraph
@@ -11,8 +14,9 @@ from voicetest.models.agent import GlobalNodeSetting
 from voicetest.models.agent import GoBackCondition
 from voicetest.models.agent import MetricsConfig
 from voicetest.models.agent import TransitionCondition
-from voicetest.storage.linked_file import check_file
+from voicetest.storage.linked_file import FileCache
 from voicetest.storage.linked_file import compute_etag
+from voicetest.storage.linked_file import file_version
 from voicetest.storage.linked_file import write_json
 from voicetest.storage.repositories import AgentRepository
 from voicetest.util.pathutil import resolve_file
@@ -21,6 +25,15 @@ from voicetest.util.templating import expand_graph_snippets
 from voicetest.util.templating import extract_variables
 
 
+# Parsed graphs shared across service instances. Stored graphs are keyed by
+# (agent_id, updated_at), which every write bumps; linked files by mtime/size.
+# Cached graphs are shared: callers that mutate must load with copy=True.
+_GRAPH_CACHE_SIZE = 64
+_stored_graphs: LRUCache = LRUCache(maxsize=_GRAPH_CACHE_SIZE)
+_stored_graphs_lock = threading.Lock()
+_linked_graphs = FileCache(maxsize=_GRAPH_CACHE_SIZE)
+
+
 class AgentService:
     """Manages agent import/export and persistence."""
 
@@ -123,12 +136,16 @@ class AgentService:
         """Backfill `node_type` on stored graphs that predate the required field."""
         return self._repo.migrate_node_types()
 
-    def load_graph(self, agent_id: str) -> tuple[dict, AgentGraph]:
-        """Load agent record and its graph (linked file first, else DB)."""
+    def load_graph(self, agent_id: str, copy: bool = False) -> tuple[dict, AgentGraph]:
+        """Load agent record and its graph (linked file first, else DB).
+
+        The graph comes from a shared parse cache and must be treated as
+        read-only; pass `copy=True` to get a private deep copy to modify."""
         agent = self._repo.get(agent_id)
         if not agent:
             raise ValueError(f"Agent not found: {agent_id}")
-        return agent, self._load_graph_payload(agent, agent_id)
+        graph = self._load_graph_payload(agent, agent_id)
+        return agent, graph.model_copy(deep=True) if copy else graph
 
     def save_graph(self, agent_id: str, agent: dict, graph: AgentGraph) -> None:
         """Persist an updated graph back to DB or linked file."""
@@ -151,7 +168,8 @@ class AgentService:
 
         source_path = agent.get("source_path")
         if source_path:
-            _mtime, etag = check_file(source_path, agent_id)
+            mtime_ns, size = file_version(str(resolve_path(source_path)))
+            etag = compute_etag(agent_id, f"{mtime_ns}-{size}")
         else:
             etag = compute_etag(agent_id, agent.get("updated_at", ""))
 
@@ -161,12 +179,23 @@ class AgentService:
         return self._load_graph_payload(agent, agent_id), etag, False
 
     def _load_graph_payload(self, agent: dict, agent_id: str) -> AgentGraph:
-        """Resolve the graph for an agent: re-import the linked file if any, else DB."""
+        """Resolve the (shared, cached) graph for an agent: linked file if any, else DB."""
         source_path = agent.get("source_path")
         if source_path:
-            return self._importers.import_agent(resolve_path(source_path))
-        result = self._repo.load_graph(agent_id)
-        return self._importers.import_agent(result) if isinstance(result, Path) else result
+            return _linked_graphs.get(
+                str(resolve_path(source_path)),
+                lambda path: self._importers.import_agent(Path(path)),
+            )
+
+        key = (agent_id, agent.get("updated_at"))
+        with _stored_graphs_lock:
+            graph = _stored_graphs.get(key)
+        if graph is None:
+            result = self._repo.load_graph(agent_id)
+            graph = self._importers.import_agent(result) if isinstance(result, Path) else result
+            with _stored_graphs_lock:
+                _stored_graphs[key] = graph
+        return graph
 
     def get_variables(self, agent_id: str) -> list[str]:
         """Extract dynamic variable names from agent prompts."""
@@ -195,7 +224,7 @@ class AgentService:
         When node_id is None, updates source_metadata.general_prompt.
         When node_id is set and transition_target_id is None, updates that node's state_prompt.
         When both are set, updates transition condition value."""
-        agent, graph = self.load_graph(agent_id)
+        agent, graph = self.load_graph(agent_id, copy=True)
 
         if node_id is None:
             graph.source_metadata["general_prompt"] = prompt_text
@@ -221,7 +250,7 @@ class AgentService:
 
     def update_metadata(self, agent_id: str, updates: dict[str, Any]) -> AgentGraph:
         """Merge updates into an agent's source_metadata."""
-        agent, graph = self.load_graph(agent_id)
+        agent, graph = self.load_graph(agent_id, copy=True)
         graph.source_metadata.update(updates)
         self.save_graph(agent_id, agent, graph)
         return graph
@@ -233,7 +262,7 @@ class AgentService:
         setting: dict[str, Any] | None,
     ) -> AgentGraph:
         """Set or remove a node's global_node_setting."""
-        agent, graph = self.load_graph(agent_id)
+        agent, graph = self.load_graph(agent_id, copy=True)
         node = graph.get_node(node_id)
         if not node:
             raise ValueError(f"Node not found: {node_id}")
@@ -4,6 +4,7 @@ from voicetest.exporters.registry import ExporterRegistry
 from voicetest.importers.base import ImporterInfo
 from voicetest.importers.registry import ImporterRegistry
 from voicetest.platforms.registry import PlatformRegistry
+from voicetest.settings import Settings
 
 
 class DiscoveryService:
@@ -35,12 +36,15 @@ class DiscoveryService:
             for info in self._exporters.list_formats()
         ]
 
-    def list_platforms(self) -> list[dict]:
-        """List available platforms with configuration status."""
+    def list_platforms(self, settings: Settings | None = None) -> list[dict]:
+        """List available platforms with configuration status.
+
+        A platform counts as configured if its keys are in the environment or
+        in the `env` block of `settings`."""
         return [
             {
                 "name": name,
-                "configured": self._platforms.is_configured(name),
+                "configured": self._platforms.is_configured(name, settings),
                 "env_key": self._platforms.get_env_key(name),
                 "required_env_keys": self._platforms.get_required_env_keys(name),
             }
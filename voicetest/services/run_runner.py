@@ -8,19 +8,28 @@ task.
 
 import asyncio
 from dataclasses import dataclass
+from dataclasses import field
+import logging
 
+from voicetest.engine.forking import ConversationForks
 from voicetest.exceptions import QuotaExhaustedError
 from voicetest.models.results import Message
 from voicetest.models.results import TestResult
 from voicetest.models.test_case import RunOptions
 from voicetest.services.agents import AgentService
+from voicetest.services.runs import ORPHANED_RESULT_MESSAGE
 from voicetest.services.runs import RunService
 from voicetest.services.testing.cases import TestCaseService
 from voicetest.services.testing.execution import TestExecutionService
+from voicetest.util.cache import run_cache_manifest
 from voicetest.util.retry import RetryError
+from voicetest.util.tracing import trace_span
 from voicetest.web.coordinator import RunCoordinator
 
 
+_logger = logging.getLogger(__name__)
+
+
 @dataclass
 class RunJob:
     """Job data for executing a test run."""
@@ -30,6 +39,23 @@ class RunJob:
     test_records: list[dict]
     result_ids: dict[str, str]
     options: RunOptions
+    # Conversation checkpoints by result id, for tests resumed mid-conversation.
+    checkpoints: dict[str, dict] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """JSON-ready form, for handing the job to an executor process."""
+        return {
+            "run_id": self.run_id,
+            "agent_id": self.agent_id,
+            "test_records": self.test_records,
+            "result_ids": self.result_ids,
+            "options": self.options.model_dump(mode="json"),
+            "checkpoints": self.checkpoints,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunJob":
+        return cls(**{**data, "options": RunOptions.model_validate(data["options"])})
 
 
 class RunRunner:
@@ -51,112 +77,203 @@ class RunRunner:
 
     async def execute(self, job: RunJob) -> None:
         """Execute the tests in `job`. Caller has already called `coordinator.start(run_id)`."""
+        self._coordinator.mark_started(job.run_id)
+        with trace_span("run", run_id=job.run_id, tests=len(job.test_records)):
+            await self._execute(job)
+
+    def resume_job(self, run_id: str) -> RunJob | None:
+        """Rebuild the job for a run's unfinished tests and reopen them.
+
+        A test is unfinished if its result is still `running` (the process
+        executing it stopped), was marked orphaned when the run was found
+        inactive, or ended on a turn timeout with a checkpoint saved. Tests
+        with a checkpoint continue from their last completed turn; the rest
+        start over. Tests are rebuilt from the agent's current test cases and
+        the options stored on the run; a result whose test case was deleted
+        is marked as an error. Returns None, after completing the run, when
+        nothing is left to run."""
+        run = self._runs.get_run(run_id)
+        if not run:
+            raise ValueError(f"Run not found: {run_id}")
+
+        checkpoints = self._runs.get_checkpoints([result["id"] for result in run["results"]])
+        tests_by_id = {record["id"]: record for record in self._tests.list_tests(run["agent_id"])}
+        test_records: list[dict] = []
+        result_ids: dict[str, str] = {}
+        for result in run["results"]:
+            if not _is_unfinished(result, result["id"] in checkpoints):
+                continue
+            record = tests_by_id.get(result.get("test_case_id"))
+            if record is None:
+                self._runs.mark_result_error(result["id"], "Test case no longer exists")
+                continue
+            test_records.append(record)
+            result_ids[record["id"]] = result["id"]
+
+        if not test_records:
+            if run["completed_at"] is None:
+                self._runs.complete(run_id)
+            return None
+
+        self._runs.reopen_results(run_id, list(result_ids.values()))
+        return RunJob(
+            run_id=run_id,
+            agent_id=run["agent_id"],
+            test_records=test_records,
+            result_ids=result_ids,
+            options=self._runs.get_run_options(run_id),
+            checkpoints={
+                result_id: checkpoints[result_id]
+                for result_id in result_ids.values()
+                if result_id in checkpoints
+            },
+        )
+
+    def interrupted_jobs(self) -> list[RunJob]:
+        """Resumable jobs for every run a stopped server left incomplete.
+
+        Runs that cannot be resumed are logged and skipped; the orphan
+        cleanup in `GET /runs/{id}` finalizes them."""
+        jobs = []
+        for run_id in self._runs.interrupted_run_ids():
+            try:
+                job = self.resume_job(run_id)
+            except Exception:
+                _logger.exception("cannot resume run %s", run_id)
+                continue
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+    async def _execute(self, job: RunJob) -> None:
         try:
             _agent, graph = self._agents.load_graph(job.agent_id)
         except (FileNotFoundError, ValueError):
             return
 
         metrics_config = self._agents.get_metrics_config(job.agent_id)
+        forks = None if job.options.no_cache else ConversationForks()
 
         try:
-            for idx, test_record in enumerate(job.test_records):
-                result_id = job.result_ids[test_record["id"]]
+            test_cases = [self._tests.to_model(record) for record in job.test_records]
+            async with run_cache_manifest(
+                graph, test_cases, run_id=job.run_id, prefetch=not job.options.no_cache
+            ):
+                for idx, test_record in enumerate(job.test_records):
+                    result_id = job.result_ids[test_record["id"]]
 
-                if self._coordinator.is_test_cancelled(job.run_id, result_id):
-                    self._runs.mark_result_cancelled(result_id)
-                    await self._coordinator.broadcast(
-                        job.run_id,
-                        {"type": "test_cancelled", "result_id": result_id},
-                    )
-                    continue
+                    if self._coordinator.is_test_cancelled(job.run_id, result_id):
+                        self._runs.mark_result_cancelled(result_id)
+                        await self._coordinator.broadcast(
+                            job.run_id,
+                            {"type": "test_cancelled", "result_id": result_id},
+                        )
+                        continue
 
-                if self._coordinator.is_run_cancelled(job.run_id):
-                    await self._cancel_remaining(job, idx)
-                    break
+                    if self._coordinator.is_run_cancelled(job.run_id):
+                        await self._cancel_remaining(job, idx)
+                        break
 
-                test_case = self._tests.to_model(test_record)
+                    test_case = test_cases[idx]
 
-                await self._coordinator.broadcast(
-                    job.run_id,
-                    {
-                        "type": "test_started",
-                        "result_id": result_id,
-                        "test_case_id": test_record["id"],
-                        "test_name": test_case.name,
-                    },
-                )
-
-                last_transcript: list[Message] = []
-                try:
-                    result = await self._exec.run_test(
-                        graph,
-                        test_case,
-                        options=job.options,
-                        metrics_config=metrics_config,
-                        on_turn=self._make_on_turn(job.run_id, result_id, last_transcript),
-                        on_token=self._make_on_token(job.run_id, result_id)
-                        if job.options.streaming
-                        else None,
-                        on_error=self._make_on_error(job.run_id, result_id),
-                    )
-                    self._runs.complete_result(result_id, result)
                     await self._coordinator.broadcast(
                         job.run_id,
                         {
-                            "type": "test_completed",
+                            "type": "test_started",
                             "result_id": result_id,
-                            "status": result.status,
-                        },
-                    )
-                except asyncio.CancelledError:
-                    cancelled_result = TestResult(
-                        test_name=test_case.name,
-                        status="error",
-                        transcript=last_transcript,
-                        error_message="Cancelled by user",
-                    )
-                    self._runs.complete_result(result_id, cancelled_result)
-                    await self._coordinator.broadcast(
-                        job.run_id,
-                        {"type": "test_cancelled", "result_id": result_id},
-                    )
-                except QuotaExhaustedError as e:
-                    error_result = TestResult(
-                        test_name=test_case.name,
-                        status="error",
-                        transcript=last_transcript,
-                        error_message=str(e),
-                    )
-                    self._runs.complete_result(result_id, error_result)
-                    await self._coordinator.broadcast(
-                        job.run_id,
-                        {
-                            "type": "quota_exhausted",
-                            "result_id": result_id,
-                            "message": str(e),
-                            "reset_message": e.reset_message,
-                        },
-                    )
-                    # Quota won't reset for hours — abort rather than burn through retry backoff.
-                    await self._cancel_remaining(job, idx + 1)
-                    break
-                except Exception as e:
-                    error_result = TestResult(
-                        test_name=test_case.name,
-                        status="error",
-                        transcript=last_transcript,
-                        error_message=str(e),
-                    )
-                    self._runs.complete_result(result_id, error_result)
-                    await self._coordinator.broadcast(
-                        job.run_id,
-                        {
-                            "type": "test_error",
-                            "result_id": result_id,
-                            "error": str(e),
+                            "test_case_id": test_record["id"],
+                            "test_name": test_case.name,
                         },
                     )
 
+                    last_transcript: list[Message] = []
+                    try:
+                        result = await self._exec.run_test(
+                            graph,
+                            test_case,
+                            options=job.options,
+                            metrics_config=metrics_config,
+                            on_turn=self._make_on_turn(job.run_id, result_id, last_transcript),
+                            on_token=self._make_on_token(job.run_id, result_id)
+                            if job.options.streaming
+                            else None,
+                            on_error=self._make_on_error(job.run_id, result_id),
+                            checkpoint=job.checkpoints.get(result_id),
+                            on_checkpoint=self._make_on_checkpoint(job.run_id, result_id),
+                            forks=forks,
+                        )
+                        self._runs.complete_result(result_id, result)
+                        await self._coordinator.broadcast(
+                            job.run_id,
+                            {
+                                "type": "test_completed",
+                                "result_id": result_id,
+                                "status": result.status,
+                            },
+                        )
+                    except asyncio.CancelledError:
+                        if not (
+                            self._coordinator.is_run_cancelled(job.run_id)
+                            or self._coordinator.is_test_cancelled(job.run_id, result_id)
+                        ):
+                            # Shutdown, not the user: leave the test running and its
+                            # checkpoint in place so the run can be resumed.
+                            raise
+                        cancelled_result = TestResult(
+                            test_name=test_case.name,
+                            status="error",
+                            transcript=last_transcript,
+                            error_message="Cancelled by user",
+                        )
+                        self._runs.complete_result(result_id, cancelled_result)
+                        await self._coordinator.broadcast(
+                            job.run_id,
+                            {"type": "test_cancelled", "result_id": result_id},
+                        )
+                    except QuotaExhaustedError as e:
+                        error_result = TestResult(
+                            test_name=test_case.name,
+                            status="error",
+                            transcript=last_transcript,
+                            error_message=str(e),
+                        )
+                        self._runs.complete_result(result_id, error_result)
+                        await self._coordinator.broadcast(
+                            job.run_id,
+                            {
+                                "type": "quota_exhausted",
+                                "result_id": result_id,
+                                "message": str(e),
+                                "reset_message": e.reset_message,
+                            },
+                        )
+                        # Quota won't reset for hours — abort rather than burn through
+                        # retry backoff.
+                        await self._cancel_remaining(job, idx + 1)
+                        break
+                    except Exception as e:
+                        error_result = TestResult(
+                            test_name=test_case.name,
+                            status="error",
+                            transcript=last_transcript,
+                            error_message=str(e),
+                        )
+                        self._runs.complete_result(result_id, error_result)
+                        await self._coordinator.broadcast(
+                            job.run_id,
+                            {
+                                "type": "test_error",
+                                "result_id": result_id,
+                                "error": str(e),
+                            },
+                        )
+
+            if forks is not None and forks.llm_calls_saved:
+                _logger.info(
+                    "run %s: shared conversation openings saved %d provider calls",
+                    job.run_id,
+                    forks.llm_calls_saved,
+                )
             self._runs.complete(job.run_id)
             await self._coordinator.broadcast(job.run_id, {"type": "run_completed"})
         finally:
@@ -199,6 +316,12 @@ class RunRunner:
 
         return on_turn
 
+    def _make_on_checkpoint(self, run_id: str, result_id: str):
+        def on_checkpoint(checkpoint: dict) -> None:
+            self._runs.save_checkpoint(result_id, run_id, checkpoint)
+
+        return on_checkpoint
+
     def _make_on_token(self, run_id: str, result_id: str):
         async def on_token(token: str, source: str) -> None:
             await self._coordinator.broadcast(
@@ -229,3 +352,11 @@ class RunRunner:
             )
 
         return on_error
+
+
+def _is_unfinished(result: dict, has_checkpoint: bool) -> bool:
+    if result["status"] == "running":
+        return True
+    if has_checkpoint and result.get("end_reason") == "turn_timeout":
+        return True
+    return result["status"] == "error" and result.get("error_message") == ORPHANED_RESULT_MESSAGE
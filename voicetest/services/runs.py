@@ -1,13 +1,22 @@
 """Run service: persisted test run management."""
 
+from collections.abc import Callable
+from collections.abc import Iterable
+from datetime import UTC
 from datetime import datetime
+from datetime import timedelta
+import itertools
 import logging
+from pathlib import Path
 
+from voicetest.config import get_archive_dir
 from voicetest.engine.session import ConversationRunner
+from voicetest.exceptions import ArchiveInProgressError
 from voicetest.models.agent import AgentGraph
 from voicetest.models.results import Message
 from voicetest.models.results import MetricResult
 from voicetest.models.results import TestResult
+from voicetest.models.results import TestRun
 from voicetest.models.test_case import RunOptions
 from voicetest.models.test_case import TestCase
 from voicetest.services.agents import AgentService
@@ -15,6 +24,7 @@ from voicetest.services.settings import SettingsService
 from voicetest.services.testing.execution import TestExecutionService
 from voicetest.services.testing.execution import resolve_run_options
 from voicetest.simulator.scripted import ScriptedUserSimulator
+from voicetest.storage.parquet import write_runs_parquet
 from voicetest.storage.repositories import AgentRepository
 from voicetest.storage.repositories import RunRepository
 from voicetest.storage.repositories import TestCaseRepository
@@ -22,6 +32,9 @@ from voicetest.storage.repositories import TestCaseRepository
 
 _logger = logging.getLogger(__name__)
 
+# Error recorded on results of a run found unfinished with nothing executing it.
+ORPHANED_RESULT_MESSAGE = "Run orphaned - backend stopped"
+
 
 class RunService:
     """Manages persisted test runs (CRUD, result tracking)."""
@@ -42,14 +55,55 @@ class RunService:
         self._test_execution = test_execution_service
         self._settings = settings_service
 
-    def create_run(self, agent_id: str) -> dict:
-        """Create a new run."""
-        return self._runs.create(agent_id)
+    def create_run(self, agent_id: str, options: RunOptions | None = None) -> dict:
+        """Create a new run. `options` are stored so an interrupted run can be resumed."""
+        return self._runs.create(
+            agent_id, options=options.model_dump(mode="json") if options else None
+        )
+
+    def save_run(self, agent_id: str, run: TestRun) -> dict:
+        """Record a finished `TestRun` as a completed run with all its results.
+
+        The run keeps the id and start time it ran with, so a run that is
+        interrupted before it is saved leaves nothing in the history."""
+        started_at = run.started_at.astimezone(UTC)
+        db_run = self._runs.create(agent_id, run_id=run.run_id, started_at=started_at)
+        for result in run.results:
+            self._runs.add_result(db_run["id"], result)
+        self._runs.complete(db_run["id"])
+        return db_run
+
+    def get_run_options(self, run_id: str) -> RunOptions:
+        """The options a run was started with, or the current settings if none were stored."""
+        data = self._runs.get_options(run_id)
+        if data is None:
+            return resolve_run_options(None, self._settings)
+        return RunOptions.model_validate(data)
+
+    def interrupted_run_ids(self) -> list[str]:
+        """Runs never marked complete, oldest first."""
+        return self._runs.find_incomplete_run_ids()
+
+    def reopen_results(self, run_id: str, result_ids: list[str]) -> None:
+        """Mark a run incomplete again with the given results back to `running`."""
+        self._runs.reopen(run_id, result_ids)
+
+    def save_checkpoint(self, result_id: str, run_id: str, checkpoint: dict) -> None:
+        """Store the latest conversation checkpoint of an in-progress result."""
+        self._runs.save_checkpoint(result_id, run_id, checkpoint)
+
+    def get_checkpoints(self, result_ids: list[str]) -> dict[str, dict]:
+        """Stored conversation checkpoints by result id."""
+        return self._runs.get_checkpoints(result_ids)
 
     def list_runs(self, agent_id: str, limit: int = 50) -> list[dict]:
         """List runs for an agent with result summary counts."""
         return self._runs.list_for_agent_with_summary(agent_id, limit)
 
+    def run_exists(self, run_id: str) -> bool:
+        """Whether the run exists, without loading its results."""
+        return self._runs.get(run_id) is not None
+
     def get_run(self, run_id: str) -> dict | None:
         """Get a run with all results, enriched with dynamic variables."""
         run = self._runs.get_with_results(run_id)
@@ -73,6 +127,90 @@ class RunService:
 
         return run
 
+    def get_stats(self, agent_id: str, last_runs: int = 30) -> dict:
+        """Aggregate node, metric and tool analytics over an agent's recent runs."""
+        run_ids = self._runs.recent_run_ids(agent_id, last_runs)
+        return {
+            "agent_id": agent_id,
+            "run_count": len(run_ids),
+            "nodes": self._runs.node_stats(run_ids),
+            "metrics": self._runs.metric_stats(run_ids),
+            "tools": self._runs.tool_stats(run_ids),
+        }
+
+    def get_usage(self, agent_id: str, days: int = 30) -> dict:
+        """Token and cost totals per day over an agent's runs of the last `days` days."""
+        since = datetime.now(UTC) - timedelta(days=days)
+        daily = self._runs.usage_by_day(agent_id, since)
+        totals = {
+            key: sum(d[key] for d in daily)
+            for key in ("runs", "results", "prompt_tokens", "completion_tokens")
+        }
+        totals["cost_usd"] = round(sum(d["cost_usd"] for d in daily), 6)
+        return {"agent_id": agent_id, "days": days, "total": totals, "daily": daily}
+
+    def backfill_stats(self) -> dict:
+        """Populate analytics tables for results recorded before they existed."""
+        return self._runs.backfill_analytics()
+
+    def export_runs(
+        self,
+        output_dir: str | Path,
+        *,
+        run_ids: list[str] | None = None,
+        agent_id: str | None = None,
+        batch_size: int = 500,
+    ) -> dict:
+        """Export runs to partitioned Parquet datasets under `output_dir`.
+
+        Exports the given `run_ids`, or every run of `agent_id`. Results are
+        streamed from the DB `batch_size` at a time. Returns row counts."""
+        if run_ids is None:
+            if agent_id is None:
+                raise ValueError("Provide run_ids or agent_id to export")
+            run_ids = self._runs.find_run_ids(agent_id=agent_id)
+        batches = self._runs.iter_export_batches(run_ids, batch_size)
+        return write_runs_parquet(batches, Path(output_dir), self._runs.export_run_rows(run_ids))
+
+    def archive_runs(
+        self,
+        older_than_days: int | None = None,
+        archive_dir: str | Path | None = None,
+    ) -> dict:
+        """Move completed runs older than the retention window into the Parquet archive.
+
+        Defaults come from the `[archive]` settings section. Runs are written
+        to the archive before they are deleted, so a failed export loses
+        nothing; runs without results are kept as rows of the `runs` dataset.
+        Only one process archives a database at a time; the others
+        get ArchiveInProgressError. Returns the export counts; `runs` is the
+        number archived."""
+        archive_settings = self._settings.get_settings().archive
+        if older_than_days is None:
+            older_than_days = archive_settings.retention_days
+        if older_than_days is None:
+            raise ValueError(
+                "No retention period: pass older_than_days or set archive.retention_days"
+            )
+        if older_than_days < 0:
+            raise ValueError("older_than_days must be non-negative")
+        archive_dir = Path(archive_dir or archive_settings.directory or get_archive_dir())
+
+        cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
+        with self._runs.archive_lock() as acquired:
+            if not acquired:
+                raise ArchiveInProgressError("Another process is already archiving runs")
+            run_ids = self._runs.find_run_ids(started_before=cutoff)
+            summary = write_runs_parquet(
+                self._runs.iter_export_batches(run_ids),
+                archive_dir,
+                self._runs.export_run_rows(run_ids),
+            )
+            for run_id in run_ids:
+                self._runs.delete(run_id)
+        summary["runs"] = len(run_ids)
+        return summary
+
     def add_result(
         self,
         run_id: str,
@@ -175,19 +313,46 @@ class RunService:
         """Back-compat alias — prefer add_result(run_id, result, call_id=...)."""
         return self.add_result(run_id, test_result, call_id=call_id)
 
-    def import_calls(self, agent_id: str, results: list[TestResult]) -> dict:
+    def import_calls(
+        self,
+        agent_id: str,
+        results: Iterable[TestResult],
+        *,
+        batch_size: int = 500,
+        on_progress: Callable[[int], None] | None = None,
+        include_results: bool = True,
+    ) -> dict:
         """Persist a batch of imported call transcripts as a single Run.
 
         Creates one Run with N Results — each Result holds one call's transcript
         with status="imported" and no test_case_id/call_id linkage. The Run is
         marked complete immediately since imports are historical, not running.
 
-        Returns the created Run record."""
+        `results` may be a lazy iterator (see `iter_retell_file`); it is
+        consumed and written `batch_size` results per transaction, calling
+        `on_progress` with the running total after each batch. If the source
+        raises part-way, the partial Run is deleted and the error re-raised.
+
+        Returns the created Run record with an `imported` count, plus all
+        results unless `include_results` is False (for very large imports)."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
         run = self.create_run(agent_id)
-        for result in results:
-            self.add_result(run["id"], result)
+        imported = 0
+        try:
+            for batch in itertools.batched(results, batch_size):
+                imported += self._runs.add_results(run["id"], batch)
+                if on_progress:
+                    on_progress(imported)
+        except Exception:
+            self._runs.delete(run["id"])
+            raise
         self.complete(run["id"])
-        return self.get_run(run["id"])
+
+        record = self.get_run(run["id"]) if include_results else self._runs.get(run["id"])
+        record["imported"] = imported
+        return record
 
     async def replay_run(
         self,
@@ -18,21 +18,21 @@ class SnippetService:
 
     def update_all_snippets(self, agent_id: str, snippets: dict[str, str]) -> dict[str, str]:
         """Replace all snippets for an agent."""
-        agent, graph = self._agents.load_graph(agent_id)
+        agent, graph = self._agents.load_graph(agent_id, copy=True)
         graph.snippets = snippets
         self._agents.save_graph(agent_id, agent, graph)
         return graph.snippets
 
     def update_snippet(self, agent_id: str, name: str, text: str) -> dict[str, str]:
         """Create or update a single snippet."""
-        agent, graph = self._agents.load_graph(agent_id)
+        agent, graph = self._agents.load_graph(agent_id, copy=True)
         graph.snippets[name] = text
         self._agents.save_graph(agent_id, agent, graph)
         return graph.snippets
 
     def delete_snippet(self, agent_id: str, name: str) -> dict[str, str]:
         """Delete a single snippet."""
-        agent, graph = self._agents.load_graph(agent_id)
+        agent, graph = self._agents.load_graph(agent_id, copy=True)
         if name not in graph.snippets:
             raise ValueError(f"Snippet not found: {name}")
         del graph.snippets[name]
@@ -53,7 +53,7 @@ class SnippetService:
 
     def apply_snippets(self, agent_id: str, snippets: list[dict[str, str]]) -> AgentGraph:
         """Apply snippets: add to graph and replace occurrences in prompts with {%name%} refs."""
-        agent, graph = self._agents.load_graph(agent_id)
+        agent, graph = self._agents.load_graph(agent_id, copy=True)
 
         for snippet in snippets:
             name = snippet["name"]
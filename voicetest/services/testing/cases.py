@@ -148,8 +148,7 @@ class TestCaseService:
             tests_paths = agent.get("tests_paths")
             if not tests_paths:
                 continue
-            linked = self._repo.list_for_agent_with_linked(agent["id"], tests_paths)
-            for t in linked:
-                if t["id"] == test_id and t.get("source_path"):
-                    return t
+            linked = self._repo.find_linked(agent["id"], tests_paths, test_id)
+            if linked:
+                return linked
         return None
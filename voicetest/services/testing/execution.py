@@ -6,11 +6,16 @@ from datetime import datetime
 import logging
 import uuid
 
+from voicetest.engine.forking import ConversationForks
 from voicetest.engine.session import ConversationRunner
+from voicetest.engine.session import OnCheckpointCallback
 from voicetest.judges.flow import FlowJudge
 from voicetest.judges.flow import FlowResult
 from voicetest.judges.metric import MetricJudge
 from voicetest.judges.rule import RuleJudge
+from voicetest.llm import _invoke_callback
+from voicetest.llm.stats import LLMStatsCollector
+from voicetest.llm.stats import collect_llm_stats
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import MetricsConfig
 from voicetest.models.results import Message
@@ -26,8 +31,12 @@ from voicetest.settings import resolve_model
 from voicetest.simulator.user_sim import SimulatorResponse
 from voicetest.simulator.user_sim import UserSimulator
 from voicetest.util.audio import AudioRoundTrip
+from voicetest.util.cache import strict_offline
+from voicetest.util.metrics import TESTS_IN_FLIGHT
 from voicetest.util.retry import OnErrorCallback
 from voicetest.util.templating import substitute_variables
+from voicetest.util.timing import collect_timings
+from voicetest.util.tracing import trace_span
 
 
 OnTurnCallback = Callable[[list[Message]], Awaitable[None] | None]
@@ -113,8 +122,70 @@ class TestExecutionService:
         on_turn: OnTurnCallback | None = None,
         on_token: OnTokenCallback | None = None,
         on_error: OnErrorCallback | None = None,
+        checkpoint: dict | None = None,
+        on_checkpoint: OnCheckpointCallback | None = None,
+        forks: ConversationForks | None = None,
+    ) -> TestResult:
+        """Run a single test case against an agent.
+
+        Every LLM call made for the test is tallied by role into
+        `TestResult.llm_stats`, with token usage priced from the settings
+        `pricing` table, and time spent per span (transition, response,
+        simulator, judges) into `TestResult.timings`. With
+        `options.strict_offline`, any LLM cache miss fails the test instead
+        of reaching the provider. `on_checkpoint` and `checkpoint` save and
+        resume the conversation between turns (see `ConversationRunner.run`).
+        With `forks`, a test without a checkpoint starts from the opening
+        already run by an earlier test with the same dynamic variables, or
+        records its own for later tests; the provider calls skipped (not
+        cache hits) are counted in `TestResult.llm_calls_saved`."""
+        offline = bool(options and options.strict_offline)
+        llm_calls_saved = 0
+        with (
+            trace_span("test", new_lane=True, test=test_case.name) as trace,
+            collect_llm_stats(self._settings.get_settings().pricing) as llm_stats,
+            collect_timings() as timings,
+            strict_offline(offline),
+            TESTS_IN_FLIGHT.track(),
+        ):
+            if forks is not None and checkpoint is None and not _mock_mode:
+                shared = forks.fork(test_case)
+                if shared is not None:
+                    checkpoint, llm_calls_saved = shared
+                else:
+                    on_checkpoint = _recording_opening(forks, test_case, llm_stats, on_checkpoint)
+            result = await self._run_test(
+                graph,
+                test_case,
+                options,
+                metrics_config,
+                _mock_mode=_mock_mode,
+                on_turn=on_turn,
+                on_token=on_token,
+                on_error=on_error,
+                checkpoint=checkpoint,
+                on_checkpoint=on_checkpoint,
+            )
+            if trace:
+                trace.set(status=result.status, turns=len(result.transcript))
+        result.llm_stats = llm_stats.snapshot()
+        result.timings = timings.snapshot()
+        result.llm_calls_saved = llm_calls_saved
+        return result
+
+    async def _run_test(
+        self,
+        graph: AgentGraph,
+        test_case: TestCase,
+        options: RunOptions | None,
+        metrics_config: MetricsConfig | None,
+        _mock_mode: bool,
+        on_turn: OnTurnCallback | None,
+        on_token: OnTokenCallback | None,
+        on_error: OnErrorCallback | None,
+        checkpoint: dict | None = None,
+        on_checkpoint: OnCheckpointCallback | None = None,
     ) -> TestResult:
-        """Run a single test case against an agent."""
         options = resolve_run_options(options, self._settings)
         overrides: list[ModelOverride] = []
         tmp = options.test_model_precedence
@@ -218,7 +289,13 @@ class TestExecutionService:
                 )
 
             state = await runner.run(
-                test_case, simulator, on_turn=tracking_on_turn, on_token=on_token, on_error=on_error
+                test_case,
+                simulator,
+                on_turn=tracking_on_turn,
+                on_token=on_token,
+                on_error=on_error,
+                checkpoint=checkpoint,
+                on_checkpoint=on_checkpoint,
             )
 
             test_type = test_case.effective_type
@@ -343,15 +420,22 @@ class TestExecutionService:
         options: RunOptions | None = None,
         _mock_mode: bool = False,
     ) -> TestRun:
-        """Run multiple test cases, return aggregated results."""
+        """Run multiple test cases, return aggregated results.
+
+        Tests share conversation openings (see `ConversationForks`) unless
+        `options.no_cache` asks for every call to be made afresh."""
         run_id = str(uuid.uuid4())
         started_at = datetime.now()
 
         options = resolve_run_options(options, self._settings)
+        forks = None if options.no_cache else ConversationForks()
         results = []
-        for test_case in test_cases:
-            result = await self.run_test(graph, test_case, options, _mock_mode=_mock_mode)
-            results.append(result)
+        with trace_span("run", run_id=run_id, tests=len(test_cases)):
+            for test_case in test_cases:
+                result = await self.run_test(
+                    graph, test_case, options, _mock_mode=_mock_mode, forks=forks
+                )
+                results.append(result)
 
         return TestRun(
             run_id=run_id,
@@ -361,6 +445,24 @@ class TestExecutionService:
         )
 
 
+def _recording_opening(
+    forks: ConversationForks,
+    test_case: TestCase,
+    llm_stats: LLMStatsCollector,
+    on_checkpoint: OnCheckpointCallback | None,
+) -> OnCheckpointCallback:
+    """Wrap `on_checkpoint` to offer each checkpoint to `forks`, with the
+    provider calls the test has made so far (cache hits are free to repeat)."""
+
+    async def record(checkpoint: dict) -> None:
+        llm_calls = sum(stats.provider_calls for stats in llm_stats.snapshot().values())
+        forks.record(test_case, checkpoint, llm_calls)
+        if on_checkpoint:
+            await _invoke_callback(on_checkpoint, checkpoint)
+
+    return record
+
+
 def _model_overrides(
     role: str,
     settings_value: str | None,
@@ -25,11 +25,36 @@ class CacheSettings(BaseModel):
     """DSPy cache backend configuration."""
 
     cache_backend: str = Field(
-        default="disk", description="Cache backend: 'disk' (default) or 's3'"
+        default="disk",
+        description="Cache backend: 'disk' (default), 's3', or 'tiered' (local disk + S3)",
     )
     s3_bucket: str = Field(default="", description="S3 bucket for cache storage")
     s3_prefix: str = Field(default="dspy-cache/", description="S3 key prefix")
     s3_region: str | None = Field(default=None, description="AWS region (uses default if unset)")
+    local_cache_dir: str = Field(
+        default="", description="Local tier directory for 'tiered' (defaults to .voicetest/cache)"
+    )
+    local_cache_max_bytes: int = Field(
+        default=1 << 30, description="Size bound of the local tier; least recently used evicted"
+    )
+    negative_ttl_seconds: float = Field(
+        default=30.0, description="How long an S3 miss is remembered before asking S3 again"
+    )
+    memory_max_bytes: int = Field(
+        default=256 << 20,
+        description="Byte budget of the in-memory tier; values sized by pickled length",
+    )
+    disk_max_bytes: int = Field(
+        default=30_000_000_000, description="Size bound of the 'disk' backend's cache directory"
+    )
+    disk_ttl_seconds: float = Field(
+        default=0.0,
+        description="Expire disk and local-tier entries this long after writing (0 = never)",
+    )
+    s3_expire_days: int = Field(
+        default=0,
+        description="Lifecycle rule expiring S3 objects under s3_prefix after N days (0 = none)",
+    )
 
 
 class AudioSettings(BaseModel):
@@ -62,6 +87,10 @@ class RunSettings(BaseModel):
         default="fnmatch",
         description="Pattern engine: 'fnmatch' (wildcards) or 're2' (regex)",
     )
+    resume_interrupted: bool = Field(
+        default=True,
+        description="On server start, resume runs a stopped server left unfinished",
+    )
 
 
 class ExportSettings(BaseModel):
@@ -70,6 +99,31 @@ class ExportSettings(BaseModel):
     layout: bool = Field(default=True, description="Compute display positions for exported nodes")
 
 
+class ArchiveSettings(BaseModel):
+    """Retention policy for archiving old runs to Parquet."""
+
+    retention_days: int | None = Field(
+        default=None,
+        description="Archive completed runs older than this many days (None disables)",
+    )
+    directory: str = Field(
+        default="", description="Archive directory (defaults to .voicetest/archive)"
+    )
+
+
+class ModelPrice(BaseModel):
+    """Price of one model in USD per million tokens."""
+
+    input_per_mtok: float = Field(default=0.0, description="USD per million prompt tokens")
+    output_per_mtok: float = Field(default=0.0, description="USD per million completion tokens")
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        """USD cost of a call with the given token counts."""
+        return (
+            prompt_tokens * self.input_per_mtok + completion_tokens * self.output_per_mtok
+        ) / 1e6
+
+
 class Settings(BaseModel):
     """Voicetest settings."""
 
@@ -78,6 +132,11 @@ class Settings(BaseModel):
     audio: AudioSettings = Field(default_factory=AudioSettings)
     export: ExportSettings = Field(default_factory=ExportSettings)
     cache: CacheSettings = Field(default_factory=CacheSettings)
+    archive: ArchiveSettings = Field(default_factory=ArchiveSettings)
+    pricing: dict[str, ModelPrice] = Field(
+        default_factory=dict,
+        description="Per-model prices keyed by model string; overrides provider-reported cost",
+    )
     env: dict[str, str] = Field(
         default_factory=dict,
         description="Environment variables to set (e.g., API keys for LLM providers)",
@@ -144,7 +203,8 @@ def _to_toml(settings: Settings) -> str:
     lines.append(f"layout = {str(settings.export.layout).lower()}")
     lines.append("")
 
-    if settings.cache.cache_backend != "disk":
+    cache_defaults = CacheSettings()
+    if settings.cache != cache_defaults:
         lines.append("[cache]")
         lines.append(f'cache_backend = "{settings.cache.cache_backend}"')
         if settings.cache.s3_bucket:
@@ -152,6 +212,36 @@ def _to_toml(settings: Settings) -> str:
         lines.append(f's3_prefix = "{settings.cache.s3_prefix}"')
         if settings.cache.s3_region:
             lines.append(f's3_region = "{settings.cache.s3_region}"')
+        if settings.cache.local_cache_dir:
+            lines.append(f'local_cache_dir = "{settings.cache.local_cache_dir}"')
+        for name in (
+            "local_cache_max_bytes",
+            "negative_ttl_seconds",
+            "memory_max_bytes",
+            "disk_max_bytes",
+            "disk_ttl_seconds",
+            "s3_expire_days",
+        ):
+            value = getattr(settings.cache, name)
+            if value != getattr(cache_defaults, name):
+                lines.append(f"{name} = {value}")
+        lines.append("")
+
+    if settings.archive.retention_days is not None or settings.archive.directory:
+        lines.append("[archive]")
+        if settings.archive.retention_days is not None:
+            lines.append(f"retention_days = {settings.archive.retention_days}")
+        if settings.archive.directory:
+            lines.append(f'directory = "{settings.archive.directory}"')
+        lines.append("")
+
+    if settings.pricing:
+        lines.append("[pricing]")
+        for model, price in sorted(settings.pricing.items()):
+            lines.append(
+                f'"{model}" = {{ input_per_mtok = {price.input_per_mtok}, '
+                f"output_per_mtok = {price.output_per_mtok} }}"
+            )
         lines.append("")
 
     if settings.env:
@@ -19,6 +19,7 @@ from voicetest.models.results import Message
 from voicetest.util.cache import try_evict_last_call
 from voicetest.util.retry import EmptyLLMOutputError
 from voicetest.util.retry import OnErrorCallback
+from voicetest.util.timing import timed
 
 
 # Callback type for token updates: receives token string and source ("agent" or "user")
@@ -48,6 +49,7 @@ class SimulatorResponse(BaseModel):
     """Response from user simulator."""
 
     message: str
+    duration_ms: float | None = None  # time spent generating it, when an LLM did
 
 
 class UserSimulator:
@@ -72,7 +74,10 @@ class UserSimulator:
         on_token: OnTokenCallback | None = None,
         on_error: OnErrorCallback | None = None,
     ) -> SimulatorResponse | None:
-        """Generate next user message based on conversation so far."""
+        """Generate next user message based on conversation so far.
+
+        The time taken is reported as the `simulator` span and returned in
+        `SimulatorResponse.duration_ms`."""
         # Mock mode for testing
         if self._mock_mode:
             if self._mock_index >= len(self._mock_responses):
@@ -81,7 +86,11 @@ class UserSimulator:
             self._mock_index += 1
             return response
 
-        return await self._generate_with_llm(transcript, on_token, on_error)
+        with timed("simulator") as span:
+            response = await self._generate_with_llm(transcript, on_token, on_error)
+        if response is not None:
+            response.duration_ms = round(span.ms, 1)
+        return response
 
     async def _generate_with_llm(
         self,
@@ -127,6 +136,7 @@ class UserSimulator:
                 cache_salt=cache_salt,
                 no_cache=is_retry,
                 predictor_class=dspy.Predict,
+                role="simulator",
                 persona=user_prompt,
                 conversation_history=conversation_history,
                 current_agent_message=current_agent_message or "(agent has not spoken yet)",
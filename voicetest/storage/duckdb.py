@@ -11,17 +11,21 @@ load can segfault DuckDB's C extension.
 
 This module patches every mutating Session method to serialize on a
 single RLock. Applied only to DuckDB sessions; Postgres uses transient
-sessions and does not need the lock.
+sessions and does not need the lock. Time spent waiting for the lock is
+recorded in the `voicetest_db_lock_wait_seconds` metric.
 """
 
 from __future__ import annotations
 
 import functools
 import threading
+import time
 
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 
+from voicetest.util.metrics import DB_LOCK_WAIT_SECONDS
+
 
 _SESSION_LOCK = threading.RLock()
 
@@ -57,7 +61,9 @@ def wrap_session(session: Session) -> Session:
 
         @functools.wraps(original)
         def locked(*args, _original=original, **kwargs):
+            start = time.perf_counter()
             with _SESSION_LOCK:
+                DB_LOCK_WAIT_SECONDS.observe(time.perf_counter() - start)
                 return _original(*args, **kwargs)
 
         setattr(session, name, locked)
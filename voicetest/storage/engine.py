@@ -45,6 +45,45 @@ _MIGRATIONS: list[tuple[int, str, str | list[str], str]] = [
         "SELECT 1 FROM information_schema.columns "
         "WHERE table_name = 'results' AND column_name = 'audio_metrics_json'",
     ),
+    (
+        4,
+        "Add llm_stats to results",
+        "ALTER TABLE results ADD COLUMN llm_stats JSON",
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'results' AND column_name = 'llm_stats'",
+    ),
+    (
+        5,
+        "Add timings to results",
+        "ALTER TABLE results ADD COLUMN timings JSON",
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'results' AND column_name = 'timings'",
+    ),
+    (
+        6,
+        "Add token and cost totals to results",
+        [
+            "ALTER TABLE results ADD COLUMN prompt_tokens INTEGER",
+            "ALTER TABLE results ADD COLUMN completion_tokens INTEGER",
+            "ALTER TABLE results ADD COLUMN cost_usd DOUBLE PRECISION",
+        ],
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'results' AND column_name = 'cost_usd'",
+    ),
+    (
+        7,
+        "Add options_json to runs",
+        "ALTER TABLE runs ADD COLUMN options_json JSON",
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'runs' AND column_name = 'options_json'",
+    ),
+    (
+        8,
+        "Add llm_calls_saved to results",
+        "ALTER TABLE results ADD COLUMN llm_calls_saved INTEGER",
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'results' AND column_name = 'llm_calls_saved'",
+    ),
 ]
 
 
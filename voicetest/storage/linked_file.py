@@ -1,7 +1,73 @@
 """Shared file operations for linked resources (agents, tests)."""
 
+from collections.abc import Callable
 import json
+import os
 from pathlib import Path
+import threading
+from typing import Any
+import weakref
+
+from cachetools import LRUCache
+
+
+# Every FileCache, so write_json can invalidate entries for files we rewrite.
+_FILE_CACHES: weakref.WeakSet["FileCache"] = weakref.WeakSet()
+
+
+class FileCache:
+    """Process-wide cache of values derived from files, validated by (mtime, size).
+
+    `get` stats the file and rebuilds only when its mtime or size changed
+    since the cached build. Stat happens before the read, so a write racing
+    the build leaves a stale key that the next call rebuilds. `write_json`
+    invalidates explicitly, covering filesystems with coarse mtimes."""
+
+    def __init__(self, maxsize: int = 256):
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        _FILE_CACHES.add(self)
+
+    def get(self, path: str, build: Callable[[str], Any]) -> Any:
+        """Return `build(path)`, reusing the cached value while the file is unchanged.
+
+        Raises FileNotFoundError (and drops any cached value) if the file is gone."""
+        try:
+            version = file_version(path)
+        except FileNotFoundError:
+            self.invalidate(path)
+            raise
+
+        with self._lock:
+            cached = self._entries.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        value = build(path)
+        with self._lock:
+            self._entries[path] = (version, value)
+        return value
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached values for `path`, however it was spelled when cached."""
+        target = os.path.abspath(path)
+        with self._lock:
+            for cached_path in [p for p in self._entries if os.path.abspath(p) == target]:
+                del self._entries[cached_path]
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+
+def file_version(path: str) -> tuple[int, int]:
+    """Return a file's (mtime_ns, size), the version key for cached derivations."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+    return st.st_mtime_ns, st.st_size
 
 
 def compute_etag(resource_id: str, version: float | str) -> str:
@@ -33,3 +99,5 @@ def write_json(path: str, data: list | dict) -> None:
     """Write data to a JSON file with pretty formatting."""
     p = Path(path)
     p.write_text(json.dumps(data, indent=2) + "\n")
+    for cache in list(_FILE_CACHES):
+        cache.invalidate(str(path))
@@ -3,7 +3,10 @@
 from datetime import UTC
 from datetime import datetime
 
+from sqlalchemy import Boolean
 from sqlalchemy import DateTime
+from sqlalchemy import Double
+from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
 from sqlalchemy import String
@@ -111,6 +114,8 @@ class Run(Base):
     agent_id: Mapped[str] = mapped_column(ForeignKey("agents.id"), nullable=False)
     started_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # RunOptions the run started with, so an interrupted run can be resumed.
+    options_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
     agent: Mapped["Agent"] = relationship(back_populates="runs")
     results: Mapped[list["Result"]] = relationship(
@@ -177,6 +182,14 @@ class Result(Base):
     nodes_visited: Mapped[list | None] = mapped_column(JSON, nullable=True)
     tools_called: Mapped[list | None] = mapped_column(JSON, nullable=True)
     models_used: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    llm_stats: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    timings: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Totals of llm_stats across roles, as columns so runs and agents can be
+    # summed in SQL.
+    prompt_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    completion_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cost_usd: Mapped[float | None] = mapped_column(Double, nullable=True)
+    llm_calls_saved: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
 
     run: Mapped["Run"] = relationship(back_populates="results")
@@ -200,5 +213,78 @@ class Result(Base):
             "nodes_visited": self.nodes_visited,
             "tools_called": self.tools_called,
             "models_used": self.models_used,
+            "llm_stats": self.llm_stats,
+            "timings": self.timings,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": self.cost_usd,
+            "llm_calls_saved": self.llm_calls_saved or 0,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+# Analytics side tables.
+#
+# Normalized projections of the JSON blobs on `results` (nodes_visited,
+# metrics_json, tools_called) so "which node fails most often" or "which
+# metric regressed" are single SQL aggregates instead of a Python scan over
+# every row. Written alongside the result by RunRepository and rebuilt by
+# `RunRepository.backfill_analytics` for history.
+#
+# No ForeignKey to `results`: DuckDB rewrites an UPDATE on a referenced row as
+# delete+insert and rejects it while children exist, and results are updated
+# in place as tests complete. Repositories delete these rows explicitly.
+
+
+class ResultNodeVisit(Base):
+    """One node visit within a result, in visit order."""
+
+    __tablename__ = "result_node_visits"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    result_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    run_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    node_id: Mapped[str] = mapped_column(String, nullable=False)
+
+
+class ResultMetricOutcome(Base):
+    """One metric verdict within a result (text or audio evaluation)."""
+
+    __tablename__ = "result_metric_outcomes"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    result_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    run_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    metric: Mapped[str] = mapped_column(Text, nullable=False)
+    passed: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    threshold: Mapped[float | None] = mapped_column(Float, nullable=True)
+    audio: Mapped[bool] = mapped_column(Boolean, default=False)
+
+
+class ResultToolCall(Base):
+    """One tool invocation within a result, in call order."""
+
+    __tablename__ = "result_tool_calls"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    result_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    run_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+
+
+class ConversationCheckpoint(Base):
+    """Latest `ConversationEngine` snapshot of an unfinished test result or chat.
+
+    Keyed by the result or call id, so each save replaces the previous one.
+    No ForeignKey for the same reason as the analytics tables above."""
+
+    __tablename__ = "conversation_checkpoints"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    # Set for test results, so deleting a run can drop its checkpoints.
+    run_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    data: Mapped[dict] = mapped_column(JSON, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
@@ -0,0 +1,243 @@
+"""Columnar Parquet export of runs for analytics and archival.
+
+Runs are written as four hive-partitioned datasets under one directory:
+
+    runs/agent_id=<id>/run_date=<YYYY-MM-DD>/part-*.parquet
+    results/...    one row per result
+    metrics/...    one row per metric outcome (audio metrics flagged)
+    messages/...   one row per transcript message
+
+`runs` has a row for every exported run, including runs with no results.
+Each input batch becomes its own set of part files, so memory is bounded by
+the batch size rather than by run size. DuckDB reads the layout directly:
+
+    SELECT * FROM read_parquet('<dir>/results/**/*.parquet', hive_partitioning = true)
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+import json
+from pathlib import Path
+from uuid import uuid4
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+
+DATASETS = ("runs", "results", "metrics", "messages")
+
+_PARTITIONING = ds.partitioning(
+    pa.schema([("agent_id", pa.string()), ("run_date", pa.string())]), flavor="hive"
+)
+
+_RUN_COLUMNS = [
+    ("agent_id", pa.string()),
+    ("run_date", pa.string()),
+    ("run_id", pa.string()),
+    ("result_id", pa.string()),
+]
+
+RUNS_SCHEMA = pa.schema(
+    [
+        ("agent_id", pa.string()),
+        ("run_date", pa.string()),
+        ("run_id", pa.string()),
+        ("started_at", pa.timestamp("us")),
+        ("completed_at", pa.timestamp("us")),
+    ]
+)
+
+RESULTS_SCHEMA = pa.schema(
+    [
+        *_RUN_COLUMNS,
+        ("run_started_at", pa.timestamp("us")),
+        ("run_completed_at", pa.timestamp("us")),
+        ("test_case_id", pa.string()),
+        ("call_id", pa.string()),
+        ("test_name", pa.string()),
+        ("status", pa.string()),
+        ("duration_ms", pa.int64()),
+        ("turn_count", pa.int64()),
+        ("end_reason", pa.string()),
+        ("error_message", pa.string()),
+        ("nodes_visited", pa.list_(pa.string())),
+        ("tools_called", pa.list_(pa.string())),
+        ("agent_model", pa.string()),
+        ("simulator_model", pa.string()),
+        ("judge_model", pa.string()),
+        ("metrics_total", pa.int64()),
+        ("metrics_passed", pa.int64()),
+        ("prompt_tokens", pa.int64()),
+        ("completion_tokens", pa.int64()),
+        ("cost_usd", pa.float64()),
+        ("created_at", pa.timestamp("us")),
+    ]
+)
+
+METRICS_SCHEMA = pa.schema(
+    [
+        *_RUN_COLUMNS,
+        ("test_name", pa.string()),
+        ("metric", pa.string()),
+        ("passed", pa.bool_()),
+        ("score", pa.float64()),
+        ("threshold", pa.float64()),
+        ("confidence", pa.float64()),
+        ("reasoning", pa.string()),
+        ("audio", pa.bool_()),
+    ]
+)
+
+MESSAGES_SCHEMA = pa.schema(
+    [
+        *_RUN_COLUMNS,
+        ("position", pa.int32()),
+        ("role", pa.string()),
+        ("content", pa.string()),
+        ("node_id", pa.string()),
+        ("timestamp", pa.string()),
+        ("metadata_json", pa.string()),
+    ]
+)
+
+_SCHEMAS = {
+    "runs": RUNS_SCHEMA,
+    "results": RESULTS_SCHEMA,
+    "metrics": METRICS_SCHEMA,
+    "messages": MESSAGES_SCHEMA,
+}
+
+
+def _run_date(started: datetime | None) -> str:
+    return started.date().isoformat() if started else "unknown"
+
+
+def flatten_run(run: dict) -> dict:
+    """The `runs` record for one `RunRepository.export_run_rows` item."""
+    return {
+        "agent_id": run["agent_id"],
+        "run_date": _run_date(run["started_at"]),
+        "run_id": run["id"],
+        "started_at": run["started_at"],
+        "completed_at": run["completed_at"],
+    }
+
+
+def flatten_result(row: dict) -> dict[str, list[dict]]:
+    """Split one exported result row into results/metrics/messages records.
+
+    `row` is a `RunRepository.iter_export_batches` item: the result columns
+    plus `agent_id`, `run_started_at` and `run_completed_at` from its run."""
+    started = row["run_started_at"]
+    keys = {
+        "agent_id": row["agent_id"],
+        "run_date": _run_date(started),
+        "run_id": row["run_id"],
+        "result_id": row["id"],
+    }
+
+    metrics = []
+    for audio, entries in ((False, row["metrics_json"]), (True, row["audio_metrics_json"])):
+        for m in entries or []:
+            metrics.append(
+                {
+                    **keys,
+                    "test_name": row["test_name"],
+                    "metric": m.get("metric"),
+                    "passed": m.get("passed"),
+                    "score": m.get("score"),
+                    "threshold": m.get("threshold"),
+                    "confidence": m.get("confidence"),
+                    "reasoning": m.get("reasoning"),
+                    "audio": audio,
+                }
+            )
+
+    messages = []
+    for position, m in enumerate(row["transcript_json"] or []):
+        metadata = m.get("metadata") or {}
+        timestamp = m.get("timestamp")
+        messages.append(
+            {
+                **keys,
+                "position": position,
+                "role": m.get("role"),
+                "content": m.get("content"),
+                "node_id": metadata.get("node_id"),
+                "timestamp": str(timestamp) if timestamp is not None else None,
+                "metadata_json": json.dumps(metadata, default=str) if metadata else None,
+            }
+        )
+
+    models = row["models_used"] or {}
+    judged = [m for m in metrics if not m["audio"]]
+    result = {
+        **keys,
+        "run_started_at": started,
+        "run_completed_at": row["run_completed_at"],
+        "test_case_id": row["test_case_id"],
+        "call_id": row["call_id"],
+        "test_name": row["test_name"],
+        "status": row["status"],
+        "duration_ms": row["duration_ms"],
+        "turn_count": row["turn_count"],
+        "end_reason": row["end_reason"],
+        "error_message": row["error_message"],
+        "nodes_visited": list(row["nodes_visited"] or []),
+        "tools_called": [t.get("name") for t in row["tools_called"] or []],
+        "agent_model": models.get("agent"),
+        "simulator_model": models.get("simulator"),
+        "judge_model": models.get("judge"),
+        "metrics_total": len(judged),
+        "metrics_passed": sum(1 for m in judged if m["passed"]),
+        "prompt_tokens": row["prompt_tokens"],
+        "completion_tokens": row["completion_tokens"],
+        "cost_usd": row["cost_usd"],
+        "created_at": row["created_at"],
+    }
+    return {"results": [result], "metrics": metrics, "messages": messages}
+
+
+def write_runs_parquet(
+    batches: Iterable[list[dict]], output_dir: Path, runs: Iterable[dict] = ()
+) -> dict:
+    """Stream batches of exported result rows into partitioned Parquet datasets.
+
+    `runs` are `RunRepository.export_run_rows` items, written to the `runs`
+    dataset whether or not they have results. Appends to any existing
+    datasets in `output_dir`: part files are named with a per-call token, so
+    repeated exports never overwrite each other. Returns row counts per
+    dataset, with `runs` counting every run written to any of them."""
+    output_dir = Path(output_dir)
+    token = uuid4().hex[:12]
+    counts = dict.fromkeys(DATASETS, 0)
+    run_ids: set[str] = set()
+
+    def write(name: str, rows: list[dict], part: str) -> None:
+        ds.write_dataset(
+            pa.Table.from_pylist(rows, schema=_SCHEMAS[name]),
+            output_dir / name,
+            format="parquet",
+            partitioning=_PARTITIONING,
+            basename_template=f"part-{token}-{part}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        counts[name] += len(rows)
+
+    run_rows = [flatten_run(run) for run in runs]
+    if run_rows:
+        run_ids.update(row["run_id"] for row in run_rows)
+        write("runs", run_rows, "runs")
+
+    for batch_no, batch in enumerate(batches):
+        records: dict[str, list[dict]] = {name: [] for name in DATASETS if name != "runs"}
+        for row in batch:
+            run_ids.add(row["run_id"])
+            for name, rows in flatten_result(row).items():
+                records[name].extend(rows)
+
+        for name, rows in records.items():
+            if rows:
+                write(name, rows, f"{batch_no:05d}")
+
+    return {**counts, "runs": len(run_ids), "output_dir": str(output_dir)}
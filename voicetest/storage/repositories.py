@@ -1,17 +1,27 @@
 """Repository classes for CRUD operations on each entity."""
 
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC
 from datetime import datetime
 import json
 import logging
 from pathlib import Path
+import threading
 from uuid import NAMESPACE_URL
 from uuid import uuid4
 from uuid import uuid5
 
 from pydantic import ValidationError
+from sqlalchemy import Date
+from sqlalchemy import and_
 from sqlalchemy import case
+from sqlalchemy import cast
 from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from voicetest.exceptions import StaleGraphSchemaError
@@ -22,14 +32,20 @@ from voicetest.models.agent import VariableExtraction
 from voicetest.models.agent import infer_node_type
 from voicetest.models.results import TestResult
 from voicetest.models.test_case import TestCase
+from voicetest.storage.linked_file import FileCache
 from voicetest.storage.linked_file import read_json
 from voicetest.storage.linked_file import write_json
 from voicetest.storage.models import Agent
 from voicetest.storage.models import Call
+from voicetest.storage.models import ConversationCheckpoint
 from voicetest.storage.models import Result
+from voicetest.storage.models import ResultMetricOutcome
+from voicetest.storage.models import ResultNodeVisit
+from voicetest.storage.models import ResultToolCall
 from voicetest.storage.models import Run
 from voicetest.storage.models import TestCase as TestCaseModel
 from voicetest.util.pathutil import resolve_path
+from voicetest.util.tracing import traced
 
 
 logger = logging.getLogger(__name__)
@@ -46,6 +62,116 @@ def _serialize_datetime(dt: datetime | None) -> str | None:
     return dt.isoformat() if dt else None
 
 
+# Parsed linked test files, shared across repository instances. Entries are
+# keyed by path and rebuilt when the file's mtime or size changes.
+_LINKED_TESTS_CACHE = FileCache()
+
+_ANALYTICS_MODELS = (ResultNodeVisit, ResultMetricOutcome, ResultToolCall)
+
+# Statuses that represent a finished, judged test. Imported transcripts,
+# cancelled tests and in-flight rows would skew failure rates.
+_JUDGED_STATUSES = ("pass", "fail", "error")
+
+
+def _metric_outcome_rows(
+    result_id: str, run_id: str, metrics: list[dict] | None, audio: bool
+) -> list[ResultMetricOutcome]:
+    """Build metric-outcome rows from serialized MetricResult dicts."""
+    return [
+        ResultMetricOutcome(
+            id=str(uuid4()),
+            result_id=result_id,
+            run_id=run_id,
+            metric=m.get("metric", ""),
+            passed=bool(m.get("passed")),
+            score=m.get("score"),
+            threshold=m.get("threshold"),
+            audio=audio,
+        )
+        for m in metrics or []
+    ]
+
+
+def _analytics_rows(
+    result_id: str,
+    run_id: str,
+    *,
+    nodes_visited: list[str] | None,
+    metrics: list[dict] | None,
+    audio_metrics: list[dict] | None,
+    tools: list[dict] | None,
+) -> list:
+    """Project a result's JSON payloads onto the normalized analytics tables."""
+    rows: list = [
+        ResultNodeVisit(
+            id=str(uuid4()),
+            result_id=result_id,
+            run_id=run_id,
+            position=position,
+            node_id=node_id,
+        )
+        for position, node_id in enumerate(nodes_visited or [])
+    ]
+    rows.extend(_metric_outcome_rows(result_id, run_id, metrics, audio=False))
+    rows.extend(_metric_outcome_rows(result_id, run_id, audio_metrics, audio=True))
+    rows.extend(
+        ResultToolCall(
+            id=str(uuid4()),
+            result_id=result_id,
+            run_id=run_id,
+            position=position,
+            name=t.get("name", ""),
+        )
+        for position, t in enumerate(tools or [])
+    )
+    return rows
+
+
+# Rows per multi-row INSERT in RunRepository.add_results; keeps the bound
+# parameter count well under Postgres' 65535 limit for the widest table.
+_INSERT_CHUNK_ROWS = 1000
+
+_EXPORT_RESULT_COLUMNS = (
+    "id",
+    "run_id",
+    "test_case_id",
+    "call_id",
+    "test_name",
+    "status",
+    "duration_ms",
+    "turn_count",
+    "end_reason",
+    "error_message",
+    "transcript_json",
+    "metrics_json",
+    "audio_metrics_json",
+    "nodes_visited",
+    "tools_called",
+    "models_used",
+    "prompt_tokens",
+    "completion_tokens",
+    "cost_usd",
+    "created_at",
+)
+
+
+def _usage_columns(result: TestResult) -> dict:
+    """Token and cost totals across a result's LLM roles, or all None without stats."""
+    if not result.llm_stats:
+        return {"prompt_tokens": None, "completion_tokens": None, "cost_usd": None}
+    stats = result.llm_stats.values()
+    return {
+        "prompt_tokens": sum(s.prompt_tokens for s in stats),
+        "completion_tokens": sum(s.completion_tokens for s in stats),
+        "cost_usd": round(sum(s.cost_usd for s in stats), 6),
+    }
+
+
+def _rate(numerator: int | None, denominator: int | None) -> float | None:
+    """Ratio of two counts, or None when the denominator is empty."""
+    return (numerator or 0) / denominator if denominator else None
+
+
 class AgentRepository:
     """CRUD operations for agents."""
 
@@ -164,15 +290,22 @@ class AgentRepository:
         agent = self.session.get(Agent, agent_id)
         if agent:
             try:
-                # FK-dependency order: results → runs → tests/calls → agent.
+                # FK-dependency order: analytics/results → runs → tests/calls → agent.
                 # DuckDB enforces FKs eagerly within a transaction, so each
                 # layer must be committed before deleting the parent layer.
                 run_ids = [r.id for r in agent.runs]
                 self.session.expire(agent)
                 if run_ids:
+                    for model in _ANALYTICS_MODELS:
+                        self.session.query(model).filter(model.run_id.in_(run_ids)).delete(
+                            synchronize_session=False
+                        )
                     self.session.query(Result).filter(Result.run_id.in_(run_ids)).delete(
                         synchronize_session=False
                     )
+                    self.session.query(ConversationCheckpoint).filter(
+                        ConversationCheckpoint.run_id.in_(run_ids)
+                    ).delete(synchronize_session=False)
                     self.session.commit()
                     self.session.query(Run).filter(Run.agent_id == agent_id).delete(
                         synchronize_session=False
@@ -181,6 +314,10 @@ class AgentRepository:
                 self.session.query(TestCaseModel).filter(TestCaseModel.agent_id == agent_id).delete(
                     synchronize_session=False
                 )
+                call_ids = self.session.query(Call.id).filter(Call.agent_id == agent_id)
+                self.session.query(ConversationCheckpoint).filter(
+                    ConversationCheckpoint.id.in_(call_ids.scalar_subquery())
+                ).delete(synchronize_session=False)
                 self.session.query(Call).filter(Call.agent_id == agent_id).delete(
                     synchronize_session=False
                 )
@@ -395,24 +532,47 @@ class TestCaseRepository:
 
         linked_tests = []
         for path in tests_paths:
-            try:
-                entries = read_json(path)
-            except (FileNotFoundError, json.JSONDecodeError):
-                logger.warning("Skipping unreadable tests file: %s", path)
-                continue
-
-            if not isinstance(entries, list):
-                logger.warning("Tests file is not a JSON array: %s", path)
-                continue
-
-            for index, entry in enumerate(entries):
-                test_id = str(uuid5(NAMESPACE_URL, f"{path}:{entry.get('name', index)}"))
-                linked_tests.append(
-                    self._linked_entry_to_dict(entry, test_id, agent_id, path, index)
-                )
+            parsed = self._load_linked_file(path)
+            if parsed is not None:
+                linked_tests.extend({**d, "agent_id": agent_id} for d in parsed[0])
 
         return db_tests + linked_tests
 
+    def find_linked(self, agent_id: str, tests_paths: list[str], test_id: str) -> dict | None:
+        """Look up a file-based test by ID across an agent's linked files."""
+        for path in tests_paths:
+            parsed = self._load_linked_file(path)
+            if parsed is not None and test_id in parsed[1]:
+                entries, index = parsed
+                return {**entries[index[test_id]], "agent_id": agent_id}
+        return None
+
+    def _load_linked_file(self, path: str) -> tuple[list[dict], dict[str, int]] | None:
+        """Cached `_parse_linked_file`, or None if the file is unreadable."""
+        try:
+            return _LINKED_TESTS_CACHE.get(path, self._parse_linked_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            logger.warning("Skipping unreadable tests file: %s", path)
+            return None
+
+    def _parse_linked_file(self, path: str) -> tuple[list[dict], dict[str, int]] | None:
+        """Parse a linked tests file into API dicts plus an id -> position index.
+
+        Dicts carry an empty `agent_id`; callers fill it in on a copy. Returns
+        None for files that are not a JSON array."""
+        entries = read_json(path)
+        if not isinstance(entries, list):
+            logger.warning("Tests file is not a JSON array: %s", path)
+            return None
+
+        tests = []
+        index: dict[str, int] = {}
+        for position, entry in enumerate(entries):
+            test_id = str(uuid5(NAMESPACE_URL, f"{path}:{entry.get('name', position)}"))
+            tests.append(self._linked_entry_to_dict(entry, test_id, "", path, position))
+            index.setdefault(test_id, position)
+        return tests, index
+
     def update_linked(
         self,
         test_id: str,
@@ -533,6 +693,12 @@ class TestCaseRepository:
         }
 
 
+# pg_try_advisory_lock key held while archiving: "voicetes" in ASCII.
+_ARCHIVE_LOCK_KEY = 0x766F696365746573
+# Stands in for the advisory lock on databases that only one process opens.
+_ARCHIVE_LOCK = threading.Lock()
+
+
 class RunRepository:
     """CRUD operations for runs and results."""
 
@@ -555,6 +721,17 @@ class RunRepository:
                 [t.model_dump() for t in result.tools_called] if result.tools_called else None
             ),
             "models": result.models_used.model_dump() if result.models_used else None,
+            "llm_stats": (
+                {role: stats.model_dump() for role, stats in result.llm_stats.items()}
+                if result.llm_stats
+                else None
+            ),
+            "timings": (
+                {name: span.model_dump() for name, span in result.timings.items()}
+                if result.timings
+                else None
+            ),
+            "usage": _usage_columns(result),
         }
 
     def list_all(self, limit: int = 50, user_id: str | None = None) -> list[dict]:
@@ -578,7 +755,8 @@ class RunRepository:
     def list_for_agent_with_summary(
         self, agent_id: str, limit: int = 50, user_id: str | None = None
     ) -> list[dict]:
-        """List runs for an agent with per-run result status counts.
+        """List runs for an agent with per-run result status counts and
+        token and cost totals.
 
         Uses a single grouped query to avoid N+1 on result-status counts."""
         counts = (
@@ -590,6 +768,10 @@ class RunRepository:
                 func.sum(case((Result.status == "error", 1), else_=0)).label("errors"),
                 func.sum(case((Result.status == "running", 1), else_=0)).label("running"),
                 func.sum(case((Result.status == "imported", 1), else_=0)).label("imported"),
+                func.sum(Result.prompt_tokens).label("prompt_tokens"),
+                func.sum(Result.completion_tokens).label("completion_tokens"),
+                func.sum(Result.cost_usd).label("cost_usd"),
+                func.sum(Result.llm_calls_saved).label("llm_calls_saved"),
             )
             .group_by(Result.run_id)
             .subquery()
@@ -617,6 +799,10 @@ class RunRepository:
                 "errors": row.errors or 0,
                 "running": row.running or 0,
                 "imported": row.imported or 0,
+                "prompt_tokens": row.prompt_tokens or 0,
+                "completion_tokens": row.completion_tokens or 0,
+                "cost_usd": round(row.cost_usd or 0.0, 6),
+                "llm_calls_saved": row.llm_calls_saved or 0,
                 "failed_names": [],
             }
             results.append(d)
@@ -639,6 +825,11 @@ class RunRepository:
 
         return results
 
+    def get(self, run_id: str) -> dict | None:
+        """Get a run record without its results."""
+        run = self.session.get(Run, run_id)
+        return self._run_to_dict(run) if run else None
+
     def get_with_results(self, run_id: str, user_id: str | None = None) -> dict | None:
         """Get a run with all its results, optionally checking ownership."""
         run = self.session.get(Run, run_id)
@@ -652,10 +843,21 @@ class RunRepository:
         result["results"] = results
         return result
 
-    def create(self, agent_id: str, user_id: str | None = None) -> dict:
-        """Create a new run."""
-        run_id = str(uuid4())
-        now = datetime.now(UTC)
+    @traced("db.create")
+    def create(
+        self,
+        agent_id: str,
+        user_id: str | None = None,
+        options: dict | None = None,
+        *,
+        run_id: str | None = None,
+        started_at: datetime | None = None,
+    ) -> dict:
+        """Create a new run, recording the options it runs with.
+
+        `run_id` and `started_at` default to a new id and the current time."""
+        run_id = run_id or str(uuid4())
+        now = started_at or datetime.now(UTC)
 
         run = Run(
             id=run_id,
@@ -663,6 +865,7 @@ class RunRepository:
             agent_id=agent_id,
             started_at=now,
             completed_at=None,
+            options_json=options,
         )
         self.session.add(run)
         self.session.commit()
@@ -675,6 +878,7 @@ class RunRepository:
             "completed_at": None,
         }
 
+    @traced("db.add_result")
     def add_result(
         self,
         run_id: str,
@@ -689,8 +893,47 @@ class RunRepository:
           - test runs: pass `test_case_id`
           - live calls: pass `call_id`
           - imported transcripts: pass neither (both columns null)"""
+        rows = self._new_result_rows(run_id, result, test_case_id=test_case_id, call_id=call_id)
+        self.session.add_all(rows)
+        self.session.commit()
+        return rows[0].id
+
+    @traced("db.add_results")
+    def add_results(self, run_id: str, results: Iterable[TestResult]) -> int:
+        """Add many imported results to a run in one transaction.
+
+        Rows are written with multi-row INSERT ... VALUES statements per
+        table instead of one ORM flush and commit per result; DuckDB runs
+        executemany row by row, so this is several times faster. Callers
+        bound memory by passing modest batches. Returns the number added."""
+        rows_by_table: dict[type, list[dict]] = {}
+        count = 0
+        try:
+            for result in results:
+                for row in self._new_result_rows(run_id, result):
+                    values = {k: v for k, v in vars(row).items() if not k.startswith("_")}
+                    rows_by_table.setdefault(type(row), []).append(values)
+                count += 1
+            for model, rows in rows_by_table.items():
+                for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+                    chunk = rows[start : start + _INSERT_CHUNK_ROWS]
+                    self.session.execute(insert(model).values(chunk))
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return count
+
+    def _new_result_rows(
+        self,
+        run_id: str,
+        result: TestResult,
+        *,
+        test_case_id: str | None = None,
+        call_id: str | None = None,
+    ) -> list:
+        """Build a Result row followed by its analytics rows, uncommitted."""
         result_id = str(uuid4())
-        now = datetime.now(UTC)
         data = self._serialize_result_data(result)
 
         db_result = Result(
@@ -710,11 +953,13 @@ class RunRepository:
             nodes_visited=result.nodes_visited,
             tools_called=data["tools"],
             models_used=data["models"],
-            created_at=now,
+            llm_stats=data["llm_stats"],
+            timings=data["timings"],
+            **data["usage"],
+            llm_calls_saved=result.llm_calls_saved,
+            created_at=datetime.now(UTC),
         )
-        self.session.add(db_result)
-        self.session.commit()
-        return result_id
+        return [db_result, *self._result_analytics_rows(result_id, run_id, result, data)]
 
     def add_result_from_call(
         self,
@@ -725,6 +970,7 @@ class RunRepository:
         """Back-compat alias — prefer add_result(run_id, result, call_id=...)."""
         return self.add_result(run_id, result, call_id=call_id)
 
+    @traced("db.create_pending_result")
     def create_pending_result(self, run_id: str, test_case_id: str, test_name: str) -> str:
         """Create a pending result for an in-progress test."""
         result_id = str(uuid4())
@@ -743,6 +989,7 @@ class RunRepository:
         self.session.commit()
         return result_id
 
+    @traced("db.update_transcript")
     def update_transcript(self, result_id: str, transcript: list) -> None:
         """Update the transcript for an in-progress result."""
         result = self.session.get(Result, result_id)
@@ -750,6 +997,7 @@ class RunRepository:
             result.transcript_json = [m.model_dump() for m in transcript]
             self.session.commit()
 
+    @traced("db.mark_result_error")
     def mark_result_error(self, result_id: str, error_message: str) -> None:
         """Mark a result as error with a message."""
         result = self.session.get(Result, result_id)
@@ -758,6 +1006,7 @@ class RunRepository:
             result.error_message = error_message
             self.session.commit()
 
+    @traced("db.mark_result_cancelled")
     def mark_result_cancelled(self, result_id: str) -> None:
         """Mark a result as cancelled before it started."""
         result = self.session.get(Result, result_id)
@@ -766,6 +1015,7 @@ class RunRepository:
             result.error_message = "Cancelled before starting"
             self.session.commit()
 
+    @traced("db.complete_result")
     def complete_result(self, result_id: str, result: TestResult) -> None:
         """Update a pending result with final data."""
         db_result = self.session.get(Result, result_id)
@@ -785,9 +1035,21 @@ class RunRepository:
         db_result.nodes_visited = result.nodes_visited
         db_result.tools_called = data["tools"]
         db_result.models_used = data["models"]
+        db_result.llm_stats = data["llm_stats"]
+        db_result.timings = data["timings"]
+        db_result.llm_calls_saved = result.llm_calls_saved
+        for column, value in data["usage"].items():
+            setattr(db_result, column, value)
+        self._replace_analytics(result_id, db_result.run_id, result, data)
+        # A test stopped by a turn timeout keeps its checkpoint so it can be resumed.
+        if result.end_reason != "turn_timeout":
+            self.session.query(ConversationCheckpoint).filter(
+                ConversationCheckpoint.id == result_id
+            ).delete(synchronize_session=False)
 
         self.session.commit()
 
+    @traced("db.update_audio_eval")
     def update_audio_eval(
         self,
         result_id: str,
@@ -803,8 +1065,67 @@ class RunRepository:
         db_result.audio_metrics_json = (
             [m.model_dump() for m in audio_metrics] if audio_metrics else None
         )
+        self.session.query(ResultMetricOutcome).filter(
+            ResultMetricOutcome.result_id == result_id,
+            ResultMetricOutcome.audio.is_(True),
+        ).delete(synchronize_session=False)
+        self.session.add_all(
+            _metric_outcome_rows(
+                result_id, db_result.run_id, db_result.audio_metrics_json, audio=True
+            )
+        )
+        self.session.commit()
+
+    def get_options(self, run_id: str) -> dict | None:
+        """The options a run was started with (None for runs from before they were kept)."""
+        run = self.session.get(Run, run_id)
+        return run.options_json if run else None
+
+    def find_incomplete_run_ids(self) -> list[str]:
+        """Ids of runs never marked complete, oldest first."""
+        query = self.session.query(Run.id).filter(Run.completed_at.is_(None))
+        return [r.id for r in query.order_by(Run.started_at).all()]
+
+    @traced("db.reopen")
+    def reopen(self, run_id: str, result_ids: list[str]) -> None:
+        """Mark a run incomplete again and return the given results to `running`.
+
+        Transcripts are kept for results with a checkpoint, which continue
+        from it, and cleared for the rest, which start over."""
+        run = self.session.get(Run, run_id)
+        if not run:
+            return
+        run.completed_at = None
+        checkpointed = self.get_checkpoints(result_ids).keys()
+        for result_id in result_ids:
+            result = self.session.get(Result, result_id)
+            if result:
+                result.status = "running"
+                result.error_message = None
+                if result_id not in checkpointed:
+                    result.transcript_json = []
+        self.session.commit()
+
+    @traced("db.save_checkpoint")
+    def save_checkpoint(self, result_id: str, run_id: str, data: dict) -> None:
+        """Store the latest conversation checkpoint of an in-progress result."""
+        self.session.merge(
+            ConversationCheckpoint(
+                id=result_id, run_id=run_id, data=data, updated_at=datetime.now(UTC)
+            )
+        )
         self.session.commit()
 
+    def get_checkpoints(self, result_ids: list[str]) -> dict[str, dict]:
+        """Stored checkpoints by result id, for the results that have one."""
+        if not result_ids:
+            return {}
+        rows = self.session.query(ConversationCheckpoint.id, ConversationCheckpoint.data).filter(
+            ConversationCheckpoint.id.in_(result_ids)
+        )
+        return {row.id: row.data for row in rows}
+
+    @traced("db.complete")
     def complete(self, run_id: str) -> None:
         """Mark a run as completed."""
         run = self.session.get(Run, run_id)
@@ -812,17 +1133,331 @@ class RunRepository:
             run.completed_at = datetime.now(UTC)
             self.session.commit()
 
+    @contextmanager
+    def archive_lock(self) -> Generator[bool]:
+        """Hold the database-wide archiving lock if it is free; yields whether it was.
+
+        On PostgreSQL this is an advisory lock on a connection of its own, so
+        every process sharing the database sees it. Other databases are only
+        opened by one process, where a process-wide lock is enough."""
+        engine = self.session.get_bind()
+        if engine.dialect.name != "postgresql":
+            acquired = _ARCHIVE_LOCK.acquire(blocking=False)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    _ARCHIVE_LOCK.release()
+            return
+
+        params = {"key": _ARCHIVE_LOCK_KEY}
+        with engine.connect() as conn:
+            acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), params).scalar()
+            try:
+                yield bool(acquired)
+            finally:
+                if acquired:
+                    conn.execute(text("SELECT pg_advisory_unlock(:key)"), params)
+
+    @traced("db.delete")
     def delete(self, run_id: str) -> None:
         """Delete a run and all its results."""
         run = self.session.get(Run, run_id)
         if run:
+            for model in _ANALYTICS_MODELS:
+                self.session.query(model).filter(model.run_id == run_id).delete(
+                    synchronize_session=False
+                )
             self.session.query(Result).filter(Result.run_id == run_id).delete(
                 synchronize_session=False
             )
+            self.session.query(ConversationCheckpoint).filter(
+                ConversationCheckpoint.run_id == run_id
+            ).delete(synchronize_session=False)
             self.session.commit()
             self.session.query(Run).filter(Run.id == run_id).delete(synchronize_session=False)
             self.session.commit()
 
+    def _result_analytics_rows(
+        self, result_id: str, run_id: str, result: TestResult, data: dict
+    ) -> list:
+        """Analytics rows for a TestResult and its `_serialize_result_data` payload."""
+        return _analytics_rows(
+            result_id,
+            run_id,
+            nodes_visited=result.nodes_visited,
+            metrics=data["metrics"],
+            audio_metrics=data["audio_metrics"],
+            tools=data["tools"],
+        )
+
+    def _replace_analytics(
+        self, result_id: str, run_id: str, result: TestResult, data: dict
+    ) -> None:
+        """Rewrite a result's analytics rows. Caller commits."""
+        for model in _ANALYTICS_MODELS:
+            self.session.query(model).filter(model.result_id == result_id).delete(
+                synchronize_session=False
+            )
+        self.session.add_all(self._result_analytics_rows(result_id, run_id, result, data))
+
+    def backfill_analytics(self, batch_size: int = 500) -> dict:
+        """Populate analytics tables for results written before they existed.
+
+        Scans results that have no analytics rows yet in primary-key order,
+        one batch per commit, selecting only the JSON columns it projects so
+        transcripts never load. Idempotent — backfilled results drop out of
+        the scan on the next call."""
+        has_rows = [
+            self.session.query(model).filter(model.result_id == Result.id).exists()
+            for model in _ANALYTICS_MODELS
+        ]
+        scanned = 0
+        backfilled = 0
+        last_id = ""
+        while True:
+            rows = (
+                self.session.query(
+                    Result.id,
+                    Result.run_id,
+                    Result.nodes_visited,
+                    Result.metrics_json,
+                    Result.audio_metrics_json,
+                    Result.tools_called,
+                )
+                .filter(Result.id > last_id, *[~e for e in has_rows])
+                .order_by(Result.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            for row in rows:
+                new_rows = _analytics_rows(
+                    row.id,
+                    row.run_id,
+                    nodes_visited=row.nodes_visited,
+                    metrics=row.metrics_json,
+                    audio_metrics=row.audio_metrics_json,
+                    tools=row.tools_called,
+                )
+                if new_rows:
+                    self.session.add_all(new_rows)
+                    backfilled += 1
+            self.session.commit()
+            scanned += len(rows)
+            last_id = rows[-1].id
+
+        return {"results_scanned": scanned, "results_backfilled": backfilled}
+
+    def recent_run_ids(self, agent_id: str, limit: int = 30) -> list[str]:
+        """IDs of an agent's most recent runs, newest first."""
+        rows = (
+            self.session.query(Run.id)
+            .filter(Run.agent_id == agent_id)
+            .order_by(Run.started_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [r.id for r in rows]
+
+    def node_stats(self, run_ids: list[str]) -> list[dict]:
+        """Per-node visit counts and failure rates across the given runs.
+
+        A result counts toward a node's failures if it visited the node and
+        ended in fail/error. Sorted by failure rate, worst first."""
+        if not run_ids:
+            return []
+        failed = case((Result.status.in_(["fail", "error"]), ResultNodeVisit.result_id))
+        results = func.count(func.distinct(ResultNodeVisit.result_id))
+        failures = func.count(func.distinct(failed))
+        rows = (
+            self.session.query(
+                ResultNodeVisit.node_id,
+                func.count().label("visits"),
+                results.label("results"),
+                failures.label("failures"),
+            )
+            .join(Result, Result.id == ResultNodeVisit.result_id)
+            .filter(
+                ResultNodeVisit.run_id.in_(run_ids),
+                Result.status.in_(_JUDGED_STATUSES),
+            )
+            .group_by(ResultNodeVisit.node_id)
+            .order_by((failures * 1.0 / results).desc(), ResultNodeVisit.node_id)
+            .all()
+        )
+        return [
+            {
+                "node_id": r.node_id,
+                "visits": r.visits,
+                "results": r.results,
+                "failures": r.failures,
+                "failure_rate": _rate(r.failures, r.results),
+            }
+            for r in rows
+        ]
+
+    def metric_stats(self, run_ids: list[str]) -> list[dict]:
+        """Per-metric pass rates across the given runs (`run_ids` newest first).
+
+        Splits each metric's evaluations into the latest run versus the
+        earlier runs so a regression shows up as a negative `delta`. Sorted
+        most-regressed first; metrics absent from one side sort last."""
+        if not run_ids:
+            return []
+        latest = run_ids[0]
+        in_latest = ResultMetricOutcome.run_id == latest
+        passed = ResultMetricOutcome.passed.is_(True)
+        rows = (
+            self.session.query(
+                ResultMetricOutcome.metric,
+                func.count().label("evaluations"),
+                func.sum(case((passed, 1), else_=0)).label("passed"),
+                func.avg(ResultMetricOutcome.score).label("avg_score"),
+                func.sum(case((in_latest, 1), else_=0)).label("latest_evaluations"),
+                func.sum(case((and_(in_latest, passed), 1), else_=0)).label("latest_passed"),
+            )
+            .filter(
+                ResultMetricOutcome.run_id.in_(run_ids),
+                ResultMetricOutcome.audio.is_(False),
+            )
+            .group_by(ResultMetricOutcome.metric)
+            .all()
+        )
+        stats = []
+        for r in rows:
+            previous_evaluations = r.evaluations - (r.latest_evaluations or 0)
+            previous_passed = (r.passed or 0) - (r.latest_passed or 0)
+            latest_rate = _rate(r.latest_passed, r.latest_evaluations)
+            previous_rate = _rate(previous_passed, previous_evaluations)
+            delta = (
+                latest_rate - previous_rate
+                if latest_rate is not None and previous_rate is not None
+                else None
+            )
+            stats.append(
+                {
+                    "metric": r.metric,
+                    "evaluations": r.evaluations,
+                    "passed": r.passed or 0,
+                    "pass_rate": _rate(r.passed, r.evaluations),
+                    "avg_score": float(r.avg_score) if r.avg_score is not None else None,
+                    "latest_pass_rate": latest_rate,
+                    "previous_pass_rate": previous_rate,
+                    "delta": delta,
+                }
+            )
+        stats.sort(key=lambda m: (m["delta"] is None, m["delta"] or 0.0, m["metric"]))
+        return stats
+
+    def tool_stats(self, run_ids: list[str]) -> list[dict]:
+        """Per-tool call counts across the given runs, most-called first."""
+        if not run_ids:
+            return []
+        rows = (
+            self.session.query(
+                ResultToolCall.name,
+                func.count().label("calls"),
+                func.count(func.distinct(ResultToolCall.result_id)).label("results"),
+            )
+            .filter(ResultToolCall.run_id.in_(run_ids))
+            .group_by(ResultToolCall.name)
+            .order_by(func.count().desc(), ResultToolCall.name)
+            .all()
+        )
+        return [{"name": r.name, "calls": r.calls, "results": r.results} for r in rows]
+
+    def usage_by_day(self, agent_id: str, since: datetime | None = None) -> list[dict]:
+        """Per-day run, result, token and cost totals for an agent, oldest first.
+
+        Days are the UTC dates the runs started; results recorded before
+        token accounting existed count toward `results` but add no usage."""
+        day = cast(Run.started_at, Date)
+        query = (
+            self.session.query(
+                day.label("day"),
+                func.count(func.distinct(Run.id)).label("runs"),
+                func.count(Result.id).label("results"),
+                func.sum(Result.prompt_tokens).label("prompt_tokens"),
+                func.sum(Result.completion_tokens).label("completion_tokens"),
+                func.sum(Result.cost_usd).label("cost_usd"),
+            )
+            .join(Result, Result.run_id == Run.id)
+            .filter(Run.agent_id == agent_id)
+        )
+        if since is not None:
+            query = query.filter(Run.started_at >= since)
+        rows = query.group_by(day).order_by(day).all()
+        return [
+            {
+                "date": r.day.isoformat(),
+                "runs": r.runs,
+                "results": r.results,
+                "prompt_tokens": r.prompt_tokens or 0,
+                "completion_tokens": r.completion_tokens or 0,
+                "cost_usd": round(r.cost_usd or 0.0, 6),
+            }
+            for r in rows
+        ]
+
+    def find_run_ids(
+        self, *, agent_id: str | None = None, started_before: datetime | None = None
+    ) -> list[str]:
+        """IDs of runs matching the filters, oldest first.
+
+        `started_before` only matches completed runs so in-flight runs are
+        never picked up for archival."""
+        query = self.session.query(Run.id)
+        if agent_id is not None:
+            query = query.filter(Run.agent_id == agent_id)
+        if started_before is not None:
+            query = query.filter(Run.started_at < started_before, Run.completed_at.isnot(None))
+        return [r.id for r in query.order_by(Run.started_at).all()]
+
+    def export_run_rows(self, run_ids: list[str]) -> list[dict]:
+        """The given runs' own columns as plain dicts, for the `runs` export dataset."""
+        if not run_ids:
+            return []
+        rows = (
+            self.session.query(Run.id, Run.agent_id, Run.started_at, Run.completed_at)
+            .filter(Run.id.in_(run_ids))
+            .order_by(Run.started_at)
+            .all()
+        )
+        return [row._asdict() for row in rows]
+
+    def iter_export_batches(
+        self, run_ids: list[str], batch_size: int = 500
+    ) -> Iterator[list[dict]]:
+        """Yield the given runs' results as plain dicts, `batch_size` at a time.
+
+        Keyset-paginates on `Result.id` and selects plain columns, so only one
+        batch of transcripts is held in memory and none enter the identity map. Each row
+        carries its run's `agent_id`, `run_started_at` and `run_completed_at`."""
+        if not run_ids:
+            return
+        columns = [getattr(Result, name) for name in _EXPORT_RESULT_COLUMNS]
+        last_id = ""
+        while True:
+            rows = (
+                self.session.query(
+                    *columns,
+                    Run.agent_id,
+                    Run.started_at.label("run_started_at"),
+                    Run.completed_at.label("run_completed_at"),
+                )
+                .join(Run, Run.id == Result.run_id)
+                .filter(Result.run_id.in_(run_ids), Result.id > last_id)
+                .order_by(Result.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                return
+            last_id = rows[-1].id
+            yield [row._asdict() for row in rows]
+
     def _run_to_dict(self, run: Run) -> dict:
         """Convert Run model to dictionary."""
         return {
@@ -852,6 +1487,12 @@ class RunRepository:
             "nodes_visited": result.nodes_visited,
             "tools_called": result.tools_called,
             "models_used": result.models_used,
+            "llm_stats": result.llm_stats,
+            "timings": result.timings,
+            "prompt_tokens": result.prompt_tokens,
+            "completion_tokens": result.completion_tokens,
+            "cost_usd": result.cost_usd,
+            "llm_calls_saved": result.llm_calls_saved or 0,
             "created_at": _serialize_datetime(result.created_at),
         }
 
@@ -922,6 +1563,7 @@ class CallRepository:
 
         call.status = "ended"
         call.ended_at = datetime.now(UTC)
+        self._delete_checkpoint(call_id)
         self.session.commit()
         return self.get(call_id)
 
@@ -929,9 +1571,27 @@ class CallRepository:
         """Delete a call."""
         call = self.session.get(Call, call_id)
         if call:
+            self._delete_checkpoint(call_id)
             self.session.delete(call)
             self.session.commit()
 
+    def save_checkpoint(self, call_id: str, data: dict) -> None:
+        """Store the latest conversation checkpoint of an active chat."""
+        self.session.merge(
+            ConversationCheckpoint(id=call_id, data=data, updated_at=datetime.now(UTC))
+        )
+        self.session.commit()
+
+    def get_checkpoint(self, call_id: str) -> dict | None:
+        """The chat's stored checkpoint, if it has one."""
+        checkpoint = self.session.get(ConversationCheckpoint, call_id)
+        return checkpoint.data if checkpoint else None
+
+    def _delete_checkpoint(self, call_id: str) -> None:
+        self.session.query(ConversationCheckpoint).filter(
+            ConversationCheckpoint.id == call_id
+        ).delete(synchronize_session=False)
+
     def _to_dict(self, call: Call) -> dict:
         """Convert Call model to dictionary."""
         return {
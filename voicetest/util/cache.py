@@ -1,15 +1,47 @@
 """Pluggable DSPy cache backend."""
 
+import asyncio
+import atexit
+from collections.abc import AsyncGenerator
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+import hashlib
+import itertools
+import json
 import logging
+from pathlib import Path
+import sys
 import threading
 from typing import Any
 from typing import Protocol
 from typing import runtime_checkable
+import uuid
+import zlib
 
 from cachetools import LRUCache
+from cachetools import TTLCache
 import cloudpickle
+import diskcache
 import dspy
+from dspy.clients import DISK_CACHE_DIR
 from dspy.clients.cache import Cache
+from pydantic import BaseModel
+
+from voicetest.config import get_cache_dir
+from voicetest.config import get_manifest_dir
+from voicetest.exceptions import CacheMissError
 
 
 try:
@@ -43,11 +75,210 @@ def _require_boto3() -> None:
         raise ImportError("boto3 is required for S3 cache backend. Install it with: uv add boto3")
 
 
+# Compressed payloads carry this prefix; anything else is a bare cloudpickle
+# written before compression existed, so old S3 objects stay readable.
+_COMPRESSED_MAGIC = b"VTZ1"
+
+
+def _dumps(value: Any, compress: bool = False) -> bytes:
+    data = cloudpickle.dumps(value)
+    return _COMPRESSED_MAGIC + zlib.compress(data) if compress else data
+
+
+def _loads(data: bytes) -> Any:
+    if data.startswith(_COMPRESSED_MAGIC):
+        data = zlib.decompress(data[len(_COMPRESSED_MAGIC) :])
+    return cloudpickle.loads(data)
+
+
+def _value_size(value: Any) -> int:
+    """Approximate footprint of a cached value by its pickled length."""
+    try:
+        return len(cloudpickle.dumps(value))
+    except Exception:  # noqa: BLE001 — an unpicklable value still needs a size
+        return sys.getsizeof(value)
+
+
+class _CountingLRUCache(LRUCache):
+    """LRUCache that counts the items it evicts to stay under maxsize."""
+
+    def __init__(self, maxsize: int, getsizeof=None):
+        super().__init__(maxsize, getsizeof)
+        self.evictions = 0
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+
+class SizedMemoryCache:
+    """Byte-bounded LRU for the memory tier, with hit/miss/eviction counts.
+
+    Replaces DSPy's entry-count LRU: values are sized by their pickled
+    length, so a few large ChainOfThought predictions cannot hold the
+    process at gigabytes. A value larger than the whole budget is skipped
+    (counted as `rejected`) rather than raising. Supports both lookup
+    styles DSPy's Cache uses: `get()`, and `in` followed by `[key]`."""
+
+    def __init__(self, max_bytes: int):
+        self._lru = _CountingLRUCache(maxsize=max_bytes, getsizeof=_value_size)
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+
+    def peek(self, key: str) -> bool:
+        """Membership test that does not count as a lookup."""
+        return key in self._lru
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._lru:
+            return True
+        self.misses += 1
+        return False
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            value = self._lru[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        try:
+            self._lru[key] = value
+        except ValueError:
+            # cachetools refuses values larger than maxsize.
+            self._lru.pop(key, None)
+            self.rejected += 1
+
+    def __delitem__(self, key: str) -> None:
+        del self._lru[key]
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        return self._lru.pop(key, default)
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def clear(self) -> None:
+        self._lru.clear()
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "entries": len(self._lru),
+            "bytes": int(self._lru.currsize),
+            "max_bytes": int(self._lru.maxsize),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self._lru.evictions,
+            "rejected": self.rejected,
+        }
+
+
+class DiskCacheBackend:
+    """diskcache store with an optional TTL and hit/miss/eviction counts.
+
+    Wraps a diskcache Cache or FanoutCache: DSPy's own disk tier, or the
+    tiered backend's local store. Entries expire `ttl` seconds after they
+    are written. diskcache normally culls inside every write, out of sight;
+    here its cull limit is set to 0 and `cull()` runs every `cull_every`
+    writes so removed entries can be counted. Between culls the store may
+    overshoot its size limit by up to that many entries."""
+
+    def __init__(
+        self,
+        store: diskcache.Cache | diskcache.FanoutCache,
+        ttl: float = 0,
+        cull_every: int = 32,
+    ):
+        self.store = store
+        self.ttl = ttl or None
+        self._cull_every = cull_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        store.reset("cull_limit", 0)
+
+    def _count(self, stat: str, n: int = 1) -> None:
+        with self._lock:
+            self.stats[stat] += n
+
+    def cull(self) -> int:
+        """Drop expired entries, then evict down to the size limit."""
+        expired = self.store.expire()
+        evicted = self.store.cull()
+        self._count("expired", expired)
+        self._count("evictions", evicted)
+        return expired + evicted
+
+    def __contains__(self, key: str) -> bool:
+        if key in self.store:
+            return True
+        self._count("misses")
+        return False
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            value = self.store[key]
+        except KeyError:
+            self._count("misses")
+            raise
+        self._count("hits")
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.store.set(key, value, expire=self.ttl)
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self._cull_every == 0
+        if due:
+            self.cull()
+
+    def __delitem__(self, key: str) -> None:
+        del self.store[key]
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def get(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        self[key] = value
+
+    def delete(self, key: str) -> None:
+        self.store.delete(key)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        return {
+            "entries": len(self.store),
+            "bytes": self.store.volume(),
+            "ttl_seconds": self.ttl,
+            **stats,
+        }
+
+
 class S3CacheBackend:
     """S3-backed cache backend using cloudpickle for serialization.
 
     S3 key format: {prefix}{cache_key}
-    Error handling: GET/HEAD failures → cache miss, PUT failures → log + skip."""
+    Error handling: GET/HEAD failures → cache miss, PUT failures → log + skip.
+    With `compress=True` values are zlib-compressed on write; reads accept
+    both forms."""
 
     def __init__(
         self,
@@ -55,15 +286,104 @@ class S3CacheBackend:
         prefix: str = "",
         region: str | None = None,
         client: Any = None,
+        compress: bool = False,
     ):
         _require_boto3()
         self.bucket = bucket
         self.prefix = prefix
+        self.compress = compress
         self._client = client or boto3.client("s3", region_name=region)
 
     def _s3_key(self, key: str) -> str:
         return f"{self.prefix}{key}"
 
+    def fetch(self, key: str) -> bytes | None:
+        """One GET for the raw payload; None if the object does not exist.
+
+        The 404 doubles as the existence check, so no HEAD is needed."""
+        try:
+            response = self._client.get_object(Bucket=self.bucket, Key=self._s3_key(key))
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code not in ("404", "NoSuchKey"):
+                logger.warning("Cache read failed for key %s: %s", key, e)
+            return None
+        return response["Body"].read()
+
+    def store(self, key: str, data: bytes) -> None:
+        """PUT a raw payload; failures are logged and skipped."""
+        try:
+            self._client.put_object(
+                Bucket=self.bucket,
+                Key=self._s3_key(key),
+                Body=data,
+                ContentType="application/octet-stream",
+            )
+        except (ClientError, Exception):
+            logger.warning("Failed to write cache key %s", key)
+
+    def list_objects(self, subprefix: str = "") -> Iterator[tuple[str, datetime]]:
+        """Yield (key, last_modified) under `prefix + subprefix`, keys relative to prefix."""
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._s3_key(subprefix)):
+            for obj in page.get("Contents", []):
+                yield obj["Key"][len(self.prefix) :], obj["LastModified"]
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete keys in batches of 1000 (the DeleteObjects limit); returns the count removed."""
+        deleted = 0
+        for chunk in itertools.batched(keys, 1000):
+            response = self._client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": self._s3_key(k)} for k in chunk], "Quiet": True},
+            )
+            errors = response.get("Errors", [])
+            for error in errors:
+                logger.warning("Failed to delete cache key %s: %s", error["Key"], error["Message"])
+            deleted += len(chunk) - len(errors)
+        return deleted
+
+    def ensure_expiry(self, days: int) -> bool:
+        """Install a lifecycle rule expiring objects under the prefix after `days`.
+
+        The rule is keyed by prefix, so other rules on the bucket are kept.
+        With an empty prefix the rule would expire the whole bucket, so nothing
+        is installed. Returns True when the bucket configuration changed."""
+        if not self.prefix:
+            logger.warning(
+                "Not setting cache expiry on %s: with no s3_prefix it would expire "
+                "every object in the bucket",
+                self.bucket,
+            )
+            return False
+        rule = {
+            "ID": f"voicetest-cache-expiry:{self.prefix}"[:255],
+            "Filter": {"Prefix": self.prefix},
+            "Status": "Enabled",
+            "Expiration": {"Days": days},
+        }
+        try:
+            response = self._client.get_bucket_lifecycle_configuration(Bucket=self.bucket)
+            rules = response.get("Rules", [])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchLifecycleConfiguration":
+                logger.warning("Failed to read lifecycle rules for %s: %s", self.bucket, e)
+                return False
+            rules = []
+
+        existing = next((r for r in rules if r.get("ID") == rule["ID"]), None)
+        if existing is not None and all(existing.get(k) == v for k, v in rule.items()):
+            return False
+        rules = [r for r in rules if r.get("ID") != rule["ID"]] + [rule]
+        try:
+            self._client.put_bucket_lifecycle_configuration(
+                Bucket=self.bucket, LifecycleConfiguration={"Rules": rules}
+            )
+        except ClientError as e:
+            logger.warning("Failed to set cache expiry on %s: %s", self.bucket, e)
+            return False
+        return True
+
     def __contains__(self, key: str) -> bool:
         try:
             self._client.head_object(Bucket=self.bucket, Key=self._s3_key(key))
@@ -76,22 +396,13 @@ class S3CacheBackend:
             return False
 
     def __getitem__(self, key: str) -> Any:
-        try:
-            response = self._client.get_object(Bucket=self.bucket, Key=self._s3_key(key))
-            return cloudpickle.loads(response["Body"].read())
-        except ClientError as e:
-            raise KeyError(key) from e
+        data = self.fetch(key)
+        if data is None:
+            raise KeyError(key)
+        return _loads(data)
 
     def __setitem__(self, key: str, value: Any) -> None:
-        try:
-            self._client.put_object(
-                Bucket=self.bucket,
-                Key=self._s3_key(key),
-                Body=cloudpickle.dumps(value),
-                ContentType="application/octet-stream",
-            )
-        except (ClientError, Exception):
-            logger.warning("Failed to write cache key %s", key)
+        self.store(key, _dumps(value, self.compress))
 
     def __delitem__(self, key: str) -> None:
         try:
@@ -114,7 +425,293 @@ class S3CacheBackend:
         del self[key]
 
 
-class S3Cache(Cache):
+class TieredCacheBackend:
+    """Bounded local disk tier in front of an S3CacheBackend.
+
+    Used as an S3Cache's `disk_cache`, behind DSPy's in-memory LRU, giving
+    memory → local disk → S3. Lookups hit the local store first and fall
+    through to a single S3 GET; S3 hits are copied down, and misses are
+    remembered for `negative_ttl` seconds so repeated lookups of an absent
+    key stay local. Writes land on disk at once and reach S3 from a
+    background thread. Both tiers hold compressed payloads. Local entries
+    can be given a TTL (`local_ttl`) on top of the size bound."""
+
+    def __init__(
+        self,
+        remote: S3CacheBackend,
+        local_dir: str | Path,
+        local_max_bytes: int = 1 << 30,
+        negative_ttl: float = 30.0,
+        async_writes: bool = True,
+        local_ttl: float = 0,
+    ):
+        self.remote = remote
+        self.local = DiskCacheBackend(
+            diskcache.Cache(
+                str(local_dir),
+                size_limit=local_max_bytes,
+                eviction_policy="least-recently-used",
+            ),
+            ttl=local_ttl,
+        )
+        self._misses: TTLCache | None = (
+            TTLCache(maxsize=100_000, ttl=negative_ttl) if negative_ttl > 0 else None
+        )
+        self._lock = threading.Lock()
+        self._writer = (
+            ThreadPoolExecutor(max_workers=4, thread_name_prefix="voicetest-cache-write")
+            if async_writes
+            else None
+        )
+        self._pending: set[Future] = set()
+        self.stats = {"local_hits": 0, "remote_hits": 0, "misses": 0, "negative_hits": 0}
+        atexit.register(self.flush)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _lookup(self, key: str) -> bytes | None:
+        data = self.local.get(key)
+        if data is not None:
+            self._count("local_hits")
+            return data
+
+        if self._misses is not None:
+            with self._lock:
+                if key in self._misses:
+                    self.stats["negative_hits"] += 1
+                    return None
+
+        data = self.remote.fetch(key)
+        if data is None:
+            self._count("misses")
+            if self._misses is not None:
+                with self._lock:
+                    self._misses[key] = True
+            return None
+
+        self._count("remote_hits")
+        self.local.set(key, data)
+        return data
+
+    def _write_remote(self, key: str, data: bytes) -> None:
+        if self._writer is None:
+            self.remote.store(key, data)
+            return
+        future = self._writer.submit(self.remote.store, key, data)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+
+    def _discard_pending(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until queued S3 writes finish (also runs at interpreter exit)."""
+        with self._lock:
+            pending = list(self._pending)
+        if pending:
+            wait(pending, timeout=timeout)
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not None
+
+    def __getitem__(self, key: str) -> Any:
+        data = self._lookup(key)
+        if data is None:
+            raise KeyError(key)
+        try:
+            return _loads(data)
+        except Exception as e:
+            self.local.delete(key)
+            raise KeyError(key) from e
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        data = _dumps(value, compress=True)
+        self.local.set(key, data)
+        if self._misses is not None:
+            with self._lock:
+                self._misses.pop(key, None)
+        self._write_remote(key, data)
+
+    def __delitem__(self, key: str) -> None:
+        # A queued write for this key must not land after the delete.
+        self.flush()
+        self.local.delete(key)
+        del self.remote[key]
+
+    def get(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        self[key] = value
+
+    def delete(self, key: str) -> None:
+        del self[key]
+
+
+MANIFEST_PREFIX = "_manifests/"
+
+
+@dataclass
+class CacheManifest:
+    """Cache keys one run read and wrote.
+
+    Saved locally as `.voicetest/cache-manifests/{run_id}.json` for cache
+    bundles. S3 caches also save it next to the entries as
+    `{prefix}_manifests/{suite_id}/{stamp}-{run_id}.json`, so the next run of
+    the same suite can prefetch them and `S3Cache.gc` can tell live entries
+    from dead ones."""
+
+    suite_id: str
+    run_id: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    reads: set[str] = field(default_factory=set)
+    writes: set[str] = field(default_factory=set)
+
+    @property
+    def keys(self) -> set[str]:
+        return self.reads | self.writes
+
+    @property
+    def object_key(self) -> str:
+        stamp = self.created_at.strftime("%Y%m%dT%H%M%S%fZ")
+        return f"{MANIFEST_PREFIX}{self.suite_id}/{stamp}-{self.run_id}.json"
+
+    def to_bytes(self) -> bytes:
+        return json.dumps(
+            {
+                "suite_id": self.suite_id,
+                "run_id": self.run_id,
+                "created_at": self.created_at.isoformat(),
+                "reads": sorted(self.reads),
+                "writes": sorted(self.writes),
+            }
+        ).encode()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CacheManifest":
+        raw = json.loads(data)
+        return cls(
+            suite_id=raw["suite_id"],
+            run_id=raw["run_id"],
+            created_at=datetime.fromisoformat(raw["created_at"]),
+            reads=set(raw["reads"]),
+            writes=set(raw["writes"]),
+        )
+
+
+def _manifest_stamp(object_key: str) -> str:
+    """Sort key for manifests across suites: the `{stamp}-{run_id}.json` file name."""
+    return object_key.rsplit("/", 1)[-1]
+
+
+# The manifest of the run executing in the current task (and the worker
+# threads it spawns via asyncio.to_thread, which copy the context).
+_active_manifest: ContextVar[CacheManifest | None] = ContextVar(
+    "voicetest_cache_manifest", default=None
+)
+
+
+_strict_offline: ContextVar[bool] = ContextVar("voicetest_strict_offline", default=False)
+
+
+@contextmanager
+def strict_offline(enabled: bool = True) -> Generator[None]:
+    """Make every LLM cache miss inside the block raise CacheMissError."""
+    token = _strict_offline.set(enabled)
+    try:
+        yield
+    finally:
+        _strict_offline.reset(token)
+
+
+def is_strict_offline() -> bool:
+    return _strict_offline.get()
+
+
+def _local_manifest_path(run_id: str) -> Path:
+    return get_manifest_dir() / f"{run_id}.json"
+
+
+class RecordingCache(Cache):
+    """DSPy Cache that records the keys each run touches.
+
+    Lookups and writes made inside `run_cache_manifest` land in the active
+    CacheManifest, which is saved under .voicetest/cache-manifests/ so
+    `voicetest cache export --run` can bundle them. Inside `strict_offline`
+    a lookup that finds nothing raises CacheMissError instead of letting
+    DSPy call the provider."""
+
+    def _record(self, request: dict[str, Any], ignored: list[str] | None, writes: bool) -> None:
+        manifest = _active_manifest.get()
+        if manifest is None:
+            return
+        try:
+            key = self.cache_key(request, ignored)
+        except Exception:  # noqa: BLE001 — Cache.get/put skip unkeyable requests too
+            return
+        (manifest.writes if writes else manifest.reads).add(key)
+
+    def get(self, request: dict[str, Any], ignored_args_for_cache_key: list[str] | None = None):
+        self._record(request, ignored_args_for_cache_key, writes=False)
+        value = super().get(request, ignored_args_for_cache_key)
+        if value is None and _strict_offline.get():
+            model = request.get("model", "unknown model")
+            raise CacheMissError(f"Strict offline: no cached response for a {model} request")
+        return value
+
+    def put(
+        self,
+        request: dict[str, Any],
+        value: Any,
+        ignored_args_for_cache_key: list[str] | None = None,
+        enable_memory_cache: bool = True,
+    ) -> None:
+        self._record(request, ignored_args_for_cache_key, writes=True)
+        super().put(request, value, ignored_args_for_cache_key, enable_memory_cache)
+
+    def save_manifest(self, manifest: CacheManifest) -> None:
+        path = _local_manifest_path(manifest.run_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(manifest.to_bytes())
+        except OSError as e:
+            logger.warning("Failed to save cache manifest for run %s: %s", manifest.run_id, e)
+
+    def find_manifest(self, run_id: str) -> CacheManifest | None:
+        """The manifest saved for `run_id`, or None."""
+        path = _local_manifest_path(run_id)
+        if not path.exists():
+            return None
+        return CacheManifest.from_bytes(path.read_bytes())
+
+    def lookup(self, key: str) -> Any:
+        """Stored value for a raw cache key from either tier, without recording it."""
+        if self.enable_memory_cache:
+            with self._lock:
+                value = self.memory_cache.get(key)
+            if value is not None:
+                return value
+        if self.enable_disk_cache:
+            return self.disk_cache.get(key)
+        return None
+
+    def store(self, key: str, value: Any) -> None:
+        """Write a value under a raw cache key to the persistent tier."""
+        if self.enable_disk_cache:
+            self.disk_cache.set(key, value)
+        elif self.enable_memory_cache:
+            with self._lock:
+                self.memory_cache[key] = value
+
+
+class S3Cache(RecordingCache):
     """DSPy Cache subclass that uses S3 for persistent storage."""
 
     def __init__(
@@ -124,26 +721,212 @@ class S3Cache(Cache):
         s3_region: str | None = None,
         s3_client: Any = None,
         enable_memory_cache: bool = True,
-        memory_max_entries: int = 1_000_000,
+        memory_max_bytes: int = 256 << 20,
+        local_cache_dir: str | Path | None = None,
+        local_cache_max_bytes: int = 1 << 30,
+        local_cache_ttl_seconds: float = 0,
+        negative_ttl_seconds: float = 30.0,
         **kwargs: Any,
     ):
+        """With `local_cache_dir`, S3 sits behind a TieredCacheBackend."""
         _require_boto3()
         # Skip Cache.__init__ — it would create a FanoutCache we don't need.
         # Instead, set up the attributes it would have created.
         self.enable_disk_cache = True
         self.enable_memory_cache = enable_memory_cache
         if self.enable_memory_cache:
-            self.memory_cache = LRUCache(maxsize=memory_max_entries)
+            self.memory_cache = SizedMemoryCache(memory_max_bytes)
         else:
             self.memory_cache = {}
-        self.disk_cache = S3CacheBackend(
+        s3_backend = S3CacheBackend(
             bucket=s3_bucket,
             prefix=s3_prefix,
             region=s3_region,
             client=s3_client,
+            compress=local_cache_dir is not None,
         )
+        if local_cache_dir is not None:
+            self.disk_cache = TieredCacheBackend(
+                s3_backend,
+                local_cache_dir,
+                local_max_bytes=local_cache_max_bytes,
+                negative_ttl=negative_ttl_seconds,
+                local_ttl=local_cache_ttl_seconds,
+            )
+        else:
+            self.disk_cache = s3_backend
+        self.s3_backend = s3_backend
         self._lock = threading.RLock()
 
+    def save_manifest(self, manifest: CacheManifest) -> None:
+        super().save_manifest(manifest)
+        self.s3_backend.store(manifest.object_key, manifest.to_bytes())
+
+    def find_manifest(self, run_id: str) -> CacheManifest | None:
+        """The manifest for `run_id`, locally or, for runs from elsewhere, in S3."""
+        manifest = super().find_manifest(run_id)
+        if manifest is not None:
+            return manifest
+        suffix = f"-{run_id}.json"
+        for key, _ in self.s3_backend.list_objects(MANIFEST_PREFIX):
+            if key.endswith(suffix):
+                data = self.s3_backend.fetch(key)
+                return CacheManifest.from_bytes(data) if data is not None else None
+        return None
+
+    def latest_manifest(self, suite_id: str) -> CacheManifest | None:
+        """Most recent manifest saved for `suite_id`, or None."""
+        keys = [key for key, _ in self.s3_backend.list_objects(f"{MANIFEST_PREFIX}{suite_id}/")]
+        if not keys:
+            return None
+        data = self.s3_backend.fetch(max(keys, key=_manifest_stamp))
+        return CacheManifest.from_bytes(data) if data is not None else None
+
+    def prefetch(self, keys: Iterable[str], max_workers: int = 10) -> int:
+        """Concurrently load `keys` into the memory tier (and the local tier, if any).
+
+        Returns how many were found. `max_workers` matches botocore's default
+        connection pool so the threads don't queue on connections."""
+        missing = [
+            key for key in keys if not (self.enable_memory_cache and self.memory_cache.peek(key))
+        ]
+        if not missing:
+            return 0
+
+        def load(key: str) -> tuple[str, Any]:
+            try:
+                return key, self.disk_cache.get(key)
+            except Exception as e:  # noqa: BLE001 — a bad entry only costs a live call later
+                logger.debug("Prefetch failed for key %s: %s", key, e)
+                return key, None
+
+        found = 0
+        with ThreadPoolExecutor(max_workers, thread_name_prefix="voicetest-prefetch") as pool:
+            for key, value in pool.map(load, missing):
+                if value is None:
+                    continue
+                found += 1
+                if self.enable_memory_cache:
+                    with self._lock:
+                        self.memory_cache[key] = value
+        return found
+
+    def gc(
+        self,
+        keep: int = 10,
+        min_age: timedelta = timedelta(days=1),
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """Delete S3 entries not referenced by the newest `keep` manifests.
+
+        Entries modified within `min_age` are kept regardless, so a run still in
+        progress (its manifest not yet written) doesn't lose its entries.
+        Manifests older than the newest `keep` are deleted too."""
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+
+        backend = self.s3_backend
+        manifest_keys = sorted(
+            (key for key, _ in backend.list_objects(MANIFEST_PREFIX)),
+            key=_manifest_stamp,
+            reverse=True,
+        )
+        if not manifest_keys:
+            raise ValueError(
+                "No cache manifests found. Run a suite against this cache first, "
+                "otherwise every entry would be deleted."
+            )
+        kept, expired = manifest_keys[:keep], manifest_keys[keep:]
+
+        referenced: set[str] = set()
+        for key in kept:
+            data = backend.fetch(key)
+            if data is not None:
+                referenced |= CacheManifest.from_bytes(data).keys
+
+        cutoff = datetime.now(UTC) - min_age
+        scanned = 0
+
+        def stale_keys() -> Iterator[str]:
+            nonlocal scanned
+            for key, modified in backend.list_objects():
+                if key.startswith(MANIFEST_PREFIX):
+                    continue
+                scanned += 1
+                if key not in referenced and modified < cutoff:
+                    yield key
+
+        if dry_run:
+            deleted = sum(1 for _ in stale_keys())
+        else:
+            deleted = backend.delete_many(stale_keys())
+            backend.delete_many(expired)
+
+        return {
+            "manifests_kept": len(kept),
+            "manifests_deleted": len(expired),
+            "entries_scanned": scanned,
+            "entries_referenced": len(referenced),
+            "entries_deleted": deleted,
+            "dry_run": dry_run,
+        }
+
+
+def suite_cache_id(graph: BaseModel, test_cases: Iterable[BaseModel]) -> str:
+    """Stable id for an agent + test-case set; runs with the same id share manifests."""
+    digest = hashlib.sha256(graph.model_dump_json().encode())
+    for dumped in sorted(tc.model_dump_json() for tc in test_cases):
+        digest.update(b"\0")
+        digest.update(dumped.encode())
+    return digest.hexdigest()[:32]
+
+
+def _prefetch_suite(cache: S3Cache, suite_id: str) -> None:
+    try:
+        manifest = cache.latest_manifest(suite_id)
+        if manifest is None:
+            return
+        found = cache.prefetch(manifest.keys)
+        logger.info(
+            "Prefetched %d/%d cache entries for suite %s", found, len(manifest.keys), suite_id
+        )
+    except Exception as e:  # noqa: BLE001 — prefetch is an optimisation, never fail the run
+        logger.warning("Cache prefetch failed for suite %s: %s", suite_id, e)
+
+
+@asynccontextmanager
+async def run_cache_manifest(
+    graph: BaseModel,
+    test_cases: Iterable[BaseModel],
+    run_id: str | None = None,
+    prefetch: bool = True,
+) -> AsyncGenerator[CacheManifest | None]:
+    """Record the cache keys a run touches, after prefetching the previous run's.
+
+    A no-op (yields None) unless `dspy.cache` is a RecordingCache. Only S3
+    caches prefetch. The manifest is saved on exit if the run touched the
+    cache at all."""
+    cache = dspy.cache
+    if not isinstance(cache, RecordingCache):
+        yield None
+        return
+
+    suite_id = suite_cache_id(graph, test_cases)
+    if prefetch and isinstance(cache, S3Cache):
+        await asyncio.to_thread(_prefetch_suite, cache, suite_id)
+
+    manifest = CacheManifest(suite_id=suite_id, run_id=run_id or uuid.uuid4().hex)
+    # Restore the previous value rather than resetting a token: when the
+    # caller is an async generator, exit can run in a different context.
+    previous = _active_manifest.get()
+    _active_manifest.set(manifest)
+    try:
+        yield manifest
+    finally:
+        _active_manifest.set(previous)
+        if manifest.keys:
+            await asyncio.to_thread(cache.save_manifest, manifest)
+
 
 def _reconstruct_last_request(lm: Any) -> tuple[dict | None, str | None]:
     """Rebuild the request dict + fn_identifier used as the cache key on the LM's
@@ -236,21 +1019,83 @@ def try_evict_last_call(lm: Any) -> bool:
         return False
 
 
+def bounded_disk_cache(
+    disk_cache_dir: str | Path = DISK_CACHE_DIR,
+    disk_max_bytes: int = 30_000_000_000,
+    disk_ttl_seconds: float = 0,
+    memory_max_bytes: int = 256 << 20,
+) -> Cache:
+    """DSPy's two-tier cache with byte-bounded memory and TTL'd disk, recording manifests.
+
+    The disk tier is the FanoutCache DSPy itself would create in
+    `disk_cache_dir`, so entries written before these limits stay valid."""
+    cache = RecordingCache(
+        enable_disk_cache=True,
+        enable_memory_cache=True,
+        disk_cache_dir=str(disk_cache_dir),
+        disk_size_limit_bytes=disk_max_bytes,
+    )
+    cache.memory_cache = SizedMemoryCache(memory_max_bytes)
+    cache.disk_cache = DiskCacheBackend(cache.disk_cache, ttl=disk_ttl_seconds)
+    return cache
+
+
+def cache_stats(cache: Cache | None = None) -> dict[str, Any]:
+    """Sizes and hit/miss/eviction counters of each tier of `cache` (default dspy.cache).
+
+    Counters cover this process only; sizes cover what is stored."""
+    cache = cache if cache is not None else dspy.cache
+    stats: dict[str, Any] = {"backend": type(cache).__name__}
+    memory = getattr(cache, "memory_cache", None)
+    if isinstance(memory, SizedMemoryCache):
+        stats["memory"] = memory.snapshot()
+    disk = getattr(cache, "disk_cache", None)
+    if isinstance(disk, DiskCacheBackend):
+        stats["disk"] = disk.snapshot()
+    elif isinstance(disk, TieredCacheBackend):
+        stats["disk"] = disk.local.snapshot()
+        with disk._lock:
+            stats["tiered"] = dict(disk.stats)
+    return stats
+
+
 def setup_cache_from_settings(cache_settings: Any) -> None:
     """Configure DSPy cache from voicetest CacheSettings."""
-    if cache_settings.cache_backend != "s3":
-        return
-    if not cache_settings.s3_bucket:
-        logger.warning("Cache backend set to 's3' but no s3_bucket configured, using disk cache")
+    backend = cache_settings.cache_backend
+    if backend not in ("s3", "tiered") or not cache_settings.s3_bucket:
+        if backend in ("s3", "tiered"):
+            logger.warning(
+                "Cache backend set to '%s' but no s3_bucket configured, using disk cache", backend
+            )
+        dspy.cache = bounded_disk_cache(
+            disk_max_bytes=cache_settings.disk_max_bytes,
+            disk_ttl_seconds=cache_settings.disk_ttl_seconds,
+            memory_max_bytes=cache_settings.memory_max_bytes,
+        )
         return
 
-    dspy.cache = S3Cache(
+    tier_kwargs: dict[str, Any] = {}
+    if backend == "tiered":
+        tier_kwargs = {
+            "local_cache_dir": cache_settings.local_cache_dir or str(get_cache_dir()),
+            "local_cache_max_bytes": cache_settings.local_cache_max_bytes,
+            "local_cache_ttl_seconds": cache_settings.disk_ttl_seconds,
+            "negative_ttl_seconds": cache_settings.negative_ttl_seconds,
+        }
+
+    cache = S3Cache(
         s3_bucket=cache_settings.s3_bucket,
         s3_prefix=cache_settings.s3_prefix,
         s3_region=cache_settings.s3_region,
+        memory_max_bytes=cache_settings.memory_max_bytes,
+        **tier_kwargs,
     )
+    if cache_settings.s3_expire_days > 0:
+        cache.s3_backend.ensure_expiry(cache_settings.s3_expire_days)
+    dspy.cache = cache
     logger.info(
-        "DSPy cache configured with S3 backend: s3://%s/%s",
+        "DSPy cache configured with %s backend: s3://%s/%s",
+        backend,
         cache_settings.s3_bucket,
         cache_settings.s3_prefix,
     )
@@ -0,0 +1,121 @@
+"""Portable LLM cache bundles for offline re-runs.
+
+A bundle is a zip holding every cache entry one run touched:
+
+    index.json          {"version", "run_id", "suite_id", "entries": {cache_key: sha256}}
+    objects/<sha256>    cloudpickled cached response
+
+Objects are content-addressed, so identical responses are stored once and
+`import_bundle` can verify every object before writing anything. The
+bundle digest (and default file name) is a hash of the key → object map,
+and zip entries carry a fixed timestamp, so exporting the same run twice
+gives the same file. Bundles are unpickled on import; only import bundles
+you trust, as with the cache itself.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+import zipfile
+
+import cloudpickle
+
+from voicetest.util.cache import CacheManifest
+from voicetest.util.cache import RecordingCache
+
+
+BUNDLE_VERSION = 1
+
+_INDEX = "index.json"
+_OBJECTS = "objects/"
+_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def _write(zf: zipfile.ZipFile, name: str, data: bytes) -> None:
+    info = zipfile.ZipInfo(name, date_time=_EPOCH)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    zf.writestr(info, data)
+
+
+def bundle_digest(entries: dict[str, str]) -> str:
+    """Content address of a bundle: hash of its sorted key → object mapping."""
+    return hashlib.sha256(json.dumps(entries, sort_keys=True).encode()).hexdigest()
+
+
+def export_bundle(
+    cache: RecordingCache,
+    manifest: CacheManifest,
+    path: Path | None = None,
+) -> dict[str, Any]:
+    """Write the entries `manifest` references to a bundle.
+
+    `path` defaults to `voicetest-cache-<digest>.zip` in the working
+    directory. Keys no longer in the cache (evicted or expired) are skipped
+    and counted as missing."""
+    entries: dict[str, str] = {}
+    objects: dict[str, bytes] = {}
+    missing = 0
+    for key in sorted(manifest.keys):
+        value = cache.lookup(key)
+        if value is None:
+            missing += 1
+            continue
+        data = cloudpickle.dumps(value)
+        digest = hashlib.sha256(data).hexdigest()
+        entries[key] = digest
+        objects[digest] = data
+
+    digest = bundle_digest(entries)
+    path = path or Path(f"voicetest-cache-{digest[:16]}.zip")
+    index = {
+        "version": BUNDLE_VERSION,
+        "run_id": manifest.run_id,
+        "suite_id": manifest.suite_id,
+        "digest": digest,
+        "entries": entries,
+    }
+    with zipfile.ZipFile(path, "w") as zf:
+        _write(zf, _INDEX, json.dumps(index, indent=2, sort_keys=True).encode())
+        for object_digest in sorted(objects):
+            _write(zf, f"{_OBJECTS}{object_digest}", objects[object_digest])
+
+    return {
+        "path": str(path),
+        "digest": digest,
+        "entries": len(entries),
+        "objects": len(objects),
+        "missing": missing,
+    }
+
+
+def import_bundle(cache: RecordingCache, path: Path) -> dict[str, Any]:
+    """Verify a bundle and write its entries to the cache's persistent tier.
+
+    Raises ValueError for an unreadable, unsupported or corrupt bundle; in
+    that case nothing is written."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            index = json.loads(zf.read(_INDEX))
+            if index.get("version") != BUNDLE_VERSION:
+                raise ValueError(f"Unsupported cache bundle version: {index.get('version')}")
+            entries: dict[str, str] = index["entries"]
+            objects = {digest: zf.read(f"{_OBJECTS}{digest}") for digest in set(entries.values())}
+    except (zipfile.BadZipFile, KeyError, json.JSONDecodeError) as e:
+        raise ValueError(f"Not a valid cache bundle: {path}: {e}") from e
+
+    for digest, data in objects.items():
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupt cache bundle: object {digest[:12]} does not match its hash")
+    if index.get("digest") not in (None, bundle_digest(entries)):
+        raise ValueError("Corrupt cache bundle: index digest does not match its entries")
+
+    values = {digest: cloudpickle.loads(data) for digest, data in objects.items()}
+    for key, digest in entries.items():
+        cache.store(key, values[digest])
+
+    return {
+        "run_id": index.get("run_id"),
+        "digest": index.get("digest"),
+        "entries": len(entries),
+    }
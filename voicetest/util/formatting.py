@@ -1,5 +1,7 @@
 """Shared formatting utilities for CLI, TUI, and shell."""
 
+from voicetest.models.results import LLMRoleStats
+from voicetest.models.results import SpanTiming
 from voicetest.models.results import TestResult
 from voicetest.models.results import TestRun
 
@@ -37,6 +39,82 @@ def format_result_line(result: TestResult) -> str:
     )
 
 
+def total_llm_stats(stats_by_role: list[dict[str, LLMRoleStats]]) -> LLMRoleStats:
+    """Sum per-role LLM stats across roles (and results)."""
+    total = LLMRoleStats()
+    for stats in stats_by_role:
+        for role_stats in stats.values():
+            total.calls += role_stats.calls
+            total.cache_hits += role_stats.cache_hits
+            total.cache_misses += role_stats.cache_misses
+            total.cache_bypassed += role_stats.cache_bypassed
+            total.coalesced += role_stats.coalesced
+            total.latency_ms += role_stats.latency_ms
+            total.prompt_tokens += role_stats.prompt_tokens
+            total.completion_tokens += role_stats.completion_tokens
+            total.cost_usd += role_stats.cost_usd
+    return total
+
+
+def format_llm_stats(stats: dict[str, LLMRoleStats]) -> str:
+    """Format per-role LLM stats as 'role calls (hits cached, ms)' pairs."""
+    parts = []
+    for role, s in sorted(stats.items()):
+        shared = f", {s.coalesced} shared" if s.coalesced else ""
+        parts.append(f"{role} {s.calls} ({s.cache_hits} cached{shared}, {s.latency_ms:.0f}ms)")
+    return ", ".join(parts)
+
+
+def format_usage(stats: LLMRoleStats) -> str:
+    """Format token usage and cost, e.g. '12,400 in / 830 out tokens, $0.0213'."""
+    return (
+        f"{stats.prompt_tokens:,} in / {stats.completion_tokens:,} out tokens, "
+        f"{format_cost(stats.cost_usd)}"
+    )
+
+
+def format_cost(cost_usd: float) -> str:
+    """Format a USD amount, keeping sub-cent costs visible."""
+    return f"${cost_usd:.4f}" if cost_usd < 1 else f"${cost_usd:,.2f}"
+
+
+def format_cache_hit_rate(stats: LLMRoleStats) -> str:
+    """Format overall cache effectiveness, e.g. '12/20 cached (60%)'."""
+    eligible = stats.cache_hits + stats.cache_misses
+    if not eligible:
+        return "cache bypassed" if stats.calls else "no LLM calls"
+    return f"{stats.cache_hits}/{eligible} cached ({stats.hit_rate:.0%})"
+
+
+def total_timings(timings: list[dict[str, SpanTiming]]) -> dict[str, SpanTiming]:
+    """Sum per-span timings across results."""
+    totals: dict[str, SpanTiming] = {}
+    for by_span in timings:
+        for name, span in by_span.items():
+            total = totals.setdefault(name, SpanTiming())
+            total.count += span.count
+            total.total_ms += span.total_ms
+            total.max_ms = max(total.max_ms, span.max_ms)
+    return totals
+
+
+def format_timings(timings: dict[str, SpanTiming]) -> str:
+    """Format spans slowest first as 'name total (count, max)' pairs."""
+    parts = [
+        f"{name} {span.total_ms / 1000:.1f}s ({span.count}x, max {span.max_ms / 1000:.1f}s)"
+        for name, span in sorted(timings.items(), key=lambda item: -item[1].total_ms)
+    ]
+    return ", ".join(parts)
+
+
+def slowest_span(timings: dict[str, SpanTiming]) -> str:
+    """Name and total of the span that took longest, e.g. 'response 4.2s'."""
+    if not timings:
+        return ""
+    name, span = max(timings.items(), key=lambda item: item[1].total_ms)
+    return f"{name} {span.total_ms / 1000:.1f}s"
+
+
 def format_result_detail(result: TestResult) -> list[str]:
     """Format full result details as list of lines."""
     lines = [format_result_line(result)]
@@ -52,6 +130,15 @@ def format_result_detail(result: TestResult) -> list[str]:
     for v in result.constraint_violations:
         lines.append(f"  [red]\u2717 {v}[/red]")
 
+    if result.llm_stats:
+        lines.append(f"  [dim]LLM: {format_llm_stats(result.llm_stats)}[/dim]")
+        usage = total_llm_stats([result.llm_stats])
+        if usage.prompt_tokens or usage.completion_tokens:
+            lines.append(f"  [dim]Usage: {format_usage(usage)}[/dim]")
+
+    if result.timings:
+        lines.append(f"  [dim]Time: {format_timings(result.timings)}[/dim]")
+
     return lines
 
 
@@ -68,4 +155,18 @@ def format_run(run: TestRun) -> list[str]:
         lines.append("")
     lines.append("\u2500" * 50)
     lines.append(format_run_summary(run))
+    llm_totals = total_llm_stats([r.llm_stats for r in run.results])
+    if llm_totals.calls:
+        lines.append(
+            f"LLM calls: {llm_totals.calls}, {format_cache_hit_rate(llm_totals)}, "
+            f"{llm_totals.latency_ms / 1000:.1f}s total"
+        )
+    llm_calls_saved = sum(r.llm_calls_saved for r in run.results)
+    if llm_calls_saved:
+        lines.append(f"Provider calls saved by shared openings: {llm_calls_saved}")
+    if llm_totals.prompt_tokens or llm_totals.completion_tokens:
+        lines.append(f"Usage: {format_usage(llm_totals)}")
+    timing_totals = total_timings([r.timings for r in run.results])
+    if timing_totals:
+        lines.append(f"Time by span: {format_timings(timing_totals)}")
     return lines
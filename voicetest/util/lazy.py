@@ -0,0 +1,71 @@
+"""Registry entries that are imported on first use.
+
+Importers, exporters and platform clients pull in vendor SDKs when their
+modules load. Registering them as `"package.module:Class"` strings lets the
+container list every entry by name while importing only the ones a command
+actually uses."""
+
+from dataclasses import dataclass
+import importlib
+import threading
+from typing import Any
+
+
+def import_object(path: str) -> Any:
+    """Import `"package.module:attribute"` and return the attribute."""
+    module_name, _, attribute = path.partition(":")
+    if not attribute:
+        raise ValueError(f"Expected 'package.module:attribute', got {path!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+@dataclass(frozen=True)
+class _Pending:
+    path: str
+    args: tuple
+
+
+class LazyEntries[T]:
+    """Ordered name -> entry map whose entries may be built on first lookup.
+
+    `add` stores a ready instance. `add_lazy` stores an import path and the
+    constructor arguments; the class is imported and instantiated the first
+    time that name is looked up, and the instance is kept from then on.
+    Iteration order is registration order either way."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, T | _Pending] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, entry: T) -> None:
+        with self._lock:
+            self._entries[name] = entry
+
+    def add_lazy(self, name: str, path: str, *args: Any) -> None:
+        with self._lock:
+            self._entries[name] = _Pending(path, args)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, name: str) -> T | None:
+        entry = self._entries.get(name)
+        if not isinstance(entry, _Pending):
+            return entry
+        with self._lock:
+            entry = self._entries[name]
+            if isinstance(entry, _Pending):
+                entry = self._entries[name] = import_object(entry.path)(*entry.args)
+            return entry
+
+    def names(self) -> list[str]:
+        """Every registered name, in registration order, without importing anything."""
+        return list(self._entries)
+
+    def values(self) -> list[T]:
+        """Every entry, importing any that are still pending."""
+        return [self.get(name) for name in self.names()]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
@@ -0,0 +1,259 @@
+"""Process-wide operational metrics in the Prometheus text format.
+
+Counters, gauges and histograms are plain in-memory objects registered on
+`REGISTRY`; `render()` writes them in the text exposition format (version
+0.0.4) that Prometheus and most scrapers read, so `voicetest serve` can
+expose `/metrics` without a client library or any outside service.
+
+Instrumented code updates the module-level metrics below directly. Values
+that already live elsewhere (in-flight runs, sessions, WebSocket
+subscribers) are copied into gauges by the `/metrics` handler at scrape
+time instead of being tracked twice."""
+
+import asyncio
+from collections.abc import Generator
+from collections.abc import Iterable
+from contextlib import contextmanager
+import math
+import threading
+import time
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds. Covers cache hits (sub-millisecond) through slow LLM completions.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Seconds. Lock waits are normally microseconds; anything near a second is a stall.
+LOCK_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+LabelKey = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values, strict=True)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Shared shape: name, help text, label names and a per-label-set value map."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track(self, **labels: str) -> Generator[None]:
+        """Count the enclosed block as in progress while it runs."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram of observed values, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label key -> [per-bucket counts..., sum, count]
+        self._values: dict[LabelKey, list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[i] += 1
+                    break
+            entry[-2] += value
+            entry[-1] += 1
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return int(entry[-1]) if entry else 0
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = []
+        for key, entry in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, entry, strict=False):
+                cumulative += bucket_count
+                labels = _format_labels((*self.labelnames, "le"), (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(entry[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(entry[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register[M: _Metric](self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+RUNS_IN_FLIGHT = REGISTRY.register(
+    Gauge("voicetest_runs_in_flight", "Test runs registered with the run coordinator.")
+)
+RUNS_QUEUED = REGISTRY.register(
+    Gauge("voicetest_runs_queued", "Runs accepted by the API whose job has not started yet.")
+)
+TESTS_IN_FLIGHT = REGISTRY.register(
+    Gauge("voicetest_tests_in_flight", "Tests currently executing in this process.")
+)
+SESSIONS_ACTIVE = REGISTRY.register(
+    Gauge("voicetest_sessions_active", "Active chat and live call sessions.", ["kind"])
+)
+WEBSOCKET_SUBSCRIBERS = REGISTRY.register(
+    Gauge("voicetest_websocket_subscribers", "Attached WebSocket subscribers.", ["channel"])
+)
+BROADCAST_QUEUED = REGISTRY.register(
+    Gauge(
+        "voicetest_broadcast_queued_messages",
+        "Broadcast messages waiting for a subscriber to attach.",
+        ["channel"],
+    )
+)
+LLM_CALL_SECONDS = REGISTRY.register(
+    Histogram("voicetest_llm_call_seconds", "LLM call latency.", ["model", "role"])
+)
+LLM_CACHE_LOOKUPS = REGISTRY.register(
+    Counter(
+        "voicetest_llm_cache_lookups_total",
+        "LLM calls that consulted the response cache, by outcome.",
+        ["result"],
+    )
+)
+LLM_CACHE_HIT_RATIO = REGISTRY.register(
+    Gauge("voicetest_llm_cache_hit_ratio", "Share of cache lookups served from the cache.")
+)
+LLM_RETRIES = REGISTRY.register(
+    Counter("voicetest_llm_retries_total", "Retried LLM calls by exception type.", ["error_type"])
+)
+DB_LOCK_WAIT_SECONDS = REGISTRY.register(
+    Histogram(
+        "voicetest_db_lock_wait_seconds",
+        "Time spent waiting for the shared DuckDB session lock.",
+        buckets=LOCK_WAIT_BUCKETS,
+    )
+)
+EVENT_LOOP_LAG_SECONDS = REGISTRY.register(
+    Gauge("voicetest_event_loop_lag_seconds", "Most recent event loop scheduling delay.")
+)
+
+
+def observe_llm_call(model: str, role: str, latency_ms: float, cache_hit: bool | None) -> None:
+    """Record one LLM call's latency and, unless the cache was bypassed, its cache outcome."""
+    LLM_CALL_SECONDS.observe(latency_ms / 1000, model=model or "unknown", role=role)
+    if cache_hit is None:
+        return
+    LLM_CACHE_LOOKUPS.inc(result="hit" if cache_hit else "miss")
+    hits = LLM_CACHE_LOOKUPS.value(result="hit")
+    LLM_CACHE_HIT_RATIO.set(hits / (hits + LLM_CACHE_LOOKUPS.value(result="miss")))
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """Sample how late the loop wakes a sleeping task, forever; run as a background task."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG_SECONDS.set(max(0.0, time.perf_counter() - start - interval))
@@ -4,12 +4,12 @@ import asyncio
 from collections.abc import Awaitable
 from collections.abc import Callable
 from dataclasses import dataclass
+import functools
 import random
 import time
 
-from dspy.utils.exceptions import AdapterParseError
-import litellm
-import openai
+from voicetest.util.metrics import LLM_RETRIES
+from voicetest.util.tracing import trace_event
 
 
 @dataclass
@@ -39,15 +39,25 @@ class EmptyLLMOutputError(Exception):
 
 OnErrorCallback = Callable[[RetryError], Awaitable[None] | None]
 
-# Exceptions that should trigger a retry. Callers must be idempotent — see
-# docs/development.md § Retry and idempotency.
-RETRYABLE_EXCEPTIONS = (
-    litellm.RateLimitError,
-    litellm.Timeout,
-    litellm.APIConnectionError,
-    openai.APITimeoutError,
-    AdapterParseError,
-)
+
+@functools.cache
+def retryable_exceptions() -> tuple[type[Exception], ...]:
+    """Exceptions that should trigger a retry. Callers must be idempotent — see
+    docs/development.md § Retry and idempotency.
+
+    Imported on first use: litellm takes seconds to import, and `except`
+    only evaluates this once a call has already failed."""
+    from dspy.utils.exceptions import AdapterParseError  # noqa: PLC0415
+    import litellm  # noqa: PLC0415
+    import openai  # noqa: PLC0415
+
+    return (
+        litellm.RateLimitError,
+        litellm.Timeout,
+        litellm.APIConnectionError,
+        openai.APITimeoutError,
+        AdapterParseError,
+    )
 
 
 def _effective_max_attempts(
@@ -100,6 +110,18 @@ def _retry_decision(
     return retry_after, error_info
 
 
+def _trace_retry(error: RetryError) -> None:
+    """Count the retry and mark it, with the backoff that follows, on the current span."""
+    LLM_RETRIES.inc(error_type=error.error_type)
+    trace_event(
+        "retry",
+        attempt=error.attempt,
+        max_attempts=error.max_attempts,
+        error_type=error.error_type,
+        retry_after_s=round(error.retry_after, 3),
+    )
+
+
 async def with_retry(
     func: Callable[[], Awaitable],
     max_attempts: int = 8,
@@ -118,13 +140,14 @@ async def with_retry(
     for attempt in range(1, max_attempts + 1):
         try:
             return await func()
-        except RETRYABLE_EXCEPTIONS as e:
+        except retryable_exceptions() as e:
             decision = _retry_decision(
                 e, attempt, max_attempts, base_delay, max_delay, max_attempts_by_exception
             )
             if decision is None:
                 raise
             retry_after, error_info = decision
+            _trace_retry(error_info)
             if on_error:
                 result = on_error(error_info)
                 if result is not None and hasattr(result, "__await__"):
@@ -144,13 +167,14 @@ def with_retry_sync(
     for attempt in range(1, max_attempts + 1):
         try:
             return func()
-        except RETRYABLE_EXCEPTIONS as e:
+        except retryable_exceptions() as e:
             decision = _retry_decision(
                 e, attempt, max_attempts, base_delay, max_delay, max_attempts_by_exception
             )
             if decision is None:
                 raise
             retry_after, error_info = decision
+            _trace_retry(error_info)
             if on_error:
                 on_error(error_info)
             time.sleep(retry_after)
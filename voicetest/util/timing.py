@@ -0,0 +1,79 @@
+"""Per-test latency breakdown by span.
+
+Code on the hot path wraps each unit of work in `timed(name)`: the engine
+times transition checks, extract calls and responses, the simulator its
+turns, and each judge its evaluation. Spans are reported to the collector
+active in the current context; `TestExecutionService.run_test` opens one
+per test and stores the totals on `TestResult.timings`.
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import threading
+import time
+
+from voicetest.models.results import SpanTiming
+
+
+class TimingCollector:
+    """Accumulates SpanTiming by span name; safe to share across tasks and threads."""
+
+    def __init__(self):
+        self._spans: dict[str, SpanTiming] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        with self._lock:
+            span = self._spans.setdefault(name, SpanTiming())
+            span.count += 1
+            span.total_ms += elapsed_ms
+            span.max_ms = max(span.max_ms, elapsed_ms)
+
+    def snapshot(self) -> dict[str, SpanTiming]:
+        """Copy of the current totals, keyed by span name."""
+        with self._lock:
+            return {
+                name: span.model_copy(
+                    update={"total_ms": round(span.total_ms, 1), "max_ms": round(span.max_ms, 1)}
+                )
+                for name, span in self._spans.items()
+            }
+
+
+_collector: ContextVar[TimingCollector | None] = ContextVar("voicetest_timings", default=None)
+
+
+@contextmanager
+def collect_timings() -> Generator[TimingCollector]:
+    """Collect every `timed` span entered inside the block."""
+    collector = TimingCollector()
+    token = _collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _collector.reset(token)
+
+
+class Span:
+    """Elapsed time of a `timed` block; `ms` is set when the block exits."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.ms = 0.0
+
+
+@contextmanager
+def timed(name: str) -> Generator[Span]:
+    """Time the block and report it to the active collector, if any.
+
+    Spans that raise are still recorded, so slow failures show up too."""
+    span = Span(name)
+    start = time.perf_counter()
+    try:
+        yield span
+    finally:
+        span.ms = (time.perf_counter() - start) * 1000
+        collector = _collector.get()
+        if collector is not None:
+            collector.record(name, span.ms)
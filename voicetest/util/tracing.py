@@ -0,0 +1,290 @@
+"""Optional tracing of runs, tests, turns, LLM calls and database writes.
+
+Tracing is off unless a `Tracer` has been installed with `start_tracing`
+(the CLI's global `--trace FILE` option). While it is off, `trace_span`,
+`trace_event` and `traced` functions return straight away after one global
+lookup, so instrumented code costs next to nothing.
+
+On `stop_tracing` the spans are written to a local file for offline viewing:
+OTLP/JSON (the OpenTelemetry file encoding) when the name ends in
+`.otlp.json`, otherwise Chrome trace-event JSON, which chrome://tracing and
+https://ui.perfetto.dev open directly. In the Chrome view every test gets its
+own row, so concurrent tests and runs show side by side."""
+
+from collections.abc import Callable
+from collections.abc import Generator
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+import functools
+import inspect
+import itertools
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+
+OTLP_SUFFIX = ".otlp.json"
+
+
+@dataclass
+class SpanRecord:
+    """One finished or in-progress span."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    lane: int
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    events: list[tuple[str, int, dict[str, Any]]] = field(default_factory=list)
+    error: str | None = None
+
+    def set(self, **attributes: Any) -> None:
+        """Add or overwrite attributes, e.g. outcomes known only at the end."""
+        self.attributes.update(attributes)
+
+
+class Tracer:
+    """Collects spans in memory and writes them to `path` when stopped."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.format = "otlp" if self.path.name.endswith(OTLP_SUFFIX) else "chrome"
+        self.start_ns = time.time_ns()
+        self.spans: list[SpanRecord] = []
+        self._lock = threading.Lock()
+        self._lanes = itertools.count(1)
+
+    def start(
+        self, name: str, parent: SpanRecord | None, new_lane: bool, attributes: dict
+    ) -> SpanRecord:
+        """Open a span under `parent`. Root spans always start a new lane."""
+        if parent is None:
+            trace_id, parent_id, lane = os.urandom(16).hex(), None, next(self._lanes)
+        else:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+            lane = next(self._lanes) if new_lane else parent.lane
+        return SpanRecord(
+            name=name,
+            trace_id=trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            lane=lane,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+
+    def finish(self, record: SpanRecord) -> None:
+        record.end_ns = time.time_ns()
+        with self._lock:
+            self.spans.append(record)
+
+    def write(self) -> Path:
+        """Write every finished span to `path` in the tracer's format."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start_ns)
+        document = _otlp_document(spans) if self.format == "otlp" else self._chrome(spans)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(document) + "\n")
+        return self.path
+
+    def _chrome(self, spans: list[SpanRecord]) -> dict:
+        pid = os.getpid()
+        events: list[dict] = []
+        named_lanes: set[int] = set()
+        for record in spans:
+            if record.lane not in named_lanes:
+                named_lanes.add(record.lane)
+                label = record.attributes.get("test") or record.attributes.get("run_id")
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": record.lane,
+                        "args": {"name": f"{record.name}: {label}" if label else record.name},
+                    }
+                )
+            args = dict(record.attributes)
+            if record.error:
+                args["error"] = record.error
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.name.split(".")[0],
+                    "ph": "X",
+                    "ts": self._micros(record.start_ns),
+                    "dur": (record.end_ns - record.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": record.lane,
+                    "args": args,
+                }
+            )
+            for name, at_ns, attributes in record.events:
+                events.append(
+                    {
+                        "name": name,
+                        "ph": "i",
+                        "s": "t",
+                        "ts": self._micros(at_ns),
+                        "pid": pid,
+                        "tid": record.lane,
+                        "args": attributes,
+                    }
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def _micros(self, ns: int) -> float:
+        return (ns - self.start_ns) / 1000
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items() if v is not None]
+
+
+def _otlp_document(spans: list[SpanRecord]) -> dict:
+    """Spans as one ExportTraceServiceRequest in the OTLP/JSON encoding."""
+    otlp_spans = []
+    for record in spans:
+        otlp_span = {
+            "traceId": record.trace_id,
+            "spanId": record.span_id,
+            "name": record.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(record.start_ns),
+            "endTimeUnixNano": str(record.end_ns),
+            "attributes": _otlp_attributes(record.attributes),
+            "events": [
+                {
+                    "timeUnixNano": str(at_ns),
+                    "name": name,
+                    "attributes": _otlp_attributes(attributes),
+                }
+                for name, at_ns, attributes in record.events
+            ],
+            # STATUS_CODE_ERROR = 2, STATUS_CODE_OK = 1
+            "status": {"code": 2, "message": record.error} if record.error else {"code": 1},
+        }
+        if record.parent_id:
+            otlp_span["parentSpanId"] = record.parent_id
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otlp_attributes({"service.name": "voicetest"})},
+                "scopeSpans": [{"scope": {"name": "voicetest"}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+_tracer: Tracer | None = None
+_current: ContextVar[SpanRecord | None] = ContextVar("voicetest_current_span", default=None)
+
+
+def start_tracing(path: Path) -> Tracer:
+    """Install a process-wide tracer writing to `path`, replacing any active one."""
+    global _tracer
+    _tracer = Tracer(path)
+    return _tracer
+
+
+def stop_tracing() -> Path | None:
+    """Uninstall the tracer and write its file. Returns the path, or None if off."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer.write() if tracer is not None else None
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def trace_span(
+    name: str, *, new_lane: bool = False, **attributes: Any
+) -> AbstractContextManager[SpanRecord | None]:
+    """Trace the enclosed block as a child of the current span.
+
+    Yields the `SpanRecord` (or None while tracing is off) so callers can
+    `set()` attributes learned inside the block. An exception escaping the
+    block is recorded on the span and re-raised. `new_lane` puts the span and
+    its children on their own row in the Chrome view."""
+    tracer = _tracer
+    if tracer is None:
+        return _DISABLED
+    return _active_span(tracer, name, new_lane, attributes)
+
+
+# Shared, reusable no-op context so a disabled span allocates nothing.
+_DISABLED = nullcontext()
+
+
+@contextmanager
+def _active_span(
+    tracer: Tracer, name: str, new_lane: bool, attributes: dict[str, Any]
+) -> Generator[SpanRecord]:
+    record = tracer.start(name, _current.get(), new_lane, attributes)
+    token = _current.set(record)
+    try:
+        yield record
+    except BaseException as e:
+        record.error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        raise
+    finally:
+        _current.reset(token)
+        tracer.finish(record)
+
+
+def trace_event(name: str, **attributes: Any) -> None:
+    """Attach a timestamped event to the current span, if tracing."""
+    if _tracer is None:
+        return
+    record = _current.get()
+    if record is not None:
+        record.events.append((name, time.time_ns(), attributes))
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Decorator tracing each call of a sync or async function as span `name`."""
+
+    def decorate(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with trace_span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with trace_span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -12,6 +12,8 @@ channel has its own `asyncio.Lock` covering attach (drain queue then
 subscribe) AND broadcast (send to all subscribers under the lock), so
 messages land in a single total order per channel and a connecting client
 receives queued backlog before any newly-broadcast message.
+
+`voicetest.web.bus` extends `BroadcastBus` across processes.
 """
 
 import asyncio
@@ -69,6 +71,15 @@ class BroadcastBus:
         if ch is not None:
             ch["websockets"].discard(websocket)
 
+    def stats(self) -> dict[str, int]:
+        """Open channels, attached subscribers and queued messages across all channels."""
+        channels = list(self._channels.values())
+        return {
+            "channels": len(channels),
+            "subscribers": sum(len(ch["websockets"]) for ch in channels),
+            "queued_messages": sum(len(ch["message_queue"]) for ch in channels),
+        }
+
     async def broadcast(self, channel: str, data: dict) -> None:
         """Send to all subscribers; queue for later if none are attached.
 
@@ -99,9 +110,9 @@ class SessionRegistry[TSession]:
     delegations (`broadcast` / `attach` / `detach`). Subscribers are closed
     inside `close()` so callers don't have to remember the order."""
 
-    def __init__(self) -> None:
+    def __init__(self, bus: BroadcastBus | None = None) -> None:
         self._sessions: dict[str, TSession] = {}
-        self._bus = BroadcastBus()
+        self._bus = bus or BroadcastBus()
 
     def register(self, session_id: str, session: TSession) -> None:
         self._sessions[session_id] = session
@@ -133,3 +144,7 @@ class SessionRegistry[TSession]:
 
     def detach(self, session_id: str, websocket: Any) -> None:
         self._bus.detach(session_id, websocket)
+
+    def stats(self) -> dict[str, int]:
+        """Active sessions plus the bus's subscriber and queue counts."""
+        return {"sessions": len(self._sessions), **self._bus.stats()}
@@ -0,0 +1,501 @@
+"""Cross-process backends for `BroadcastBus`.
+
+`BroadcastBus` delivers to the WebSockets attached in its own process, so
+with several server processes a client only sees events produced where it
+happens to be connected. `RelayedBroadcastBus` keeps the same
+`start`/`attach`/`broadcast`/`end` surface, but sends every operation
+through a shared transport and applies it when the transport hands it back.
+Every process, including the publisher, sees each channel's events in the
+transport's order, so there is still a single total order per channel.
+
+Transports:
+
+- `UnixSocketTransport` talks to a `BusBroker` (`voicetest bus-broker`) on
+  one host. The broker keeps each open channel's events, so a process that
+  connects or reconnects mid-run catches up.
+- `PostgresTransport` uses LISTEN/NOTIFY, with events kept in a
+  `voicetest_bus_events` table until their channel ends, so the backlog also
+  survives a restart of every server process.
+
+`create_bus(topic)` picks the backend from VOICETEST_BUS: unset or `local`
+for the in-process bus, `unix:/path/to/bus.sock`, or `postgres` (connects to
+DATABASE_URL). The topic ("run", "chat", "call") keeps each kind of channel
+on its own stream.
+"""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+import contextlib
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from voicetest.web.broadcast import BroadcastBus
+
+
+logger = logging.getLogger(__name__)
+
+# Broadcast messages carry whole transcripts.
+STREAM_LIMIT = 64 << 20
+
+# A broker client whose unsent output passes this is dropped; it reconnects
+# and catches up from the broker's history instead of stalling every other client.
+MAX_CLIENT_BUFFER = 16 << 20
+
+# How long `broadcast` waits for its own event to come back before giving up.
+DELIVERY_TIMEOUT_SECONDS = 5.0
+
+# How long `attach` waits for a channel started in another process to show up here.
+ATTACH_WAIT_SECONDS = 2.0
+
+RECONNECT_DELAY_SECONDS = 1.0
+
+Deliver = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class BusTransport:
+    """Carries bus events between processes in one order for every subscriber."""
+
+    async def open(self, deliver: Deliver) -> None:
+        """Connect, replay the backlog of open channels, then deliver new events."""
+        raise NotImplementedError
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        """Send `event` to every subscriber, this process included."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+
+class RelayedBroadcastBus(BroadcastBus):
+    """A `BroadcastBus` whose events go through a `BusTransport`.
+
+    `start` opens the channel locally right away so clients can attach
+    before the first event; everything else takes effect when the transport
+    delivers it. `broadcast` returns once the event has been delivered here.
+    The transport is opened on first use, on the running event loop; while it
+    cannot be opened, events are delivered in this process only and the next
+    operation tries again."""
+
+    def __init__(self, transport: BusTransport) -> None:
+        super().__init__()
+        self._transport = transport
+        self._origin = uuid4().hex
+        self._seq = itertools.count()
+        self._pending: dict[int, asyncio.Future] = {}
+        self._outbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._opened: asyncio.Future | None = None
+        self._sender: asyncio.Task | None = None
+        self._opener: asyncio.Task | None = None
+        self._starting: dict[str, asyncio.Event] = {}
+
+    async def open(self) -> None:
+        """Connect the transport. Called implicitly by the first bus operation."""
+        if self._opened is None:
+            self._opened = asyncio.ensure_future(self._transport.open(self._deliver))
+        try:
+            await asyncio.shield(self._opened)
+        except Exception:
+            self._opened = None
+            raise
+        if self._sender is None:
+            self._sender = asyncio.create_task(self._send_loop())
+
+    async def close(self) -> None:
+        if self._opener is not None and not self._opener.done():
+            self._opener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._opener
+        if self._sender is not None:
+            self._sender.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sender
+        if self._opened is not None:
+            await self._transport.close()
+        self._opened = self._sender = self._opener = None
+
+    def start(self, channel: str) -> None:
+        if not self.is_active(channel):
+            super().start(channel)
+        self._publish(channel, "start")
+
+    def end(self, channel: str) -> None:
+        self._publish(channel, "end")
+
+    async def attach(self, channel: str, websocket: Any) -> None:
+        # Opening replays the backlog, so channels started elsewhere are known,
+        # except one whose start is still on its way from another process.
+        try:
+            await self.open()
+        except Exception:
+            logger.warning("bus: transport unavailable, attaching locally only", exc_info=True)
+        if not self.is_active(channel) and self._sender is not None:
+            started = self._starting.setdefault(channel, asyncio.Event())
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(started.wait(), ATTACH_WAIT_SECONDS)
+            self._starting.pop(channel, None)
+        await super().attach(channel, websocket)
+
+    async def broadcast(self, channel: str, data: dict) -> None:
+        if not self.is_active(channel):
+            return
+        delivered = self._publish(channel, "message", data)
+        try:
+            await asyncio.wait_for(asyncio.shield(delivered), DELIVERY_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning("bus: %s message was not delivered back within timeout", channel)
+
+    def _publish(self, channel: str, kind: str, data: dict | None = None) -> asyncio.Future:
+        seq = next(self._seq)
+        delivered = asyncio.get_running_loop().create_future()
+        self._pending[seq] = delivered
+        self._outbox.put_nowait(
+            {"origin": self._origin, "seq": seq, "channel": channel, "kind": kind, "data": data}
+        )
+        if self._sender is None and (self._opener is None or self._opener.done()):
+            self._opener = asyncio.create_task(self._open_or_deliver_locally())
+        return delivered
+
+    async def _open_or_deliver_locally(self) -> None:
+        try:
+            await self.open()
+        except Exception:
+            # Without a transport nothing would drain the outbox, so apply the
+            # queued events here rather than leave broadcasts waiting on them.
+            logger.warning("bus: transport unavailable, delivering locally only", exc_info=True)
+            while not self._outbox.empty():
+                await self._deliver(self._outbox.get_nowait())
+
+    async def _send_loop(self) -> None:
+        while True:
+            event = await self._outbox.get()
+            try:
+                await self._transport.publish(event)
+            except Exception:
+                # Keep local subscribers served even when the transport is down.
+                logger.exception("bus: publish failed, delivering locally only")
+                await self._deliver(event)
+
+    async def _deliver(self, event: dict[str, Any]) -> None:
+        channel, kind = event["channel"], event["kind"]
+        if kind == "start":
+            if not self.is_active(channel):
+                super().start(channel)
+            if channel in self._starting:
+                self._starting[channel].set()
+        elif kind == "message":
+            await super().broadcast(channel, event["data"])
+        elif kind == "end":
+            super().end(channel)
+        if event["origin"] == self._origin:
+            delivered = self._pending.pop(event["seq"], None)
+            if delivered is not None and not delivered.done():
+                delivered.set_result(None)
+
+
+class _Dedup:
+    """Drops events at or below the last delivered id, for replays after reconnecting."""
+
+    def __init__(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        self.last_id = 0
+
+    async def __call__(self, event_id: int, event: dict[str, Any]) -> None:
+        if event_id > self.last_id:
+            self.last_id = event_id
+            await self._deliver(event)
+
+
+class _OriginDedup:
+    """Drops events already delivered, by publisher and sequence number.
+
+    For transports whose event ids are not in delivery order: each publisher
+    sends its events one at a time, so its `seq` is, even when ids from
+    several publishers arrive out of order."""
+
+    def __init__(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        self._last_seq: dict[str, int] = {}
+
+    async def __call__(self, event: dict[str, Any]) -> None:
+        origin = event["origin"]
+        if event["seq"] > self._last_seq.get(origin, -1):
+            self._last_seq[origin] = event["seq"]
+            await self._deliver(event)
+
+
+class BusBroker:
+    """Single-host event broker for `UnixSocketTransport` clients.
+
+    Clients send `{"op": "subscribe", "topic": ...}`, then `{"op": "publish",
+    "event": ...}` lines. A new subscriber gets `hello`, the events of the
+    topic's open channels and `ready`. After that the broker numbers each
+    published event and writes it to every subscriber of the topic in the
+    order received."""
+
+    def __init__(self) -> None:
+        self.instance = uuid4().hex
+        self._ids = itertools.count(1)
+        self._subscribers: dict[str, set[asyncio.StreamWriter]] = {}
+        # topic -> channel -> encoded events since the channel started
+        self._history: dict[str, dict[str, list[bytes]]] = {}
+        self._server: asyncio.Server | None = None
+
+    async def serve(self, socket_path: Path) -> None:
+        """Listen on `socket_path` until `stop()` is called."""
+        socket_path.unlink(missing_ok=True)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle, path=str(socket_path), limit=STREAM_LIMIT
+        )
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for writers in self._subscribers.values():
+            for writer in writers:
+                writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        topic = None
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                if message["op"] == "subscribe":
+                    topic = message["topic"]
+                    self._subscribe(topic, writer)
+                elif message["op"] == "publish" and topic is not None:
+                    self._publish(topic, message["event"])
+        except (ConnectionError, asyncio.CancelledError):
+            # Cancelled when the loop shuts down with clients still connected.
+            pass
+        finally:
+            if topic is not None:
+                self._subscribers[topic].discard(writer)
+            writer.close()
+
+    def _subscribe(self, topic: str, writer: asyncio.StreamWriter) -> None:
+        writer.write(json.dumps({"op": "hello", "broker": self.instance}).encode() + b"\n")
+        for lines in self._history.get(topic, {}).values():
+            writer.writelines(lines)
+        writer.write(b'{"op": "ready"}\n')
+        self._subscribers.setdefault(topic, set()).add(writer)
+
+    def _publish(self, topic: str, event: dict[str, Any]) -> None:
+        line = json.dumps({"op": "event", "id": next(self._ids), "event": event}).encode() + b"\n"
+        channels = self._history.setdefault(topic, {})
+        if event["kind"] == "end":
+            channels.pop(event["channel"], None)
+        else:
+            channels.setdefault(event["channel"], []).append(line)
+        for writer in list(self._subscribers.get(topic, ())):
+            if writer.is_closing():
+                self._subscribers[topic].discard(writer)
+            elif writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                logger.warning("bus broker: dropping a client that stopped reading")
+                self._subscribers[topic].discard(writer)
+                writer.close()
+            else:
+                writer.write(line)
+
+
+class UnixSocketTransport(BusTransport):
+    """Connects to a `BusBroker`, reconnecting and catching up if the connection drops."""
+
+    def __init__(self, socket_path: Path, topic: str) -> None:
+        self.socket_path = socket_path
+        self.topic = topic
+        self._writer: asyncio.StreamWriter | None = None
+        self._task: asyncio.Task | None = None
+        self._broker: str | None = None
+        self._dedup: _Dedup | None = None
+
+    async def open(self, deliver: Deliver) -> None:
+        self._dedup = _Dedup(deliver)
+        reader = await self._connect()
+        await self._catch_up(reader)
+        self._task = asyncio.create_task(self._follow(reader))
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        if self._writer is None or self._writer.is_closing():
+            raise ConnectionError(f"Not connected to the bus broker at {self.socket_path}")
+        self._writer.write(json.dumps({"op": "publish", "event": event}).encode() + b"\n")
+        await self._writer.drain()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        if self._writer is not None:
+            self._writer.close()
+
+    async def _connect(self) -> asyncio.StreamReader:
+        reader, self._writer = await asyncio.open_unix_connection(
+            str(self.socket_path), limit=STREAM_LIMIT
+        )
+        self._writer.write(json.dumps({"op": "subscribe", "topic": self.topic}).encode() + b"\n")
+        hello = json.loads(await reader.readline())
+        if hello["broker"] != self._broker:
+            # A restarted broker numbers events from 1 again.
+            self._broker = hello["broker"]
+            self._dedup.last_id = 0
+        return reader
+
+    async def _catch_up(self, reader: asyncio.StreamReader) -> None:
+        while line := await reader.readline():
+            if not await self._apply(line):
+                return
+
+    async def _apply(self, line: bytes) -> bool:
+        """Deliver one broker line; False for the `ready` marker after a replay."""
+        message = json.loads(line)
+        if message["op"] != "event":
+            return False
+        await self._dedup(message["id"], message["event"])
+        return True
+
+    async def _follow(self, reader: asyncio.StreamReader) -> None:
+        while True:
+            try:
+                while line := await reader.readline():
+                    await self._apply(line)
+            except ConnectionError:
+                pass
+            logger.warning("bus broker at %s disconnected; reconnecting", self.socket_path)
+            while True:
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                try:
+                    reader = await self._connect()
+                    break
+                except (OSError, ValueError):
+                    continue
+
+
+class PostgresTransport(BusTransport):
+    """LISTEN/NOTIFY with a backing table holding the events of open channels.
+
+    Each publish inserts the event and notifies in one transaction, so
+    listeners receive events in commit order. Notifications carry the event
+    when it fits in a NOTIFY payload, otherwise just its id. Ending a
+    channel deletes its rows.
+
+    Row ids are assigned at INSERT, not commit, so concurrent publishers'
+    events can arrive with a lower id after a higher one; replays are
+    therefore deduplicated by publisher sequence (`_OriginDedup`), not id."""
+
+    TABLE = "voicetest_bus_events"
+    # NOTIFY payloads must stay under 8000 bytes.
+    MAX_INLINE_PAYLOAD = 7000
+
+    def __init__(self, url: str, topic: str) -> None:
+        self.url = url
+        self.topic = topic
+        self.notify_channel = f"voicetest_bus_{topic}"
+        self._listen_conn = None
+        self._conn = None
+        self._task: asyncio.Task | None = None
+        self._dedup: _OriginDedup | None = None
+
+    async def open(self, deliver: Deliver) -> None:
+        try:
+            import psycopg  # noqa: PLC0415
+        except ImportError as e:
+            raise ImportError(
+                "psycopg is required for the postgres bus backend. "
+                "Install it with: uv add 'voicetest[postgres]'"
+            ) from e
+
+        self._dedup = _OriginDedup(deliver)
+        self._conn = await psycopg.AsyncConnection.connect(self.url, autocommit=True)
+        await self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+            "id BIGSERIAL PRIMARY KEY, topic TEXT NOT NULL, channel TEXT NOT NULL, "
+            "event TEXT NOT NULL)"
+        )
+        await self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.TABLE}_topic_channel "
+            f"ON {self.TABLE} (topic, channel)"
+        )
+        self._listen_conn = await psycopg.AsyncConnection.connect(self.url, autocommit=True)
+        # LISTEN before reading the backlog so nothing falls between the two.
+        await self._listen_conn.execute(f'LISTEN "{self.notify_channel}"')
+        cursor = await self._conn.execute(
+            f"SELECT id, event FROM {self.TABLE} WHERE topic = %s ORDER BY id", (self.topic,)
+        )
+        for _event_id, event in await cursor.fetchall():
+            await self._dedup(json.loads(event))
+        self._task = asyncio.create_task(self._follow())
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        encoded = json.dumps(event)
+        async with self._conn.transaction():
+            cursor = await self._conn.execute(
+                f"INSERT INTO {self.TABLE} (topic, channel, event) VALUES (%s, %s, %s) "
+                "RETURNING id",
+                (self.topic, event["channel"], encoded),
+            )
+            (event_id,) = await cursor.fetchone()
+            if event["kind"] == "end":
+                await self._conn.execute(
+                    f"DELETE FROM {self.TABLE} WHERE topic = %s AND channel = %s",
+                    (self.topic, event["channel"]),
+                )
+            payload = {"id": event_id}
+            if len(encoded) <= self.MAX_INLINE_PAYLOAD:
+                payload["event"] = event
+            await self._conn.execute(
+                "SELECT pg_notify(%s, %s)", (self.notify_channel, json.dumps(payload))
+            )
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        for conn in (self._listen_conn, self._conn):
+            if conn is not None:
+                await conn.close()
+
+    async def _follow(self) -> None:
+        async for notify in self._listen_conn.notifies():
+            payload = json.loads(notify.payload)
+            event = payload.get("event")
+            if event is None:
+                cursor = await self._conn.execute(
+                    f"SELECT event FROM {self.TABLE} WHERE id = %s", (payload["id"],)
+                )
+                row = await cursor.fetchone()
+                if row is None:
+                    # Its channel ended before we read it.
+                    continue
+                event = json.loads(row[0])
+            await self._dedup(event)
+
+
+def create_bus(topic: str) -> BroadcastBus:
+    """The bus selected by VOICETEST_BUS, for channels of the given topic."""
+    backend = os.environ.get("VOICETEST_BUS", "")
+    if backend in ("", "local"):
+        return BroadcastBus()
+    if backend.startswith("unix:"):
+        return RelayedBroadcastBus(UnixSocketTransport(Path(backend.removeprefix("unix:")), topic))
+    if backend == "postgres":
+        url = os.environ.get("DATABASE_URL")
+        if not url:
+            raise ValueError("VOICETEST_BUS=postgres needs DATABASE_URL to be set")
+        return RelayedBroadcastBus(PostgresTransport(url, topic))
+    raise ValueError(f"Unknown VOICETEST_BUS backend: {backend!r}")
@@ -12,11 +12,10 @@ import subprocess
 from typing import Any
 from uuid import uuid4
 
-from livekit import api as livekit_api
-
 from voicetest.models.agent import AgentGraph
 from voicetest.services.settings import SettingsService
 from voicetest.web.broadcast import SessionRegistry
+from voicetest.web.bus import create_bus
 
 
 @dataclass
@@ -66,11 +65,17 @@ class CallManager:
         config: LiveKitConfig,
     ):
         self.config = config
-        self._sessions: SessionRegistry[ActiveCall] = SessionRegistry()
+        self._sessions: SessionRegistry[ActiveCall] = SessionRegistry(create_bus("call"))
         self._settings = settings_service
 
+    def stats(self) -> dict[str, int]:
+        """Active calls, their WebSocket subscribers and queued broadcasts."""
+        return self._sessions.stats()
+
     async def create_room(self, room_name: str) -> None:
         """Create a LiveKit room."""
+        from livekit import api as livekit_api  # noqa: PLC0415
+
         url = self.config.url.replace("ws://", "http://").replace("wss://", "https://")
         async with livekit_api.LiveKitAPI(
             url=url,
@@ -81,6 +86,8 @@ class CallManager:
 
     def generate_token(self, room_name: str, identity: str, is_agent: bool = False) -> str:
         """Generate a LiveKit access token."""
+        from livekit import api as livekit_api  # noqa: PLC0415
+
         grant = livekit_api.VideoGrants(
             room_join=True,
             room=room_name,
@@ -18,6 +18,7 @@ from voicetest.models.test_case import RunOptions
 from voicetest.services.settings import SettingsService
 from voicetest.settings import resolve_model
 from voicetest.web.broadcast import SessionRegistry
+from voicetest.web.bus import create_bus
 
 
 logger = logging.getLogger(__name__)
@@ -42,9 +43,13 @@ class ChatManager:
     """Manages text-based chat sessions with agents."""
 
     def __init__(self, settings_service: SettingsService) -> None:
-        self._sessions: SessionRegistry[ActiveChat] = SessionRegistry()
+        self._sessions: SessionRegistry[ActiveChat] = SessionRegistry(create_bus("chat"))
         self._settings = settings_service
 
+    def stats(self) -> dict[str, int]:
+        """Active chats, their WebSocket subscribers and queued broadcasts."""
+        return self._sessions.stats()
+
     async def start_chat(
         self,
         agent_id: str,
@@ -81,6 +86,31 @@ class ChatManager:
 
         return {"chat_id": call_record["id"]}
 
+    def resume_chat(self, call: dict, graph: AgentGraph, call_repo: Any) -> bool:
+        """Recreate the session of a chat left active by a stopped server.
+
+        Restores the engine from the checkpoint saved after its last agent
+        reply. Returns False if the chat has no usable checkpoint."""
+        if call["id"] in self._sessions:
+            return True
+        checkpoint = call_repo.get_checkpoint(call["id"])
+        if checkpoint is None:
+            return False
+        engine = ConversationEngine(graph, checkpoint["model"], RunOptions())
+        try:
+            engine.restore(checkpoint["engine"])
+        except ValueError:
+            logger.warning("Cannot resume chat %s from its checkpoint", call["id"], exc_info=True)
+            return False
+        active_chat = ActiveChat(
+            chat_id=call["id"],
+            agent_id=call["agent_id"],
+            engine=engine,
+            transcript=[m.model_dump() for m in engine.transcript],
+        )
+        self._sessions.register(call["id"], active_chat)
+        return True
+
     async def process_message(
         self,
         chat_id: str,
@@ -131,6 +161,10 @@ class ChatManager:
                 # Update transcript with agent response
                 active_chat.transcript = [m.model_dump() for m in active_chat.engine.transcript]
                 call_repo.update_transcript(chat_id, active_chat.transcript)
+                call_repo.save_checkpoint(
+                    chat_id,
+                    {"model": active_chat.engine.model, "engine": active_chat.engine.snapshot()},
+                )
 
                 # Broadcast full transcript update
                 await self._sessions.broadcast(
@@ -1,7 +1,8 @@
 """In-process coordination state for in-flight test runs.
 
 Owns the per-run cancellation flags + orphan-cleanup single-flight, and
-delegates WebSocket pub/sub to a `BroadcastBus`.
+delegates WebSocket pub/sub to a `BroadcastBus` (cross-process when
+VOICETEST_BUS is set, see voicetest.web.bus).
 
 Registered as a Punq singleton so the FastAPI app, the WebSocket handlers,
 and the background `_execute_run` task all share one instance per process.
@@ -12,15 +13,18 @@ import contextlib
 import threading
 from typing import Any
 
-from voicetest.web.broadcast import BroadcastBus
+from voicetest.web.bus import create_bus
 
 
 class RunCoordinator:
     """Per-run cancellation + orphan-cleanup + broadcast surface."""
 
+    # False when runs execute in executor processes (see voicetest.web.executor).
+    executes_locally = True
+
     def __init__(self) -> None:
         self._runs: dict[str, dict[str, Any]] = {}
-        self._bus = BroadcastBus()
+        self._bus = create_bus("run")
         self._cleaning_orphans: set[str] = set()
         self._cleaning_orphans_lock = threading.Lock()
 
@@ -29,9 +33,16 @@ class RunCoordinator:
         self._runs[run_id] = {
             "cancel": asyncio.Event(),
             "cancelled_tests": set(),
+            "started": False,
         }
         self._bus.start(run_id)
 
+    def mark_started(self, run_id: str) -> None:
+        """Record that the run's job has begun executing (it is no longer queued)."""
+        run = self._runs.get(run_id)
+        if run is not None:
+            run["started"] = True
+
     def end(self, run_id: str) -> None:
         """Drop a run's coordination state. Called from _execute_run's finally."""
         self._runs.pop(run_id, None)
@@ -40,6 +51,21 @@ class RunCoordinator:
     def is_active(self, run_id: str) -> bool:
         return run_id in self._runs
 
+    async def is_orphaned(self, run_id: str) -> bool:
+        """Whether an incomplete run has nothing executing it any more.
+
+        Runs execute in this process, so that is whenever it is not active."""
+        return not self.is_active(run_id)
+
+    def stats(self) -> dict[str, int]:
+        """Active and not-yet-started runs plus the bus's subscriber and queue counts."""
+        runs = list(self._runs.values())
+        return {
+            "runs": len(runs),
+            "queued_runs": sum(not run["started"] for run in runs),
+            **self._bus.stats(),
+        }
+
     async def attach(self, run_id: str, websocket: Any) -> None:
         await self._bus.attach(run_id, websocket)
 
@@ -0,0 +1,398 @@
+"""Run execution in separate executor processes.
+
+By default `voicetest serve` executes runs inside the API process, on the
+same event loop that serves REST and WebSockets. With
+`voicetest serve --executors N`, runs execute in N `voicetest executor`
+processes instead. Each executor listens on a Unix socket, and every API
+worker connects to all of them and exchanges one JSON object per line:
+
+- API -> executor: `submit` (a serialized `RunJob`), `cancel_run`,
+  `cancel_test` and `sync`.
+- executor -> API: `runs` (the executor's active runs, sent on connect),
+  `run_started`, `run_running`, `run_event` (one broadcast message),
+  `run_ended` and `synced` (the reply to `sync`).
+
+Each API worker feeds those events into its own `RemoteRunCoordinator`, so
+WebSocket attach, replay and `is_active` behave as in single-process mode on
+every worker. A worker learns of a run another worker submitted only once
+the executor announces it, so before treating a run as unknown it sends
+`sync` to every executor: each replies after everything it has already
+announced. API workers and executors share the database, so this mode
+needs DATABASE_URL pointing at PostgreSQL; a DuckDB file admits one process."""
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import punq
+
+from voicetest.services.run_runner import RunJob
+from voicetest.services.run_runner import RunRunner
+from voicetest.web.broadcast import BroadcastBus
+from voicetest.web.coordinator import RunCoordinator
+
+
+logger = logging.getLogger(__name__)
+
+# Run events carry whole transcripts.
+STREAM_LIMIT = 64 << 20
+
+RECONNECT_DELAY_SECONDS = 1.0
+
+# How long a worker waits for every executor to answer `sync`.
+SYNC_TIMEOUT_SECONDS = 5.0
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    # Test records from the DB carry datetimes; executors only need them as text.
+    return json.dumps(message, default=str).encode() + b"\n"
+
+
+class RelayRunCoordinator(RunCoordinator):
+    """Executor-side coordinator: run lifecycle and broadcasts go to every API worker."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Run events reach API workers over the executor links, not a shared bus.
+        self._bus = BroadcastBus()
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    def add_writer(self, writer: asyncio.StreamWriter) -> None:
+        """Send this worker the active runs, then include it in every later event."""
+        runs = [{"run_id": run_id, "started": run["started"]} for run_id, run in self._runs.items()]
+        writer.write(_encode({"op": "runs", "runs": runs}))
+        self._writers.add(writer)
+
+    def remove_writer(self, writer: asyncio.StreamWriter) -> None:
+        self._writers.discard(writer)
+
+    def start(self, run_id: str) -> None:
+        super().start(run_id)
+        self._publish({"op": "run_started", "run_id": run_id})
+
+    def mark_started(self, run_id: str) -> None:
+        super().mark_started(run_id)
+        self._publish({"op": "run_running", "run_id": run_id})
+
+    def end(self, run_id: str) -> None:
+        super().end(run_id)
+        self._publish({"op": "run_ended", "run_id": run_id})
+
+    async def broadcast(self, run_id: str, data: dict) -> None:
+        if not self.is_active(run_id):
+            return
+        self._publish({"op": "run_event", "run_id": run_id, "data": data})
+        for writer in list(self._writers):
+            try:
+                await writer.drain()
+            except ConnectionError:
+                self._writers.discard(writer)
+
+    def _publish(self, message: dict[str, Any]) -> None:
+        line = _encode(message)
+        for writer in list(self._writers):
+            if writer.is_closing():
+                self._writers.discard(writer)
+            else:
+                writer.write(line)
+
+
+class ExecutorServer:
+    """Executes submitted runs and relays their events to connected API workers."""
+
+    def __init__(self, container: punq.Container):
+        self.coordinator = RelayRunCoordinator()
+        self._runner = container.resolve(RunRunner, coordinator=self.coordinator)
+        self._tasks: set[asyncio.Task] = set()
+        self._server: asyncio.Server | None = None
+
+    async def serve(self, socket_path: Path) -> None:
+        """Listen on `socket_path` until `stop()` is called."""
+        socket_path.unlink(missing_ok=True)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle, path=str(socket_path), limit=STREAM_LIMIT
+        )
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+            for task in list(self._tasks):
+                task.cancel()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+
+    def submit(self, job: RunJob) -> None:
+        """Register the run and execute it on a background task."""
+        self.coordinator.start(job.run_id)
+        task = asyncio.create_task(self._runner.execute(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def resume_interrupted(self) -> int:
+        """Submit the unfinished tests of runs a stopped server left incomplete."""
+        jobs = self._runner.interrupted_jobs()
+        for job in jobs:
+            self.submit(job)
+        if jobs:
+            logger.info("executor: resumed %d interrupted runs", len(jobs))
+        return len(jobs)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.coordinator.add_writer(writer)
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                op = message["op"]
+                if op == "submit":
+                    self.submit(RunJob.from_dict(message["job"]))
+                elif op == "cancel_run":
+                    self.coordinator.cancel_run(message["run_id"])
+                elif op == "cancel_test":
+                    self.coordinator.cancel_test(message["run_id"], message["result_id"])
+                elif op == "sync":
+                    # Everything published to this writer so far is ahead of the reply.
+                    writer.write(_encode({"op": "synced", "id": message["id"]}))
+                else:
+                    logger.warning("executor: unknown op %r", op)
+        except ConnectionError:
+            pass
+        finally:
+            self.coordinator.remove_writer(writer)
+            writer.close()
+
+
+class ExecutorLink:
+    """An API worker's connection to one executor, reconnecting if it drops."""
+
+    def __init__(self, socket_path: Path, coordinator: "RemoteRunCoordinator"):
+        self.socket_path = socket_path
+        self._coordinator = coordinator
+        self._writer: asyncio.StreamWriter | None = None
+        self._task: asyncio.Task | None = None
+        self._syncs: dict[int, asyncio.Future] = {}
+        self._sync_ids = itertools.count()
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def open(self, timeout: float) -> None:
+        """Connect, waiting up to `timeout` seconds for the executor, then keep connected."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            try:
+                reader = await self._connect()
+                break
+            except OSError:
+                if asyncio.get_running_loop().time() >= deadline:
+                    raise
+                await asyncio.sleep(0.05)
+        self._task = asyncio.create_task(self._follow(reader))
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        if self._writer is not None:
+            self._writer.close()
+
+    def send(self, message: dict[str, Any]) -> None:
+        if not self.connected:
+            raise ConnectionError(f"Executor at {self.socket_path} is not connected")
+        self._writer.write(_encode(message))
+
+    async def drain(self) -> None:
+        if self._writer is not None:
+            await self._writer.drain()
+
+    async def sync(self) -> None:
+        """Wait until every event the executor had sent when it received this
+        request has been applied. Raises ConnectionError if the link drops."""
+        sync_id = next(self._sync_ids)
+        synced = asyncio.get_running_loop().create_future()
+        self._syncs[sync_id] = synced
+        try:
+            self.send({"op": "sync", "id": sync_id})
+            await synced
+        finally:
+            self._syncs.pop(sync_id, None)
+
+    async def _connect(self) -> asyncio.StreamReader:
+        reader, self._writer = await asyncio.open_unix_connection(
+            str(self.socket_path), limit=STREAM_LIMIT
+        )
+        return reader
+
+    async def _follow(self, reader: asyncio.StreamReader) -> None:
+        while True:
+            try:
+                while line := await reader.readline():
+                    message = json.loads(line)
+                    if message["op"] == "synced":
+                        synced = self._syncs.get(message["id"])
+                        if synced is not None and not synced.done():
+                            synced.set_result(None)
+                    else:
+                        await self._coordinator.apply(self, message)
+            except ConnectionError:
+                pass
+            self._writer = None
+            for synced in self._syncs.values():
+                if not synced.done():
+                    synced.set_exception(ConnectionError("Executor disconnected"))
+            self._coordinator.executor_lost(self)
+            logger.warning("executor at %s disconnected; reconnecting", self.socket_path)
+            while True:
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                try:
+                    reader = await self._connect()
+                    break
+                except OSError:
+                    continue
+
+
+class RemoteRunCoordinator(RunCoordinator):
+    """API-side coordinator whose runs execute in executor processes.
+
+    Run state and the WebSocket bus stay local to this worker; executors
+    report each run's lifecycle and broadcasts, and cancellation is
+    forwarded to the executor that owns the run."""
+
+    executes_locally = False
+
+    def __init__(self, socket_paths: list[Path]):
+        super().__init__()
+        # Every worker gets every run event from the executors already.
+        self._bus = BroadcastBus()
+        self._links = [ExecutorLink(path, self) for path in socket_paths]
+        self._owners: dict[str, ExecutorLink] = {}
+
+    async def open(self, timeout: float = 30.0) -> None:
+        """Connect to every executor. Raises OSError if one is unreachable."""
+        await asyncio.gather(*(link.open(timeout) for link in self._links))
+
+    async def close(self) -> None:
+        await asyncio.gather(*(link.close() for link in self._links))
+
+    def start(self, run_id: str) -> None:
+        # Executors announce runs this worker already registered in start_run.
+        if not self.is_active(run_id):
+            super().start(run_id)
+
+    def end(self, run_id: str) -> None:
+        self._owners.pop(run_id, None)
+        super().end(run_id)
+
+    async def is_orphaned(self, run_id: str) -> bool:
+        """Whether no executor is running `run_id`.
+
+        The local run table can lag behind: a run submitted by another worker
+        is unknown here until its executor announces it, and runs of a
+        disconnected executor are dropped although it may still be running
+        them. So a run counts as orphaned only when every executor is
+        connected and, once caught up with each of them, none reports it."""
+        if self.is_active(run_id):
+            return False
+        if not all(link.connected for link in self._links):
+            return False
+        try:
+            await self._sync()
+        except (ConnectionError, TimeoutError):
+            return False
+        return not self.is_active(run_id)
+
+    async def attach(self, run_id: str, websocket: Any) -> None:
+        if not self.is_active(run_id):
+            # The run may have been submitted by another worker and not yet announced.
+            with contextlib.suppress(ConnectionError, TimeoutError):
+                await self._sync()
+        await super().attach(run_id, websocket)
+
+    async def _sync(self) -> None:
+        await asyncio.wait_for(
+            asyncio.gather(*(link.sync() for link in self._links)), SYNC_TIMEOUT_SECONDS
+        )
+
+    async def submit(self, job: RunJob) -> None:
+        """Hand the job to the connected executor with the fewest active runs."""
+        links = [link for link in self._links if link.connected]
+        if not links:
+            self.end(job.run_id)
+            raise ConnectionError("No run executor is connected")
+        owned = list(self._owners.values())
+        link = min(links, key=owned.count)
+        self._owners[job.run_id] = link
+        link.send({"op": "submit", "job": job.to_dict()})
+        # Flushed before start_run responds, so the executor has the job
+        # before any other worker can ask it about the run.
+        await link.drain()
+
+    def cancel_run(self, run_id: str) -> None:
+        super().cancel_run(run_id)
+        self._forward(run_id, {"op": "cancel_run", "run_id": run_id})
+
+    def cancel_test(self, run_id: str, result_id: str) -> None:
+        super().cancel_test(run_id, result_id)
+        self._forward(run_id, {"op": "cancel_test", "run_id": run_id, "result_id": result_id})
+
+    def _forward(self, run_id: str, message: dict[str, Any]) -> None:
+        link = self._owners.get(run_id)
+        if link is not None and link.connected:
+            link.send(message)
+
+    async def apply(self, link: ExecutorLink, message: dict[str, Any]) -> None:
+        """Apply one event received from `link`'s executor."""
+        op = message["op"]
+        if op == "runs":
+            live = {run["run_id"] for run in message["runs"]}
+            for run_id in [r for r, owner in self._owners.items() if owner is link]:
+                if run_id not in live:
+                    self.end(run_id)
+            for run in message["runs"]:
+                self.start(run["run_id"])
+                self._owners[run["run_id"]] = link
+                if run["started"]:
+                    self.mark_started(run["run_id"])
+        elif op == "run_started":
+            self.start(message["run_id"])
+            self._owners[message["run_id"]] = link
+        elif op == "run_running":
+            self.mark_started(message["run_id"])
+        elif op == "run_event":
+            await self.broadcast(message["run_id"], message["data"])
+        elif op == "run_ended":
+            self.end(message["run_id"])
+
+    def executor_lost(self, link: ExecutorLink) -> None:
+        """The executor went away, and its runs with it: stop reporting them active."""
+        for run_id in [r for r, owner in self._owners.items() if owner is link]:
+            self.end(run_id)
+
+
+async def run_executor(socket_path: Path, resume: bool = False) -> None:
+    """Entry point of a `voicetest executor` process.
+
+    With `resume`, runs left incomplete by a previous server are restarted
+    first (unless `run.resume_interrupted` is off)."""
+    from voicetest.container import create_container  # noqa: PLC0415
+    from voicetest.services.settings import SettingsService  # noqa: PLC0415
+    from voicetest.util.cache import setup_cache_from_settings  # noqa: PLC0415
+
+    container = create_container()
+    settings = container.resolve(SettingsService).get_settings()
+    setup_cache_from_settings(settings.cache)
+    server = ExecutorServer(container)
+    if resume and settings.run.resume_interrupted:
+        server.resume_interrupted()
+    await server.serve(socket_path)
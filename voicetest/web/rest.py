@@ -1,16 +1,19 @@
 """REST API for voicetest."""
 
+import asyncio
 from collections.abc import AsyncIterator
 import contextlib
 from datetime import UTC
 from datetime import datetime
 from importlib.metadata import version as pkg_version
+import io
 import json
 import logging
 import os
 from pathlib import Path
 import tempfile
 from typing import Any
+import zipfile
 
 from fastapi import APIRouter
 from fastapi import BackgroundTasks
@@ -28,14 +31,16 @@ from pydantic import BaseModel
 from sqlalchemy import bindparam
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from starlette.websockets import WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
 from voicetest.container import create_container
 from voicetest.demo import get_demo_agent
 from voicetest.demo import get_demo_tests
+from voicetest.exceptions import ArchiveInProgressError
 from voicetest.exceptions import StaleGraphSchemaError
-from voicetest.importers.transcripts.retell import parse_retell_file
+from voicetest.importers.transcripts.retell import iter_retell_file
 from voicetest.models.agent import AgentGraph
 from voicetest.models.agent import GlobalMetric
 from voicetest.models.agent import MetricsConfig
@@ -55,6 +60,7 @@ from voicetest.services.evaluation import EvaluationService
 from voicetest.services.platforms import PlatformService
 from voicetest.services.run_runner import RunJob
 from voicetest.services.run_runner import RunRunner
+from voicetest.services.runs import ORPHANED_RESULT_MESSAGE
 from voicetest.services.runs import RunService
 from voicetest.services.settings import SettingsService
 from voicetest.services.snippets import SnippetService
@@ -67,7 +73,16 @@ from voicetest.storage.models import Run as RunModel
 from voicetest.storage.repositories import AgentRepository
 from voicetest.storage.repositories import CallRepository
 from voicetest.storage.repositories import TestCaseRepository
+from voicetest.util.cache import cache_stats
 from voicetest.util.cache import setup_cache_from_settings
+from voicetest.util.metrics import BROADCAST_QUEUED
+from voicetest.util.metrics import CONTENT_TYPE
+from voicetest.util.metrics import REGISTRY
+from voicetest.util.metrics import RUNS_IN_FLIGHT
+from voicetest.util.metrics import RUNS_QUEUED
+from voicetest.util.metrics import SESSIONS_ACTIVE
+from voicetest.util.metrics import WEBSOCKET_SUBSCRIBERS
+from voicetest.util.metrics import monitor_event_loop_lag
 from voicetest.util.pathutil import resolve_within
 from voicetest.web.calls import CallManager
 from voicetest.web.chat import ChatManager
@@ -108,8 +123,6 @@ def _db_session(http_request: Request) -> Session:
 
 _logger = logging.getLogger("voicetest.web.rest")
 
-_ORPHAN_ERROR_MESSAGE = "Run orphaned - backend stopped"
-
 # Pre-compiled SQL for orphan cleanup. Two bulk UPDATEs replace N+1
 # round-trips and use guard clauses so a redundant cleanup (e.g. after a
 # server restart where the in-memory guard was lost) is a no-op rather
@@ -199,7 +212,54 @@ async def _lifespan(app: FastAPI):
     init_storage(app.state.container)
     settings = app.state.container.resolve(SettingsService).get_settings()
     setup_cache_from_settings(settings.cache)
-    yield
+    if settings.archive.retention_days is not None:
+        _apply_retention(app.state.container)
+    coordinator = app.state.container.resolve(RunCoordinator)
+    if not coordinator.executes_locally:
+        await coordinator.open()
+    elif settings.run.resume_interrupted:
+        app.state.resumed_runs = _resume_interrupted_runs(app.state.container, coordinator)
+    lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+    try:
+        yield
+    finally:
+        lag_monitor.cancel()
+        if not coordinator.executes_locally:
+            await coordinator.close()
+
+
+def _resume_interrupted_runs(container, coordinator: RunCoordinator) -> set[asyncio.Task]:
+    """Restart the unfinished tests of runs a stopped server left incomplete.
+
+    Returns the running tasks so they are not garbage-collected; failures
+    never block startup."""
+    runner = container.resolve(RunRunner)
+    tasks: set[asyncio.Task] = set()
+    try:
+        jobs = runner.interrupted_jobs()
+    except Exception:
+        _logger.exception("resuming interrupted runs failed")
+        return tasks
+    for job in jobs:
+        coordinator.start(job.run_id)
+        task = asyncio.create_task(runner.execute(job))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if jobs:
+        _logger.info("resumed %d interrupted runs", len(jobs))
+    return tasks
+
+
+def _apply_retention(container) -> None:
+    """Archive runs past the configured retention window; failures never block startup."""
+    try:
+        summary = container.resolve(RunService).archive_runs()
+        if summary["runs"]:
+            _logger.info("archived %d runs to %s", summary["runs"], summary["output_dir"])
+    except ArchiveInProgressError:
+        _logger.info("skipping run retention: another process is archiving")
+    except Exception:
+        _logger.exception("run retention failed")
 
 
 app = FastAPI(
@@ -491,6 +551,12 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/cache/stats")
+async def get_cache_stats() -> dict:
+    """Size and hit/miss/eviction counters of each LLM cache tier in this process."""
+    return cache_stats()
+
+
 class ExportFormatInfo(BaseModel):
     """Export format information for API response."""
 
@@ -672,6 +738,9 @@ def _require_agent(http_request: Request, agent_id: str) -> dict:
     return agent
 
 
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
 @contextlib.asynccontextmanager
 async def _saved_upload(file: UploadFile) -> AsyncIterator[Path]:
     """Save an UploadFile to a temp path; remove it on exit.
@@ -681,8 +750,8 @@ async def _saved_upload(file: UploadFile) -> AsyncIterator[Path]:
         raise HTTPException(status_code=400, detail="No filename provided")
     suffix = Path(file.filename).suffix
     with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        content = await file.read()
-        tmp.write(content)
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            tmp.write(chunk)
         tmp_path = Path(tmp.name)
     try:
         yield tmp_path
@@ -773,12 +842,17 @@ async def import_call(
     file: UploadFile,
     http_request: Request,
     format: str = "retell",
+    batch_size: int = 500,
+    include_results: bool = True,
 ) -> dict:
     """Import call transcripts as a new Run with imported Results.
 
     The uploaded file's content is parsed by a platform-specific adapter
     (currently Retell only). Each conversation in the file becomes one Result
-    inside the created Run, with status="imported" and no test_case_id linkage."""
+    inside the created Run, with status="imported" and no test_case_id linkage.
+    The upload is spooled to disk and streamed into the database
+    `batch_size` conversations at a time; pass `include_results=false` to get
+    just the run record back for very large imports."""
     _require_agent(http_request, agent_id)
 
     if format not in _SUPPORTED_TRANSCRIPT_FORMATS:
@@ -790,17 +864,21 @@ async def import_call(
             ),
         )
 
+    def on_progress(count: int) -> None:
+        _logger.info("import-call %s: %d conversations imported", agent_id, count)
+
     try:
         async with _saved_upload(file) as tmp_path:
-            results = parse_retell_file(tmp_path)
+            return _resolve(http_request, RunService).import_calls(
+                agent_id,
+                iter_retell_file(tmp_path),
+                batch_size=batch_size,
+                on_progress=on_progress,
+                include_results=include_results,
+            )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from None
 
-    if not results:
-        raise HTTPException(status_code=400, detail="No conversations found in file")
-
-    return _resolve(http_request, RunService).import_calls(agent_id, results)
-
 
 @router.post("/agents")
 async def create_agent(request: CreateAgentRequest, http_request: Request) -> dict:
@@ -1151,6 +1229,20 @@ async def list_runs_for_agent(agent_id: str, http_request: Request, limit: int =
     return _resolve(http_request, RunService).list_runs(agent_id, limit)
 
 
+@router.get("/agents/{agent_id}/stats")
+async def get_agent_stats(agent_id: str, http_request: Request, last_runs: int = 30) -> dict:
+    """Node failure rates, metric pass-rate deltas and tool usage over recent runs."""
+    _require_agent(http_request, agent_id)
+    return _resolve(http_request, RunService).get_stats(agent_id, last_runs)
+
+
+@router.get("/agents/{agent_id}/usage")
+async def get_agent_usage(agent_id: str, http_request: Request, days: int = 30) -> dict:
+    """LLM token usage and cost per day over the agent's runs of the last `days` days."""
+    _require_agent(http_request, agent_id)
+    return _resolve(http_request, RunService).get_usage(agent_id, days)
+
+
 @router.get("/runs/{run_id}")
 async def get_run(run_id: str, http_request: Request) -> dict:
     """Get a run with all results."""
@@ -1167,7 +1259,7 @@ async def get_run(run_id: str, http_request: Request) -> dict:
     # single-flighted per run_id; concurrent clicks see owns=False and skip
     # straight to the response while the writes happen exactly once.
     coordinator = _resolve(http_request, RunCoordinator)
-    if run["completed_at"] is None and not coordinator.is_active(run_id):
+    if run["completed_at"] is None and await coordinator.is_orphaned(run_id):
         run["completed_at"] = datetime.now(UTC).isoformat()
 
         orphaned_result_ids: list[str] = []
@@ -1175,7 +1267,7 @@ async def get_run(run_id: str, http_request: Request) -> dict:
             if result["status"] == "running":
                 orphaned_result_ids.append(result["id"])
                 result["status"] = "error"
-                result["error_message"] = _ORPHAN_ERROR_MESSAGE
+                result["error_message"] = ORPHANED_RESULT_MESSAGE
 
         with coordinator.claim_orphan_cleanup(run_id) as owns:
             if owns:
@@ -1202,7 +1294,7 @@ def _cleanup_orphaned_run(http_request: Request, run_id: str, result_ids: list[s
         if result_ids:
             session.execute(
                 _UPDATE_RESULTS_ORPHANED,
-                {"rids": result_ids, "msg": _ORPHAN_ERROR_MESSAGE},
+                {"rids": result_ids, "msg": ORPHANED_RESULT_MESSAGE},
             )
         session.commit()
         _logger.info("orphan-cleanup committed run=%s", run_id)
@@ -1210,6 +1302,53 @@ def _cleanup_orphaned_run(http_request: Request, run_id: str, result_ids: list[s
         _logger.exception("orphan-cleanup failed run=%s", run_id)
 
 
+@router.get("/runs/{run_id}/export")
+async def export_run(run_id: str, http_request: Request, format: str = "parquet") -> Response:
+    """Export a run as a zip of partitioned Parquet datasets (runs, results, metrics, messages)."""
+    if format != "parquet":
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {format}")
+    run_svc = _resolve(http_request, RunService)
+    if not run_svc.run_exists(run_id):
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    content = await run_in_threadpool(_export_run_zip, run_svc, run_id)
+    return Response(
+        content=content,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="run-{run_id}.parquet.zip"'},
+    )
+
+
+def _export_run_zip(run_svc: RunService, run_id: str) -> bytes:
+    """Write the run's Parquet datasets and zip them; blocking, so run off the event loop."""
+    buf = io.BytesIO()
+    with tempfile.TemporaryDirectory() as tmp:
+        run_svc.export_runs(tmp, run_ids=[run_id])
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+            for path in sorted(Path(tmp).rglob("*.parquet")):
+                zf.write(path, path.relative_to(tmp).as_posix())
+    return buf.getvalue()
+
+
+class ArchiveRunsRequest(BaseModel):
+    """Request to archive old runs; omitted fields fall back to `[archive]` settings."""
+
+    older_than_days: int | None = None
+
+
+@router.post("/runs/archive")
+async def archive_runs(request: ArchiveRunsRequest, http_request: Request) -> dict:
+    """Move completed runs older than the retention window to the Parquet archive."""
+    try:
+        return await run_in_threadpool(
+            _resolve(http_request, RunService).archive_runs, request.older_than_days
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+    except ArchiveInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from None
+
+
 @router.delete("/runs/{run_id}")
 async def delete_run(run_id: str, http_request: Request) -> dict:
     """Delete a run and all its results."""
@@ -1224,6 +1363,28 @@ async def delete_run(run_id: str, http_request: Request) -> dict:
     return {"status": "deleted", "id": run_id}
 
 
+@router.post("/runs/{run_id}/resume")
+async def resume_run(run_id: str, background_tasks: BackgroundTasks, http_request: Request) -> dict:
+    """Re-run the unfinished tests of a run whose server stopped mid-run.
+
+    Finished results are kept; running and orphaned ones are reset and
+    executed again with the options the run started with."""
+    coordinator = _resolve(http_request, RunCoordinator)
+    if coordinator.is_active(run_id):
+        raise HTTPException(status_code=400, detail="Run is still active")
+
+    try:
+        job = _resolve(http_request, RunRunner).resume_job(run_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Run not found") from None
+    if job is None:
+        raise HTTPException(status_code=400, detail="Run has no unfinished tests")
+
+    coordinator.start(run_id)
+    await _dispatch_run(http_request, background_tasks, coordinator, job)
+    return {"id": run_id, "agent_id": job.agent_id, "test_count": len(job.test_records)}
+
+
 @router.post("/runs/{source_run_id}/replay")
 async def replay_run(source_run_id: str, http_request: Request) -> dict:
     """Replay a source Run against the agent's current graph.
@@ -1549,8 +1710,10 @@ async def start_run(
     if not test_records:
         raise HTTPException(status_code=400, detail="No test cases to run")
 
+    options = resolve_run_options(request.options, _resolve(http_request, SettingsService))
+
     run_svc = _resolve(http_request, RunService)
-    run = run_svc.create_run(agent_id)
+    run = run_svc.create_run(agent_id, options)
 
     # Create all pending results upfront so they appear immediately in UI
     # Map test_case_id -> result_id for the background task to use
@@ -1559,11 +1722,10 @@ async def start_run(
         result_id = run_svc.create_pending_result(run["id"], test_record["id"], test_record["name"])
         result_ids[test_record["id"]] = result_id
 
-    options = resolve_run_options(request.options, _resolve(http_request, SettingsService))
-
     # Register the run with the coordinator BEFORE the background task starts
     # so WebSocket connections can register immediately.
-    _resolve(http_request, RunCoordinator).start(run["id"])
+    coordinator = _resolve(http_request, RunCoordinator)
+    coordinator.start(run["id"])
 
     # Create job and submit to executor
     job = RunJob(
@@ -1573,8 +1735,7 @@ async def start_run(
         result_ids=result_ids,
         options=options,
     )
-
-    background_tasks.add_task(_resolve(http_request, RunRunner).execute, job)
+    await _dispatch_run(http_request, background_tasks, coordinator, job)
 
     return {
         "id": run["id"],
@@ -1584,6 +1745,24 @@ async def start_run(
     }
 
 
+async def _dispatch_run(
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    coordinator: RunCoordinator,
+    job: RunJob,
+) -> None:
+    """Execute `job` in this process or hand it to an executor.
+
+    The caller has already called `coordinator.start(job.run_id)`."""
+    if coordinator.executes_locally:
+        background_tasks.add_task(_resolve(http_request, RunRunner).execute, job)
+        return
+    try:
+        await coordinator.submit(job)
+    except ConnectionError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+
+
 # Live call endpoints
 
 
@@ -1812,6 +1991,9 @@ async def chat_websocket(websocket: WebSocket, chat_id: str):
     chat_manager = container.resolve(ChatManager)
 
     try:
+        if call["status"] == "active" and chat_manager.get_active_chat(chat_id) is None:
+            _resume_chat(container, chat_manager, call, call_repo)
+
         # Send initial state
         active_chat = chat_manager.get_active_chat(chat_id)
         transcript = active_chat.transcript if active_chat else (call.get("transcript_json") or [])
@@ -1833,7 +2015,11 @@ async def chat_websocket(websocket: WebSocket, chat_id: str):
             data = await websocket.receive_json()
             if data.get("type") == "message":
                 content = data.get("content", "").strip()
-                if content:
+                if content and chat_manager.get_active_chat(chat_id) is None:
+                    await websocket.send_json(
+                        {"type": "error", "message": "Chat is no longer active"}
+                    )
+                elif content:
                     await chat_manager.process_message(chat_id, content, call_repo)
             elif data.get("type") == "end_chat":
                 await chat_manager.end_chat(chat_id, call_repo)
@@ -1846,6 +2032,16 @@ async def chat_websocket(websocket: WebSocket, chat_id: str):
         chat_manager.detach_websocket(chat_id, websocket)
 
 
+def _resume_chat(container, chat_manager: ChatManager, call: dict, call_repo) -> None:
+    """Pick up a chat a stopped server left active; on failure it stays read-only."""
+    try:
+        _agent, graph = container.resolve(AgentService).load_graph(call["agent_id"])
+        if chat_manager.resume_chat(call, graph, call_repo):
+            _vt_logger.info("resumed chat %s from its checkpoint", call["id"])
+    except Exception:
+        _vt_logger.exception("Cannot resume chat %s", call["id"])
+
+
 # Platform integration endpoints
 
 
@@ -1950,6 +2146,22 @@ async def sync_to_platform(
         raise HTTPException(status_code=500, detail=f"Failed to sync: {e}") from None
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(http_request: Request) -> Response:
+    """Operational metrics in the Prometheus text exposition format."""
+    runs = _resolve(http_request, RunCoordinator).stats()
+    chats = _resolve(http_request, ChatManager).stats()
+    calls = _resolve(http_request, CallManager).stats()
+    RUNS_IN_FLIGHT.set(runs["runs"])
+    RUNS_QUEUED.set(runs["queued_runs"])
+    for kind, stats in (("chat", chats), ("call", calls)):
+        SESSIONS_ACTIVE.set(stats["sessions"], kind=kind)
+    for channel, stats in (("run", runs), ("chat", chats), ("call", calls)):
+        WEBSOCKET_SUBSCRIBERS.set(stats["subscribers"], channel=channel)
+        BROADCAST_QUEUED.set(stats["queued_messages"], channel=channel)
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 # Include API router
 app.include_router(router)
 
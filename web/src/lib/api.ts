@@ -326,11 +326,12 @@ export const api = {
   startRun: (agentId: string, testIds?: string[], options?: Partial<RunOptions>) =>
     post<StartRunResponse>(`/agents/${agentId}/runs`, { test_ids: testIds, options }),
 
-  importCall: async (agentId: string, file: File, format = "retell"): Promise<RunWithResults> => {
+  importCall: async (agentId: string, file: File, format = "retell"): Promise<RunRecord> => {
     const headers = await getHeaders();
     const formData = new FormData();
     formData.append("file", file);
-    const url = `${globalConfig.baseUrl}/agents/${agentId}/import-call?format=${encodeURIComponent(format)}`;
+    // Only the run id is needed; skip echoing back every imported result.
+    const url = `${globalConfig.baseUrl}/agents/${agentId}/import-call?format=${encodeURIComponent(format)}&include_results=false`;
     const res = await fetch(url, {
       method: "POST",
       headers,
@@ -123,6 +123,24 @@ export interface ModelOverride {
   reason: string;
 }
 
+export interface LLMRoleStats {
+  calls: number;
+  cache_hits: number;
+  cache_misses: number;
+  cache_bypassed: number;
+  coalesced?: number;
+  latency_ms: number;
+  prompt_tokens?: number;
+  completion_tokens?: number;
+  cost_usd?: number;
+}
+
+export interface SpanTiming {
+  count: number;
+  total_ms: number;
+  max_ms: number;
+}
+
 export interface TestResult {
   test_id: string;
   test_name: string;
@@ -138,6 +156,8 @@ export interface TestResult {
   error_message?: string;
   models_used?: ModelsUsed;
   model_overrides?: ModelOverride[];
+  llm_stats?: Record<string, LLMRoleStats>;
+  timings?: Record<string, SpanTiming>;
 }
 
 export interface TestRun {
@@ -174,6 +194,7 @@ export interface RunOptions {
   simulator_model: string;
   judge_model: string;
   no_cache?: boolean;
+  strict_offline?: boolean;
 }
 
 export interface Settings {
@@ -194,6 +215,7 @@ export interface Settings {
     tts_url: string;
     stt_url: string;
   };
+  pricing?: Record<string, { input_per_mtok: number; output_per_mtok: number }>;
   env: Record<string, string>;
 }
 
@@ -267,6 +289,9 @@ export interface RunSummary {
   running: number;
   imported: number;
   failed_names: string[];
+  prompt_tokens?: number;
+  completion_tokens?: number;
+  cost_usd?: number;
 }
 
 export interface RunRecord {
@@ -294,6 +319,11 @@ export interface RunResultRecord {
   nodes_visited: string | null;
   tools_called: string | null;
   models_used: string | null;
+  llm_stats?: Record<string, LLMRoleStats> | null;
+  timings?: Record<string, SpanTiming> | null;
+  prompt_tokens?: number | null;
+  completion_tokens?: number | null;
+  cost_usd?: number | null;
   dynamic_variables?: Record<string, unknown> | null;
   created_at: string;
 }